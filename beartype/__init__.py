@@ -92,6 +92,18 @@ from beartype._util.kind.maplike.utilmapfrozen import (
     FrozenDict as FrozenDict,
 )
 
+# Publicize the cache introspector enabling callers to profile the memory
+# footprint of all internal caches.
+from beartype._util.cache.utilcacheinfo import (
+    cache_info as cache_info,
+)
+
+# Publicize the type-checking time budget introspector enabling callers to tune
+# the "BeartypeConf.check_budget_ns" option.
+from beartype._check.code.codebudget import (
+    get_check_budget_exceeded_count as get_check_budget_exceeded_count,
+)
+
 # ....................{ GLOBALS ~ __all__                  }....................
 __all__ = [
     'BeartypeConf',
@@ -100,6 +112,8 @@ __all__ = [
     'BeartypeViolationVerbosity',
     'FrozenDict',
     'beartype',
+    'cache_info',
+    'get_check_budget_exceeded_count',
     '__version__',
     '__version_info__',
 ]
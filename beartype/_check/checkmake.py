@@ -19,6 +19,9 @@ from beartype._check.code.codemain import (
     CodeGenerated,
     make_check_expr,
 )
+from beartype._check.code.coderegen import set_func_regenerator
+from beartype._check.code.codespecialize import make_code_specialize_pith_check
+from beartype._check.code.codeunion import make_code_union_pith_check
 from beartype._check.error.errmain import (
     get_func_pith_violation,
     get_hint_object_violation,
@@ -39,6 +42,7 @@ from beartype._check.cls.hint.hintsane import (
 from beartype._check.signature.sigmake import make_func_signature
 from beartype._conf.confmain import BeartypeConf
 from beartype._conf.conftest import die_unless_conf
+from beartype._data.check.code.datacodelen import FUNC_CHECKER_CACHE_SIZE
 from beartype._data.check.code.datacodename import (
     ARG_NAME_CALL_META,
     ARG_NAME_CONF,
@@ -65,11 +69,13 @@ from beartype._data.func.datafuncarg import (
     ARG_NAME_RETURN,
     ARG_NAME_RETURN_REPR,
 )
+from beartype._data.kind.datakindiota import SENTINEL
 from beartype._data.typing.datatyping import (
     CallableRaiserOrTester,
     LexicalScope,
 )
 from beartype._data.typing.datatypingport import Hint
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
 from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.error.utilerrraise import reraise_exception_placeholder
 from beartype._util.error.utilerrwarn import reissue_warnings_placeholder
@@ -79,6 +85,7 @@ from beartype._util.kind.maplike.utilmapfrozen import (
     FrozenDict,
     FrozenDictStrToAny,
 )
+from beartype._util.text.utiltextprefix import prefix_object
 from collections.abc import Callable
 from itertools import count
 from typing import Optional
@@ -139,8 +146,7 @@ def make_func_checker(
     conf: BeartypeConf,
     exception_prefix: str,
     make_code_check: Callable[..., CodeGenerated],
-    hint_conf_exception_prefix_to_func_checker: (
-        dict[TupleHintConfStr, CallableRaiserOrTester]),
+    hint_conf_exception_prefix_to_func_checker: CacheLruStrong,
 ) -> CallableRaiserOrTester:
     '''
     **Type-checking function factory** (i.e., low-level callable dynamically
@@ -184,10 +190,14 @@ def make_func_checker(
         **Type-checking code factory** (i.e., function dynamically generating a
         code snippet of a function type-checking an arbitrary object against the
         passed type hint under the passed beartype configuration).
-    hint_conf_exception_prefix_to_func_checker : dict[TupleHintConfStr, CallableRaiserOrTester]
-        **Type-checking function factory cache** (i.e., dictionary mapping from
-        each 3-tuple ``(hint, conf, exception_prifx)`` of these parameters to
-        the type-checking function dynamically generated by this factory).
+    hint_conf_exception_prefix_to_func_checker : CacheLruStrong
+        **Type-checking function factory cache** (i.e., size-bounded Least
+        Recently Used (LRU) cache mapping from each 3-tuple ``(hint, conf,
+        exception_prifx)`` of these parameters to the type-checking function
+        dynamically generated by this factory). Bounding this cache prevents
+        dynamically constructed hints (e.g., ``typing.Literal[*values]``)
+        from unboundedly prolonging the lifetimes of both those hints and the
+        functions generated for those hints.
 
     Returns
     -------
@@ -232,19 +242,26 @@ def make_func_checker(
 
     # Attempt to...
     try:
-        # Either:
-        # * If this hint is safely memoizable *AND* this function factory has
-        #   already been passed the same parameters, the function previously
-        #   generated by that call.
-        # * Else, "None".
-        func_checker = hint_conf_exception_prefix_to_func_checker.get(CACHE_KEY)
-
-        # If a prior call to this factory has already generated a function
-        # type-checking these parameters, return that function.
-        if func_checker is not None:
-            return func_checker
-        # Else, this is the first call to this factory passed these parameters.
-    # If the dictionary lookup above raised the standard "TypeError" exception,
+        # Function previously generated by a prior call to this factory passed
+        # the same parameters if any *OR* the sentinel placeholder otherwise.
+        #
+        # Note that this lock-free getter is intentionally called rather than
+        # the thread-safe but slower CacheLruStrong.__getitem__() method. This
+        # getter still preserves this function from eviction by recording this
+        # key as recently referenced. Since this factory is called on each call
+        # to the is_bearable() and die_if_unbearable() functions, this matters.
+        func_checker_cached = (
+            hint_conf_exception_prefix_to_func_checker.get_or_sentinel(
+                CACHE_KEY))
+
+        # If this hint is safely memoizable *AND* this function factory has
+        # already been passed the same parameters, return that function.
+        if func_checker_cached is not SENTINEL:
+            return func_checker_cached  # type: ignore[return-value]
+        # Else, this is the first call to this factory passed these parameters
+        # (or a prior function generated for these parameters was since
+        # evicted).
+    # If the cache lookup above raised the standard "TypeError" exception,
     # this hint is unhashable. In this case...
     except TypeError:
         # Record that the function dynamically generated by this factory
@@ -381,9 +398,20 @@ def make_func_checker(
                 func_code=func_checker_code,
                 func_locals=func_scope,
                 func_label=EXCEPTION_PLACEHOLDER,
+                func_code_cache_dir=conf.code_cache_dir,
                 is_debug=conf.is_debug,
             )
 
+            # If this function is passed one or more runtime profilers (e.g.,
+            # profiling the child hints of unions), bind these profilers to a
+            # new regenerator of this function.
+            set_func_regenerator(
+                func=func_checker,
+                func_name=func_checker_name,
+                func_code=func_checker_code,
+                func_scope=func_scope,
+            )
+
             # If...
             if (
                 # That function is *SUPERFICIALLY* memoizable *AND*...
@@ -425,6 +453,83 @@ def make_func_checker(
     # Return that function.
     return func_checker
 
+
+def make_func_raiser_generator_pith(
+    decor_func: BeartypeCallDecorFuncData,
+    hint: Hint,
+    pith_label: str,
+) -> Optional[CallableRaiserOrTester]:
+    '''
+    **Generator pith type-checking raiser function factory** (i.e., low-level
+    callable dynamically generating a pure-Python function raising the
+    **return violation type** (i.e., the
+    :attr:`beartype.BeartypeConf.violation_return_type` option) if an arbitrary
+    object yielded by, sent into, or returned from the generator created by the
+    currently decorated synchronous or asynchronous generator factory violates
+    the passed child hint of the return hint annotating that factory) if that
+    hint is unignorable *or* :data:`None` otherwise.
+
+    This factory is effectively memoized by the
+    :data:`._HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR` dictionary.
+
+    Parameters
+    ----------
+    decor_func : BeartypeCallDecorFuncData
+        Decorated callable to be type-checked.
+    hint : Hint
+        Child hint subscripting the return hint annotating that callable (e.g.,
+        the ``{hint_yield}`` in ``Generator[{hint_yield}, {hint_send},
+        {hint_return}]``).
+    pith_label : str
+        Human-readable noun describing the kind of objects to be type-checked
+        (e.g., ``"yield"``), embedded in exception messages.
+
+    Returns
+    -------
+    Optional[CallableRaiserOrTester]
+        Either:
+
+        * If this hint is unignorable, this raiser function.
+        * Else, :data:`None`.
+
+    Raises
+    ------
+    All exceptions raised by the lower-level :func:`.make_func_checker` factory.
+    '''
+    assert isinstance(decor_func, BeartypeCallDecorFuncData), (
+        f'{repr(decor_func)} not beartype decorator call metadata.')
+    assert isinstance(pith_label, str), f'{repr(pith_label)} not string.'
+
+    # Beartype configuration configuring the decorated callable.
+    conf = decor_func.conf
+
+    # Beartype configuration raising the same type of violation as the wrapper
+    # function type-checking that callable raises for returns. Since the
+    # make_func_checker() factory raises the "violation_door_type" of the
+    # configuration it is passed, this configuration is that configuration with
+    # this option replaced by the "violation_return_type" option.
+    conf_generator = BeartypeConf(**{  # type: ignore[arg-type]
+        **conf._conf_kwargs,
+        'violation_door_type': conf.violation_return_type,
+    })
+
+    # Raiser function type-checking these objects against this child hint.
+    #
+    # Note that parameters are intentionally passed positionally for efficiency.
+    func_raiser = make_func_checker(
+        hint,
+        conf_generator,
+        (
+            f'{prefix_object(obj=decor_func.func_wrappee, is_color=conf.is_color)}'
+            f'{pith_label} '
+        ),
+        make_code_raiser_hint_object_check,
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR,
+    )
+
+    # Return either "None" if this hint is ignorable *OR* this raiser otherwise.
+    return None if func_raiser is _func_checker_ignorable else func_raiser
+
 # ....................{ FACTORIES ~ code                   }....................
 #FIXME: Unit test us up, please.
 def make_code_raiser_hint_object_check(
@@ -493,6 +598,12 @@ def make_code_raiser_hint_object_check(
     code_expr, func_scope_frozen = make_check_expr(
         call_curr=call_curr, hint_sane=hint_sane, conf=conf)
 
+    # If this configuration reorders union child hints at runtime, uniquely
+    # identify this root pith to the union profiler passed to this wrapper.
+    if conf.union_reorder_calls is not None:
+        code_expr = make_code_union_pith_check(code_expr)
+    # Else, this configuration never reorders union child hints.
+
     # ....................{ SCOPE                          }....................
     # Mutable dictionary coerced from this immutable frozen dictionary.
     func_scope = dict(func_scope_frozen)
@@ -600,6 +711,12 @@ def make_code_tester_check(
     code_expr, func_scope_frozen = make_check_expr(
         call_curr=call_curr, hint_sane=hint_sane, conf=conf)
 
+    # If this configuration reorders union child hints at runtime, uniquely
+    # identify this root pith to the union profiler passed to this wrapper.
+    if conf.union_reorder_calls is not None:
+        code_expr = make_code_union_pith_check(code_expr)
+    # Else, this configuration never reorders union child hints.
+
     # Code snippet type-checking the root pith against the root hint.
     func_code = f'{CODE_TESTER_CHECK_PREFIX}{code_expr}'
 
@@ -728,6 +845,12 @@ def make_code_raiser_func_pith_check(
     code_expr, func_scope_frozen = make_check_expr(
         call_curr=decor_func, hint_sane=hint_sane, conf=decor_func.conf)
 
+    # If this configuration reorders union child hints at runtime, uniquely
+    # identify this root pith to the union profiler passed to this wrapper.
+    if decor_func.conf.union_reorder_calls is not None:
+        code_expr = make_code_union_pith_check(code_expr)
+    # Else, this configuration never reorders union child hints.
+
     #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
     # CAUTION: Synchronize with similar logic in make_func_checker() above.
     #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
@@ -760,6 +883,14 @@ def make_code_raiser_func_pith_check(
     # parameter passed to this wrapper function.
     func_scope[ARG_NAME_GET_VIOLATION] = get_func_pith_violation
 
+    # If this configuration specializes wrappers to observed types, wrap this
+    # expression with a call to the type specializer passed to this wrapper if
+    # this hint is specializable.
+    if decor_func.conf.specialize_calls is not None:
+        code_expr = make_code_specialize_pith_check(
+            code_expr=code_expr, func_scope=func_scope, hint=hint_sane.hint)
+    # Else, this configuration never specializes wrappers.
+
     # ....................{ RAISER                         }....................
     #FIXME: [SPEED] Globalize CODE_GET_FUNC_PITH_VIOLATION.format() as
     #"CODE_GET_FUNC_PITH_VIOLATION_format". *sigh*
@@ -813,6 +944,19 @@ integer incrementation starting at 0, leveraged by the
 functions dynamically generated by that factory).
 '''
 
+
+_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR = CacheLruStrong(
+    FUNC_CHECKER_CACHE_SIZE)
+'''
+**Generator pith type-checking raiser function factory cache** (i.e.,
+size-bounded Least Recently Used (LRU) cache mapping from each 3-tuple
+``(hint, conf, exception_prefix)`` of the
+same triple of parameters passed by the
+:func:`.make_func_raiser_generator_pith` factory to the
+:func:`.make_func_checker` factory to the raiser function dynamically generated
+by the latter).
+'''
+
 # ....................{ PRIVATE ~ testers                  }....................
 def _func_checker_ignorable(obj: object) -> bool:
     '''
@@ -159,6 +159,25 @@ class HintTreeCode(HintTreeABC):
         :attr:`beartype._check.cls.hint.hintsane.HintSane.is_check_expr_cacheable`
         boolean across *all* child hints transitively subscripting the root hint
         of this queue. See also that instance variable for further details.
+    is_check_memo_safe : bool
+        :data:`True` only if *all* hints in this queue visited thus far are
+        either shallowly type-checkable *or* deeply immutable container hints
+        (e.g., ``tuple[int, ...]``), in which case the validity of any pith
+        satisfying the root hint of this queue is guaranteed to be invariant
+        across the lifetime of that pith. If :data:`True` *and* the
+        :attr:`beartype.BeartypeConf.is_check_memo` option is enabled, the code
+        type-checking the root pith against that root hint will be wrapped with
+        code memoizing successful type-checks of that pith.
+    is_check_memo_useful : bool
+        :data:`True` only if one or more hints in this queue visited thus far
+        are deeply immutable container hints, in which case memoizing successful
+        type-checks as described above is more efficient than repeating them.
+    is_var_check_deadline_ns_needed : bool
+        :data:`True` only if one or more child hints of the root hint of this
+        queue iterate over container items under a time budget configured by
+        the :attr:`beartype.BeartypeConf.check_budget_ns` option. If
+        :data:`True`, the code type-checking the root pith against that root
+        hint will be prefixed with code localizing the deadline of that budget.
     is_var_random_int_needed : bool
         :data:`True` only if one or more child hints of the root hint of this
         queue require a pseudo-random integer. If :data:`True`, the body of this
@@ -176,6 +195,13 @@ class HintTreeCode(HintTreeABC):
           the name of the local variable uniquely assigned to by the assignment
           expression defined by :attr:`pith_curr_assign_expr` (i.e., the
           left-hand side (LHS) of that assignment expression).
+    union_profiled_count : int
+        Number of unions whose child hints are type-checked in an order
+        profiled at runtime under the
+        :attr:`beartype.BeartypeConf.union_reorder_calls` option visited thus
+        far. For efficiency, this integer also uniquely identifies the next such
+        union visited in the code type-checking the root pith against the root
+        hint of this queue.
     _hint_queue : FixedList
         **Type hint tree type-checking queue** (i.e., First-In-First-Out (FIFO)
         queue of :class:`.HintDataCode` objects describing all visitable type hints
@@ -198,9 +224,13 @@ class HintTreeCode(HintTreeABC):
         'indent_level_child',
         'index_last',
         'is_check_expr_cacheable',
+        'is_check_memo_safe',
+        'is_check_memo_useful',
+        'is_var_check_deadline_ns_needed',
         'is_var_random_int_needed',
         'pith_curr_assign_expr',
         'pith_curr_var_name',
+        'union_profiled_count',
         '_hint_queue',
     )
 
@@ -216,9 +246,13 @@ class HintTreeCode(HintTreeABC):
         indent_level_child: int
         index_last: int
         is_check_expr_cacheable: bool
+        is_check_memo_safe: bool
+        is_check_memo_useful: bool
+        is_var_check_deadline_ns_needed: bool
         is_var_random_int_needed: bool
         pith_curr_assign_expr: str
         pith_curr_var_name: str
+        union_profiled_count: int
         _hint_queue : FixedList
 
     # ..................{ INITIALIZERS                       }..................
@@ -261,6 +295,9 @@ class HintTreeCode(HintTreeABC):
         self.indent_level_child) = (  # pyright: ignore
         self.index_last) = (  # pyright: ignore
         self.is_check_expr_cacheable) = (  # pyright: ignore
+        self.is_check_memo_safe) = (  # pyright: ignore
+        self.is_check_memo_useful) = (  # pyright: ignore
+        self.is_var_check_deadline_ns_needed) = (  # pyright: ignore
         self.is_var_random_int_needed) = (  # pyright: ignore
         self.pith_curr_assign_expr) = (  # pyright: ignore
         self.pith_curr_var_name) = None  # type: ignore[assignment]
@@ -313,8 +350,12 @@ class HintTreeCode(HintTreeABC):
 
         # ..................{ DEFAULTS                       }..................
         # Restore instance variables to initial defaults.
+        self.is_check_memo_safe = True
+        self.is_check_memo_useful = False
+        self.is_var_check_deadline_ns_needed = False
         self.is_var_random_int_needed = False
         self.func_wrapper_locals = {}
+        self.union_profiled_count = 0
 
         # 0-based index of metadata describing the last visitable hint in this
         # queue, initialized to "-1" to ensure that the initial incrementation
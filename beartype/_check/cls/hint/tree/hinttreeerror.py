@@ -65,6 +65,7 @@ from beartype._check.cls.hint.tree.hinttreeabc import HintTreeABC
 from beartype._conf.confmain import BeartypeConf
 from beartype._data.typing.datatyping import TypeException
 from beartype._data.typing.datatypingport import Hint
+from beartype._data.hint.sign.datahintsigns import HintSignCallable
 from beartype._data.hint.sign.datahintsignset import (
     HINT_SIGNS_SUPPORTED_DEEP,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
@@ -456,8 +457,16 @@ class HintTreeError(HintTreeABC):
             self.hint_curr.hint_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE and (
                 # Unsubscripted *OR*...
                 not get_hint_pep_args(self.hint_curr_sanified) or
-                # Currently unsupported with deep type-checking...
-                self.hint_curr.hint_sign not in HINT_SIGNS_SUPPORTED_DEEP
+                # Currently unsupported with deep type-checking *AND*
+                # neither...
+                self.hint_curr.hint_sign not in HINT_SIGNS_SUPPORTED_DEEP and
+                not (
+                    # A callable type hint *NOR*...
+                    self.hint_curr.hint_sign is HintSignCallable and
+                    # A configuration type-checking the signatures of
+                    # callables against these hints.
+                    self.conf.is_check_callable_signature
+                )
             )
         # Then this hint is both unsubscripted and originating from a standard
         # type origin. In this case, this hint was type-checked shallowly.
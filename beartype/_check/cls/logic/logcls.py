@@ -17,45 +17,67 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from beartype._check.code.coderandom import (
+    get_reiterable_item_indices,
+    make_reiterable_pith_child_expr,
+)
+from beartype._check.code.codebudget import make_check_budget_iterable_expr
+from beartype._check.code.codecursor import make_cursor
 from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
 from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
 from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
 from beartype._check.cls.hint.hintsane import HintSane
 from beartype._conf.confenum import BeartypeStrategy
-from beartype._data.typing.datatyping import (
-    EnumeratorItem,
-    Enumerator,
-)
+from beartype._data.check.code.datacodename import ARG_NAME_CURSOR
+from beartype._data.typing.datatyping import Enumerator
 from beartype._data.check.code.pep.datacodepep484585 import (
     CODE_PEP484585_SEQUENCE_NONRANDOM_PITH_CHILD_EXPR,
     CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR,
+    CODE_PEP484585_SEQUENCE_CURSOR_format,
+    CODE_PEP484585_SEQUENCE_LOGN_format,
+    CODE_PEP484585_SEQUENCE_LOGN_NONRANDOM_START_EXPR,
+    CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR_format,
     CODE_PEP484585_QUASIITERABLE_format,
+    CODE_PEP484585_QUASIITERABLE_ALL_format,
     CODE_PEP484585_REITERABLE_OR_SEQUENCE_format,
-    CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format,
+    CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_format,
+    CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_TYPE_format,
 )
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.cls.utilclstest import is_type_builtin
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from beartype._util.hint.pep.utilpeptest import is_hint_pep
 from collections.abc import (
     Callable,
     Collection,
     Sequence,
 )
+from itertools import (
+    islice,
+    repeat,
+)
+from operator import is_not
 from typing import TYPE_CHECKING
 
 # ....................{ PRIVATE ~ hints                    }....................
-_GetCauseEnumeratorItem = Callable[[HintTreeError], EnumeratorItem]
+_GetCauseEnumerator = Callable[[HintTreeError], Enumerator]
 '''
-PEP-compliant type hint matching an **enumerator item violation cause getter**
-(i.e., callable accepting a :class:`.HintTreeError` object and returning a
-2-tuple ``(item_index, item)`` describing an arbitrary item efficiently accessed
-from the container encapsulated by this violation cause.
+PEP-compliant type hint matching an **enumerator violation cause getter**
+(i.e., callable accepting a :class:`.HintTreeError` object and returning an
+iterator satisfying the :func:`enumerate` protocol over the one or more items
+efficiently accessed from the container encapsulated by this violation cause
+that the parent wrapper function could have type-checked in :math:`O(1)` time).
 
 This hint matches callables with signatures resembling:
 
 .. code-block:: python
 
-   def _get_cause_enumerator_item(cause: HintTreeError) -> EnumeratorItem:
+   def _get_cause_enumerator(cause: HintTreeError) -> Enumerator:
 
-Callables matched by this hint return 2-tuples of the standard form
-``(item_index, item)`` returned by the :func:`enumerate` builtin, where:
+Iterators returned by callables matched by this hint yield 2-tuples of the
+standard form ``(item_index, item)`` yielded by the :func:`enumerate` builtin,
+where:
 
 * ``item_index`` is the 0-based index of an arbitrary item efficiently accessed
   from this container.
@@ -99,11 +121,11 @@ class HintLogicABC(object, metaclass=ABCMeta):
 
     Attributes
     ----------
-    _get_cause_enumerator_item : _GetCauseEnumeratorItem
-        **Enumerator item violation cause getter** (i.e., callable accepting a
-        :class:`.HintTreeError` object and returning a 2-tuple ``(item_index,
-        item)`` describing an arbitrary item efficiently accessed from the
-        container encapsulated by this violation cause.
+    _get_cause_enumerator : _GetCauseEnumerator
+        **Enumerator violation cause getter** (i.e., callable accepting a
+        :class:`.HintTreeError` object and returning an iterator satisfying the
+        :func:`enumerate` protocol over the one or more items efficiently
+        accessed from the container encapsulated by this violation cause).
     _is_var_random_int_needed_if_conf_is_random : bool
         :data:`True` only if the Python expression dynamically generated by the
         subclass-specific :attr:`_make_code` factory method requires a
@@ -121,14 +143,14 @@ class HintLogicABC(object, metaclass=ABCMeta):
     # cache dunder methods. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
-        '_get_cause_enumerator_item',
+        '_get_cause_enumerator',
         '_is_var_random_int_needed_if_conf_is_random',
     )
 
     # Squelch false negatives from mypy. This is absurd. This is mypy. See:
     #     https://github.com/python/mypy/issues/5941
     if TYPE_CHECKING:
-        _get_cause_enumerator_item: _GetCauseEnumeratorItem
+        _get_cause_enumerator: _GetCauseEnumerator
         _is_var_random_int_needed_if_conf_is_random: bool
 
     # ..................{ INITIALIZERS                       }..................
@@ -136,7 +158,7 @@ class HintLogicABC(object, metaclass=ABCMeta):
         self,
 
         # Mandatory parameters.
-        get_cause_enumerator_item: _GetCauseEnumeratorItem,
+        get_cause_enumerator: _GetCauseEnumerator,
 
         # Optional parameters.
         is_var_random_int_needed_if_conf_is_random: bool = False,
@@ -148,13 +170,13 @@ class HintLogicABC(object, metaclass=ABCMeta):
         ----------
         See the class docstring for further details.
         '''
-        assert callable(get_cause_enumerator_item), (
-            f'{repr(get_cause_enumerator_item)} uncallable.')
+        assert callable(get_cause_enumerator), (
+            f'{repr(get_cause_enumerator)} uncallable.')
         assert isinstance(is_var_random_int_needed_if_conf_is_random, bool), (
             f'{repr(is_var_random_int_needed_if_conf_is_random)} not boolean.')
 
         # Classify all passed parameters.
-        self._get_cause_enumerator_item = get_cause_enumerator_item
+        self._get_cause_enumerator = get_cause_enumerator
         self._is_var_random_int_needed_if_conf_is_random = (
             is_var_random_int_needed_if_conf_is_random)
 
@@ -197,14 +219,13 @@ class HintLogicABC(object, metaclass=ABCMeta):
 
         # If the only a single item of this container was type-checked by the
         # parent @beartype-generated wrapper function in O(1) time, type-check
-        # only the same single item of this container in O(1) time as well.
+        # only the same single item of this container (or the few candidates
+        # for that item) in O(1) time as well.
         if cause.conf.strategy is BeartypeStrategy.O1:
-            # 2-tuple of the index and value of an arbitrary item in the same
-            # order as the 2-tuples returned by the enumerate() builtin.
-            container_enumerator_item = self._get_cause_enumerator_item(cause)
-
-            # Iterator yielding only this 2-tuple.
-            container_enumerator = iter((container_enumerator_item,))
+            # Iterator yielding the 2-tuples of the indices and values of these
+            # items in the same order as the 2-tuples yielded by the
+            # enumerate() builtin.
+            container_enumerator = self._get_cause_enumerator(cause)
         # Else, *ALL* items of this container were type-checked by the parent
         # @beartype-generated wrapper function in O(n) time. In this case,
         # type-check *ALL* items of this container in O(n) time as well.
@@ -245,6 +266,10 @@ class HintLogicABC(object, metaclass=ABCMeta):
             # The beartype configuration under which this expression was
             # generated above allows randomized type-checking *AND*...
             hint_tree.conf.is_random and
+            # This configuration does *NOT* enable the linear-time strategy,
+            # which type-checks *ALL* items and thus *NO* random items of this
+            # container *AND*...
+            hint_tree.conf.strategy is not BeartypeStrategy.On and
             # Our subclass insists this expression requires a pseudo-random
             # integer in that case.
             self._is_var_random_int_needed_if_conf_is_random
@@ -301,7 +326,7 @@ class HintLogicQuasiiterable(HintLogicABC):
 
         # Initialize our superclass.
         super().__init__(
-            get_cause_enumerator_item=_get_cause_enumerator_item_collection,
+            get_cause_enumerator=_get_cause_enumerator_collection,
             # Code snippets dynamically generated by this logic require
             # pseudo-random integers to type-check random sequence items for the
             # proper subset of quasi-iterables that are actually sequences.
@@ -320,6 +345,38 @@ class HintLogicQuasiiterable(HintLogicABC):
         collection_abc_expr = add_hints_meta_scope_type_or_types(
             hint_tree=hint_tree, type_or_types=Collection)
 
+        # If this beartype configuration enables the linear-time strategy...
+        if hint_tree.conf.strategy is BeartypeStrategy.On:
+            # Name of a unique local variable storing the value of this parent
+            # pith *BEFORE* modifying the "hint_tree.hint_curr.pith_var_name"
+            # and thus this name as well below.
+            pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+            # Name of a unique local variable iteratively storing the value of
+            # each item of this parent pith.
+            pith_child_var_name = _get_pith_child_var_name(hint_tree)
+
+            # Python expression deeply type-checking *ALL* items of this pith
+            # against this hint.
+            hint_tree.func_curr_code = CODE_PEP484585_QUASIITERABLE_ALL_format(
+                collection_abc_expr=collection_abc_expr,
+                hint_curr_expr=hint_tree.hint_curr_expr,
+                indent_curr=hint_tree.indent_curr,
+                pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+                pith_curr_iterable_expr=make_check_budget_iterable_expr(
+                    hint_tree=hint_tree,
+                    pith_curr_iterable_expr=pith_curr_var_name,
+                ),
+                pith_curr_var_name=pith_curr_var_name,
+                pith_child_var_name=pith_child_var_name,
+                hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                    hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+            )
+
+            # Halt generating code. Oh, the humanity!
+            return
+        # Else, this configuration enables a sublinear-time strategy.
+
         # Python expression evaluating to the "collections.abc.Sequence" ABC as
         # a hidden parameter passed to the current wrapper function.
         sequence_abc_expr = add_hints_meta_scope_type_or_types(
@@ -338,12 +395,16 @@ class HintLogicQuasiiterable(HintLogicABC):
         # thus this name as well below.
         pith_curr_var_name = hint_tree.hint_curr.pith_var_name
 
-        # Increment the integer suffixing the name of a unique local variable
-        # storing the value of this child pith *BEFORE* localizing this name.
-        hint_tree.hint_curr.pith_var_name_index += 1
+        # Python expression efficiently yielding the value of a (typically)
+        # pseudo-randomly selected item of the current reiterable pith.
+        reiterable_pith_child_expr = make_reiterable_pith_child_expr(
+            hint_tree=hint_tree,
+            pith_curr_var_name=pith_curr_var_name,
+            pith_curr_iterable_expr=pith_curr_var_name,
+        )
 
         # Name of a unique local variable storing the value of this child pith.
-        pith_child_var_name = hint_tree.hint_curr.pith_var_name
+        pith_child_var_name = _get_pith_child_var_name(hint_tree)
 
         # Python expression deeply type-checking this pith against this hint.
         hint_tree.func_curr_code = CODE_PEP484585_QUASIITERABLE_format(
@@ -353,6 +414,7 @@ class HintLogicQuasiiterable(HintLogicABC):
             pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
             pith_curr_var_name=pith_curr_var_name,
             pith_child_var_name=pith_child_var_name,
+            reiterable_pith_child_expr=reiterable_pith_child_expr,
             sequence_abc_expr=sequence_abc_expr,
             sequence_pith_child_expr=sequence_pith_child_expr,
             hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
@@ -387,7 +449,7 @@ class HintLogicReiterable(HintLogicABC):
 
         # Initialize our superclass.
         super().__init__(
-            get_cause_enumerator_item=_get_cause_enumerator_item_reiterable)
+            get_cause_enumerator=_get_cause_enumerator_reiterable)
 
     # ..................{ PRIVATE ~ factories                }..................
     def _make_code(
@@ -395,9 +457,19 @@ class HintLogicReiterable(HintLogicABC):
         assert isinstance(hint_tree, HintTreeCode), (
             f'{repr(hint_tree)} not "HintTreeCode" object.')
 
+        # If this beartype configuration enables the linear-time strategy,
+        # generate code type-checking *ALL* items of this reiterable and halt.
+        if hint_tree.conf.strategy is BeartypeStrategy.On:
+            _make_code_all(hint_tree=hint_tree, hint_child_sane=hint_child_sane)
+            return
+        # Else, this configuration enables a sublinear-time strategy.
+
         # Python snippet accessing the desired reiterable pith item.
-        pith_expr = CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format(
-            pith_curr_var_name=hint_tree.hint_curr.pith_var_name)
+        pith_expr = make_reiterable_pith_child_expr(
+            hint_tree=hint_tree,
+            pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
+            pith_curr_iterable_expr=hint_tree.hint_curr.pith_var_name,
+        )
 
         # Python expression deeply type-checking this pith against this hint.
         hint_tree.func_curr_code = (
@@ -431,7 +503,7 @@ class HintLogicSequence(HintLogicABC):
 
         # Initialize our superclass.
         super().__init__(
-            get_cause_enumerator_item=_get_cause_enumerator_item_sequence,
+            get_cause_enumerator=_get_cause_enumerator_sequence,
             # Code snippets dynamically generated by this logic require
             # pseudo-random integers to type-check random sequence items.
             is_var_random_int_needed_if_conf_is_random=True,
@@ -443,6 +515,30 @@ class HintLogicSequence(HintLogicABC):
         assert isinstance(hint_tree, HintTreeCode), (
             f'{repr(hint_tree)} not "HintTreeCode" object.')
 
+        # If this beartype configuration enables the linear-time strategy,
+        # generate code type-checking *ALL* items of this sequence and halt.
+        if hint_tree.conf.strategy is BeartypeStrategy.On:
+            _make_code_all(hint_tree=hint_tree, hint_child_sane=hint_child_sane)
+            return
+        # Else, this configuration enables a sublinear-time strategy.
+        #
+        # If this configuration enables the logarithmic-time strategy, generate
+        # code type-checking a logarithmic number of items of this sequence and
+        # halt.
+        elif hint_tree.conf.strategy is BeartypeStrategy.Ologn:
+            _make_code_sequence_logn(
+                hint_tree=hint_tree, hint_child_sane=hint_child_sane)
+            return
+        # Else, this configuration enables neither of these strategies.
+        #
+        # If this configuration enables the amortized full-coverage strategy,
+        # generate code type-checking the next slice of this sequence and halt.
+        elif hint_tree.conf.strategy is BeartypeStrategy.Ok:
+            _make_code_sequence_cursor(
+                hint_tree=hint_tree, hint_child_sane=hint_child_sane)
+            return
+        # Else, this configuration enables a constant-time strategy.
+
         # Python expression deeply type-checking this pith against this hint.
         hint_tree.func_curr_code = (
             CODE_PEP484585_REITERABLE_OR_SEQUENCE_format(
@@ -457,7 +553,243 @@ class HintLogicSequence(HintLogicABC):
             )
         )
 
+# ..................{ PRIVATE ~ factories                    }..................
+def _make_code_all(hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+    '''
+    Python expression deeply type-checking *all* items of the current
+    reiterable or sequence pith against the currently visited container hint
+    described by the passed parameters under the :math:`O(n)` linear-time
+    :attr:`beartype.BeartypeStrategy.On` type-checking strategy.
+
+    Reiterables and sequences are type-checked identically under this strategy,
+    as iterating *all* items of a container requires *no* random access.
+
+    If the child hint is a builtin type (e.g., the :class:`int` in
+    ``list[int]``) *and* this configuration defines no time budget, this
+    factory generates code first deciding whether *all* items of this pith are
+    of that exact type with C-based iteration.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    hint_child_sane : HintSane
+        **Sanified child hint metadata** (i.e., :data:`.HintSane` object)
+        encapsulating the sanification of this child hint to be type-checked.
+    '''
+
+    # Name of a unique local variable storing the value of this parent pith
+    # *BEFORE* modifying the "hint_tree.hint_curr.pith_var_name_index" and thus
+    # this name as well below.
+    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+    # Name of a unique local variable iteratively storing the value of each item
+    # of this parent pith.
+    pith_child_var_name = _get_pith_child_var_name(hint_tree)
+
+    # Child hint to be type-checked, localized for efficiency.
+    hint_child = hint_child_sane.hint
+
+    # If this child hint is a PEP-noncompliant builtin type *AND* this
+    # configuration defines *NO* time budget (which this C-based iteration would
+    # otherwise bypass), generate code first deciding whether *ALL* items of
+    # this pith are of this exact type with C-based iteration.
+    if (
+        isinstance(hint_child, type) and
+        not is_hint_pep(hint_child) and
+        is_type_builtin(hint_child) and
+        hint_tree.conf.check_budget_ns is None
+    ):
+        hint_tree.func_curr_code = (
+            CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_TYPE_format(
+                is_not_expr=add_func_scope_attr(
+                    attr=is_not,
+                    func_scope=hint_tree.func_wrapper_locals,
+                    exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+                ),
+                repeat_expr=add_func_scope_attr(
+                    attr=repeat,
+                    func_scope=hint_tree.func_wrapper_locals,
+                    exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+                ),
+                hint_curr_expr=hint_tree.hint_curr_expr,
+                hint_child_expr=add_hints_meta_scope_type_or_types(
+                    hint_tree=hint_tree, type_or_types=hint_child),
+                indent_curr=hint_tree.indent_curr,
+                pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+                pith_curr_var_name=pith_curr_var_name,
+                pith_child_var_name=pith_child_var_name,
+                hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                    hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+            )
+        )
+        return
+    # Else, this child hint is either *NOT* a builtin type *OR* this
+    # configuration defines a time budget.
+
+    # Python expression deeply type-checking *ALL* items of this pith against
+    # this hint.
+    hint_tree.func_curr_code = CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_format(
+        hint_curr_expr=hint_tree.hint_curr_expr,
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_iterable_expr=make_check_budget_iterable_expr(
+            hint_tree=hint_tree, pith_curr_iterable_expr=pith_curr_var_name),
+        pith_curr_var_name=pith_curr_var_name,
+        pith_child_var_name=pith_child_var_name,
+        hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+            hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+    )
+
+def _make_code_sequence_cursor(
+    hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+    '''
+    Python expression deeply type-checking the next slice of items of the
+    current sequence pith against the currently visited sequence hint described
+    by the passed parameters under the amortized full-coverage
+    :attr:`beartype.BeartypeStrategy.Ok` type-checking strategy.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    hint_child_sane : HintSane
+        **Sanified child hint metadata** (i.e., :data:`.HintSane` object)
+        encapsulating the sanification of this child hint to be type-checked.
+
+    See Also
+    --------
+    :data:`beartype._data.check.code.pep.datacodepep484585.CODE_PEP484585_SEQUENCE_CURSOR`
+        Further details.
+    '''
+
+    # Name of a unique local variable storing the value of this parent pith
+    # *BEFORE* modifying the "hint_tree.hint_curr.pith_var_name_index" and thus
+    # this name as well below.
+    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+    # Name of a unique local variable iteratively storing the value of each
+    # item in the next slice of this parent pith.
+    pith_child_var_name = _get_pith_child_var_name(hint_tree)
+
+    # Pass a hidden parameter to this wrapper function exposing a cursor from
+    # which the body of this wrapper localizes the index of the first item of
+    # the next slice of this pith on each call. Note that this cursor is merely
+    # a placeholder shared by all wrappers type-checking this hint under this
+    # configuration, which the make_func_signature() factory subsequently
+    # replaces by a new cursor specific to each such wrapper.
+    hint_tree.func_wrapper_locals[ARG_NAME_CURSOR] = make_cursor()
+
+    # Python expression deeply type-checking the next slice of items of this
+    # pith against this hint.
+    hint_tree.func_curr_code = CODE_PEP484585_SEQUENCE_CURSOR_format(
+        hint_curr_expr=hint_tree.hint_curr_expr,
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_var_name=pith_curr_var_name,
+        pith_child_var_name=pith_child_var_name,
+        hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+            hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+    )
+
+
+def _make_code_sequence_logn(
+    hint_tree: HintTreeCode, hint_child_sane: HintSane) -> None:
+    '''
+    Python expression deeply type-checking a logarithmic number of items of the
+    current sequence pith against the currently visited sequence hint described
+    by the passed parameters under the :math:`O(\\log n)` logarithmic-time
+    :attr:`beartype.BeartypeStrategy.Ologn` type-checking strategy.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    hint_child_sane : HintSane
+        **Sanified child hint metadata** (i.e., :data:`.HintSane` object)
+        encapsulating the sanification of this child hint to be type-checked.
+
+    See Also
+    --------
+    :data:`beartype._data.check.code.pep.datacodepep484585.CODE_PEP484585_SEQUENCE_LOGN`
+        Further details.
+    '''
+
+    # Name of a unique local variable storing the value of this parent pith
+    # *BEFORE* modifying the "hint_tree.hint_curr.pith_var_name_index" and thus
+    # this name as well below.
+    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+    # Names of unique local variables storing the number of items to be sampled
+    # from this parent pith and the stride between those items respectively.
+    #
+    # Note that these names *MUST* be generated before that of the local
+    # variable iteratively storing each sampled item below. Doing so guarantees
+    # that the names of local variables assigned by assignment expressions in
+    # code type-checking each sampled item never collide with the name of that
+    # iteration variable (which PEP 572 prohibits as a syntax error).
+    pith_sample_len_var_name = _get_pith_child_var_name(hint_tree)
+    pith_sample_stride_var_name = _get_pith_child_var_name(hint_tree)
+
+    # Name of a unique local variable iteratively storing the value of each
+    # sampled item of this parent pith.
+    pith_child_var_name = _get_pith_child_var_name(hint_tree)
+
+    # Python expression yielding the 0-based index of the first sampled item of
+    # this parent pith, defined as either...
+    pith_sample_start_expr = (
+        # If this beartype configuration allows randomized type-checking, a
+        # pseudo-random index into the first stratum of this sequence;
+        CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR_format(
+            pith_sample_stride_var_name=pith_sample_stride_var_name)
+        if hint_tree.conf.is_random else
+        # Else, the first index of this sequence.
+        CODE_PEP484585_SEQUENCE_LOGN_NONRANDOM_START_EXPR
+    )
+
+    # Python expression deeply type-checking a logarithmic number of items of
+    # this pith against this hint.
+    hint_tree.func_curr_code = CODE_PEP484585_SEQUENCE_LOGN_format(
+        hint_curr_expr=hint_tree.hint_curr_expr,
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_var_name=pith_curr_var_name,
+        pith_child_var_name=pith_child_var_name,
+        pith_sample_len_var_name=pith_sample_len_var_name,
+        pith_sample_start_expr=pith_sample_start_expr,
+        pith_sample_stride_var_name=pith_sample_stride_var_name,
+        hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+            hint_sane=hint_child_sane, pith_expr=pith_child_var_name),
+    )
+
 # ..................{ PRIVATE ~ getters                      }..................
+def _get_pith_child_var_name(hint_tree: HintTreeCode) -> str:
+    '''
+    Name of a new unique local variable storing the value of a child pith of
+    the current pith, generated by incrementing the integer suffixing the name
+    of the local variable storing the value of the current pith.
+
+    Callers should localize the name of the local variable storing the value of
+    the current pith *before* calling this getter, which modifies that name.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    '''
+
+    # Increment the integer suffixing the name of a unique local variable
+    # storing the value of this child pith *BEFORE* returning this name.
+    hint_tree.hint_curr.pith_var_name_index += 1
+
+    # Return the name of this local variable.
+    return hint_tree.hint_curr.pith_var_name
+
+
 def _get_sequence_pith_child_expr(hint_tree: HintTreeCode) -> str:
     '''
     :pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding
@@ -489,11 +821,11 @@ def _get_sequence_pith_child_expr(hint_tree: HintTreeCode) -> str:
         pith_curr_var_name=hint_tree.hint_curr.pith_var_name)
 
 # ..................{ PRIVATE ~ getters : cause              }..................
-def _get_cause_enumerator_item_collection(
-    cause: HintTreeError) -> EnumeratorItem:
+def _get_cause_enumerator_collection(cause: HintTreeError) -> Enumerator:
     '''
-    2-tuple ``(item_index, item)`` describing the first item of the passed
-    collection satisfying the format of the :func:`enumerate` iterator.
+    Iterator satisfying the :func:`enumerate` protocol over the one or more
+    items of the passed collection that the parent wrapper function could have
+    type-checked in :math:`O(1)` time.
 
     Parameters
     ----------
@@ -502,12 +834,11 @@ def _get_cause_enumerator_item_collection(
 
     Returns
     -------
-    EnumeratorItem
-        2-tuple of the standard form ``(item_index, item)`` returned by the
-        :func:`enumerate` builtin, where:
+    Enumerator
+        Iterator yielding one or more 2-tuples of the standard form
+        ``(item_index, item)`` yielded by the :func:`enumerate` builtin, where:
 
-        * ``item_index`` is the 0-based index of the first item of this
-          collection.
+        * ``item_index`` is the 0-based index of an item of this collection.
         * ``item`` is that item.
     '''
     assert isinstance(cause.pith, Collection), (
@@ -517,21 +848,21 @@ def _get_cause_enumerator_item_collection(
     return (
         # If this cause describes a sequence, a pseudo-random item of this
         # sequence;
-        _get_cause_enumerator_item_sequence(cause)
+        _get_cause_enumerator_sequence(cause)
         if isinstance(cause.pith, Sequence) else
         # Else, this cause does *NOT* describe a sequence. Since this cause
         # describes a collection, this cause *MUST* necessarily describe a
-        # reiterable by elimination. In this case, the first item of this
-        # reiterable.
-        _get_cause_enumerator_item_reiterable(cause)
+        # reiterable by elimination. In this case, one or more pseudo-random
+        # items of this reiterable.
+        _get_cause_enumerator_reiterable(cause)
     )
 
 
-def _get_cause_enumerator_item_reiterable(
-    cause: HintTreeError) -> EnumeratorItem:
+def _get_cause_enumerator_reiterable(cause: HintTreeError) -> Enumerator:
     '''
-    2-tuple ``(item_index, item)`` describing the first item of the passed
-    reiterable satisfying the format of the :func:`enumerate` iterator.
+    Iterator satisfying the :func:`enumerate` protocol over the one or more
+    items of the passed reiterable that the parent wrapper function could have
+    type-checked in :math:`O(1)` time.
 
     Parameters
     ----------
@@ -540,30 +871,50 @@ def _get_cause_enumerator_item_reiterable(
 
     Returns
     -------
-    EnumeratorItem
-        2-tuple of the standard form ``(item_index, item)`` returned by the
-        :func:`enumerate` builtin, where:
+    Enumerator
+        Iterator yielding one or more 2-tuples of the standard form
+        ``(item_index, item)`` yielded by the :func:`enumerate` builtin, where:
 
-        * ``item_index`` is the 0-based index of the first item of this
-          reiterable.
+        * ``item_index`` is the 0-based index of an item of this reiterable.
         * ``item`` is that item.
-    '''
 
-    # First item of this container.
-    item = next(iter(cause.pith))
-
-    # 0-based index of this item for readability purposes.
-    item_index = 0
+    See Also
+    --------
+    :func:`beartype._check.code.coderandom.get_reiterable_item_indices`
+        Further details.
+    '''
 
-    # Return a 2-tuple "(item_index, item)" describing this item.
-    return (item_index, item)
+    # If this beartype configuration prefers deterministic type-checking of
+    # reiterables, return an iterator yielding only the first item of this
+    # reiterable.
+    if not (cause.conf.is_random and cause.conf.is_random_reiterable):
+        return iter(((0, next(iter(cause.pith))),))
+    # Else, this beartype configuration prefers non-deterministic type-checking
+    # of reiterables.
+    assert cause.random_int is not None, (
+        f'Violation cause {repr(cause)} pseudo-random integer is "None".')
+
+    # Tuple of the 0-based indices of the *SAME EXACT ITEMS* of this reiterable
+    # that the body of the parent @beartype-generated wrapper could have
+    # type-checked, sorted in ascending order.
+    item_indices = get_reiterable_item_indices(
+        pith_len=len(cause.pith), random_int=cause.random_int)
+
+    # Return an iterator yielding only these items, iterating over this
+    # reiterable no further than the last such item.
+    return (
+        (item_index, item)
+        for item_index, item in enumerate(
+            islice(cause.pith, item_indices[-1] + 1))
+        if item_index in item_indices
+    )
 
 
-def _get_cause_enumerator_item_sequence(
-    cause: HintTreeError) -> EnumeratorItem:
+def _get_cause_enumerator_sequence(cause: HintTreeError) -> Enumerator:
     '''
-    2-tuple ``(item_index, item)`` describing a pseudo-random item of the passed
-    sequence satisfying the format of the :func:`enumerate` iterator.
+    Iterator satisfying the :func:`enumerate` protocol over the pseudo-random
+    item of the passed sequence that the parent wrapper function type-checked in
+    :math:`O(1)` time.
 
     Parameters
     ----------
@@ -572,9 +923,9 @@ def _get_cause_enumerator_item_sequence(
 
     Returns
     -------
-    EnumeratorItem
-        2-tuple of the standard form ``(item_index, item)`` returned by the
-        :func:`enumerate` builtin, where:
+    Enumerator
+        Iterator yielding exactly one 2-tuple of the standard form
+        ``(item_index, item)`` yielded by the :func:`enumerate` builtin, where:
 
         * ``item_index`` is the 0-based index of a pseudo-random item of this
           sequence.
@@ -600,5 +951,6 @@ def _get_cause_enumerator_item_sequence(
     # Pseudo-random item with this index in this sequence.
     item = cause.pith[item_index]
 
-    # Return a 2-tuple "(item_index, item)" describing this item.
-    return (item_index, item)
+    # Return an iterator yielding only a 2-tuple "(item_index, item)"
+    # describing this item.
+    return iter(((item_index, item),))
@@ -1005,7 +1005,11 @@
 
 #FIXME: [O(n)] Ah-ha! We now know how to implement O(log n) and O(n)
 #type-checking in a scalable manner that preserves @beartype's strong
-#performance guarantees. How? With a timed deadline cutoff. Specifically:
+#performance guarantees. How? With a timed deadline cutoff. Note that the
+#"BeartypeConf.check_budget_ns" option already implements the simpler absolute
+#variant of this design (i.e., a fixed per-type-check deadline polled by the
+#"beartype._check.code.codebudget.iter_check_budget" generator). The relative
+#variant proposed below remains unimplemented. Specifically:
 #* Define a new "BeartypeConf.check_time_max_multiplier" instance variable,
 #  which we've already conveniently documented.
 #* Note this critical formula in the documentation for that variable (with the
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`589`-compliant **typed dictionary type-checking code factories**
+(i.e., low-level callables dynamically generating pure-Python code snippets
+type-checking arbitrary objects against :class:`typing.TypedDict` subclasses).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
+from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._conf.confenum import BeartypeStrategy
+from beartype._data.check.code.datacodename import VAR_NAME_RANDOM_INT
+from beartype._data.check.code.pep.datacodepep589 import (
+    CODE_PEP589_KEY_INDEX_ASSIGN_EXPR_format,
+    CODE_PEP589_KEYS_REQUIRED_format,
+    CODE_PEP589_PREFIX_format,
+    CODE_PEP589_SUFFIX_format,
+    CODE_PEP589_VALUE_format,
+    CODE_PEP589_VALUE_OPTIONAL_EXPR_format,
+    CODE_PEP589_VALUE_PITH_CHILD_EXPR_format,
+    CODE_PEP589_VALUE_SAMPLED_EXPR_format,
+)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from beartype._util.hint.pep.proposal.pep589 import get_hint_pep589_key_table
+from collections.abc import Mapping
+
+# ....................{ FACTORIES                          }....................
+def make_hint_pep589_check_expr(hint_tree: HintTreeCode) -> None:
+    '''
+    Python code snippet type-checking the current pith against the passed
+    :pep:`589`-compliant **typed dictionary** (i.e., :class:`typing.TypedDict`
+    subclass).
+
+    The generated code type-checks that this pith:
+
+    * Is a mapping. By :pep:`589` edict, "any TypedDict type is consistent with
+      Mapping[str, object]."
+    * Contains *all* **required keys** of this typed dictionary.
+    * Maps keys declared by this typed dictionary to values satisfying the
+      value type hints annotating those keys, where:
+
+      * Under the linear-time :attr:`beartype.BeartypeStrategy.On` strategy,
+        the values of *all* declared keys are deeply type-checked.
+      * Under all other strategies, the value of only one declared key is
+        deeply type-checked for each call. If the
+        :attr:`beartype.BeartypeConf.is_random` option is enabled, that key is
+        pseudo-randomly sampled; else, that key is the first declared key.
+
+    Optional keys absent from this pith are silently ignored, as are keys not
+    declared by this typed dictionary. The latter are permitted by the
+    structural subtyping semantics of :pep:`589`, under which dictionaries
+    satisfying a typed dictionary subclass also satisfy that typed dictionary.
+
+    This factory is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator), as the ``hint_tree`` parameter is
+    **context-sensitive** (i.e., contextually depends on context unique to the
+    code being generated for the currently decorated callable).
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints previously discovered
+        by this breadth-first search (BFS).
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # ....................{ LOCALS                         }....................
+    # Typed dictionary, localized for both usability and efficiency.
+    hint = hint_tree.hint_curr.hint_sane.hint
+
+    # Key table precomputed for this typed dictionary by the
+    # reduce_hint_pep589() reducer.
+    hint_keys_required, hint_key_hints = get_hint_pep589_key_table(hint)  # type: ignore[arg-type]
+
+    # Name of the local variable storing the current pith *BEFORE* possibly
+    # modifying the "hint_tree.hint_curr.pith_var_name_index" and thus this
+    # name as well below.
+    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+    # Python expression evaluating to the "Mapping" superclass as a hidden
+    # beartype-specific parameter injected into the signature of this wrapper.
+    hint_tree.hint_curr_expr = add_hints_meta_scope_type_or_types(
+        hint_tree=hint_tree, type_or_types=Mapping)
+
+    # Code type-checking this pith to be a mapping.
+    func_curr_code = CODE_PEP589_PREFIX_format(
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        hint_curr_expr=hint_tree.hint_curr_expr,
+    )
+
+    # ....................{ KEYS                           }....................
+    # If this typed dictionary declares one or more required keys, append code
+    # type-checking this mapping to contain all of these keys.
+    if hint_keys_required:
+        func_curr_code += CODE_PEP589_KEYS_REQUIRED_format(
+            indent_curr=hint_tree.indent_curr,
+            pith_curr_var_name=pith_curr_var_name,
+            hint_keys_required_expr=add_func_scope_attr(
+                attr=hint_keys_required,
+                func_scope=hint_tree.func_wrapper_locals,
+                exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+            ),
+        )
+    # Else, this typed dictionary declares *NO* required keys.
+
+    # ....................{ VALUES                         }....................
+    # List of all 3-tuples "(key_name, is_key_required, hint_child_sane)"
+    # describing each key of this typed dictionary whose value type hint is
+    # unignorable, in declaration order.
+    hint_keys_checked = []
+
+    # For the name and value type hint of each key of this typed dictionary...
+    for key_name, key_hint in hint_key_hints:
+        # Metadata encapsulating the sanification of this value type hint.
+        hint_child_sane = hint_tree.sanify_hint_child(key_hint)  # type: ignore[arg-type]
+
+        # If this value type hint is unignorable, record this key.
+        if hint_child_sane is not HINT_SANE_IGNORABLE:
+            hint_keys_checked.append((
+                key_name, key_name in hint_keys_required, hint_child_sane))
+        # Else, this value type hint is ignorable.
+
+    # True only if the value of only one pseudo-randomly sampled key is to be
+    # deeply type-checked for each call.
+    is_key_sampled = False
+
+    # If this configuration enables a sublinear-time strategy, deeply
+    # type-check the value of only one of these keys. Else, this configuration
+    # enables the linear-time strategy. In this case, deeply type-check the
+    # values of *ALL* of these keys.
+    if hint_tree.conf.strategy is not BeartypeStrategy.On:
+        # If either this configuration prohibits randomized type-checking *OR*
+        # only one such key exists, that key is simply the first such key.
+        if not hint_tree.conf.is_random or len(hint_keys_checked) <= 1:
+            hint_keys_checked = hint_keys_checked[:1]
+        # Else, this configuration allows randomized type-checking *AND* two or
+        # more such keys exist. In this case, pseudo-randomly sample one such
+        # key.
+        else:
+            is_key_sampled = True
+
+            # Instruct the parent wrapper function to generate a pseudo-random
+            # integer.
+            hint_tree.is_var_random_int_needed = True
+
+            # Increment the integer suffixing the name of a unique local
+            # variable storing the 0-based index of the sampled key *BEFORE*
+            # localizing this name below.
+            hint_tree.hint_curr.pith_var_name_index += 1
+
+            # Name of this local variable.
+            pith_key_index_var_name = hint_tree.hint_curr.pith_var_name
+
+            # Python expression assigning the 0-based index of the sampled key
+            # to this local variable, embedded only by the code type-checking
+            # the first such key below. Code type-checking subsequent keys
+            # merely accesses this variable.
+            pith_key_index_expr = CODE_PEP589_KEY_INDEX_ASSIGN_EXPR_format(
+                pith_key_index_var_name=pith_key_index_var_name,
+                random_int=VAR_NAME_RANDOM_INT,
+                hint_keys_len=len(hint_keys_checked),
+            )
+    # Else, this configuration enables the linear-time strategy.
+
+    # For the 0-based index, name, requiredness, and value type hint of each
+    # key to be type-checked...
+    for hint_key_index, (key_name, is_key_required, hint_child_sane) in (
+        enumerate(hint_keys_checked)):
+        # Python expression evaluating to the name of this key, defined as
+        # either...
+        hint_key_expr = (
+            # If this name contains *NO* characters erroneously interpreted as
+            # format fields by subsequent calls to the str.format() method
+            # performed on code type-checking the value of this key, the
+            # string literal evaluating to this name. This is the common case.
+            repr(key_name)
+            if not ('{' in key_name or '}' in key_name) else
+            # Else, this name contains such characters. In this case, a hidden
+            # beartype-specific parameter passing this name.
+            add_func_scope_attr(
+                attr=key_name,
+                func_scope=hint_tree.func_wrapper_locals,
+                exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+            )
+        )
+
+        # Placeholder string to be subsequently replaced by code type-checking
+        # the value of this key against this value type hint.
+        hint_value_code = hint_tree.enqueue_hint_child_sane(
+            hint_sane=hint_child_sane,
+            pith_expr=CODE_PEP589_VALUE_PITH_CHILD_EXPR_format(
+                pith_curr_var_name=pith_curr_var_name,
+                hint_key_expr=hint_key_expr,
+            ),
+        )
+
+        # If this key is optional, type-check this value only if this key is
+        # present.
+        if not is_key_required:
+            hint_value_code = CODE_PEP589_VALUE_OPTIONAL_EXPR_format(
+                hint_key_expr=hint_key_expr,
+                pith_curr_var_name=pith_curr_var_name,
+                hint_value_code=hint_value_code,
+            )
+        # Else, this key is required and thus guaranteed to be present.
+
+        # If one of these keys is pseudo-randomly sampled, type-check this
+        # value only if this key is the sampled key.
+        if is_key_sampled:
+            hint_value_code = CODE_PEP589_VALUE_SAMPLED_EXPR_format(
+                pith_key_index_expr=pith_key_index_expr,  # pyright: ignore
+                hint_key_index=hint_key_index,
+                hint_value_code=hint_value_code,
+            )
+
+            # Subsequent such code merely accesses the local variable assigned
+            # the index of the sampled key by the above code.
+            pith_key_index_expr = pith_key_index_var_name  # pyright: ignore
+        # Else, *NO* key is pseudo-randomly sampled.
+
+        # Append code type-checking this value.
+        func_curr_code += CODE_PEP589_VALUE_format(
+            indent_curr=hint_tree.indent_curr,
+            hint_value_code=hint_value_code,
+        )
+
+    # Code type-checking this pith against this typed dictionary.
+    hint_tree.func_curr_code = (
+        f'{func_curr_code}'
+        f'{CODE_PEP589_SUFFIX_format(indent_curr=hint_tree.indent_curr)}'
+    )
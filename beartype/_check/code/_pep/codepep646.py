@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`646`-compliant **fixed-variadic tuple type-checking code
+factories** (i.e., low-level callables dynamically generating pure-Python code
+snippets type-checking arbitrary objects against :pep:`646`-compliant tuple type
+hints subscripted by an unpacked child hint matching a variable number of items).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.code.codebudget import make_check_budget_iterable_expr
+from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._conf.confenum import BeartypeStrategy
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format)
+from beartype._data.check.code.pep.datacodepep646 import (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_FIXED_CHILD_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_PREFIX_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_SUFFIX_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_ALL_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_ITERABLE_EXPR_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_NONRANDOM_PITH_CHILD_EXPR_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_RANDOM_PITH_CHILD_EXPR_format,
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR_format,
+)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from beartype._util.hint.pep.proposal.pep646.pep484585646tuple import (
+    get_hint_pep646_tuple_fixed_variadic_args)
+from itertools import islice
+
+# ....................{ FACTORIES                          }....................
+def make_hint_pep646_tuple_fixed_variadic_check_expr(
+    hint_tree: HintTreeCode) -> None:
+    '''
+    Python code snippet type-checking the current pith against the passed
+    :pep:`646`-compliant **fixed-variadic tuple hint** (i.e., of the form
+    ``tuple[{hint_prefix_1}, ..., *tuple[{hint_variadic}, ...],
+    {hint_suffix_1}, ...]``).
+
+    The generated code type-checks that this pith:
+
+    * Is a tuple containing at least as many items as fixed child hints
+      subscripting this hint.
+    * Contains leading items *exactly* satisfying the fixed child hints
+      preceding the unpacked child hint subscripting this hint, accessed by
+      non-negative indices.
+    * Contains trailing items *exactly* satisfying the fixed child hints
+      following that unpacked child hint, accessed by negative indices.
+    * Contains **variadic items** (i.e., all remaining items between these
+      leading and trailing items) satisfying the child hint constraining those
+      items, where:
+
+      * Under the linear-time :attr:`beartype.BeartypeStrategy.On` strategy,
+        *all* variadic items are deeply type-checked by iterating over a
+        C-based :func:`itertools.islice` iterator.
+      * Under all other strategies, only one variadic item is deeply
+        type-checked for each call. If the
+        :attr:`beartype.BeartypeConf.is_random` option is enabled, that item is
+        pseudo-randomly sampled; else, that item is the first variadic item.
+
+    The generated code *never* slices this tuple, which would inefficiently
+    copy these items into a new tuple.
+
+    This factory is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator), as the ``hint_tree`` parameter is
+    **context-sensitive** (i.e., contextually depends on context unique to the
+    code being generated for the currently decorated callable).
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints previously discovered
+        by this breadth-first search (BFS).
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # ....................{ LOCALS                         }....................
+    # Fixed-variadic tuple hint, localized for both usability and efficiency.
+    hint = hint_tree.hint_curr.hint_sane.hint
+
+    # Fixed prefix child hints, variadic child hint, and fixed suffix child
+    # hints precomputed for this hint by the reduce_hint_pep646_tuple() reducer.
+    hint_childs_prefix, hint_child_variadic, hint_childs_suffix = (
+        get_hint_pep646_tuple_fixed_variadic_args(hint))
+
+    # Number of fixed prefix and suffix child hints subscripting this hint.
+    hint_childs_prefix_len = len(hint_childs_prefix)
+    hint_childs_suffix_len = len(hint_childs_suffix)
+    hint_childs_fixed_len = hint_childs_prefix_len + hint_childs_suffix_len
+
+    # Name of the local variable storing the current pith *BEFORE* possibly
+    # modifying the "hint_tree.hint_curr.pith_var_name_index" and thus this
+    # name as well below.
+    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+    # Code type-checking this pith to be a tuple of the minimum length.
+    func_curr_code = CODE_PEP646_TUPLE_FIXED_VARIADIC_PREFIX_format(
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_var_name=pith_curr_var_name,
+        hint_childs_fixed_len=hint_childs_fixed_len,
+    )
+
+    # ....................{ FIXED                          }....................
+    # For the index of each fixed item of this pith and the child hint
+    # constraining that item, where the index of each:
+    # * Leading item is a non-negative index from the start of this pith.
+    # * Trailing item is a negative index from the end of this pith.
+    for pith_child_index, hint_child in (
+        *enumerate(hint_childs_prefix),
+        *enumerate(hint_childs_suffix, start=-hint_childs_suffix_len),
+    ):
+        # Metadata encapsulating the sanification of this child hint.
+        hint_child_sane = hint_tree.sanify_hint_child(hint_child)  # type: ignore[arg-type]
+
+        # If this child hint is ignorable, continue to the next.
+        if hint_child_sane is HINT_SANE_IGNORABLE:
+            continue
+        # Else, this child hint is unignorable.
+
+        # Append code deeply type-checking this item against this child hint.
+        func_curr_code += CODE_PEP646_TUPLE_FIXED_VARIADIC_FIXED_CHILD_format(
+            indent_curr=hint_tree.indent_curr,
+            hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                hint_sane=hint_child_sane,
+                pith_expr=(
+                    CODE_PEP484585_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format(
+                        pith_curr_var_name=pith_curr_var_name,
+                        pith_child_index=pith_child_index,
+                    )),
+            ),
+        )
+
+    # ....................{ VARIADIC                       }....................
+    # Metadata encapsulating the sanification of the variadic child hint.
+    hint_child_sane = hint_tree.sanify_hint_child(hint_child_variadic)  # type: ignore[arg-type]
+
+    # If this child hint is unignorable...
+    if hint_child_sane is not HINT_SANE_IGNORABLE:
+        # If this configuration enables the linear-time strategy, append code
+        # deeply type-checking *ALL* variadic items of this pith.
+        if hint_tree.conf.strategy is BeartypeStrategy.On:
+            # Increment the integer suffixing the name of a unique local
+            # variable iteratively storing the value of each variadic item
+            # *BEFORE* localizing this name below.
+            hint_tree.hint_curr.pith_var_name_index += 1
+
+            # Name of this local variable.
+            pith_child_var_name = hint_tree.hint_curr.pith_var_name
+
+            # Python expression evaluating to the itertools.islice() iterator
+            # as a hidden parameter passed to the current wrapper function.
+            islice_expr = add_func_scope_attr(
+                attr=islice,
+                func_scope=hint_tree.func_wrapper_locals,
+                exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+            )
+
+            # Python expression yielding the 0-based index of the first item
+            # following the variadic items of this pith, defined as either...
+            pith_variadic_stop_expr = (
+                # If one or more fixed child hints follow the unpacked child
+                # hint, the index of the first such trailing item;
+                CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR_format(
+                    pith_curr_var_name=pith_curr_var_name,
+                    hint_childs_suffix_len=hint_childs_suffix_len,
+                )
+                if hint_childs_suffix_len else
+                # Else, "None", iterating up to the last item of this pith.
+                'None'
+            )
+
+            # Append code deeply type-checking these items.
+            func_curr_code += (
+                CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_ALL_format(
+                    indent_curr=hint_tree.indent_curr,
+                    pith_child_var_name=pith_child_var_name,
+                    pith_curr_iterable_expr=make_check_budget_iterable_expr(
+                        hint_tree=hint_tree,
+                        pith_curr_iterable_expr=(
+                            CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_ITERABLE_EXPR_format(
+                                islice_expr=islice_expr,
+                                pith_curr_var_name=pith_curr_var_name,
+                                hint_childs_prefix_len=hint_childs_prefix_len,
+                                pith_variadic_stop_expr=pith_variadic_stop_expr,
+                            )),
+                    ),
+                    hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                        hint_sane=hint_child_sane,
+                        pith_expr=pith_child_var_name,
+                    ),
+                ))
+        # Else, this configuration enables a sublinear-time strategy. In this
+        # case, append code deeply type-checking only one variadic item.
+        else:
+            # If this configuration allows randomized type-checking...
+            if hint_tree.conf.is_random:
+                # Instruct the parent wrapper function to generate a
+                # pseudo-random integer.
+                hint_tree.is_var_random_int_needed = True
+
+                # Python expression yielding the value of a pseudo-randomly
+                # indexed variadic item.
+                pith_child_expr = (
+                    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_RANDOM_PITH_CHILD_EXPR_format(
+                        pith_curr_var_name=pith_curr_var_name,
+                        hint_childs_prefix_len=hint_childs_prefix_len,
+                        hint_childs_fixed_len=hint_childs_fixed_len,
+                    ))
+            # Else, this configuration prohibits randomized type-checking. In
+            # this case, a Python expression yielding the value of the first
+            # variadic item.
+            else:
+                pith_child_expr = (
+                    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_NONRANDOM_PITH_CHILD_EXPR_format(
+                        pith_curr_var_name=pith_curr_var_name,
+                        hint_childs_prefix_len=hint_childs_prefix_len,
+                    ))
+
+            # Append code deeply type-checking that item.
+            func_curr_code += CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_format(
+                indent_curr=hint_tree.indent_curr,
+                pith_curr_var_name=pith_curr_var_name,
+                hint_childs_fixed_len=hint_childs_fixed_len,
+                hint_child_placeholder=hint_tree.enqueue_hint_child_sane(
+                    hint_sane=hint_child_sane,
+                    pith_expr=pith_child_expr,
+                ),
+            )
+    # Else, this child hint is ignorable.
+
+    # Code type-checking this pith against this fixed-variadic tuple hint.
+    hint_tree.func_curr_code = (
+        f'{func_curr_code}'
+        f'{CODE_PEP646_TUPLE_FIXED_VARIADIC_SUFFIX_format(indent_curr=hint_tree.indent_curr)}'
+    )
@@ -13,6 +13,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
+from beartype._check.code.codeunion import UnionProfiler
 from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
 from beartype._check.cls.hint.hintsane import (
     HINT_IGNORABLE,
@@ -22,9 +23,14 @@ from beartype._check.cls.hint.hintsane import (
     TupleHintSane,
 )
 from beartype._data.check.code.datacodelen import LINE_RSTRIP_INDEX_OR
+from beartype._data.check.code.datacodename import ARG_NAME_UNION_PROFILER
 from beartype._data.check.code.pep.datacodepep484604 import (
     CODE_PEP484604_UNION_CHILD_PEP_format,
     CODE_PEP484604_UNION_CHILD_NONPEP_format,
+    CODE_PEP484604_UNION_CHILD_NONPEP_EXPR_format,
+    CODE_PEP484604_UNION_PROFILE_CHILD_format,
+    CODE_PEP484604_UNION_PROFILE_PREFIX_format,
+    CODE_PEP484604_UNION_PROFILE_SUFFIX_format,
     CODE_PEP484604_UNION_PREFIX,
     CODE_PEP484604_UNION_SUFFIX,
 )
@@ -196,6 +202,31 @@ def make_hint_pep484604_check_expr(hint_tree: HintTreeCode) -> None:
         else:
             hint_childs_nonpep[hint_child] = None  # type: ignore[index]
 
+    # ....................{ FORMAT ~ profile               }....................
+    # If this configuration reorders union child hints at runtime *AND* this
+    # union has two or more **branches** (i.e., either the single branch
+    # type-checking all PEP-noncompliant child hints or the branch
+    # type-checking a PEP-compliant child hint) whose order is thus meaningful,
+    # generate code profiling these branches and reduce to a noop.
+    if (
+        hint_tree.conf.union_reorder_calls is not None and
+        len(hint_childs_sane_pep) + bool(hint_childs_nonpep) >= 2
+    ):
+        _make_hint_pep484604_check_expr_profiled(
+            hint_tree=hint_tree,
+            hint_childs_nonpep=hint_childs_nonpep,
+            hint_childs_sane_pep=hint_childs_sane_pep,
+        )
+
+        # Release these dictionaries back to their caches.
+        release_instance(hint_childs_nonpep)
+        release_instance(hint_childs_sane_pep)
+
+        # Reduce to a noop.
+        return
+    # Else, this configuration preserves the declared order of union child
+    # hints *OR* this union has only one branch.
+
     # ....................{ FORMAT ~ non-pep               }....................
     # Initialize the code type-checking the current pith against these arguments
     # to the substring prefixing all such code.
@@ -312,6 +343,103 @@ def make_hint_pep484604_check_expr(hint_tree: HintTreeCode) -> None:
         ).format(indent_curr=hint_tree.indent_curr)
     # Else, this snippet is its initial value and thus ignorable.
 
+# ....................{ PRIVATE ~ factories                }....................
+def _make_hint_pep484604_check_expr_profiled(
+    hint_tree: HintTreeCode,
+    hint_childs_nonpep: DictTypeToAny,
+    hint_childs_sane_pep: DictHintSaneToAny,
+) -> None:
+    '''
+    Generate a Python code snippet type-checking the current pith against the
+    current :pep:`484`- or :pep:`604`-compliant union type hint whose child
+    hints are reordered at runtime under the
+    :attr:`beartype.BeartypeConf.union_reorder_calls` option.
+
+    This factory generates one **branch** (i.e., subexpression type-checking
+    the current pith against one or more child hints) for all PEP-noncompliant
+    child hints of this union *and* one branch for each PEP-compliant child hint
+    of this union. Each branch calls the union profiler passed to the current
+    wrapper function when satisfied and is delimited by comments enabling that
+    profiler to later reorder these branches. See the
+    :class:`beartype._check.code.codeunion.UnionProfiler` class for details.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    hint_childs_nonpep : DictTypeToAny
+        Dictionary whose keys are all PEP-noncompliant child hints of this
+        union.
+    hint_childs_sane_pep : DictHintSaneToAny
+        Dictionary whose keys are the sanified metadata of all PEP-compliant
+        child hints of this union.
+    '''
+
+    # Integer uniquely identifying this union in the code type-checking the
+    # current root pith. Since that code is memoized across *ALL* root piths
+    # annotated by the same root hint, this integer is *NOT* unique across those
+    # piths. The profiler thus additionally distinguishes those piths by the
+    # integer subsequently replacing the pith index placeholder embedded in
+    # this code. See make_code_union_pith_check() for details.
+    union_index = hint_tree.union_profiled_count
+    hint_tree.union_profiled_count += 1
+
+    # Expose a placeholder union profiler to the current wrapper function, which
+    # the make_func_signature() factory subsequently replaces by a new profiler
+    # specific to each wrapper embedding this code.
+    hint_tree.func_wrapper_locals[ARG_NAME_UNION_PROFILER] = UnionProfiler(
+        hint_tree.conf.union_reorder_calls)  # type: ignore[arg-type]
+
+    # Initialize the code type-checking the current pith against these child
+    # hints to the substring prefixing all such code, localizing this pith
+    # *BEFORE* all branches. Since these branches are reorderable, the first
+    # branch *CANNOT* localize this pith as in the non-profiled case.
+    hint_tree.func_curr_code = CODE_PEP484604_UNION_PROFILE_PREFIX_format(
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
+    )
+
+    # 0-based index of the next branch to be generated.
+    hint_child_index = 0
+
+    # If this union is subscripted by one or more PEP-noncompliant child hints,
+    # generate one branch type-checking this pith against all such hints.
+    if hint_childs_nonpep:
+        hint_tree.func_curr_code += CODE_PEP484604_UNION_PROFILE_CHILD_format(
+            indent_curr=hint_tree.indent_curr,
+            union_index=union_index,
+            hint_child_index=hint_child_index,
+            hint_child_expr=CODE_PEP484604_UNION_CHILD_NONPEP_EXPR_format(
+                pith_curr_expr=hint_tree.hint_curr.pith_var_name,
+                hint_curr_expr=add_hints_meta_scope_type_or_types(
+                    hint_tree=hint_tree,
+                    type_or_types=hint_childs_nonpep.keys(),
+                ),
+            ),
+        )
+        hint_child_index += 1
+    # Else, this union is subscripted by *NO* PEP-noncompliant child hints.
+
+    # For each PEP-compliant child hint of this union, generate one branch
+    # type-checking this pith against this hint.
+    for hint_child_sane_pep in hint_childs_sane_pep.keys():
+        hint_tree.func_curr_code += CODE_PEP484604_UNION_PROFILE_CHILD_format(
+            indent_curr=hint_tree.indent_curr,
+            union_index=union_index,
+            hint_child_index=hint_child_index,
+            hint_child_expr=hint_tree.enqueue_hint_child_sane(
+                hint_sane=hint_child_sane_pep,
+                pith_expr=hint_tree.hint_curr.pith_var_name,
+            ),
+        )
+        hint_child_index += 1
+
+    # Suffix this code by the substring suffixing all such code.
+    hint_tree.func_curr_code += CODE_PEP484604_UNION_PROFILE_SUFFIX_format(
+        indent_curr=hint_tree.indent_curr, union_index=union_index)
+
 # ....................{ PRIVATE ~ getters                  }....................
 def _get_hint_pep484604_union_args_flattened(
     hint_tree: HintTreeCode) -> TupleHintSane:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`484`- or :pep:`585`-compliant **callable type-checking code
+factories** (i.e., low-level callables dynamically generating pure-Python code
+snippets type-checking arbitrary objects against ``typing.Callable[...]`` and
+``collections.abc.Callable[...]`` type hints under the
+:attr:`beartype.BeartypeConf.is_check_callable_signature` option).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._check.pep.pep484585.checkpep484585callable import (
+    make_func_pep484585_callable_signature_tester)
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_CALLABLE_format)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from beartype._util.hint.pep.utilpepget import (
+    get_hint_pep_origin_type_isinstanceable)
+
+# ....................{ FACTORIES                          }....................
+def make_hint_pep484585_callable_check_expr(hint_tree: HintTreeCode) -> None:
+    '''
+    Python code snippet type-checking the current pith against the passed
+    :pep:`484`- or :pep:`585`-compliant **callable type hint** of the form
+    ``typing.Callable[...]`` or ``collections.abc.Callable[...]``.
+
+    The generated code type-checks that this pith is both callable *and* has a
+    signature compatible with this hint. See the
+    :func:`beartype._check.pep.pep484585.checkpep484585callable.get_func_pep484585_callable_signature_cause_or_none`
+    getter for further details.
+
+    This factory is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator), as the ``hint_tree`` parameter is
+    **context-sensitive** (i.e., contextually depends on context unique to the
+    code being generated for the currently decorated callable).
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints previously discovered
+        by this breadth-first search (BFS).
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # Callable type hint, localized for both usability and efficiency.
+    hint = hint_tree.hint_curr.hint_sane.hint
+
+    # Python expression evaluating to the origin type of this hint (i.e., the
+    # "collections.abc.Callable" protocol) passed to this wrapper function.
+    hint_curr_expr = add_hints_meta_scope_type_or_types(
+        hint_tree=hint_tree,
+        type_or_types=get_hint_pep_origin_type_isinstanceable(hint),
+    )
+
+    # Python expression evaluating to a new callable signature tester specific
+    # to this hint as a hidden parameter passed to this wrapper function.
+    #
+    # Note that the code generated by this factory is memoized across *ALL*
+    # wrapper functions type-checking the same hint under the same
+    # configuration, which then share this tester and thus the cache
+    # underlying this tester. Since the compatibility of a callable with this
+    # hint depends only on that callable and this hint, this is both safe and
+    # desirable.
+    callable_signature_tester_expr = add_func_scope_attr(
+        attr=make_func_pep484585_callable_signature_tester(hint),
+        func_scope=hint_tree.func_wrapper_locals,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Code type-checking this pith against this hint.
+    hint_tree.func_curr_code = CODE_PEP484585_CALLABLE_format(
+        indent_curr=hint_tree.indent_curr,
+        pith_curr_assign_expr=hint_tree.pith_curr_assign_expr,
+        pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
+        hint_curr_expr=hint_curr_expr,
+        callable_signature_tester_expr=callable_signature_tester_expr,
+    )
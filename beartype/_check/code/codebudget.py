@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking time budget utilities** (i.e., low-level callables
+generating and supporting code silently halting type-checks iterating over
+container items once the time budget configured by the
+:attr:`beartype.BeartypeConf.check_budget_ns` option is exhausted).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._data.check.code.datacodeindent import INDENT_LEVEL_TO_CODE
+from beartype._data.check.code.datacodelen import CHECK_BUDGET_ITEMS_PER_POLL
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_CHECK_BUDGET_ITERABLE_EXPR_format,
+    CODE_PEP484585_CHECK_BUDGET_ROOT_format,
+)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from itertools import islice
+from time import perf_counter_ns
+
+# ....................{ PRIVATE ~ globals                  }....................
+_check_budget_exceeded_count = 0
+'''
+Number of type-checks that have exhausted their time budgets (and thus silently
+halted iterating over container items) in the active Python interpreter.
+
+Note that this integer is incremented *without* locking and may thus undercount
+budgets exhausted concurrently by multiple threads. Since this integer is
+intended only for coarse-grained introspection (e.g., tuning budgets), this is
+preferable to the cost of locking.
+'''
+
+
+_check_deadline_ns_exceeded_last = 0
+'''
+Deadline of the type-check that most recently exhausted its time budget.
+
+Since each type-check typically iterates over multiple containers (e.g., the
+nested lists of a ``list[list[int]]`` hint), each of which silently halts once
+that deadline has passed, this deadline enables the :func:`.iter_check_budget`
+generator to record each exhausted budget only once rather than once per halted
+container. Since deadlines are denominated in nanoseconds, distinct type-checks
+almost certainly have distinct deadlines.
+'''
+
+# ....................{ GETTERS                            }....................
+def get_check_budget_exceeded_count() -> int:
+    '''
+    Number of type-checks that have exhausted the time budgets configured by the
+    :attr:`beartype.BeartypeConf.check_budget_ns` option (and thus silently
+    halted iterating over container items) in the active Python interpreter.
+
+    This getter is publicly exported as
+    :func:`beartype.get_check_budget_exceeded_count`, enabling callers to tune
+    that option by comparing this number before and after a workload. Since
+    this number is incremented *without* locking, this number may undercount
+    budgets exhausted concurrently by multiple threads.
+
+    Returns
+    -------
+    int
+        Number of such type-checks.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+       >>> from beartype import (
+       ...     BeartypeConf, BeartypeStrategy, beartype,
+       ...     get_check_budget_exceeded_count)
+       >>> @beartype(conf=BeartypeConf(
+       ...     strategy=BeartypeStrategy.On, check_budget_ns=1))
+       ... def sum_ints(ints: list[int]) -> int: return sum(ints)
+       >>> count_old = get_check_budget_exceeded_count()
+       >>> sum_ints(list(range(1_000_000)))
+       499999500000
+       >>> get_check_budget_exceeded_count() > count_old
+       True
+    '''
+
+    # Return this number. Gosh! Simple things are simple.
+    return _check_budget_exceeded_count
+
+# ....................{ ITERATORS                          }....................
+def iter_check_budget(iterable: Iterable, deadline_ns: int) -> Iterator:
+    '''
+    Generator yielding all items of the passed iterable until the
+    :func:`time.perf_counter_ns` clock passes the passed deadline, at which
+    point this generator silently halts and records that the current type-check
+    exhausted its time budget.
+
+    This generator polls that clock only once per
+    :data:`beartype._data.check.code.datacodelen.CHECK_BUDGET_ITEMS_PER_POLL`
+    items, delegating the iteration of all intermediate items to the C-based
+    :func:`itertools.islice` iterator for efficiency.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        Iterable over the container items to be type-checked.
+    deadline_ns : int
+        Value of the :func:`time.perf_counter_ns` clock after which this
+        generator silently halts.
+
+    Yields
+    ------
+    object
+        Each item of this iterable until this deadline has passed.
+    '''
+
+    # Globals modified below.
+    global _check_budget_exceeded_count, _check_deadline_ns_exceeded_last
+
+    # Iterator over this iterable, shared between the "for" loop and islice()
+    # calls below to avoid redundantly iterating over any item.
+    iterator = iter(iterable)
+
+    # For the first item of each successive chunk of items of this iterable...
+    #
+    # Note that this clock is intentionally polled *BEFORE* yielding each chunk
+    # rather than after. Doing so guarantees that this generator only records
+    # that this budget was exhausted when one or more items remain unvisited.
+    for item in iterator:
+        # If this deadline has passed...
+        if perf_counter_ns() >= deadline_ns:
+            # If this is the first container whose iteration the current
+            # type-check halted, record that this type-check exhausted its time
+            # budget.
+            if deadline_ns != _check_deadline_ns_exceeded_last:
+                _check_deadline_ns_exceeded_last = deadline_ns
+                _check_budget_exceeded_count += 1
+            # Else, a prior container whose iteration the current type-check
+            # halted already recorded this fact.
+
+            # Silently halt.
+            return
+        # Else, this deadline has yet to pass.
+
+        # Yield this item followed by all remaining items of this chunk.
+        yield item
+        yield from islice(iterator, CHECK_BUDGET_ITEMS_PER_POLL - 1)
+
+# ....................{ FACTORIES                          }....................
+def make_check_budget_iterable_expr(
+    hint_tree: HintTreeCode, pith_curr_iterable_expr: str) -> str:
+    '''
+    Python expression yielding an iterable over the items of the current
+    container pith to be type-checked under the :math:`O(n)` linear-time
+    :attr:`beartype.BeartypeStrategy.On` strategy, conditionally depending on
+    the :attr:`beartype.BeartypeConf.check_budget_ns` option of the passed tree.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    pith_curr_iterable_expr : str
+        Python expression yielding the iterable over that pith to be iterated
+        (e.g., the name of the local variable storing that pith for a list or
+        the keys of a mapping, ``f'{pith_curr_var_name}.values()'`` for the
+        values of a mapping).
+
+    Returns
+    -------
+    str
+        Either:
+
+        * If this beartype configuration defines a time budget, an expression
+          wrapping this iterable by the :func:`.iter_check_budget` generator.
+          In this case, this factory also instructs the
+          :func:`beartype._check.code.codemain.make_check_expr` factory to
+          localize the deadline required by that generator.
+        * Else, this iterable as is.
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+    assert isinstance(pith_curr_iterable_expr, str), (
+        f'{repr(pith_curr_iterable_expr)} not string.')
+
+    # If this beartype configuration defines *NO* time budget, return this
+    # iterable as is.
+    if hint_tree.conf.check_budget_ns is None:
+        return pith_curr_iterable_expr
+    # Else, this beartype configuration defines a time budget.
+
+    # Instruct the make_check_expr() factory to localize a deadline.
+    hint_tree.is_var_check_deadline_ns_needed = True
+
+    # Python expression evaluating to the iter_check_budget() generator as a
+    # hidden parameter passed to the current wrapper function.
+    iter_check_budget_expr = add_func_scope_attr(
+        attr=iter_check_budget,
+        func_scope=hint_tree.func_wrapper_locals,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Return an expression wrapping this iterable by that generator.
+    return CODE_PEP484585_CHECK_BUDGET_ITERABLE_EXPR_format(
+        iter_check_budget_expr=iter_check_budget_expr,
+        pith_curr_iterable_expr=pith_curr_iterable_expr,
+    )
+
+
+def make_check_budget_root_code(
+    hint_tree: HintTreeCode, func_root_code: str) -> str:
+    '''
+    Python expression wrapping the passed code type-checking the root pith
+    against the root hint with an assignment expression localizing the deadline
+    required by all prior expressions returned by the
+    :func:`.make_check_budget_iterable_expr` factory.
+
+    Callers should call this factory *only* if the
+    :attr:`.HintTreeCode.is_var_check_deadline_ns_needed` boolean is
+    :data:`True`.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints discovered by this
+        breadth-first search (BFS).
+    func_root_code : str
+        Python expression type-checking the root pith against the root hint.
+
+    Returns
+    -------
+    str
+        Python expression wrapping that expression as described above.
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+    assert hint_tree.conf.check_budget_ns is not None, (
+        f'Beartype configuration {repr(hint_tree.conf)} defines no budget.')
+
+    # Python expression evaluating to the perf_counter_ns() function as a hidden
+    # parameter passed to the current wrapper function.
+    perf_counter_ns_expr = add_func_scope_attr(
+        attr=perf_counter_ns,
+        func_scope=hint_tree.func_wrapper_locals,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Return this expression wrapped as described above.
+    return CODE_PEP484585_CHECK_BUDGET_ROOT_format(
+        check_budget_ns=hint_tree.conf.check_budget_ns,
+        func_root_code=func_root_code,
+        indent_curr=INDENT_LEVEL_TO_CODE[1],
+        perf_counter_ns_expr=perf_counter_ns_expr,
+    )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking cursor utilities** (i.e., low-level callables creating
+the per-wrapper cursors with which type-checking code dynamically generated by
+the :func:`beartype._check.code.codemain.make_check_expr` factory under the
+:attr:`beartype.BeartypeStrategy.Ok` strategy selects the next slice of
+container items to be type-checked).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.check.code.datacodelen import SEQUENCE_CURSOR_SLICE_LEN
+from beartype._data.check.code.datacodename import ARG_NAME_CURSOR
+from beartype._data.typing.datatyping import LexicalScope
+from collections.abc import Iterator
+from itertools import count
+
+# ....................{ FACTORIES                          }....................
+def make_cursor() -> Iterator[int]:
+    '''
+    New **cursor** (i.e., infinite iterator yielding the 0-based index of the
+    first item of the next slice of each sequence to be type-checked by the
+    type-checking wrapper function passed this cursor as a hidden parameter).
+
+    This cursor yields successive multiples of the
+    :data:`beartype._data.check.code.datacodelen.SEQUENCE_CURSOR_SLICE_LEN`
+    integer, such that each call to that wrapper type-checks the slice of each
+    sequence immediately following the slice type-checked by the prior call.
+
+    Returns
+    -------
+    Iterator[int]
+        New :func:`itertools.count` iterator yielding ``0``,
+        ``SEQUENCE_CURSOR_SLICE_LEN``, ``2 * SEQUENCE_CURSOR_SLICE_LEN``, and
+        so on.
+    '''
+
+    # Return a new cursor. Note that the C-based itertools.count() iterator is
+    # both faster and (under the GIL) more thread-safe than any pure-Python
+    # equivalent (e.g., a mutable one-item list incremented on each call).
+    return count(0, SEQUENCE_CURSOR_SLICE_LEN)
+
+# ....................{ SETTERS                            }....................
+def set_func_scope_cursor(func_scope: LexicalScope) -> None:
+    '''
+    Replace the cursor in the passed scope of a type-checking wrapper function
+    to be created by a new cursor specific to that wrapper if that scope
+    contains a cursor *or* silently reduce to a noop otherwise.
+
+    Type-checking expressions and thus the scopes required by those expressions
+    are memoized across *all* wrappers type-checking the same hints under the
+    same beartype configuration. The cursors injected into those scopes by the
+    :func:`beartype._check.code.codemain.make_check_expr` factory are thus
+    shared by all such wrappers. Since each wrapper requires its own cursor,
+    callers are required to call this setter on the mutable copy of that scope
+    specific to each wrapper *before* creating that wrapper.
+
+    Parameters
+    ----------
+    func_scope : LexicalScope
+        Mutable scope of the type-checking wrapper function to be created.
+    '''
+    assert isinstance(func_scope, dict), f'{repr(func_scope)} not dictionary.'
+
+    # If that wrapper requires a cursor, replace the shared cursor in this scope
+    # by a new cursor specific to that wrapper.
+    if ARG_NAME_CURSOR in func_scope:
+        func_scope[ARG_NAME_CURSOR] = make_cursor()
+    # Else, that wrapper requires *NO* cursor.
@@ -46,16 +46,34 @@ from beartype._data.check.code.datacodename import (
 )
 from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
 from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._check.code.codebudget import (
+    make_check_budget_iterable_expr,
+    make_check_budget_root_code,
+)
+from beartype._check.code.codememo import (
+    is_check_memo,
+    make_check_memo_root_code,
+)
+from beartype._check.code.coderandom import (
+    get_conf_getrandbits,
+    make_reiterable_pith_child_expr,
+)
 from beartype._check.code.codescope import add_hints_meta_scope_type_or_types
 from beartype._check.code._pep.pep484.codepep484604union import (
     make_hint_pep484604_check_expr)
+from beartype._check.code._pep.pep484585.codepep484585callable import (
+    make_hint_pep484585_callable_check_expr)
 from beartype._check.code._pep.pep484585.codepep484585container import (
     make_hint_pep484585_container_check_expr)
 from beartype._check.code._pep.pep484585.codepep484585generic import (
     make_hint_pep484585_generic_unsubbed_check_expr)
 from beartype._check.code._pep.pep484585.codepep484585subclass import (
     make_hint_pep484585_subclass_check_expr)
+from beartype._check.code._pep.codepep589 import make_hint_pep589_check_expr
+from beartype._check.code._pep.codepep646 import (
+    make_hint_pep646_tuple_fixed_variadic_check_expr)
 from beartype._check.code.snip.codesnipstr import (
+    CODE_PEP484_INSTANCE_EXACT_format,
     CODE_PEP484_INSTANCE_format,
     CODE_PEP572_PITH_ASSIGN_EXPR_format,
 )
@@ -63,17 +81,20 @@ from beartype._check.cls.call.calldataabc import BeartypeCallDataABC
 from beartype._check.cls.hint.hintsane import HintSane
 from beartype._check.cls.scope.checkexprscope import BeartypeCheckExprScope
 from beartype._conf.confmain import BeartypeConf
+from beartype._conf.confenum import BeartypeStrategy
 from beartype._data.check.code.datacodelen import (
     LINE_RSTRIP_INDEX_AND,
     LINE_RSTRIP_INDEX_OR,
+    PEP586_LITERALS_SET_LEN_MIN,
 )
 from beartype._data.check.code.pep.datacodepep484585 import (
     CODE_PEP484585_MAPPING_format,
     CODE_PEP484585_MAPPING_KEY_ONLY_format,
+    CODE_PEP484585_MAPPING_KEY_ONLY_ALL_format,
     CODE_PEP484585_MAPPING_KEY_VALUE_format,
+    CODE_PEP484585_MAPPING_KEY_VALUE_ALL_format,
     CODE_PEP484585_MAPPING_VALUE_ONLY_format,
-    CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR_format,
-    CODE_PEP484585_MAPPING_VALUE_ONLY_PITH_CHILD_EXPR_format,
+    CODE_PEP484585_MAPPING_VALUE_ONLY_ALL_format,
     CODE_PEP484585_MAPPING_KEY_VALUE_PITH_CHILD_EXPR_format,
     CODE_PEP484585_TUPLE_FIXED_EMPTY_format,
     CODE_PEP484585_TUPLE_FIXED_LEN_format,
@@ -84,6 +105,8 @@ from beartype._data.check.code.pep.datacodepep484585 import (
 )
 from beartype._data.check.code.pep.datacodepep586 import (
     CODE_PEP586_LITERAL_format,
+    CODE_PEP586_LITERALS_ENUM_format,
+    CODE_PEP586_LITERALS_HASHABLE_format,
     CODE_PEP586_PREFIX_format,
     CODE_PEP586_SUFFIX,
 )
@@ -98,17 +121,23 @@ from beartype._data.check.error.dataerrmagic import (
     EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
     EXCEPTION_PREFIX_HINT,
 )
+from beartype._data.cls.datacls import TYPES_BUILTIN_SCALAR
 from beartype._data.typing.datatypingport import Hint
 from beartype._data.hint.sign.datahintsigncls import HintSign
 from beartype._data.hint.sign.datahintsigns import (
     HintSignAnnotated,
+    HintSignCallable,
     HintSignCounter,
     HintSignPep484585GenericUnsubbed,
     HintSignLiteral,
     HintSignPep484585TupleFixed,
+    HintSignPep646TupleFixedVariadic,
     HintSignType,
+    HintSignTypedDict,
 )
 from beartype._data.hint.sign.datahintsignset import (
+    HINT_SIGNS_CHECK_MEMO_SAFE,
+    HINT_SIGNS_CHECK_MEMO_USEFUL,
     HINT_SIGNS_CONTAINER_ARGS_1,
     HINT_SIGNS_MAPPING,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
@@ -119,6 +148,7 @@ from beartype._util.cache.pool.utilcachepoolinstance import (
     acquire_instance,
     release_instance,
 )
+from beartype._util.cls.utilclstest import is_type_final
 from beartype._util.func.utilfuncscope import add_func_scope_attr
 from beartype._util.hint.pep.proposal.pep484585.pep484585args import (
     get_hint_pep484585_arg,
@@ -126,7 +156,11 @@ from beartype._util.hint.pep.proposal.pep484585.pep484585args import (
 )
 from beartype._util.hint.pep.proposal.pep646.pep484585646tuple import (
     is_hint_pep484585646_tuple_empty)
-from beartype._util.hint.pep.proposal.pep586 import get_hint_pep586_literals
+from beartype._util.hint.pep.proposal.pep586 import (
+    get_hint_pep586_literals,
+    is_hint_pep586_literals_enum,
+    is_hint_pep586_literals_hashable,
+)
 from beartype._util.hint.pep.proposal.pep593 import (
     get_hint_pep593_metadata,
     get_hint_pep593_metahint,
@@ -143,7 +177,6 @@ from beartype._util.hint.utilhinttest import die_as_hint_unsupported
 from beartype._util.kind.maplike.utilmapset import update_mapping
 from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextrepr import represent_object
-from random import getrandbits
 
 # ....................{ HINTS                              }....................
 CodeGenerated = tuple[str, BeartypeCheckExprScope]
@@ -514,8 +547,15 @@ def make_check_expr(
                 hint_curr_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE and (
                     # Unsubscripted *OR*...
                     not get_hint_pep_args(hint_curr) or
-                    # Currently unsupported with deep type-checking...
-                    hint_curr_sign not in HINT_SIGNS_SUPPORTED_DEEP
+                    # Currently unsupported with deep type-checking *AND*
+                    # neither...
+                    hint_curr_sign not in HINT_SIGNS_SUPPORTED_DEEP and not (
+                        # A callable type hint *NOR*...
+                        hint_curr_sign is HintSignCallable and
+                        # A configuration type-checking the signatures of
+                        # callables against these hints.
+                        hint_tree.conf.is_check_callable_signature
+                    )
                 )
             ):
             # Then generate trivial code shallowly type-checking the current
@@ -557,6 +597,20 @@ def make_check_expr(
                 # Number of these child hints.
                 hint_childs_len = len(hint_childs)
 
+                # ............{ DEEP ~ memo                        }............
+                # If successful type-checks of piths against this hint are
+                # *NOT* safely memoizable (e.g., due to this hint describing a
+                # mutable container), record this fact.
+                if hint_curr_sign not in HINT_SIGNS_CHECK_MEMO_SAFE:
+                    hint_tree.is_check_memo_safe = False
+                # Else, successful type-checks of piths against this hint are
+                # safely memoizable. In this case, if this hint describes an
+                # immutable container, record that memoizing these type-checks
+                # is more efficient than repeating them.
+                elif hint_curr_sign in HINT_SIGNS_CHECK_MEMO_USEFUL:
+                    hint_tree.is_check_memo_useful = True
+                # Else, this hint describes *NO* immutable container.
+
                 # ............{ DEEP ~ expression                  }............
                 # If the expression yielding the current pith is neither...
                 #
@@ -780,6 +834,20 @@ def make_check_expr(
                     )
                 # Else, this hint is *NOT* a fixed-length tuple.
                 #
+                # ............{ SEQUENCES ~ tuple : fixed-variadic }............
+                # If this hint is a PEP 646-compliant fixed-variadic tuple
+                # (e.g., "tuple[int, *tuple[str, ...], float]"), generate a
+                # Python code snippet type-checking the current pith against
+                # the fixed and variadic items of this tuple.
+                #
+                # Note that the reduce_hint_pep646_tuple() reducer has already
+                # reduced all trivial PEP 646-compliant tuple hints (e.g.,
+                # "tuple[*tuple[str, ...]]", "tuple[int, *tuple[str]]") to
+                # PEP 585-compliant tuple hints handled above.
+                elif hint_curr_sign is HintSignPep646TupleFixedVariadic:
+                    make_hint_pep646_tuple_fixed_variadic_check_expr(hint_tree)
+                # Else, this hint is *NOT* a fixed-variadic tuple.
+                #
                 # ..........{ MAPPINGS                             }............
                 # If this hint is a standard mapping (e.g., "dict[str, int]")...
                 elif hint_curr_sign in HINT_SIGNS_MAPPING:
@@ -972,6 +1040,12 @@ def make_check_expr(
                         # this name as well below.
                         pith_curr_var_name = hint_tree.hint_curr.pith_var_name
 
+                        # True only if this beartype configuration enables the
+                        # linear-time strategy type-checking *ALL* key-value
+                        # pairs of this mapping.
+                        is_strategy_on = (
+                            conf.strategy is BeartypeStrategy.On)
+
                         # If this child key hint is unignorable...
                         if hint_child_sane_key is not HINT_SANE_IGNORABLE:
                             # If this child value hint is also unignorable...
@@ -1013,19 +1087,89 @@ def make_check_expr(
                                     ))
 
                                 # Code deeply type-checking these child key and
-                                # value piths against these hints.
+                                # value piths against these hints, iterating
+                                # over *ALL* keys of this mapping under the
+                                # linear-time strategy.
                                 func_curr_code_key_value = (
-                                    CODE_PEP484585_MAPPING_KEY_VALUE_format(
+                                    (
+                                        CODE_PEP484585_MAPPING_KEY_VALUE_ALL_format
+                                        if is_strategy_on else
+                                        CODE_PEP484585_MAPPING_KEY_VALUE_format
+                                    )(
                                         indent_curr=hint_tree.indent_curr,
                                         pith_key_var_name=pith_key_var_name,  # pyright: ignore
                                         pith_curr_var_name=pith_curr_var_name,
+                                        # Python expression yielding an
+                                        # iterable over *ALL* keys of this
+                                        # mapping, only embedded by the
+                                        # linear-time snippet.
+                                        pith_curr_iterable_expr=(
+                                            make_check_budget_iterable_expr(
+                                                hint_tree=hint_tree,
+                                                pith_curr_iterable_expr=(
+                                                    pith_curr_var_name),
+                                            )
+                                            if is_strategy_on else
+                                            ''
+                                        ),
+                                        # Python expression yielding some key
+                                        # of this mapping. Since the
+                                        # linear-time snippet iterates over
+                                        # *ALL* keys instead, this expression
+                                        # is only embedded by the sublinear-time
+                                        # snippet.
+                                        pith_key_expr=(
+                                            ''
+                                            if is_strategy_on else
+                                            make_reiterable_pith_child_expr(
+                                                hint_tree=hint_tree,
+                                                pith_curr_var_name=(
+                                                    pith_curr_var_name),
+                                                pith_curr_iterable_expr=(
+                                                    pith_curr_var_name),
+                                            )
+                                        ),
                                         hint_key_placeholder=(
                                             hint_key_placeholder),
                                         hint_value_placeholder=(
                                             hint_value_placeholder),
                                     ))
                             # Else, this child value hint is ignorable. In this
-                            # case...
+                            # case, if this configuration enables the
+                            # linear-time strategy...
+                            elif is_strategy_on:
+                                # Increment the integer suffixing the name of a
+                                # unique local variable iteratively storing
+                                # each key of this mapping *BEFORE* localizing
+                                # this name below.
+                                hint_tree.hint_curr.pith_var_name_index += 1
+
+                                # Name of this local variable.
+                                pith_key_var_name = (
+                                    hint_tree.hint_curr.pith_var_name)
+
+                                # Code deeply type-checking *ALL* child key
+                                # piths against this hint.
+                                func_curr_code_key_value = (
+                                    CODE_PEP484585_MAPPING_KEY_ONLY_ALL_format(
+                                        indent_curr=hint_tree.indent_curr,
+                                        pith_curr_iterable_expr=(
+                                            make_check_budget_iterable_expr(
+                                                hint_tree=hint_tree,
+                                                pith_curr_iterable_expr=(
+                                                    pith_curr_var_name),
+                                            )),
+                                        pith_key_var_name=pith_key_var_name,
+                                        hint_key_placeholder=(
+                                            hint_tree.enqueue_hint_child_sane(
+                                                hint_sane=hint_child_sane_key,
+                                                pith_expr=pith_key_var_name,
+                                            )
+                                        ),
+                                    )
+                                )
+                            # Else, this configuration enables a sublinear-time
+                            # strategy. In this case...
                             else:
                                 # Code deeply type-checking only this child key
                                 # pith against this hint.
@@ -1038,9 +1182,12 @@ def make_check_expr(
                                         hint_key_placeholder=(
                                             hint_tree.enqueue_hint_child_sane(
                                                 hint_sane=hint_child_sane_key,
-                                                pith_expr=CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR_format(
+                                                pith_expr=make_reiterable_pith_child_expr(
+                                                    hint_tree=hint_tree,
                                                     pith_curr_var_name=(
                                                         pith_curr_var_name),
+                                                    pith_curr_iterable_expr=(
+                                                        pith_curr_var_name),
                                                 ),
                                             )
                                         ),
@@ -1048,7 +1195,43 @@ def make_check_expr(
                                 )
                         # Else, this child key hint is ignorable. By process
                         # of elimination, this child value hint *MUST* be
-                        # unignorable. In this case...
+                        # unignorable. In this case, if this configuration
+                        # enables the linear-time strategy...
+                        elif is_strategy_on:
+                            # Increment the integer suffixing the name of a
+                            # unique local variable iteratively storing each
+                            # value of this mapping *BEFORE* localizing this
+                            # name below.
+                            hint_tree.hint_curr.pith_var_name_index += 1
+
+                            # Name of this local variable.
+                            pith_value_var_name = (
+                                hint_tree.hint_curr.pith_var_name)
+
+                            # Code deeply type-checking *ALL* child value piths
+                            # against this hint.
+                            func_curr_code_key_value = (
+                                CODE_PEP484585_MAPPING_VALUE_ONLY_ALL_format(
+                                    indent_curr=hint_tree.indent_curr,
+                                    pith_curr_iterable_expr=(
+                                        make_check_budget_iterable_expr(
+                                            hint_tree=hint_tree,
+                                            pith_curr_iterable_expr=(
+                                                f'{pith_curr_var_name}'
+                                                f'.values()'
+                                            ),
+                                        )),
+                                    pith_value_var_name=pith_value_var_name,
+                                    hint_value_placeholder=(
+                                        hint_tree.enqueue_hint_child_sane(
+                                            hint_sane=hint_child_sane_value,
+                                            pith_expr=pith_value_var_name,
+                                        )
+                                    ),
+                                )
+                            )
+                        # Else, this configuration enables a sublinear-time
+                        # strategy. In this case...
                         else:
                             # Code deeply type-checking only this child value
                             # pith against this hint.
@@ -1061,9 +1244,14 @@ def make_check_expr(
                                     hint_value_placeholder=(
                                         hint_tree.enqueue_hint_child_sane(
                                             hint_sane=hint_child_sane_value,
-                                            pith_expr=CODE_PEP484585_MAPPING_VALUE_ONLY_PITH_CHILD_EXPR_format(
+                                            pith_expr=make_reiterable_pith_child_expr(
+                                                hint_tree=hint_tree,
                                                 pith_curr_var_name=(
                                                     pith_curr_var_name),
+                                                pith_curr_iterable_expr=(
+                                                    f'{pith_curr_var_name}'
+                                                    f'.values()'
+                                                ),
                                             ),
                                         )
                                     ),
@@ -1265,6 +1453,16 @@ def make_check_expr(
                     make_hint_pep484585_generic_unsubbed_check_expr(hint_tree)
                 # Else, this hint is *NOT* an unsubscripted generic.
                 #
+                # ............{ CALLABLE                           }............
+                # If this hint is a callable type hint, this configuration
+                # type-checks the signatures of callables against these hints
+                # (as the shallow type-checking branch above would have
+                # otherwise handled this hint). In this case, generate a Python
+                # code snippet type-checking the current pith against this hint.
+                elif hint_curr_sign is HintSignCallable:
+                    make_hint_pep484585_callable_check_expr(hint_tree)
+                # Else, this hint is *NOT* a callable type hint.
+                #
                 # ............{ PEP 484 ~ typing.TypeVar(...)      }............
                 # If this hint is a PEP 484-compliant type variable (i.e.,
                 # "typing.TypeVar" object), this hint is both dependent on and
@@ -1352,53 +1550,121 @@ def make_check_expr(
                             }),
                     )
 
-                    #FIXME: Optimize by refactoring into a "while" loop. *sigh*
-                    # For each literal object subscripting this hint...
-                    for hint_child in hint_childs:
-                        # Generate and append efficient code type-checking
-                        # this data validator by embedding this code as is.
-                        hint_tree.func_curr_code += CODE_PEP586_LITERAL_format(
-                            pith_curr_var_name=hint_tree.hint_curr.pith_var_name,
-                            # Python expression evaluating to this object.
-                            hint_child_expr=add_func_scope_attr(
-                                attr=hint_child,
-                                func_scope=hint_tree.func_wrapper_locals,
-                                exception_prefix=(
-                                    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
-                            ),
-                        )
+                    # True only if this hint is subscripted by enough literal
+                    # objects that hash-based membership in a frozen set of
+                    # these objects outperforms a chain of equality comparisons
+                    # against each of these objects.
+                    is_hint_childs_many = (
+                        len(hint_childs) >= PEP586_LITERALS_SET_LEN_MIN)
+
+                    # If this hint is subscripted by many literal objects that
+                    # are all identity-comparable enumeration members, generate
+                    # and append code testing the membership of the identifier
+                    # of this pith in a frozen set of the identifiers of these
+                    # members.
+                    if (
+                        is_hint_childs_many and
+                        is_hint_pep586_literals_enum(hint_childs)
+                    ):
+                        hint_tree.func_curr_code += (
+                            CODE_PEP586_LITERALS_ENUM_format(
+                                pith_curr_var_name=(
+                                    hint_tree.hint_curr.pith_var_name),
+                                hint_literal_ids_set_expr=add_func_scope_attr(
+                                    attr=frozenset(map(id, hint_childs)),
+                                    func_scope=hint_tree.func_wrapper_locals,
+                                    exception_prefix=(
+                                        EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                ),
+                            ))
+                    # Else, this hint is either subscripted by few literal
+                    # objects *OR* one or more of these objects are *NOT*
+                    # identity-comparable enumeration members.
+                    #
+                    # If this hint is subscripted by many literal objects that
+                    # are all hashable, generate and append code testing the
+                    # membership of this pith in a frozen set of these objects.
+                    elif (
+                        is_hint_childs_many and
+                        is_hint_pep586_literals_hashable(hint_childs)
+                    ):
+                        hint_tree.func_curr_code += (
+                            CODE_PEP586_LITERALS_HASHABLE_format(
+                                pith_curr_var_name=(
+                                    hint_tree.hint_curr.pith_var_name),
+                                hint_literals_set_expr=add_func_scope_attr(
+                                    attr=frozenset(hint_childs),
+                                    func_scope=hint_tree.func_wrapper_locals,
+                                    exception_prefix=(
+                                        EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                ),
+                                hint_literal_types_set_expr=add_func_scope_attr(
+                                    attr=frozenset(
+                                        type(hint_child)
+                                        for hint_child in hint_childs
+                                    ),
+                                    func_scope=hint_tree.func_wrapper_locals,
+                                    exception_prefix=(
+                                        EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                ),
+                                hint_literals_tuple_expr=add_func_scope_attr(
+                                    attr=hint_childs,
+                                    func_scope=hint_tree.func_wrapper_locals,
+                                    exception_prefix=(
+                                        EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                ),
+                            ))
+                    # Else, this hint is either subscripted by few literal
+                    # objects *OR* one or more of these objects are unhashable.
+                    else:
+                        #FIXME: Optimize by refactoring into a "while" loop.
+                        # For each literal object subscripting this hint...
+                        for hint_child in hint_childs:
+                            # Generate and append efficient code type-checking
+                            # this data validator by embedding this code as is.
+                            hint_tree.func_curr_code += (
+                                CODE_PEP586_LITERAL_format(
+                                    pith_curr_var_name=(
+                                        hint_tree.hint_curr.pith_var_name),
+                                    # Python expression evaluating to this
+                                    # object.
+                                    hint_child_expr=add_func_scope_attr(
+                                        attr=hint_child,
+                                        func_scope=(
+                                            hint_tree.func_wrapper_locals),
+                                        exception_prefix=(
+                                            EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                    ),
+                                ))
 
-                    # Munge this code to...
-                    hint_tree.func_curr_code = (
                         # Strip the erroneous " or" suffix appended by the last
                         # child hint from this code.
-                        f'{hint_tree.func_curr_code[:LINE_RSTRIP_INDEX_OR]}'
-                        # Suffix this code by the appropriate substring.
-                        f'{CODE_PEP586_SUFFIX}'
+                        hint_tree.func_curr_code = (
+                            hint_tree.func_curr_code[:LINE_RSTRIP_INDEX_OR])
+
+                    # Suffix this code by the appropriate substring.
+                    hint_tree.func_curr_code = (
+                        f'{hint_tree.func_curr_code}{CODE_PEP586_SUFFIX}'
                     ).format(indent_curr=hint_tree.indent_curr)
                 # Else, this hint is *NOT* a PEP 586-compliant type hint.
                 #
                 # ............{ PEP 589 ~ typing.TypeDict(...)     }............
-                # If this hint is a PEP 589-compliant type hint (i.e., a
-                # subclass of the "typing.TypeDict" superclass), this hint is...
-                #FIXME: *CURRENTLY UNSUPPORTED.* We should eventually generate
-                #proper type-checking code for typed dictionaries. At the
-                #moment, this condition is true only for the single obscure edge
-                #case of typed dictionary generics, resembling:
-                #    class UserTypedDict(TypedDict, Generic[T]): ...
+                # If this hint is a PEP 589-compliant typed dictionary (i.e.,
+                # subclass of the "typing.TypedDict" superclass), generate code
+                # type-checking the current pith against this typed dictionary.
                 #
-                #When such a subclass is used as a type hint, the
-                #get_hint_pep484585_generic_unsubbed_bases_unerased() detects
-                #"TypeDict" to be an extrinsic pseudo-superclass and then yields
-                #both the typed dictionary generic itself (e.g., "UserTypedDict"
-                #above) *AND* "HintSignTypedDict", which then causes this
-                #condition here to be triggered.
+                # Note that this condition is also triggered by typed dictionary
+                # generics, resembling:
+                #    class UserTypedDict(TypedDict, Generic[T]): ...
                 #
-                #This condition will suddenly become relevant when we remove the
-                #reduce_hint_pep589() reducer.
-                #FIXME: Actually, let's hold off on this until we need it! \o/
-                # elif hint_curr_sign is HintSignTypedDict:
-                #     pass
+                # When such a subclass is used as a type hint, the
+                # get_hint_pep484585_generic_unsubbed_bases_unerased() getter
+                # detects "TypeDict" to be an extrinsic pseudo-superclass and
+                # then yields both the typed dictionary generic itself (e.g.,
+                # "UserTypedDict" above) *AND* "HintSignTypedDict", which then
+                # triggers this condition.
+                elif hint_curr_sign is HintSignTypedDict:
+                    make_hint_pep589_check_expr(hint_tree)
                 # ............{ UNSUPPORTED                        }............
                 # Else, this hint is neither shallowly nor deeply supported and
                 # is thus unsupported. Since an exception should have already
@@ -1438,6 +1704,66 @@ def make_check_expr(
             # Python expression evaluating to this type.
             hint_tree.hint_curr_expr = add_hints_meta_scope_type_or_types(
                 hint_tree=hint_tree, type_or_types=hint_curr)
+
+            # If instances of this type are almost always of exactly this type
+            # (e.g., "int", "str") *AND* the current pith is *NOT* already an
+            # assignment expression that would be unsafe to reassign...
+            #
+            # Note that instances of subclasses of this type (e.g., "bool" for
+            # "int") fail the exact-type test generated below *BEFORE* falling
+            # back to isinstance() and are thus type-checked more slowly than
+            # by isinstance() alone (i.e., ~55% slower under CPython 3.11). See
+            # the "CODE_PEP484_INSTANCE_EXACT" snippet for details.
+            if (
+                (
+                    # This type is a builtin scalar type *OR*...
+                    hint_curr in TYPES_BUILTIN_SCALAR or
+                    (
+                        # This type is final *AND*...
+                        is_type_final(hint_curr) and
+                        # The metaclass of this type is the root metaclass,
+                        # whose __instancecheck__() dunder method is
+                        # guaranteed to accept instances of exactly this type.
+                        type(hint_curr) is type
+                    )
+                ) and
+                ':=' not in hint_tree.hint_curr.pith_expr
+            ):
+                # If the current pith is a simple Python identifier, this pith
+                # is already localized. Preserve this pith as is.
+                if hint_tree.hint_curr.pith_expr.isidentifier():
+                    pith_curr_var_name = pith_curr_assign_expr = (
+                        hint_tree.hint_curr.pith_expr)
+                # Else, the current pith is a complex Python expression. In this
+                # case, localize this pith to a unique local variable via an
+                # assignment expression, avoiding evaluating this expression
+                # twice below.
+                else:
+                    # Increment the integer suffixing the name of this variable
+                    # *BEFORE* localizing this name below.
+                    hint_tree.hint_curr.pith_var_name_index += 1
+
+                    # Name of this variable.
+                    pith_curr_var_name = hint_tree.hint_curr.pith_var_name
+
+                    # Assignment expression assigning this pith to this
+                    # variable.
+                    pith_curr_assign_expr = CODE_PEP572_PITH_ASSIGN_EXPR_format(
+                        pith_curr_var_name=pith_curr_var_name,
+                        pith_curr_expr=hint_tree.hint_curr.pith_expr,
+                    )
+
+                # Code type-checking this pith against this type, first testing
+                # whether the type of this pith is exactly this type *BEFORE*
+                # falling back to the more general isinstance() builtin.
+                hint_tree.func_curr_code = CODE_PEP484_INSTANCE_EXACT_format(
+                    pith_curr_assign_expr=pith_curr_assign_expr,
+                    pith_curr_var_name=pith_curr_var_name,
+                    hint_curr_expr=hint_tree.hint_curr_expr,
+                )
+            # Else, instances of this type are commonly instances of subclasses
+            # of this type. In this case, defer to the trivial code snippet
+            # generated below shallowly type-checking this pith.
         # ................{ NON-PEP ~ bad                      }................
         # Else, this hint is neither PEP-compliant *NOR* a class. In this case,
         # raise an exception. Note that:
@@ -1509,12 +1835,29 @@ def make_check_expr(
             f'{EXCEPTION_PREFIX_HINT}{repr(hint_sane)} unchecked.')
     # Else, the breadth-first search above successfully generated code.
 
+    # ..................{ BUDGET                             }..................
+    # If type-checking this hint iterates over container items under a time
+    # budget, wrap this code with code localizing the deadline of that budget.
+    if hint_tree.is_var_check_deadline_ns_needed:
+        func_wrapper_code = make_check_budget_root_code(
+            hint_tree=hint_tree, func_root_code=func_wrapper_code)
+    # Else, type-checking this hint iterates under *NO* time budget.
+
+    # ..................{ MEMO                               }..................
+    # If successful type-checks of the root pith against this hint should be
+    # memoized, wrap this code with code doing so.
+    if is_check_memo(hint_tree):
+        func_wrapper_code = make_check_memo_root_code(
+            hint_tree=hint_tree, func_root_code=func_wrapper_code)
+    # Else, successful type-checks of that pith should *NOT* be memoized.
+
     # ..................{ SCOPE                              }..................
     # If type-checking this hint requires a pseudo-random integer, pass a hidden
-    # parameter to this wrapper function exposing the random.getrandbits()
-    # function required to generate this integer.
+    # parameter to this wrapper function exposing the getrandbits() callable
+    # (possibly seeded by this configuration) required to generate this integer.
     if hint_tree.is_var_random_int_needed:
-        hint_tree.func_wrapper_locals[ARG_NAME_GETRANDBITS] = getrandbits
+        hint_tree.func_wrapper_locals[ARG_NAME_GETRANDBITS] = (
+            get_conf_getrandbits(conf))
     # Else, type-checking this hint requires *NO* pseudo-random integer.
 
     # ..................{ CACHE                              }..................
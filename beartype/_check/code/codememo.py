@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking memoization utilities** (i.e., low-level callables
+generating code memoizing successful type-checks of deeply immutable containers
+under the :attr:`beartype.BeartypeConf.is_check_memo` option).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._conf.confenum import BeartypeStrategy
+from beartype._data.check.code.datacodeindent import INDENT_LEVEL_TO_CODE
+from beartype._data.check.code.datacodelen import CHECK_MEMO_CACHE_SIZE
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_CHECK_MEMO_ROOT_format)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from weakref import WeakValueDictionary
+
+# ....................{ TESTERS                            }....................
+def is_check_memo(hint_tree: HintTreeCode) -> bool:
+    '''
+    :data:`True` only if the code type-checking the root pith against the root
+    hint of the passed queue should memoize successful type-checks of that pith.
+
+    This tester returns :data:`True` only if *all* of the following apply:
+
+    * The :attr:`beartype.BeartypeConf.is_check_memo` option is enabled.
+    * The :attr:`beartype.BeartypeConf.strategy` option is the
+      :attr:`beartype.BeartypeStrategy.On` linear-time strategy. Memoizing
+      successful type-checks under any other strategy would permanently exempt
+      container items that have yet to be type-checked from type-checking.
+    * The :attr:`beartype.BeartypeConf.check_budget_ns` option is :data:`None`,
+      for similar reasons.
+    * Successful type-checks of that pith are safely memoizable *and* memoizing
+      those type-checks is more efficient than repeating them (i.e., the root
+      hint is a deeply immutable container hint like ``tuple[int, ...]``).
+
+    Callers should call this tester only *after* visiting all hints in this
+    queue.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints discovered by this
+        breadth-first search (BFS).
+
+    Returns
+    -------
+    bool
+        :data:`True` only if successful type-checks should be memoized.
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # Beartype configuration configuring this queue, localized for efficiency.
+    conf = hint_tree.conf
+
+    # Return true only if all of the above conditions apply.
+    return (
+        conf.is_check_memo and
+        conf.strategy is BeartypeStrategy.On and
+        conf.check_budget_ns is None and
+        hint_tree.is_check_memo_safe and
+        hint_tree.is_check_memo_useful
+    )
+
+# ....................{ FACTORIES                          }....................
+def make_check_memo_root_code(
+    hint_tree: HintTreeCode, func_root_code: str) -> str:
+    '''
+    Python expression wrapping the passed code type-checking the root pith
+    against the root hint with code memoizing successful type-checks of that
+    pith into a new bounded Least Recently Used (LRU) cache specific to that
+    code.
+
+    Callers should call this factory *only* if the :func:`.is_check_memo`
+    tester returns :data:`True` for the passed queue.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints discovered by this
+        breadth-first search (BFS).
+    func_root_code : str
+        Python expression type-checking the root pith against the root hint.
+
+    Returns
+    -------
+    str
+        Python expression wrapping that expression as described above.
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # Python expression evaluating to a new cache as a hidden parameter passed
+    # to the current wrapper function.
+    #
+    # Note that the expression returned by this factory is memoized across
+    # *ALL* wrapper functions type-checking the same hint under the same
+    # configuration, which then share this cache. Since these functions all
+    # type-check piths identically, this is both safe and desirable.
+    check_memo_cache = CacheLruStrong(CHECK_MEMO_CACHE_SIZE)
+    check_memo_expr = add_func_scope_attr(
+        attr=check_memo_cache,
+        func_scope=hint_tree.func_wrapper_locals,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Register this cache for subsequent introspection.
+    _check_memo_caches[id(check_memo_cache)] = check_memo_cache
+
+    # Return this expression wrapped as described above.
+    return CODE_PEP484585_CHECK_MEMO_ROOT_format(
+        check_memo_expr=check_memo_expr,
+        func_root_code=func_root_code,
+        indent_curr=INDENT_LEVEL_TO_CODE[1],
+    )
+
+# ....................{ PRIVATE ~ globals                  }....................
+_check_memo_caches: WeakValueDictionary[int, CacheLruStrong] = (
+    WeakValueDictionary())
+'''
+**Type-check memoization cache registry** (i.e., weak dictionary mapping from
+the object id of each cache created by the :func:`.make_check_memo_root_code`
+factory to that cache).
+
+This registry weakly refers to these caches, which are instead strongly
+referred to by the type-checking wrapper functions passed these caches as
+hidden parameters. This registry thus never prolongs the lifetimes of these
+caches. This registry enables the
+:func:`beartype._util.cache.utilcacheinfo.cache_info` getter to introspect
+these otherwise wrapper-local caches.
+'''
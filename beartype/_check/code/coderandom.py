@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking pseudo-randomness utilities** (i.e., low-level
+callables generating the pseudo-random integers with which type-checking code
+dynamically generated by the :func:`beartype._check.code.codemain.make_check_expr`
+factory selects container items to be type-checked *and* generating the code
+selecting those items).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ TODO                               }....................
+#FIXME: Consider revisiting the "_BeartypeRNJesus" design sketched in the
+#"beartype._data.check.code.func" subpackage, which proposes replacing the
+#per-call getrandbits() call with a pre-generated buffer of pseudo-random
+#integers (e.g., generated in bulk by NumPy). Under CPython, that is currently
+#*SLOWER* than the status quo. Why? Because the dominant cost of getrandbits()
+#is *NOT* the Mersenne Twister but boxing the resulting integer into a new
+#"int" object -- a cost that buffering merely relocates rather than eliminates.
+#Profiling under CPython shows:
+#* getrandbits(32) from a wrapper-local default parameter: ~56ns per call.
+#* Yielding the next integer from a lazily refilled buffer (e.g., via
+#  chain.from_iterable() over array.tolist() chunks): ~75-80ns per integer,
+#  ~34ns of which is converting that buffer into "int" objects.
+#Only a buffer recycling the *SAME* "int" objects (e.g., itertools.cycle())
+#outperforms getrandbits(), at the unacceptable cost of capping the number of
+#distinct container items ever type-checked to the length of that buffer and
+#thus violating the Coupon Collector guarantee of our O(1) strategy. If a
+#future CPython release (e.g., under free-threading) renders the global
+#generator a contention hotspot, revisit this with per-thread generators.
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.tree.hinttreecode import HintTreeCode
+from beartype._conf.confmain import BeartypeConf
+from beartype._data.check.code.datacodelen import REITERABLE_PREFIX_LEN
+from beartype._data.check.code.pep.datacodepep484585 import (
+    CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format,
+    CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR_format,
+)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from collections.abc import Callable
+from itertools import islice
+from random import (
+    Random,
+    getrandbits,
+)
+
+# ....................{ GETTERS                            }....................
+def get_conf_getrandbits(conf: BeartypeConf) -> Callable[[int], int]:
+    '''
+    **Pseudo-random bit generator** (i.e., callable with the same signature as
+    the standard :func:`random.getrandbits` function) to be passed as a hidden
+    parameter to type-checking wrapper functions generated under the passed
+    beartype configuration.
+
+    Parameters
+    ----------
+    conf : BeartypeConf
+        Beartype configuration configuring this generator.
+
+    Returns
+    -------
+    Callable[[int], int]
+        Either:
+
+        * If this configuration defines the :attr:`.BeartypeConf.random_seed`
+          option, the :meth:`random.Random.getrandbits` method bound to a
+          private generator seeded by that seed.
+        * Else, the :func:`random.getrandbits` function bound to the global
+          generator of the standard :mod:`random` module.
+    '''
+    assert isinstance(conf, BeartypeConf), (
+        f'{repr(conf)} not beartype configuration.')
+
+    # Return either...
+    return (
+        # If this configuration defines *NO* seed, the global generator;
+        getrandbits
+        if conf.random_seed is None else
+        # Else, this configuration defines a seed. In this case, the private
+        # generator seeded by this seed.
+        _get_random_seed_getrandbits(conf.random_seed)
+    )
+
+
+def get_reiterable_item_indices(
+    pith_len: int, random_int: int) -> tuple[int, ...]:
+    '''
+    Tuple of the 0-based indices of all items of a non-empty reiterable with the
+    passed length that the expression returned by the
+    :func:`.make_reiterable_pith_child_expr` factory could have selected given
+    the passed pseudo-random integer, sorted in ascending order.
+
+    That expression selects an item from either *all* items or only the first
+    :data:`.REITERABLE_PREFIX_LEN` items of that reiterable depending on a
+    second pseudo-random integer *not* passed to this getter. This getter thus
+    returns the indices of *both* candidate items, enabling callers raising
+    type-checking violations to consider the same item as that type-checked by
+    the parent wrapper function.
+
+    Parameters
+    ----------
+    pith_len : int
+        Number of items in that reiterable.
+    random_int : int
+        Pseudo-random integer generated by the parent wrapper function.
+
+    Returns
+    -------
+    tuple[int, ...]
+        Tuple of either one or two 0-based indices into that reiterable.
+    '''
+    assert isinstance(pith_len, int), f'{repr(pith_len)} not integer.'
+    assert pith_len > 0, f'{pith_len} <= 0.'
+    assert isinstance(random_int, int), f'{repr(random_int)} not integer.'
+
+    # If this reiterable contains no more items than the number of leading items
+    # preferentially selected from, that expression unconditionally selects an
+    # item from *ALL* items of this reiterable. Return only that index.
+    if pith_len <= REITERABLE_PREFIX_LEN:
+        return (random_int % pith_len,)
+    # Else, this reiterable contains more items than that number.
+
+    # 0-based indices of the items of this reiterable that expression selects
+    # when selecting from only these leading items and from *ALL* items
+    # respectively.
+    item_index_prefix = random_int % REITERABLE_PREFIX_LEN
+    item_index_all = random_int % pith_len
+
+    # Return either...
+    return (
+        # If these indices are the same, only that index;
+        (item_index_prefix,)
+        if item_index_prefix == item_index_all else
+        # Else, both indices in ascending order.
+        (item_index_prefix, item_index_all)
+        if item_index_prefix < item_index_all else
+        (item_index_all, item_index_prefix)
+    )
+
+# ....................{ FACTORIES                          }....................
+def make_reiterable_pith_child_expr(
+    hint_tree: HintTreeCode,
+    pith_curr_var_name: str,
+    pith_curr_iterable_expr: str,
+) -> str:
+    '''
+    Python expression efficiently yielding some item of the current non-empty
+    reiterable pith conditionally depending on the
+    :attr:`beartype.BeartypeConf.is_random` and
+    :attr:`beartype.BeartypeConf.is_random_reiterable` options of the passed
+    tree.
+
+    Parameters
+    ----------
+    hint_tree : HintTreeCode
+        Stack of metadata describing all visitable hints currently discovered by
+        this breadth-first search (BFS).
+    pith_curr_var_name : str
+        Name of the local variable storing the current reiterable pith.
+    pith_curr_iterable_expr : str
+        Python expression yielding the iterable over that pith to be iterated
+        (e.g., ``pith_curr_var_name`` itself for a set or the keys of a mapping,
+        ``f'{pith_curr_var_name}.values()'`` for the values of a mapping).
+
+    Returns
+    -------
+    str
+        Either:
+
+        * If this beartype configuration enables both of these options, an
+          expression yielding a pseudo-random item of that iterable in amortized
+          :math:`O(1)` time. In this case, this factory also instructs the
+          parent wrapper function to generate a pseudo-random integer.
+        * Else, an expression yielding the first item of that iterable.
+
+    See Also
+    --------
+    :data:`beartype._data.check.code.pep.datacodepep484585.CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR`
+        Further details.
+    '''
+    assert isinstance(hint_tree, HintTreeCode), (
+        f'{repr(hint_tree)} not "HintTreeCode" object.')
+
+    # If this beartype configuration prohibits randomized type-checking of
+    # reiterables, return an expression yielding the first item of this
+    # iterable in O(1) time.
+    if not (hint_tree.conf.is_random and hint_tree.conf.is_random_reiterable):
+        return CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format(
+            pith_curr_var_name=pith_curr_iterable_expr)
+    # Else, this beartype configuration allows randomized type-checking of
+    # reiterables.
+
+    # Instruct the parent wrapper function to generate a pseudo-random integer.
+    hint_tree.is_var_random_int_needed = True
+
+    # Python expression evaluating to the itertools.islice() iterator as a
+    # hidden parameter passed to the current wrapper function.
+    islice_expr = add_func_scope_attr(
+        attr=islice,
+        func_scope=hint_tree.func_wrapper_locals,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Return an expression yielding a pseudo-random item of this iterable.
+    return CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR_format(
+        islice_expr=islice_expr,
+        pith_curr_iterable_expr=pith_curr_iterable_expr,
+        pith_curr_var_name=pith_curr_var_name,
+    )
+
+# ....................{ PRIVATE ~ getters                  }....................
+@callable_cached
+def _get_random_seed_getrandbits(random_seed: int) -> Callable[[int], int]:
+    '''
+    :meth:`random.Random.getrandbits` method bound to a private pseudo-random
+    number generator seeded by the passed seed.
+
+    This getter is memoized for efficiency *and* reproducibility. Notably, all
+    beartype configurations passed the same seed share the same generator,
+    whose output then depends *only* on that seed and the order in which
+    type-checking wrapper functions generated under those configurations are
+    called.
+
+    Parameters
+    ----------
+    random_seed : int
+        Seed with which to seed this generator.
+
+    Returns
+    -------
+    Callable[[int], int]
+        :meth:`random.Random.getrandbits` method bound to this generator.
+    '''
+    assert isinstance(random_seed, int), f'{repr(random_seed)} not integer.'
+
+    # Return this method bound to a new generator seeded by this seed.
+    return Random(random_seed).getrandbits
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking function regeneration utilities** (i.e., low-level
+callables and classes regenerating type-checking wrapper functions in-place
+from rewritten code at runtime, as required by runtime profilers passed to those
+wrappers as hidden parameters).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_TYPE_SPECIALIZER,
+    ARG_NAME_UNION_PROFILER,
+)
+from beartype._data.typing.datatyping import LexicalScope
+from beartype._util.func.utilfuncmake import make_func
+from collections.abc import Callable
+from threading import Lock
+from typing import Optional
+
+# ....................{ CLASSES                            }....................
+class FuncRegenerator(object):
+    '''
+    **Type-checking function regenerator** (i.e., object specific to a single
+    type-checking wrapper function, regenerating that wrapper in-place from
+    rewritten code on behalf of the runtime profilers passed to that wrapper as
+    hidden parameters).
+
+    All profilers passed to the same wrapper share the same regenerator, which
+    tracks the most recently regenerated code and local scope of that wrapper.
+    Each profiler thus rewrites the code regenerated by all prior profilers
+    rather than the code originally declaring that wrapper, enabling these
+    profilers to safely compose.
+
+    Each regeneration compiles that rewritten code into a new function and
+    assigns the code object of that function to the :attr:`__code__` dunder
+    attribute of that wrapper. Since that assignment is a single attribute store,
+    callers concurrently calling that wrapper observe either the prior or the
+    regenerated code object but *never* a partially regenerated wrapper.
+
+    Attributes
+    ----------
+    func : Callable
+        Type-checking wrapper function regenerated by this regenerator.
+    func_code : str
+        Code most recently declaring that wrapper.
+    func_name : str
+        Unqualified basename of that wrapper.
+    func_scope : LexicalScope
+        Local scope most recently declaring that wrapper.
+    _lock : Lock
+        Non-reentrant lock serializing regenerations of that wrapper.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # called type-checks.
+    __slots__ = (
+        'func',
+        'func_code',
+        'func_name',
+        'func_scope',
+        '_lock',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+        func: Callable,
+        func_name: str,
+        func_code: str,
+        func_scope: LexicalScope,
+    ) -> None:
+        '''
+        Initialize this function regenerator.
+
+        Parameters
+        ----------
+        func : Callable
+            Type-checking wrapper function to be regenerated.
+        func_name : str
+            Unqualified basename of that wrapper.
+        func_code : str
+            Code declaring that wrapper.
+        func_scope : LexicalScope
+            Local scope of that wrapper. Since the caller typically reuses this
+            scope, this method shallowly copies this scope.
+        '''
+        assert callable(func), f'{repr(func)} uncallable.'
+        assert isinstance(func_name, str), f'{repr(func_name)} not string.'
+        assert isinstance(func_code, str), f'{repr(func_code)} not string.'
+        assert isinstance(func_scope, dict), (
+            f'{repr(func_scope)} not dictionary.')
+
+        # Classify all passed parameters.
+        self.func = func
+        self.func_name = func_name
+        self.func_code = func_code
+        self.func_scope = func_scope.copy()
+
+        # Remove that wrapper from the copy of this scope if the make_func()
+        # factory creating that wrapper added that wrapper to this scope, as
+        # that factory prohibits scopes already defining the function it
+        # creates.
+        self.func_scope.pop(func_name, None)
+
+        # Initialize all remaining instance variables.
+        self._lock = Lock()
+
+    # ..................{ REGENERATORS                       }..................
+    def regenerate(
+        self,
+        func_code_rewriter: Callable[[str], str],
+        func_scope_extra: Optional[LexicalScope] = None,
+    ) -> None:
+        '''
+        Regenerate the wrapper bound to this regenerator from the code most
+        recently declaring that wrapper as rewritten by the passed callable.
+
+        Parameters
+        ----------
+        func_code_rewriter : Callable[[str], str]
+            Callable passed the code most recently declaring that wrapper and
+            returning the rewritten code declaring the regenerated wrapper.
+        func_scope_extra : Optional[LexicalScope], default: None
+            Dictionary mapping from the name to value of each hidden parameter
+            additionally declared by that rewritten code *or* :data:`None` if
+            that code declares *no* additional hidden parameters. Defaults to
+            :data:`None`.
+        '''
+        assert callable(func_code_rewriter), (
+            f'{repr(func_code_rewriter)} uncallable.')
+
+        # Serialize regenerations of this wrapper across threads.
+        with self._lock:
+            # Rewritten code declaring the regenerated wrapper.
+            func_code = func_code_rewriter(self.func_code)
+
+            # Local scope declaring the regenerated wrapper.
+            func_scope = self.func_scope
+            if func_scope_extra:
+                func_scope = {**func_scope, **func_scope_extra}
+            # Else, that code declares *NO* additional hidden parameters.
+
+            # Regenerated wrapper, created in the same global scope as the prior
+            # wrapper.
+            func_regenerated = make_func(
+                func_name=self.func_name,
+                func_code=func_code,
+                func_globals=self.func.__globals__,  # type: ignore[attr-defined]
+                func_locals=func_scope.copy(),
+            )
+
+            # Expose the default values of *ALL* keyword-only hidden parameters
+            # declared by the regenerated wrapper to the prior wrapper *BEFORE*
+            # replacing the code object of the prior wrapper. Since the prior
+            # code object silently ignores default values of parameters it does
+            # not declare, the prior wrapper remains callable in the interim.
+            self.func.__kwdefaults__ = func_regenerated.__kwdefaults__  # type: ignore[attr-defined]
+
+            # Atomically replace the code object of the prior wrapper by that of
+            # the regenerated wrapper.
+            self.func.__code__ = func_regenerated.__code__  # type: ignore[attr-defined]
+
+            # Record this code and scope for subsequent regenerations.
+            self.func_code = func_code
+            self.func_scope = func_scope
+
+# ....................{ SETTERS                            }....................
+def set_func_regenerator(
+    func: Callable,
+    func_name: str,
+    func_code: str,
+    func_scope: LexicalScope,
+) -> None:
+    '''
+    Bind all runtime profilers in the passed scope of the passed type-checking
+    wrapper function to a new regenerator specific to that wrapper if that scope
+    contains one or more such profilers *or* silently reduce to a noop
+    otherwise.
+
+    Callers are required to call this setter immediately *after* creating that
+    wrapper.
+
+    Parameters
+    ----------
+    func : Callable
+        Type-checking wrapper function created from the passed code and scope.
+    func_name : str
+        Unqualified basename of that wrapper.
+    func_code : str
+        Code declaring that wrapper.
+    func_scope : LexicalScope
+        Local scope of that wrapper.
+    '''
+    assert isinstance(func_scope, dict), f'{repr(func_scope)} not dictionary.'
+
+    # Regenerator specific to that wrapper, created only on demand below.
+    func_regenerator = None
+
+    # For the name of each hidden parameter passing a runtime profiler...
+    for arg_name in _ARG_NAMES_PROFILER:
+        # Profiler passed as this parameter if any *OR* "None" otherwise.
+        profiler = func_scope.get(arg_name)
+
+        # If that wrapper is passed this profiler...
+        if profiler is not None:
+            # If no regenerator has been created yet, do so now.
+            if func_regenerator is None:
+                func_regenerator = FuncRegenerator(
+                    func=func,
+                    func_name=func_name,
+                    func_code=func_code,
+                    func_scope=func_scope,
+                )
+            # Else, a regenerator has already been created.
+
+            # Bind this profiler to this regenerator.
+            profiler.bind(func_regenerator)
+        # Else, that wrapper is *NOT* passed this profiler.
+
+# ....................{ PRIVATE ~ globals                  }....................
+_ARG_NAMES_PROFILER = (
+    ARG_NAME_TYPE_SPECIALIZER,
+    ARG_NAME_UNION_PROFILER,
+)
+'''
+Tuple of the names of all hidden parameters passing **runtime profilers**
+(i.e., objects regenerating the type-checking wrapper functions passed those
+objects via the :class:`.FuncRegenerator` class) to those wrappers.
+'''
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type specialization utilities** (i.e., low-level callables and
+classes recording the types of parameters passed to and returns returned from
+type-checking wrapper functions generated under the
+:attr:`beartype.BeartypeConf.specialize_calls` option *and* regenerating those
+wrappers with fast paths specialized to the most frequently observed types).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from abc import ABCMeta
+from beartype._check.code.coderegen import FuncRegenerator
+from beartype._data.check.code.datacodeindent import CODE_INDENT_1
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_TYPE_SPECIALIZED_PREFIX,
+    ARG_NAME_TYPE_SPECIALIZER,
+    VAR_NAME_PITH_ROOT,
+)
+from beartype._data.check.code.func.datacodefunccheck import (
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD_format,
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_PREFIX,
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_format,
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_NOOP,
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_SUFFIX,
+)
+from beartype._data.check.code.func.datacodefuncwrap import (
+    CODE_SIGNATURE_SCOPE_ARG_format)
+from beartype._data.check.error.dataerrmagic import (
+    EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL)
+from beartype._data.hint.sign.datahintsignset import HINT_SIGNS_UNION
+from beartype._data.typing.datatyping import (
+    LexicalScope,
+    TupleTypes,
+)
+from beartype._data.typing.datatypingport import Hint
+from beartype._util.func.utilfuncscope import add_func_scope_attr
+from beartype._util.hint.pep.utilpepget import get_hint_pep_args
+from beartype._util.hint.pep.utilpepsign import get_hint_pep_sign_or_none
+from beartype._util.hint.pep.utilpeptest import is_hint_pep
+from itertools import count
+from re import (
+    Match,
+    compile as re_compile,
+    escape as re_escape,
+)
+from threading import Lock
+from typing import Optional
+
+# ....................{ CLASSES                            }....................
+class TypeSpecializer(object):
+    '''
+    **Type specializer** (i.e., object specific to a single type-checking
+    wrapper function generated under the
+    :attr:`beartype.BeartypeConf.specialize_calls` option, recording the types
+    of the parameters passed to and returns returned from that wrapper *and*
+    regenerating that wrapper with type-checks specialized to the most
+    frequently observed types once sufficiently many such types have been
+    recorded).
+
+    The code type-checking each **specializable pith** (i.e., parameter or
+    return annotated by a type hint reducible to an :func:`isinstance` check
+    against one or more types) calls this specializer *before* type-checking
+    that pith. After :attr:`specialize_calls` such calls for any one such pith,
+    this specializer rewrites the code of that wrapper *without* those calls and
+    with each such type-check prefixed by a ``type(pith) is ObservedType`` guard
+    *and* regenerates that wrapper in-place from that code via the
+    :class:`beartype._check.code.coderegen.FuncRegenerator` bound to this
+    specializer.
+
+    Each guard is generated only if the type most frequently observed for that
+    pith is a subclass of the types that pith is type-checked against, in which
+    case that guard accepts only objects that the original type-check would
+    also accept. Objects failing that guard fall back to the original
+    type-check. Specialization thus never changes which objects violate type
+    hints.
+
+    Attributes
+    ----------
+    specialize_calls : int
+        Number of calls to this specializer for any one pith this specializer
+        counts before regenerating the wrapper bound to this specializer.
+    _check_index_to_hint_types : dict[int, TupleTypes]
+        Dictionary mapping from the integer uniquely identifying each
+        type-check of a specializable pith to the tuple of all types that pith
+        is type-checked against.
+    _check_index_to_type_counts : dict[int, dict[type, int]]
+        Dictionary mapping from the integer uniquely identifying each
+        type-check of a specializable pith to a dictionary mapping from each
+        type observed for that pith to the number of times that type was
+        observed.
+    _func_regenerator : Optional[FuncRegenerator]
+        Regenerator of the wrapper bound to this specializer by the
+        :meth:`bind` method *or* :data:`None` if this specializer is unbound.
+    _is_specialized : bool
+        :data:`True` only if this specializer has already counted
+        :attr:`specialize_calls` calls for any one pith, in which case this
+        specializer ignores all subsequent calls.
+    _lock : Lock
+        Non-reentrant lock guaranteeing that only one thread regenerates that
+        wrapper.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # called type-checks.
+    __slots__ = (
+        'specialize_calls',
+        '_check_index_to_hint_types',
+        '_check_index_to_type_counts',
+        '_func_regenerator',
+        '_is_specialized',
+        '_lock',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, specialize_calls: int) -> None:
+        '''
+        Initialize this type specializer.
+
+        Parameters
+        ----------
+        specialize_calls : int
+            Number of calls for any one pith to be counted before regenerating
+            the wrapper bound to this specializer.
+        '''
+        assert isinstance(specialize_calls, int), (
+            f'{repr(specialize_calls)} not integer.')
+        assert specialize_calls > 0, f'{specialize_calls} <= 0.'
+
+        # Classify all passed parameters.
+        self.specialize_calls = specialize_calls
+
+        # Nullify all remaining instance variables.
+        self._check_index_to_hint_types: dict[int, TupleTypes] = {}
+        self._check_index_to_type_counts: dict[int, dict[type, int]] = {}
+        self._func_regenerator: Optional[FuncRegenerator] = None
+        self._is_specialized = False
+        self._lock = Lock()
+
+    # ..................{ DUNDERS                            }..................
+    def __call__(
+        self, check_index: int, pith: object, hint_types: TupleTypes) -> bool:
+        '''
+        Record the type of the passed pith type-checked by the type-check with
+        the passed identifier against the passed types *and* return
+        :data:`True`.
+
+        Parameters
+        ----------
+        check_index : int
+            Integer uniquely identifying that type-check.
+        pith : object
+            Parameter passed to or return returned from the wrapper bound to
+            this specializer.
+        hint_types : TupleTypes
+            Tuple of all types that type-check is equivalent to an
+            :func:`isinstance` check against.
+
+        Returns
+        -------
+        bool
+            Always :data:`True`, enabling callers to embed calls to this method
+            in boolean expressions type-checking that pith.
+        '''
+
+        # If this specializer has already counted enough calls, silently reduce
+        # to a noop. Although the regenerated wrapper no longer calls this
+        # specializer, calls to that wrapper already in progress still run the
+        # prior code object and thus still call this specializer.
+        if self._is_specialized:
+            return True
+        # Else, this specializer has yet to count enough calls.
+
+        # Dictionary mapping from each type observed for this type-check to the
+        # number of times that type was observed if any *OR* "None" otherwise.
+        type_counts = self._check_index_to_type_counts.get(check_index)
+
+        # If this is the first call for this type-check, record these types.
+        if type_counts is None:
+            type_counts = self._check_index_to_type_counts[check_index] = {}
+            self._check_index_to_hint_types[check_index] = hint_types
+        # Else, this is *NOT* the first call for this type-check.
+
+        # Type of this pith.
+        pith_type = type(pith)
+
+        # Count this type.
+        #
+        # Note that these increments are performed *WITHOUT* locking and may
+        # thus undercount calls performed concurrently by multiple threads.
+        # Since these counts are only heuristics, this is preferable to the
+        # cost of locking.
+        type_counts[pith_type] = type_counts.get(pith_type, 0) + 1
+
+        # If this specializer has now counted enough calls for this type-check
+        # *AND* no other thread is currently regenerating this wrapper,
+        # regenerate this wrapper.
+        if (
+            sum(type_counts.values()) >= self.specialize_calls and
+            self._lock.acquire(blocking=False)
+        ):
+            try:
+                # If no other thread has already regenerated this wrapper...
+                if not self._is_specialized:
+                    # Prevent this specializer from counting further calls
+                    # *BEFORE* regenerating this wrapper.
+                    self._is_specialized = True
+
+                    # If this specializer is bound to a wrapper, regenerate
+                    # that wrapper.
+                    if self._func_regenerator is not None:
+                        self._specialize()
+                    # Else, this specializer is unbound. In this case, silently
+                    # reduce to a noop.
+            finally:
+                self._lock.release()
+        # Else, either this specializer has yet to count enough calls *OR*
+        # another thread is currently regenerating this wrapper.
+
+        # Return true.
+        return True
+
+    # ..................{ BINDERS                            }..................
+    def bind(self, func_regenerator: FuncRegenerator) -> None:
+        '''
+        Bind this specializer to the passed regenerator of the type-checking
+        wrapper function passed this specializer as a hidden parameter.
+
+        Parameters
+        ----------
+        func_regenerator : FuncRegenerator
+            Regenerator of that wrapper.
+        '''
+        assert isinstance(func_regenerator, FuncRegenerator), (
+            f'{repr(func_regenerator)} not function regenerator.')
+
+        # Classify this parameter.
+        self._func_regenerator = func_regenerator
+
+    # ..................{ PRIVATE ~ specializers             }..................
+    def _specialize(self) -> None:
+        '''
+        Regenerate the wrapper bound to this specializer with the type-check of
+        each specializable pith prefixed by a guard accepting the type most
+        frequently observed for that pith *and* without calls to this
+        specializer.
+        '''
+
+        # Dictionary mapping from the name to value of each hidden parameter
+        # passing a specialized type to the regenerated wrapper.
+        func_scope_extra: LexicalScope = {}
+
+        # For the integer uniquely identifying each type-check of a
+        # specializable pith *AND* the types observed for that pith...
+        for check_index, type_counts in (
+            self._check_index_to_type_counts.items()):
+            # Type most frequently observed for this pith.
+            pith_type = max(type_counts, key=type_counts.__getitem__)
+
+            # If this type satisfies this type-check, specialize this
+            # type-check to this type.
+            if issubclass(
+                pith_type, self._check_index_to_hint_types[check_index]):
+                func_scope_extra[
+                    f'{ARG_NAME_TYPE_SPECIALIZED_PREFIX}{check_index}'] = (
+                    pith_type)
+            # Else, this type violates this type-check. In this case, silently
+            # preserve this type-check as is.
+
+        # Regenerate this wrapper.
+        self._func_regenerator.regenerate(  # type: ignore[union-attr]
+            func_code_rewriter=lambda func_code: _specialize_func_code(
+                func_code=func_code, func_scope_extra=func_scope_extra),
+            func_scope_extra=func_scope_extra,
+        )
+
+# ....................{ GETTERS                            }....................
+def get_hint_types_specializable(hint: Hint) -> Optional[TupleTypes]:
+    '''
+    Tuple of all types that type-checking an arbitrary object against the
+    passed type hint is equivalent to an :func:`isinstance` check against if
+    that hint is **specializable** (i.e., if ``type(obj) is cls`` implies that
+    object satisfies that hint for *any* subclass ``cls`` of those types) *or*
+    :data:`None` otherwise.
+
+    Specifically, this getter returns a tuple only if that hint is either a
+    PEP-noncompliant type *or* a union of such types *and* the metaclass of
+    each such type implements the :meth:`type.__instancecheck__` dunder method
+    nominally (i.e., by deferring to :func:`issubclass` against the type of the
+    passed object). This includes the root :class:`type` metaclass and the
+    :class:`abc.ABCMeta` metaclass but excludes metaclasses structurally
+    implementing that method (e.g., that of :pep:`544`-compliant protocols).
+
+    Parameters
+    ----------
+    hint : Hint
+        Type hint to be inspected.
+
+    Returns
+    -------
+    Optional[TupleTypes]
+        Either:
+
+        * If this hint is specializable, the tuple of those types.
+        * Else, :data:`None`.
+    '''
+
+    # If this hint is a PEP-noncompliant type, this hint is that type.
+    if isinstance(hint, type) and not is_hint_pep(hint):
+        hint_types: tuple = (hint,)
+    # Else if this hint is a union, this hint is the child hints of this union.
+    elif get_hint_pep_sign_or_none(hint) in HINT_SIGNS_UNION:
+        hint_types = get_hint_pep_args(hint)
+    # Else, this hint is neither. In this case, this hint is unspecializable.
+    else:
+        return None
+
+    # For each such child hint...
+    for hint_type in hint_types:
+        # If this child hint is either *NOT* a type, a PEP-compliant type, *OR*
+        # a type whose metaclass structurally implements the __instancecheck__()
+        # dunder method, this hint is unspecializable.
+        if not (
+            isinstance(hint_type, type) and
+            not is_hint_pep(hint_type) and
+            _get_type_instancecheck_owner(type(hint_type)) in (
+                _INSTANCECHECK_OWNERS_NOMINAL)
+        ):
+            return None
+        # Else, this child hint is a nominally type-checked type.
+
+    # Return these types.
+    return hint_types
+
+
+def _get_type_instancecheck_owner(cls: type) -> Optional[type]:
+    '''
+    First type in the method-resolution order (MRO) of the passed metaclass
+    defining the :meth:`type.__instancecheck__` dunder method *or* :data:`None`
+    if no such type defines that method.
+
+    Parameters
+    ----------
+    cls : type
+        Metaclass to be inspected.
+
+    Returns
+    -------
+    Optional[type]
+        Type defining that method if any *or* :data:`None` otherwise.
+    '''
+
+    # Return the first such type if any.
+    for cls_base in cls.__mro__:
+        if '__instancecheck__' in cls_base.__dict__:
+            return cls_base
+
+    # Else, return "None".
+    return None
+
+# ....................{ FACTORIES                          }....................
+def make_code_specialize_pith_check(
+    code_expr: str, func_scope: LexicalScope, hint: Hint) -> str:
+    '''
+    Python expression type-checking the current root pith of a type-checking
+    wrapper function, wrapping the passed expression with a call to the type
+    specializer passed to that wrapper if the passed hint is specializable *or*
+    the passed expression as is otherwise.
+
+    Callers should call this factory *only* if the
+    :attr:`beartype.BeartypeConf.specialize_calls` option is enabled.
+
+    Parameters
+    ----------
+    code_expr : str
+        Python expression type-checking the root pith against this hint.
+    func_scope : LexicalScope
+        Mutable local scope of that wrapper.
+    hint : Hint
+        Root type hint annotating the root pith.
+
+    Returns
+    -------
+    str
+        Python expression type-checking the root pith as described above.
+    '''
+
+    # Tuple of all types this hint reduces to if specializable *OR* "None".
+    hint_types = get_hint_types_specializable(hint)
+
+    # If this hint is unspecializable, return this expression as is.
+    if hint_types is None:
+        return code_expr
+    # Else, this hint is specializable.
+
+    # Expose a placeholder type specializer to that wrapper, which the
+    # make_func_signature() factory subsequently replaces by a new type
+    # specializer specific to that wrapper.
+    func_scope[ARG_NAME_TYPE_SPECIALIZER] = _TYPE_SPECIALIZER_PLACEHOLDER
+
+    # Name of the hidden parameter passing these types to that wrapper.
+    hint_types_expr = add_func_scope_attr(
+        attr=hint_types,
+        func_scope=func_scope,
+        exception_prefix=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
+    )
+
+    # Return this expression wrapped as described above.
+    return (
+        CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_format(
+            check_index=next(_check_index_counter),
+            hint_types_expr=hint_types_expr,
+        ) +
+        code_expr +
+        CODE_RAISER_FUNC_PITH_SPECIALIZE_SUFFIX
+    )
+
+# ....................{ SETTERS                            }....................
+def set_func_scope_type_specializer(
+    func_scope: LexicalScope, specialize_calls: Optional[int]) -> None:
+    '''
+    Replace the type specializer in the passed scope of a type-checking wrapper
+    function to be created by a new type specializer specific to that wrapper if
+    that scope contains a type specializer *or* silently reduce to a noop
+    otherwise.
+
+    Parameters
+    ----------
+    func_scope : LexicalScope
+        Mutable scope of the type-checking wrapper function to be created.
+    specialize_calls : Optional[int]
+        Value of the :attr:`beartype.BeartypeConf.specialize_calls` option
+        configuring that wrapper.
+    '''
+    assert isinstance(func_scope, dict), f'{repr(func_scope)} not dictionary.'
+
+    # If that wrapper requires a type specializer, replace the placeholder
+    # specializer in this scope by a new specializer specific to that wrapper.
+    if ARG_NAME_TYPE_SPECIALIZER in func_scope:
+        func_scope[ARG_NAME_TYPE_SPECIALIZER] = TypeSpecializer(
+            specialize_calls)  # type: ignore[arg-type]
+    # Else, that wrapper requires *NO* type specializer.
+
+# ....................{ PRIVATE ~ factories                }....................
+def _specialize_func_code(
+    func_code: str, func_scope_extra: LexicalScope) -> str:
+    '''
+    Passed code declaring a type-checking wrapper function with each call to
+    the type specializer passed to that wrapper replaced by either a guard
+    accepting the specialized type passed by the passed scope for that
+    type-check *or* nothing if that scope passes no such type.
+
+    Parameters
+    ----------
+    func_code : str
+        Code most recently declaring that wrapper.
+    func_scope_extra : LexicalScope
+        Dictionary mapping from the name to value of each hidden parameter
+        passing a specialized type to the regenerated wrapper.
+
+    Returns
+    -------
+    str
+        Specialized code declaring that wrapper.
+    '''
+
+    def _specialize_check(check_match: Match) -> str:
+        '''
+        Code replacing the call to the type specializer matched by the passed
+        match.
+        '''
+
+        # Integer uniquely identifying this type-check.
+        check_index = check_match.group(1)
+
+        # Return either a guard accepting the specialized type of this
+        # type-check if any *OR* a noop otherwise.
+        return (
+            CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD_format(
+                check_index=check_index)
+            if f'{ARG_NAME_TYPE_SPECIALIZED_PREFIX}{check_index}' in (
+                func_scope_extra) else
+            CODE_RAISER_FUNC_PITH_SPECIALIZE_NOOP
+        )
+
+    # Replace each call to the type specializer.
+    func_code = _SPECIALIZE_HOOK_REGEX.sub(_specialize_check, func_code)
+
+    # If the regenerated wrapper is passed one or more specialized types...
+    if func_scope_extra:
+        # Code declaring the hidden parameters passing these types, inserted
+        # immediately before the variadic keyword parameter terminating the
+        # signature of that wrapper.
+        code_signature_kwargs = f'{CODE_INDENT_1}**kwargs\n)'
+        assert code_signature_kwargs in func_code, (
+            f'Wrapper signature not terminated by "**kwargs":\n{func_code}')
+        func_code = func_code.replace(
+            code_signature_kwargs,
+            ''.join(
+                CODE_SIGNATURE_SCOPE_ARG_format(arg_name=arg_name, arg_comment='')
+                for arg_name in func_scope_extra
+            ) + code_signature_kwargs,
+            1,
+        )
+    # Else, the regenerated wrapper is passed *NO* specialized types.
+
+    # Return this specialized code.
+    return func_code
+
+# ....................{ PRIVATE ~ globals                  }....................
+_SPECIALIZE_HOOK_REGEX = re_compile(
+    f'{re_escape(CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_PREFIX)}'
+    f'{re_escape(ARG_NAME_TYPE_SPECIALIZER)}'
+    f'\\((\\d+), {re_escape(VAR_NAME_PITH_ROOT)}, \\w+\\) and \\('
+)
+'''
+Compiled regular expression matching each call to the type specializer embedded
+in the code of a type-checking wrapper function by the
+:data:`beartype._data.check.code.func.datacodefunccheck.CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK`
+snippet, whose first group captures the integer uniquely identifying that
+type-check.
+'''
+
+
+_INSTANCECHECK_OWNERS_NOMINAL = frozenset((type, ABCMeta))
+'''
+Frozen set of all metaclasses nominally defining the
+:meth:`type.__instancecheck__` dunder method.
+'''
+
+
+_TYPE_SPECIALIZER_PLACEHOLDER = TypeSpecializer(1)
+'''
+Placeholder type specializer exposed to the scopes of type-checking expressions,
+replaced by a new type specializer specific to each wrapper by the
+:func:`.set_func_scope_type_specializer` setter.
+'''
+
+
+_check_index_counter = count()
+'''
+Iterator yielding integers uniquely identifying type-checks of specializable
+piths.
+'''
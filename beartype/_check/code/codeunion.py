@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **union profiling utilities** (i.e., low-level callables and classes
+profiling which child hints of union type hints are satisfied by the objects
+passed to type-checking wrapper functions generated under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option *and* regenerating
+those wrappers with those child hints reordered accordingly).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.code.coderegen import FuncRegenerator
+from beartype._data.check.code.datacodename import ARG_NAME_UNION_PROFILER
+from beartype._data.check.code.pep.datacodepep484604 import (
+    CODE_PEP484604_UNION_PROFILE_HOOK_PREFIX,
+    CODE_PEP484604_UNION_PROFILE_MARKER,
+    CODE_PEP484604_UNION_PROFILE_MARKER_END,
+    CODE_PEP484604_UNION_PROFILE_PITH_INDEX_PLACEHOLDER,
+    CODE_PEP484604_UNION_REORDERED_CHILD_SUFFIX,
+)
+from beartype._data.typing.datatyping import LexicalScope
+from collections.abc import Iterator
+from itertools import count
+from threading import Lock
+from typing import Optional
+
+# ....................{ CLASSES                            }....................
+class UnionProfiler(object):
+    '''
+    **Union profiler** (i.e., object specific to a single type-checking wrapper
+    function generated under the :attr:`beartype.BeartypeConf.union_reorder_calls`
+    option, counting which child hints of the unions type-checked by that
+    wrapper are satisfied by the objects passed to that wrapper *and*
+    regenerating that wrapper with those child hints reordered from most to
+    least frequently satisfied once sufficiently many such objects have been
+    counted).
+
+    The code type-checking each child hint of each such union calls this
+    profiler when that child hint is satisfied. After :attr:`reorder_calls`
+    such calls, this profiler rewrites the code of that wrapper *without* those
+    calls and with the code type-checking the child hints of each such union
+    reordered *and* regenerates that wrapper in-place from that code via the
+    :class:`beartype._check.code.coderegen.FuncRegenerator` bound to this
+    profiler.
+
+    Attributes
+    ----------
+    reorder_calls : int
+        Number of satisfied child hints this profiler counts before
+        regenerating the wrapper bound to this profiler.
+    _calls : int
+        Number of satisfied child hints this profiler has counted thus far.
+    _func_regenerator : Optional[FuncRegenerator]
+        Regenerator of the wrapper bound to this profiler by the :meth:`bind`
+        method *or* :data:`None` if this profiler is unbound.
+    _hint_child_counts : dict[tuple[int, int, int], int]
+        Dictionary mapping from each 3-tuple ``(pith_index, union_index,
+        hint_child_index)`` of the integer uniquely identifying a root pith
+        type-checked by that wrapper, the integer uniquely identifying a union
+        in the code type-checking that pith, and the 0-based index of a child
+        hint of that union to the number of objects satisfying that child hint.
+        Since the same union annotating different root piths (e.g., two
+        parameters annotated by the same union) is keyed by different pith
+        indices, the child hints of that union are profiled and reordered
+        independently for each such pith.
+    _is_reordered : bool
+        :data:`True` only if this profiler has already counted
+        :attr:`reorder_calls` satisfied child hints, in which case this
+        profiler ignores all subsequent calls.
+    _lock : Lock
+        Non-reentrant lock guaranteeing that only one thread regenerates that
+        wrapper.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # called type-checks.
+    __slots__ = (
+        'reorder_calls',
+        '_calls',
+        '_func_regenerator',
+        '_hint_child_counts',
+        '_is_reordered',
+        '_lock',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, reorder_calls: int) -> None:
+        '''
+        Initialize this union profiler.
+
+        Parameters
+        ----------
+        reorder_calls : int
+            Number of satisfied child hints to be counted before regenerating
+            the wrapper bound to this profiler.
+        '''
+        assert isinstance(reorder_calls, int), (
+            f'{repr(reorder_calls)} not integer.')
+        assert reorder_calls > 0, f'{reorder_calls} <= 0.'
+
+        # Classify all passed parameters.
+        self.reorder_calls = reorder_calls
+
+        # Nullify all remaining instance variables.
+        self._calls = 0
+        self._func_regenerator: Optional[FuncRegenerator] = None
+        self._hint_child_counts: dict[tuple[int, int, int], int] = {}
+        self._is_reordered = False
+        self._lock = Lock()
+
+    # ..................{ DUNDERS                            }..................
+    def __call__(
+        self, pith_index: int, union_index: int, hint_child_index: int) -> bool:
+        '''
+        Record that an object passed to the wrapper bound to this profiler
+        satisfies the child hint with the passed index of the union with the
+        passed identifier type-checked against the root pith with the passed
+        identifier *and* return :data:`True`.
+
+        Parameters
+        ----------
+        pith_index : int
+            Integer uniquely identifying that root pith.
+        union_index : int
+            Integer uniquely identifying that union in the code type-checking
+            that root pith.
+        hint_child_index : int
+            0-based index of that child hint in the declared order of the child
+            hints of that union.
+
+        Returns
+        -------
+        bool
+            Always :data:`True`, enabling callers to embed calls to this method
+            in boolean expressions type-checking that child hint.
+        '''
+
+        # If this profiler has already counted enough calls, silently reduce
+        # to a noop. Although the regenerated wrapper no longer calls this
+        # profiler, calls to that wrapper already in progress still run the
+        # prior code object and thus still call this profiler.
+        if self._is_reordered:
+            return True
+        # Else, this profiler has yet to count enough calls.
+
+        # 3-tuple identifying this child hint.
+        hint_child_key = (pith_index, union_index, hint_child_index)
+
+        # Count this call.
+        #
+        # Note that these increments are performed *WITHOUT* locking and may
+        # thus undercount calls performed concurrently by multiple threads.
+        # Since these counts are only heuristics, this is preferable to the
+        # cost of locking.
+        self._hint_child_counts[hint_child_key] = (
+            self._hint_child_counts.get(hint_child_key, 0) + 1)
+        self._calls += 1
+
+        # If this profiler has now counted enough calls *AND* no other thread is
+        # currently regenerating this wrapper, regenerate this wrapper.
+        if (
+            self._calls >= self.reorder_calls and
+            self._lock.acquire(blocking=False)
+        ):
+            try:
+                # If no other thread has already regenerated this wrapper...
+                if not self._is_reordered:
+                    # Prevent this profiler from counting further calls
+                    # *BEFORE* regenerating this wrapper.
+                    self._is_reordered = True
+
+                    # If this profiler is bound to a wrapper, regenerate
+                    # that wrapper.
+                    if self._func_regenerator is not None:
+                        self._func_regenerator.regenerate(self._reorder)
+                    # Else, this profiler is unbound. In this case, silently
+                    # reduce to a noop.
+            finally:
+                self._lock.release()
+        # Else, either this profiler has yet to count enough calls *OR* another
+        # thread is currently regenerating this wrapper.
+
+        # Return true.
+        return True
+
+    # ..................{ BINDERS                            }..................
+    def bind(self, func_regenerator: FuncRegenerator) -> None:
+        '''
+        Bind this profiler to the passed regenerator of the type-checking
+        wrapper function passed this profiler as a hidden parameter.
+
+        Parameters
+        ----------
+        func_regenerator : FuncRegenerator
+            Regenerator of that wrapper.
+        '''
+        assert isinstance(func_regenerator, FuncRegenerator), (
+            f'{repr(func_regenerator)} not function regenerator.')
+
+        # Classify this parameter.
+        self._func_regenerator = func_regenerator
+
+    # ..................{ PRIVATE ~ reorderers               }..................
+    def _reorder(self, func_code: str) -> str:
+        '''
+        Passed code declaring the wrapper bound to this profiler with the code
+        type-checking the child hints of each union type-checked by that wrapper
+        reordered from most to least frequently satisfied *and* without calls to
+        this profiler.
+
+        Parameters
+        ----------
+        func_code : str
+            Code most recently declaring that wrapper.
+
+        Returns
+        -------
+        str
+            Reordered code declaring that wrapper.
+        '''
+
+        # Iterator over all lines of this code.
+        func_lines = iter(func_code.split('\n'))
+
+        # List of all reordered lines of this code *AND* the line terminating
+        # this code, which is "None" as this code terminates at the last line.
+        func_lines_reordered, func_line_last = self._reorder_lines(func_lines)
+        assert func_line_last is None, (
+            f'Union profiler hook or terminator {repr(func_line_last)} '
+            f'unbalanced in wrapper:\n{func_code}'
+        )
+
+        # Return this reordered code.
+        return '\n'.join(func_lines_reordered)
+
+
+    def _reorder_lines(
+        self, func_lines: Iterator[str]) -> tuple[list[str], Optional[str]]:
+        '''
+        2-tuple ``(lines_reordered, line_last)`` of the reordered lines of code
+        consumed from the passed iterator up to (but excluding) the next line
+        terminating the code type-checking the current child hint of the
+        current union *and* that line.
+
+        Specifically, this method consumes lines from this iterator until
+        either:
+
+        * A line calling this profiler (i.e., terminating the code type-checking
+          a child hint of a union) *or* a line terminating the code
+          type-checking *all* child hints of a union is consumed, in which case
+          this method returns that line as ``line_last``.
+        * This iterator is exhausted, in which case ``line_last`` is
+          :data:`None`.
+
+        Each line beginning the code type-checking a nested union consumed
+        along the way is replaced by the reordered code type-checking the child
+        hints of that union.
+
+        Parameters
+        ----------
+        func_lines : Iterator[str]
+            Iterator over the remaining lines of the code declaring the wrapper
+            bound to this profiler.
+
+        Returns
+        -------
+        tuple[list[str], Optional[str]]
+            2-tuple ``(lines_reordered, line_last)`` as described above.
+        '''
+
+        # List of all reordered lines consumed thus far.
+        lines_reordered: list[str] = []
+
+        # For each remaining line...
+        for func_line in func_lines:
+            # This line stripped of leading indentation.
+            func_line_code = func_line.lstrip()
+
+            # If this line terminates the code type-checking either the current
+            # child hint or *ALL* child hints of the current union, halt.
+            if func_line_code.startswith((
+                CODE_PEP484604_UNION_PROFILE_HOOK_PREFIX,
+                CODE_PEP484604_UNION_PROFILE_MARKER_END,
+            )):
+                return (lines_reordered, func_line)
+            # Else if this line begins the code type-checking the child hints of
+            # a union, replace that code by that code reordered.
+            elif func_line_code.startswith(CODE_PEP484604_UNION_PROFILE_MARKER):
+                lines_reordered.extend(self._reorder_union(
+                    func_lines=func_lines,
+                    union_key=func_line_code[
+                        len(CODE_PEP484604_UNION_PROFILE_MARKER):],
+                ))
+            # Else, this line is unrelated to unions. Preserve this line as is.
+            else:
+                lines_reordered.append(func_line)
+
+        # Return these lines, signifying that these lines terminate this code.
+        return (lines_reordered, None)
+
+
+    def _reorder_union(
+        self, func_lines: Iterator[str], union_key: str) -> list[str]:
+        '''
+        List of the lines of code type-checking the child hints of the union
+        with the passed key consumed from the passed iterator, reordered from
+        most to least frequently satisfied *and* without calls to this profiler.
+
+        Callers are expected to have already consumed the line beginning the
+        code type-checking the first child hint of this union. This method then
+        consumes all remaining lines of the code type-checking the child hints
+        of this union up to and including the line terminating that code.
+
+        Parameters
+        ----------
+        func_lines : Iterator[str]
+            Iterator over the remaining lines of the code declaring the wrapper
+            bound to this profiler.
+        union_key : str
+            Substring of the form ``{pith_index}:{union_index}`` uniquely
+            identifying this union.
+
+        Returns
+        -------
+        list[str]
+            Reordered lines type-checking the child hints of this union.
+        '''
+
+        # 2-tuple of the integers uniquely identifying the root pith and this
+        # union in the code type-checking that pith.
+        pith_index_str, _, union_index_str = union_key.partition(':')
+        pith_index = int(pith_index_str)
+        union_index = int(union_index_str)
+
+        # List of the lines type-checking each child hint of this union in the
+        # declared order of those hints, each suffixed by the operator chaining
+        # that code to the code type-checking the next child hint.
+        hint_childs_lines: list[list[str]] = []
+
+        # Line terminating the code type-checking the current child hint.
+        func_line_last: Optional[str] = None
+
+        # While the line terminating the code type-checking all child hints of
+        # this union has yet to be consumed...
+        while True:
+            # Reordered lines type-checking the current child hint *AND* the
+            # line calling this profiler terminating those lines.
+            hint_child_lines, func_line_last = self._reorder_lines(func_lines)
+            assert (
+                func_line_last is not None and
+                func_line_last.lstrip().startswith(
+                    CODE_PEP484604_UNION_PROFILE_HOOK_PREFIX)
+            ), (
+                f'Union {union_key} child hint {len(hint_childs_lines)} '
+                f'unterminated by profiler hook: {repr(func_line_last)}'
+            )
+
+            # Replace the call to this profiler by the operator that call was
+            # suffixed by, preserving the indentation of that call.
+            hint_child_lines.append(
+                func_line_last[:len(func_line_last) - len(
+                    func_line_last.lstrip())] +
+                CODE_PEP484604_UNION_REORDERED_CHILD_SUFFIX
+            )
+            hint_childs_lines.append(hint_child_lines)
+
+            # Line following these lines, which either begins the code
+            # type-checking the next child hint *OR* terminates the code
+            # type-checking all child hints of this union.
+            func_line_last = next(func_lines).lstrip()
+
+            # If that line terminates all such code, halt.
+            if func_line_last.startswith(
+                CODE_PEP484604_UNION_PROFILE_MARKER_END):
+                break
+            # Else, that line begins the code type-checking the next child hint.
+            assert func_line_last.startswith(
+                CODE_PEP484604_UNION_PROFILE_MARKER), (
+                f'Union {union_key} child hint {len(hint_childs_lines)} '
+                f'unprefixed by marker: {repr(func_line_last)}'
+            )
+
+        # Dictionary mapping from child hint key to satisfaction count.
+        hint_child_counts = self._hint_child_counts
+
+        # List of the indices of these child hints sorted by descending
+        # satisfaction count. Since sorting is stable, child hints satisfied
+        # equally often preserve their declared order.
+        hint_childs_index = sorted(
+            range(len(hint_childs_lines)),
+            key=lambda hint_child_index: -hint_child_counts.get(
+                (pith_index, union_index, hint_child_index), 0),
+        )
+
+        # Return the concatenation of the lines type-checking these child hints
+        # in this order.
+        return [
+            hint_child_line
+            for hint_child_index in hint_childs_index
+            for hint_child_line in hint_childs_lines[hint_child_index]
+        ]
+
+# ....................{ FACTORIES                          }....................
+def make_code_union_pith_check(code_expr: str) -> str:
+    '''
+    Python expression type-checking a root pith of a type-checking wrapper
+    function, replacing all pith index placeholders embedded in the passed
+    expression by a new integer uniquely identifying that pith.
+
+    The :func:`beartype._check.code.codemain.make_check_expr` factory memoizes
+    each expression across *all* root piths annotated by the same root hint
+    under the same configuration. Deferring the identification of those piths
+    to this factory, called once for each such pith embedded in each such
+    wrapper, enables the union profiler passed to that wrapper to profile the
+    same union annotating different root piths independently.
+
+    Callers should call this factory *only* if the
+    :attr:`beartype.BeartypeConf.union_reorder_calls` option is enabled.
+
+    Parameters
+    ----------
+    code_expr : str
+        Python expression type-checking that root pith.
+
+    Returns
+    -------
+    str
+        Python expression type-checking that root pith as described above.
+    '''
+
+    # Return this expression with all placeholders replaced by this integer.
+    return code_expr.replace(
+        CODE_PEP484604_UNION_PROFILE_PITH_INDEX_PLACEHOLDER,
+        str(next(_union_pith_index_counter)),
+    )
+
+# ....................{ SETTERS                            }....................
+def set_func_scope_union_profiler(
+    func_scope: LexicalScope, reorder_calls: Optional[int]) -> None:
+    '''
+    Replace the union profiler in the passed scope of a type-checking wrapper
+    function to be created by a new union profiler specific to that wrapper if
+    that scope contains a union profiler *or* silently reduce to a noop
+    otherwise.
+
+    Type-checking expressions and thus the scopes required by those expressions
+    are memoized across *all* wrappers type-checking the same hints under the
+    same beartype configuration. Since each wrapper requires its own profiler,
+    callers are required to call this setter on the mutable copy of that scope
+    specific to each wrapper *before* creating that wrapper.
+
+    Parameters
+    ----------
+    func_scope : LexicalScope
+        Mutable scope of the type-checking wrapper function to be created.
+    reorder_calls : Optional[int]
+        Value of the :attr:`beartype.BeartypeConf.union_reorder_calls` option
+        configuring that wrapper.
+    '''
+    assert isinstance(func_scope, dict), f'{repr(func_scope)} not dictionary.'
+
+    # If that wrapper requires a union profiler, replace the shared profiler in
+    # this scope by a new profiler specific to that wrapper.
+    if ARG_NAME_UNION_PROFILER in func_scope:
+        func_scope[ARG_NAME_UNION_PROFILER] = UnionProfiler(
+            reorder_calls)  # type: ignore[arg-type]
+    # Else, that wrapper requires *NO* union profiler.
+
+# ....................{ PRIVATE ~ globals                  }....................
+_union_pith_index_counter = count()
+'''
+Iterator yielding integers uniquely identifying root piths type-checked against
+union type hints whose child hints are type-checked in an order profiled at
+runtime.
+'''
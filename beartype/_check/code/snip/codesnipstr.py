@@ -75,10 +75,50 @@ little to *no* tangible gain. Indeed, we actually tried doing that once. We
 failed hard after breaking everything. **Avoid the mistakes of the past.**
 '''
 
+CODE_PEP484_INSTANCE_EXACT = (
+    '''(type({pith_curr_assign_expr}) is {hint_curr_expr} or '''
+    '''isinstance({pith_curr_var_name}, {hint_curr_expr}))'''
+)
+'''
+:pep:`484`-compliant code snippet type-checking the current pith against the
+current child PEP-compliant type expected to be a trivial non-:mod:`typing`
+type whose instances are almost always of exactly that type (e.g.,
+:class:`int`, :class:`str`, :func:`typing.final`-decorated classes).
+
+This snippet first tests whether the type of this pith is exactly this type,
+which is appreciably faster than the :func:`isinstance` builtin in the common
+case, *before* falling back to that builtin for instances of subclasses of this
+type (e.g., :class:`bool` for :class:`int`) and objects whose ``__class__``
+dunder attributes masquerade as this type.
+
+Caveats
+-------
+**This snippet is intentionally compact rather than embedding a human-readable
+comment.** See the :data:`.CODE_PEP484_INSTANCE` snippet for details.
+
+**This snippet is slower than the :data:`.CODE_PEP484_INSTANCE` snippet for
+instances of subclasses of this type.** Such instances fail the identity test
+*before* falling back to the :func:`isinstance` builtin and thus pay for both.
+Under CPython 3.11, 2,000,000 calls to a wrapper whose :class:`int` parameter
+was passed :class:`bool` instances took 0.105s with this snippet versus 0.067s
+with a bare :func:`isinstance` call (i.e., ~55% slower), whereas the same calls
+passed :class:`int` instances took 0.053s versus 0.068s (i.e., ~20% faster).
+This snippet is thus only generated for types whose instances are almost always
+of exactly those types. Callers passing predominantly subclass instances (e.g.,
+:class:`enum.IntEnum` members for :class:`int` parameters) pay that cost on
+every call. See the ``bin/profile_exact_type.py`` benchmark, which measures
+both paths alongside all hint kinds in the
+:data:`beartype._data.hint.sign.datahintsignset.HINT_SIGNS_ORIGIN_ISINSTANCEABLE`
+set, whose shallow type-checks intentionally remain bare :func:`isinstance`
+calls.
+'''
+
 # ..................{ FORMATTERS                             }..................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
 CODE_PEP484_INSTANCE_format: CallableStrFormat = (
     CODE_PEP484_INSTANCE.format)
+CODE_PEP484_INSTANCE_EXACT_format: CallableStrFormat = (
+    CODE_PEP484_INSTANCE_EXACT.format)
 CODE_PEP572_PITH_ASSIGN_EXPR_format: CallableStrFormat = (
     CODE_PEP572_PITH_ASSIGN_EXPR.format)
@@ -12,61 +12,11 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ TODO                               }....................
-#FIXME: Currently, we only shallowly type-check PEP 646-compliant mixed
-#fixed-variadic tuple hints as... tuples. It's not much. Obviously, we need to
-#deeply type-check these tuple data structures as soon as feasible. There exist
-#two distinct use cases here:
-#* Fixed-variadic tuple hints containing exactly one unpacked child tuple hint
-#  (e.g., "tuple[int, *tuple[str, ...], float]"). Note that a tuple hint may
-#  only contain *AT MOST* one unpacked child tuple hint.
-#* Fixed-variadic tuple hints containing exactly one type variable tuple, either
-#  as:
-#  * The first child hint (e.g., "tuple[*Ts, int]").
-#  * The last child hint (e.g., "tuple[str, bytes, *Ts]"). Note that this case
-#    has a prominent edge case. Fixed-variadic tuple hints of the form
-#    "tuple[hint_child, *Ts]" for *ANY* "hint_child" and type variable tuple
-#    "Ts" trivially reduce to variadic tuple hints of the form
-#    "tuple[hint_child, ...]" at the moment, as we silently ignore *ALL* type
-#    variable tuples. Ergo, if a hint is a fixed-variadic tuple hint whose last
-#    child hint is a type variable tuple, this hint *MUST* by definition be
-#    prefixed by two or more child hints that are *NOT* type variable tuples.
-#  * Any child hint other than the first or last (e.g.,
-#    "tuple[float, *Ts, bool]").
-#
-#  Note that:
-#  * A parent tuple hint can contain at most *ONE* unpacked child tuple hint.
-#    So, we'll now need to record the number of unpacked child tuple hints that
-#    have been previously visited and raise an exception if two or more are
-#    seen. Ugh!
-#  * Again, these cases have a prominent edge case. Fixed-variadic tuple hints
-#    of the form "tuple[*Ts]" for *ANY* type variable tuple "Ts" trivially
-#    reduce to the builtin type "tuple" at the moment, as we silently ignore
-#    *ALL* type variable tuples.
-#  * Fixed-variadic tuple hints *CANNOT* contain both an unpacked type variable
-#    tuple *AND* unpacked child tuple hint (e.g., "tuple[*Ts, *tuple[int,
-#    ...]]"). Fixed-variadic tuple hints can contain at most one unpacked child
-#    hint. Hopefully, this constraint reduces the complexity of code generation.
-#
-#The first place to start with all of this is implementing a new code generation
-#algorithm for the new "HintSignPep646TupleFixedVariadic" sign, which currently
-#just shallowly reduces to the builtin "tuple" type. Obviously, that's awful.
-#The first-draft implementation of this algorithm should just focus on
-#fixed-variadic tuple hints containing exactly one type variable tuple (e.g.,
-#"tuple[float, *Ts, bool]") for now, as that's the simpler use case. Of course,
-#even that's *NOT* simple -- but it's a more reasonable start than unpacked
-#child tuple hints, which spiral into madness far faster and harder.
-#
-#Lastly, note that we can trivially handle unpacked child tuple hints in a
-#simple, effective way *WITHOUT* actually investing any effort in doing so. How?
-#By simply treating each unpacked child tuple hint as a type variable tuple
-#(e.g., by treating "tuple[str, *tuple[int, ...], bytes]" as equivalent to
-#"tuple[str, *Ts, bytes]"). Since we already need to initially handle type
-#variable tuples anyway, we shatter two birds with one hand. Yes! Yes!
-#FIXME: Actually, it's *DEFINITELY* not the case that we "silently ignore *ALL*
-#type variable tuples." We reduce both type variables and type variable tuples
-#to lookup tables. So, stop ignoring type variable tuples below, please.
-#
-#Otherwise, everything above seems great -- by which I mean, exhausting.
+#FIXME: Unpacked type variable tuples subscripting fixed-variadic tuple hints
+#(e.g., the "*Ts" in "tuple[int, *Ts, float]") are currently treated as the
+#ignorable unpacked variable-length tuple hint "*tuple[typing.Any, ...]".
+#Since we already reduce type variable tuples to lookup tables, map these type
+#variable tuples through those tables instead, please.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar import BeartypeDecorHintPep646Exception
@@ -84,6 +34,7 @@ from beartype._data.hint.sign.datahintsignset import (
     HINT_SIGNS_PEP646_TUPLE_HINT_CHILD_UNPACKED)
 from beartype._util.hint.pep.proposal.pep646.pep484585646tuple import (
     get_hint_pep484585646_tuple_args_unpacked_if_needed,
+    get_hint_pep646_tuple_fixed_variadic_args,
     is_hint_pep484585646_tuple_variadic_unpacked_if_needed,
     make_hint_pep484585_tuple_fixed,
 )
@@ -413,22 +364,21 @@ def reduce_hint_pep646_tuple(hint: Hint) -> Hint:
         # to *NOT* be reducible to a PEP 585-compliant parent tuple hint.
 
     # ....................{ RETURN                         }....................
-    # Reduce this non-trivial PEP 646-compliant tuple hint to either...
-    hint_reduced = (
-        #FIXME: *STOP DOING THIS* as soon as we implement a proper code
-        #generator for PEP 646-compliant tuple hints, please. *sigh*
-        # If this PEP 646-compliant parent tuple hint is irreducible to a PEP
-        # 585-compliant parent tuple hint, the builtin "tuple" type as a
-        # temporary means of shallowly ignoring *ALL* child hints subscripting
-        # this hint. Although obviously non-ideal, this simplistic approach does
-        # have the benefit of actually working -- an improvement over our prior
-        # approach of raising fatal exceptions for these hints.
-        tuple
-        if hint_pep585_childs is None else
-        # Else, this PEP 646-compliant parent tuple hint is reducible to a PEP
-        # 585-compliant parent tuple hint. In this case, the latter.
-        make_hint_pep484585_tuple_fixed(hint_pep585_childs)
-    )
+    # If this PEP 646-compliant parent tuple hint is reducible to a PEP
+    # 585-compliant parent tuple hint, reduce the former to the latter.
+    if hint_pep585_childs is not None:
+        hint_reduced = make_hint_pep484585_tuple_fixed(hint_pep585_childs)
+        # print(f'Reduced PEP 646 tuple hint {hint} to {hint_reduced}!')
+        return hint_reduced
+    # Else, this PEP 646-compliant parent tuple hint is irreducible to a PEP
+    # 585-compliant parent tuple hint, implying this hint to be subscripted by
+    # exactly one unpacked child hint matching a variable number of tuple items
+    # (e.g., "tuple[int, *tuple[str, ...], float]", "tuple[int, *Ts]").
 
-    # print(f'Reduced PEP 646 tuple hint {hint} to {hint_reduced}!')
-    return hint_reduced
+    # Precompute and memoize the fixed prefix child hints, variadic child hint,
+    # and fixed suffix child hints of this hint for subsequent reuse by code
+    # generators deeply type-checking against this hint.
+    get_hint_pep646_tuple_fixed_variadic_args(hint)
+
+    # Preserve this hint as is.
+    return hint
@@ -4,29 +4,35 @@
 # See "LICENSE" for further details.
 
 '''
-Project-wide :pep:`589`-compliant **type alias reducers** (i.e., low-level
-low-level callables converting higher-level :class:`typing.TypedDict` subclasses
-to lower-level type hints more readily consumable by :mod:`beartype`).
+Project-wide :pep:`589`-compliant **typed dictionary reducers** (i.e.,
+low-level callables preparing :class:`typing.TypedDict` subclasses to be
+deeply type-checked by :mod:`beartype`).
 
 This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
 from beartype._data.typing.datatypingport import Hint
-from beartype._data.typing.datatyping import MappingStrToAny
+from beartype._util.hint.pep.proposal.pep589 import get_hint_pep589_key_table
 
 # ....................{ REDUCERS                           }....................
-#FIXME: Remove *AFTER* deeply type-checking typed dictionaries. For now,
-#shallowly type-checking such hints by reduction to untyped dictionaries
-#remains the sanest temporary work-around.
 def reduce_hint_pep589(hint: Hint) -> Hint:
     '''
-    Reduce the passed :pep:`589`-compliant **typed dictionary** (i.e.,
-    :class:`typing.TypedDict` subclass) to a lower-level type hint currently
-    supported by :mod:`beartype`.
+    Preserve the passed :pep:`589`-compliant **typed dictionary** (i.e.,
+    :class:`typing.TypedDict` subclass) as is *after* precomputing the key table
+    describing the required keys and value type hints of this typed dictionary.
+
+    Typed dictionaries are deeply type-checked by code generated by the
+    :func:`beartype._check.code._pep.codepep589.make_hint_pep589_check_expr`
+    factory, which type-checks dictionaries against this key table. Precomputing
+    this table here guarantees that the non-trivial introspection of the
+    annotations of this typed dictionary is performed exactly once at
+    decoration time rather than repeatedly by each such factory call.
 
     This reducer is intentionally *not* memoized (e.g., by the
-    ``callable_cached`` decorator), as reducers cannot be memoized.
+    ``callable_cached`` decorator), as reducers cannot be memoized. The
+    :func:`.get_hint_pep589_key_table` getter called by this reducer is
+    memoized instead.
 
     Parameters
     ----------
@@ -36,11 +42,11 @@ def reduce_hint_pep589(hint: Hint) -> Hint:
     Returns
     -------
     Hint
-        Lower-level type hint currently supported by :mod:`beartype`.
+        This typed dictionary as is.
     '''
 
-    # Silently ignore all child type hints annotating this dictionary by
-    # reducing this hint to the "Mapping" type hint. Yes, "Mapping" rather than
-    # "dict". By PEP 589 edict:
-    #     First, any TypedDict type is consistent with Mapping[str, object].
-    return MappingStrToAny  # pyright: ignore
+    # Precompute the key table describing this typed dictionary.
+    get_hint_pep589_key_table(hint)  # type: ignore[arg-type]
+
+    # Preserve this typed dictionary as is.
+    return hint
@@ -360,19 +360,10 @@ HINT_SIGN_TO_REDUCE_HINT_CACHED: _HintSignToReduceHintCached = {
         reduce_hint_pep585_builtin_subbed_unknown),
 
     # ..................{ PEP 589                            }..................
-    #FIXME: Remove *AFTER* deeply type-checking typed dictionaries. For now,
-    #shallowly type-checking such hints by reduction to untyped dictionaries
-    #remains the sanest temporary work-around.
-
     # If this hint is a PEP 589-compliant typed dictionary (i.e.,
-    # "typing.TypedDict" or "typing_extensions.TypedDict" subclass), silently
-    # ignore all child type hints annotating this dictionary by reducing this
-    # hint to the "Mapping" superclass. Yes, "Mapping" rather than "dict". By
-    # PEP 589 edict:
-    #     First, any TypedDict type is consistent with Mapping[str, object].
-    #
-    # Typed dictionaries are largely discouraged in the typing community, due to
-    # their non-standard semantics and syntax.
+    # "typing.TypedDict" or "typing_extensions.TypedDict" subclass), preserve
+    # this hint as is *AFTER* precomputing the key table subsequently required
+    # to deeply type-check this hint.
     HintSignTypedDict: reduce_hint_pep589,
 
     # ..................{ PEP 591                            }..................
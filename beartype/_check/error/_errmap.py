@@ -41,11 +41,14 @@ def _init() -> None:
     # Defer heavyweight imports.
     from beartype._data.hint.sign.datahintsigns import (
         HintSignAnnotated,
+        HintSignCallable,
         HintSignLiteral,
         HintSignNoReturn,
         HintSignPep484585GenericUnsubbed,
         HintSignPep484585TupleFixed,
+        HintSignPep646TupleFixedVariadic,
         HintSignType,
+        HintSignTypedDict,
     )
     from beartype._data.hint.sign.datahintsignset import (
         HINT_SIGNS_MAPPING,
@@ -60,9 +63,15 @@ def _init() -> None:
     from beartype._check.error._pep.errpep484604 import (
         find_cause_pep484604_union)
     from beartype._check.error._pep.errpep586 import find_cause_pep586_literal
+    from beartype._check.error._pep.errpep589 import (
+        find_cause_pep589_typeddict)
     from beartype._check.error._pep.errpep593 import find_cause_pep593_annotated
+    from beartype._check.error._pep.errpep646 import (
+        find_cause_pep646_tuple_fixed_variadic)
     from beartype._check.error._pep.pep484.errpep484noreturn import (
         find_cause_pep484_noreturn)
+    from beartype._check.error._pep.pep484585.errpep484585callable import (
+        find_cause_pep484585_callable)
     from beartype._check.error._pep.pep484585.errpep484585container import (
         find_cause_pep484585_container_args_1,
         find_cause_pep484585_tuple_fixed,
@@ -108,6 +117,7 @@ def _init() -> None:
         HintSignNoReturn: find_cause_pep484_noreturn,
 
         # ....................{ PEP (484|585)              }....................
+        HintSignCallable: find_cause_pep484585_callable,
         HintSignPep484585GenericUnsubbed: (
             find_cause_pep484585_generic_unsubbed),
         HintSignPep484585TupleFixed: find_cause_pep484585_tuple_fixed,
@@ -116,8 +126,15 @@ def _init() -> None:
         # ....................{ PEP 586                    }....................
         HintSignLiteral: find_cause_pep586_literal,
 
+        # ....................{ PEP 589                    }....................
+        HintSignTypedDict: find_cause_pep589_typeddict,
+
         # ....................{ PEP 593                    }....................
         HintSignAnnotated: find_cause_pep593_annotated,
+
+        # ....................{ PEP 646                    }....................
+        HintSignPep646TupleFixedVariadic: (
+            find_cause_pep646_tuple_fixed_variadic),
     })
 
 
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`589`-compliant **type hint violation describers** (i.e.,
+functions returning human-readable strings explaining violations of
+:pep:`589`-compliant :class:`typing.TypedDict` subclasses).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.data.hintdataerror import HintDataError
+from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
+from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
+from beartype._check.error._nonpep.errnonpeptype import find_cause_instance_type
+from beartype._data.hint.sign.datahintsigns import HintSignTypedDict
+from beartype._util.hint.pep.proposal.pep589 import get_hint_pep589_key_table
+from beartype._util.text.utiltextjoin import join_delimited_conjunction
+from beartype._util.text.utiltextprefix import prefix_pith_type
+from beartype._util.text.utiltextrepr import represent_pith
+from collections.abc import Mapping
+
+# ....................{ FINDERS                            }....................
+def find_cause_pep589_typeddict(cause: HintTreeError) -> HintTreeError:
+    '''
+    Output cause describing whether the pith of the passed input cause either
+    satisfies or violates the :pep:`589`-compliant **typed dictionary** (i.e.,
+    :class:`typing.TypedDict` subclass) of that cause.
+
+    This finder type-checks the values of *all* keys declared by this typed
+    dictionary regardless of the configured strategy. Since the code generated
+    under sublinear strategies type-checks a subset of these values, this
+    finder is guaranteed to find the violation detected by that code.
+
+    Parameters
+    ----------
+    cause : HintTreeError
+        Input cause providing this data.
+
+    Returns
+    -------
+    HintTreeError
+        Output cause type-checking this data.
+    '''
+    assert isinstance(cause, HintTreeError), f'{repr(cause)} not cause.'
+    assert cause.hint_curr.hint_sign is HintSignTypedDict, (
+        f'{repr(cause.hint_curr.hint_sign)} not "HintSignTypedDict".')
+
+    # ....................{ VIOLATE ~ shallow              }....................
+    # Shallow output cause describing the failure of this pith to be a mapping
+    # if this pith is not a mapping *OR* "None" otherwise.
+    cause_shallow = find_cause_instance_type(
+        cause.permute_cause_hint_child_insane(Mapping))
+
+    # If this pith is *NOT* a mapping, return this shallow cause.
+    if cause_shallow.cause_str_or_none is not None:
+        return cause_shallow
+    # Else, this pith is a mapping.
+
+    # Key table precomputed for this typed dictionary.
+    hint_keys_required, hint_key_hints = get_hint_pep589_key_table(
+        cause.hint_curr_sanified)  # type: ignore[arg-type]
+
+    # ....................{ VIOLATE ~ keys                 }....................
+    # List of the names of all required keys missing from this mapping, sorted
+    # in declaration order.
+    pith_keys_missing = [
+        key_name
+        for key_name, _ in hint_key_hints
+        if key_name in hint_keys_required and key_name not in cause.pith
+    ]
+
+    # If this mapping is missing one or more required keys, this mapping fails
+    # to satisfy this hint. In this case, return a deep output cause describing
+    # this failure.
+    if pith_keys_missing:
+        return cause.permute_cause(cause_str_or_none=(
+            f'{represent_pith(cause.pith)} missing required '
+            f'key{"s" if len(pith_keys_missing) > 1 else ""} '
+            f'{join_delimited_conjunction(map(repr, pith_keys_missing))}'
+        ))
+    # Else, this mapping contains all required keys.
+
+    # ....................{ VIOLATE ~ values               }....................
+    # For the name and value type hint of each key of this typed dictionary...
+    for key_name, key_hint in hint_key_hints:
+        # If this optional key is absent from this mapping, continue to the
+        # next key.
+        if key_name not in cause.pith:
+            continue
+        # Else, this key is present in this mapping.
+
+        # Metadata encapsulating the sanification of this value type hint.
+        hint_child_sane = cause.sanify_hint_child(key_hint)
+
+        # If this value type hint is ignorable, continue to the next key.
+        if hint_child_sane is HINT_SANE_IGNORABLE:
+            continue
+        # Else, this value type hint is unignorable.
+
+        # Deep output cause describing the failure of the value of this key to
+        # satisfy this value type hint if this value violates this hint *OR*
+        # "None" otherwise.
+        cause_deep = cause.permute_cause(
+            hint_curr=HintDataError(hint_child_sane),
+            pith=cause.pith[key_name],
+        ).find_cause()
+
+        # If this value is the cause of this failure...
+        if cause_deep.cause_str_or_none is not None:
+            # Human-readable substring prefixing this failure with metadata
+            # describing this key.
+            cause_deep.cause_str_or_none = (
+                f'{prefix_pith_type(pith=cause.pith, is_color=cause.conf.is_color)}'
+                f'key {represent_pith(key_name)} '
+                f'value {cause_deep.cause_str_or_none}'
+            )
+
+            # Return this cause.
+            return cause_deep
+        # Else, this value is *NOT* the cause of this failure. Silently
+        # continue to the next key.
+
+    # ....................{ SATISFY                        }....................
+    # Return this cause as is. Since this mapping contains all required keys
+    # *AND* the values of all present keys are valid, this mapping deeply
+    # satisfies this hint.
+    return cause
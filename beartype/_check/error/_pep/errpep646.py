@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`646`-compliant **type hint violation describers** (i.e.,
+functions returning human-readable strings explaining violations of
+:pep:`646`-compliant fixed-variadic tuple type hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.data.hintdataerror import HintDataError
+from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
+from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
+from beartype._check.error._nonpep.errnonpeptype import (
+    find_cause_type_instance_origin)
+from beartype._data.hint.sign.datahintsigns import (
+    HintSignPep646TupleFixedVariadic)
+from beartype._util.hint.pep.proposal.pep646.pep484585646tuple import (
+    get_hint_pep646_tuple_fixed_variadic_args)
+from beartype._util.text.utiltextansi import color_type
+from beartype._util.text.utiltextprefix import prefix_pith_type
+from beartype._util.text.utiltextrepr import represent_pith
+
+# ....................{ FINDERS                            }....................
+def find_cause_pep646_tuple_fixed_variadic(
+    cause: HintTreeError) -> HintTreeError:
+    '''
+    Output cause describing whether the pith of the passed input cause either
+    satisfies or violates the :pep:`646`-compliant **fixed-variadic tuple hint**
+    (i.e., of the form ``tuple[{hint_prefix_1}, ..., *tuple[{hint_variadic},
+    ...], {hint_suffix_1}, ...]``) of that cause.
+
+    This finder type-checks *all* items of this tuple regardless of the
+    configured strategy. Since the code generated under sublinear strategies
+    type-checks a subset of these items, this finder is guaranteed to find the
+    violation detected by that code.
+
+    Parameters
+    ----------
+    cause : HintTreeError
+        Input cause providing this data.
+
+    Returns
+    -------
+    HintTreeError
+        Output cause type-checking this data.
+    '''
+    assert isinstance(cause, HintTreeError), f'{repr(cause)} not cause.'
+    assert cause.hint_curr.hint_sign is HintSignPep646TupleFixedVariadic, (
+        f'{repr(cause.hint_curr.hint_sign)} not '
+        f'"HintSignPep646TupleFixedVariadic".'
+    )
+
+    # ....................{ VIOLATE ~ shallow              }....................
+    # Shallow output cause describing the failure of this pith to be a tuple if
+    # this pith is not a tuple *OR* "None" otherwise.
+    cause_shallow = find_cause_type_instance_origin(cause)
+
+    # If this pith is *NOT* a tuple, return this shallow cause.
+    if cause_shallow.cause_str_or_none is not None:
+        return cause_shallow
+    # Else, this pith is a tuple.
+
+    # Fixed prefix child hints, variadic child hint, and fixed suffix child
+    # hints precomputed for this hint.
+    hint_childs_prefix, hint_child_variadic, hint_childs_suffix = (
+        get_hint_pep646_tuple_fixed_variadic_args(cause.hint_curr_sanified))
+
+    # Number of items in this tuple.
+    pith_len = len(cause.pith)
+
+    # Number of fixed prefix child hints subscripting this hint.
+    hint_childs_prefix_len = len(hint_childs_prefix)
+
+    # Number of fixed child hints subscripting this hint.
+    hint_childs_fixed_len = hint_childs_prefix_len + len(hint_childs_suffix)
+
+    # ....................{ VIOLATE ~ length               }....................
+    # If this tuple contains fewer items than fixed child hints, this tuple
+    # fails to satisfy this hint. In this case, return a deep output cause
+    # describing this failure.
+    if pith_len < hint_childs_fixed_len:
+        return cause.permute_cause(cause_str_or_none=(
+            f'{represent_pith(cause.pith)} length '
+            f'{pith_len} < {hint_childs_fixed_len}'
+        ))
+    # Else, this tuple contains at least as many items as fixed child hints.
+
+    # ....................{ VIOLATE ~ items                }....................
+    # Index of the first trailing item of this tuple matched by the fixed
+    # suffix child hints.
+    pith_suffix_index = pith_len - len(hint_childs_suffix)
+
+    # For the 0-based index of each item of this tuple and that item...
+    for pith_item_index, pith_item in enumerate(cause.pith):
+        # Child hint constraining this item, defined as either...
+        hint_child = (
+            # If this item is a leading item, the corresponding prefix child
+            # hint;
+            hint_childs_prefix[pith_item_index]
+            if pith_item_index < hint_childs_prefix_len else
+            # If this item is a trailing item, the corresponding suffix child
+            # hint;
+            hint_childs_suffix[pith_item_index - pith_suffix_index]
+            if pith_item_index >= pith_suffix_index else
+            # Else, this item is a variadic item. In this case, the variadic
+            # child hint.
+            hint_child_variadic
+        )
+
+        # Metadata encapsulating the sanification of this child hint.
+        hint_child_sane = cause.sanify_hint_child(hint_child)
+
+        # If this child hint is ignorable, continue to the next item.
+        if hint_child_sane is HINT_SANE_IGNORABLE:
+            continue
+        # Else, this child hint is unignorable.
+
+        # Deep output cause describing the failure of this item to satisfy this
+        # child hint if this item violates this hint *OR* "None" otherwise.
+        cause_deep = cause.permute_cause(
+            hint_curr=HintDataError(hint_child_sane), pith=pith_item,
+        ).find_cause()
+
+        # If this item is the cause of this failure...
+        if cause_deep.cause_str_or_none is not None:
+            # Human-readable substring prefixing this failure with metadata
+            # describing this item.
+            cause_deep.cause_str_or_none = (
+                f'{prefix_pith_type(pith=cause.pith, is_color=cause.conf.is_color)}'
+                f'index {color_type(text=str(pith_item_index), is_color=cause.conf.is_color)} '
+                f'item {cause_deep.cause_str_or_none}'
+            )
+
+            # Return this cause.
+            return cause_deep
+        # Else, this item is *NOT* the cause of this failure. Silently
+        # continue to the next.
+
+    # ....................{ SATISFY                        }....................
+    # Return this cause as is. Since this tuple is of a satisfactory length
+    # *AND* all items of this tuple are valid, this tuple deeply satisfies this
+    # hint.
+    return cause
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`484`- or :pep:`585`-compliant **callable type hint violation
+describers** (i.e., functions returning human-readable strings explaining
+violations of :pep:`484`- and :pep:`585`-compliant ``typing.Callable[...]`` and
+``collections.abc.Callable[...]`` type hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
+from beartype._check.error._nonpep.errnonpeptype import (
+    find_cause_type_instance_origin)
+from beartype._check.pep.pep484585.checkpep484585callable import (
+    get_func_pep484585_callable_signature_cause_or_none)
+from beartype._data.hint.sign.datahintsigns import HintSignCallable
+from beartype._util.text.utiltextrepr import represent_pith
+
+# ....................{ GETTERS                            }....................
+def find_cause_pep484585_callable(cause: HintTreeError) -> HintTreeError:
+    '''
+    Output cause describing whether the pith of the passed input cause either
+    satisfies or violates the :pep:`484`- or :pep:`585`-compliant **callable
+    type hint** (i.e., ``typing.Callable[...]`` or
+    ``collections.abc.Callable[...]`` type hint) of that cause.
+
+    This finder is only called for subscripted callable type hints under the
+    :attr:`beartype.BeartypeConf.is_check_callable_signature` option. Under all
+    other configurations, callers instead defer to the shallow
+    :func:`.find_cause_type_instance_origin` finder.
+
+    Parameters
+    ----------
+    cause : HintTreeError
+        Input cause providing this data.
+
+    Returns
+    -------
+    HintTreeError
+        Output cause type-checking this data.
+    '''
+    assert isinstance(cause, HintTreeError), f'{repr(cause)} not cause.'
+    assert cause.hint_curr.hint_sign is HintSignCallable, (
+        f'{repr(cause.hint_curr.hint_sign)} not "HintSignCallable".')
+
+    # Shallow output cause describing the failure of this pith to be callable
+    # if this pith is not callable *OR* "None" otherwise.
+    cause_shallow = find_cause_type_instance_origin(cause)
+
+    # If this pith is *NOT* callable, return this shallow cause.
+    if cause_shallow.cause_str_or_none is not None:
+        return cause_shallow
+    # Else, this pith is callable.
+
+    # Human-readable substring describing why the signature of this callable is
+    # incompatible with this hint if this signature is incompatible with this
+    # hint *OR* "None" otherwise.
+    cause_signature = get_func_pep484585_callable_signature_cause_or_none(
+        func=cause.pith, hint=cause.hint_curr_sanified)
+
+    # If this signature is compatible with this hint, return this cause as is.
+    if cause_signature is None:
+        return cause
+    # Else, this signature is incompatible with this hint.
+
+    # Return a deep output cause describing this incompatibility.
+    return cause.permute_cause(cause_str_or_none=(
+        f'{represent_pith(cause.pith)} {cause_signature}'))
@@ -13,6 +13,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype import BeartypeStrategy
+from beartype._check.code.coderandom import get_reiterable_item_indices
 from beartype._check.cls.hint.data.hintdataerror import HintDataError
 from beartype._check.cls.hint.tree.hinttreeerror import HintTreeError
 from beartype._check.error._nonpep.errnonpeptype import (
@@ -28,6 +29,7 @@ from collections.abc import (
     Hashable,
     Iterable,
 )
+from itertools import islice
 
 # ....................{ FINDERS                            }....................
 def find_cause_pep484585_mapping(cause: HintTreeError) -> HintTreeError:
@@ -123,16 +125,39 @@ def find_cause_pep484585_mapping(cause: HintTreeError) -> HintTreeError:
     # * "value" is the value of the current key-value pair.
     pith_items: Iterable[tuple[Hashable, object]] = None  # type: ignore[assignment]
 
-    # If the only the first key-value pair of this mapping was type-checked by
+    # If only a single key-value pair of this mapping was type-checked by
     # the parent @beartype-generated wrapper function in O(1) time, type-check
-    # only this key-value pair of this mapping in O(1) time as well.
+    # only this key-value pair (or the few candidates for this pair) of this
+    # mapping in O(1) time as well.
     if cause.conf.strategy is BeartypeStrategy.O1:
-        # First key-value pair of this mapping.
-        pith_item = next(iter(cause.pith.items()))
-
-        # Tuple containing only this pair.
-        pith_items = (pith_item,)
-        # print(f'Checking item {pith_item_index} in O(1) time!')
+        # If this beartype configuration prefers non-deterministic
+        # type-checking of reiterables...
+        if cause.conf.is_random and cause.conf.is_random_reiterable:
+            assert cause.random_int is not None, (
+                f'Violation cause {repr(cause)} pseudo-random integer is '
+                f'"None".'
+            )
+
+            # Tuple of the 0-based indices of the *SAME EXACT PAIRS* of this
+            # mapping that the body of the parent @beartype-generated wrapper
+            # could have type-checked, sorted in ascending order.
+            pith_item_indices = get_reiterable_item_indices(
+                pith_len=len(cause.pith), random_int=cause.random_int)
+
+            # Tuple of these pairs, iterating over this mapping no further than
+            # the last such pair.
+            pith_items = tuple(
+                pith_item
+                for pith_item_index, pith_item in enumerate(islice(
+                    cause.pith.items(), pith_item_indices[-1] + 1))
+                if pith_item_index in pith_item_indices
+            )
+        # Else, this beartype configuration prefers deterministic type-checking.
+        # In this case, the tuple containing only the first key-value pair of
+        # this mapping.
+        else:
+            pith_items = (next(iter(cause.pith.items())),)
+        # print(f'Checking items {pith_items} in O(1) time!')
     # Else, this mapping was iterated by the parent @beartype-generated wrapper
     # function in O(n) time. In this case, type-check *ALL* key-value pairs of
     # this mapping in O(n) time as well.
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide :pep:`484`- and :pep:`585`-compliant **callable signature
+type-checking utilities** (i.e., low-level callables type-checking the
+signatures of arbitrary callables against both :pep:`484`-compliant
+``typing.Callable[...]`` and :pep:`585`-compliant
+``collections.abc.Callable[...]`` type hints under the
+:attr:`beartype.BeartypeConf.is_check_callable_signature` option).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.roar import BeartypeDoorException
+from beartype.typing import (
+    Callable,
+    Optional,
+)
+from beartype._cave._cavefast import (
+    FunctionType,
+    MethodBoundInstanceOrClassType,
+)
+from beartype._data.check.code.datacodelen import CALLABLE_SIGNATURE_CACHE_SIZE
+from beartype._data.typing.datatypingport import Hint
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.hint.pep.proposal.pep484585.pep484585callable import (
+    get_hint_pep484585_callable_params,
+    get_hint_pep484585_callable_return,
+)
+from inspect import CO_VARARGS
+from weakref import WeakValueDictionary
+
+# ....................{ GETTERS                            }....................
+def get_func_pep484585_callable_signature_cause_or_none(
+    func: object, hint: Hint) -> Optional[str]:
+    '''
+    Human-readable substring describing why the signature of the passed
+    callable is incompatible with the passed :pep:`484`- or
+    :pep:`585`-compliant **callable type hint** (i.e., ``typing.Callable[...]``
+    or ``collections.abc.Callable[...]`` type hint) if that signature is
+    incompatible with that hint *or* :data:`None` otherwise.
+
+    This getter validates that:
+
+    * That callable accepts exactly as many positional parameters as parameter
+      type hints subscripting that hint. Specifically, that callable is
+      required to both:
+
+      * Require *no* more positional parameters than these parameter type
+        hints.
+      * Accept at least as many positional parameters as these parameter type
+        hints, either explicitly *or* via a variadic positional parameter.
+
+    * That callable requires *no* keyword-only parameters.
+    * Each annotated positional parameter of that callable is annotated by a
+      **superhint** (in the sense of :func:`beartype.door.is_subhint`) of the
+      corresponding parameter type hint, as callables are contravariant in
+      their parameters.
+    * The return of that callable (if annotated) is annotated by a **subhint**
+      of the return type hint subscripting that hint, as callables are
+      covariant in their returns.
+
+    If that hint is subscripted by either an ellipsis *or* a :pep:`612`-compliant
+    parameter specification (e.g., ``Callable[..., int]``), this getter only
+    validates the return of that callable.
+
+    This getter silently ignores:
+
+    * Callables that are neither pure-Python functions *nor* methods bound to
+      pure-Python functions (e.g., C-based builtins, classes, objects defining
+      the ``__call__()`` dunder method), whose signatures are *not* efficiently
+      introspectable.
+    * Parameters and returns annotated by either stringified forward references
+      *or* hints unsupported by the :func:`beartype.door.is_subhint` tester.
+
+    This getter is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator). Callers requiring efficiency should
+    instead call the tester returned by the
+    :func:`.make_func_pep484585_callable_signature_tester` factory, which
+    memoizes the results of this getter against the code objects of callables.
+
+    Parameters
+    ----------
+    func : object
+        Callable to be inspected.
+    hint : Hint
+        Callable type hint to validate this callable against.
+
+    Returns
+    -------
+    Optional[str]
+        Either:
+
+        * If the signature of this callable is incompatible with this hint, a
+          human-readable substring describing this incompatibility.
+        * Else, :data:`None`.
+    '''
+
+    # ....................{ LOCALS                         }....................
+    # Pure-Python function underlying this callable if any *OR* "None"
+    # otherwise and the number of leading positional parameters of that
+    # function implicitly passed by that callable (e.g., "self" for methods).
+    func_pure, func_args_bound_len = _get_func_pure_or_none(func)
+
+    # If this callable is *NOT* efficiently introspectable, silently accept
+    # this callable.
+    if func_pure is None:
+        return None
+    # Else, this callable is efficiently introspectable.
+
+    # Avoid circular import dependencies.
+    from beartype.door import is_subhint
+
+    # Code object underlying this function.
+    func_codeobj = func_pure.__code__
+
+    # Dictionary mapping from the names of annotated parameters of this
+    # function to the hints annotating those parameters.
+    func_hints = func_pure.__annotations__
+
+    # Number of positional-only and flexible parameters accepted by this
+    # function, excluding parameters implicitly passed by this callable.
+    func_args_len = func_codeobj.co_argcount
+
+    # Parameter type hints subscripting this callable type hint.
+    hint_params = get_hint_pep484585_callable_params(hint)
+
+    # ....................{ PARAMS                         }....................
+    # If this hint is subscripted by a tuple of parameter type hints (rather
+    # than an ellipsis or parameter specification)...
+    if isinstance(hint_params, tuple):
+        # Number of these parameter type hints.
+        hint_params_len = len(hint_params)
+
+        # Number of positional parameters accepted by this callable, excluding
+        # parameters implicitly passed by this callable.
+        func_args_pos_len = max(func_args_len - func_args_bound_len, 0)
+
+        # Number of these positional parameters lacking default values.
+        func_args_pos_required_len = max(
+            func_args_pos_len - len(func_pure.__defaults__ or ()), 0)
+
+        # True only if this function accepts a variadic positional parameter.
+        is_func_arg_var_pos = bool(func_codeobj.co_flags & CO_VARARGS)
+
+        # If this callable requires more positional parameters than this hint
+        # passes, this callable is incompatible with this hint.
+        if func_args_pos_required_len > hint_params_len:
+            return (
+                f'requires {func_args_pos_required_len} positional '
+                f'parameter(s) but hint passes only {hint_params_len}'
+            )
+        # Else, this callable requires no more positional parameters than this
+        # hint passes.
+        #
+        # If this callable accepts fewer positional parameters than this hint
+        # passes, this callable is incompatible with this hint.
+        elif (
+            func_args_pos_len < hint_params_len and
+            not is_func_arg_var_pos
+        ):
+            return (
+                f'accepts only {func_args_pos_len} positional '
+                f'parameter(s) but hint passes {hint_params_len}'
+            )
+        # Else, this callable accepts at least as many positional parameters as
+        # this hint passes.
+
+        # Dictionary mapping from the names of optional keyword-only parameters
+        # accepted by this function to the default values of those parameters.
+        func_kwdefaults = func_pure.__kwdefaults__ or {}
+
+        # For the name of each keyword-only parameter accepted by this
+        # function...
+        for func_arg_name in func_codeobj.co_varnames[
+            func_args_len:func_args_len + func_codeobj.co_kwonlyargcount]:
+            # If this parameter is mandatory, this callable is incompatible
+            # with this hint.
+            if func_arg_name not in func_kwdefaults:
+                return (
+                    f'requires keyword-only parameter "{func_arg_name}" '
+                    f'unpassable by hint'
+                )
+            # Else, this parameter is optional.
+
+        # Names of all positional parameters accepted by this callable.
+        func_arg_names = func_codeobj.co_varnames[
+            func_args_bound_len:func_args_len]
+
+        # Name of the variadic positional parameter accepted by this function
+        # if any *OR* "None" otherwise.
+        func_arg_var_pos_name = (
+            func_codeobj.co_varnames[
+                func_args_len + func_codeobj.co_kwonlyargcount]
+            if is_func_arg_var_pos else
+            None
+        )
+
+        # For the 0-based index of each parameter type hint and that hint...
+        for hint_param_index, hint_param in enumerate(hint_params):
+            # Name of the parameter of this callable receiving this parameter.
+            func_arg_name = (
+                func_arg_names[hint_param_index]
+                if hint_param_index < len(func_arg_names) else
+                func_arg_var_pos_name
+            )
+
+            # If this parameter is annotated by a hint that is *NOT* a superhint
+            # of this parameter type hint, this callable is incompatible with
+            # this hint.
+            if not _is_subhint_or_unknown(
+                is_subhint=is_subhint,
+                subhint=hint_param,
+                superhint=func_hints.get(func_arg_name, hint_param),  # pyright: ignore
+            ):
+                return (
+                    f'parameter "{func_arg_name}" hint '
+                    f'{repr(func_hints[func_arg_name])} not superhint of '  # pyright: ignore
+                    f'{repr(hint_param)}'
+                )
+            # Else, this parameter is either unannotated *OR* annotated by a
+            # superhint of this parameter type hint.
+    # Else, this hint is subscripted by either an ellipsis *OR* parameter
+    # specification. In either case, this hint accepts *ANY* parameters.
+
+    # ....................{ RETURN                         }....................
+    # Return type hint subscripting this callable type hint.
+    hint_return = get_hint_pep484585_callable_return(hint)
+
+    # If the return of this callable is annotated by a hint that is *NOT* a
+    # subhint of this return type hint, this callable is incompatible with this
+    # hint.
+    if not _is_subhint_or_unknown(
+        is_subhint=is_subhint,
+        subhint=func_hints.get('return', hint_return),
+        superhint=hint_return,
+    ):
+        return (
+            f'return hint {repr(func_hints["return"])} not subhint of '
+            f'{repr(hint_return)}'
+        )
+    # Else, the return of this callable is either unannotated *OR* annotated by
+    # a subhint of this return type hint.
+
+    # Return "None", as the signature of this callable is compatible with this
+    # hint.
+    return None
+
+# ....................{ FACTORIES                          }....................
+def make_func_pep484585_callable_signature_tester(
+    hint: Hint) -> Callable[[object], bool]:
+    '''
+    **Callable signature tester** (i.e., low-level function returning
+    :data:`True` only if the signature of the passed callable is compatible
+    with the passed :pep:`484`- or :pep:`585`-compliant **callable type hint**)
+    dynamically created for the passed hint.
+
+    The returned tester memoizes the result of calling the
+    :func:`.get_func_pep484585_callable_signature_cause_or_none` getter on each
+    callable against the code object underlying that callable into a new
+    bounded Least Recently Used (LRU) cache specific to that tester. Repeatedly
+    passing callables sharing the same code object (e.g., the same callback
+    registered by a plugin, closures created by the same factory) thus reduces
+    to a single dictionary lookup after the first such call.
+
+    Callables sharing the same code object are assumed to share the same
+    parameter defaults and annotations. Although callers may violate this
+    assumption by manually reassigning the ``__defaults__``,
+    ``__kwdefaults__``, or ``__annotations__`` dunder attributes of a
+    callable, doing so is sufficiently uncommon to be safely ignorable.
+
+    This factory is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator), as the type-checking code calling the
+    returned tester is already memoized against this hint.
+
+    Parameters
+    ----------
+    hint : Hint
+        Callable type hint to create this tester for.
+
+    Returns
+    -------
+    Callable[[object], bool]
+        Callable signature tester specific to this hint.
+    '''
+
+    # Cache mapping from the 2-tuple "(func_codeobj, func_args_bound_len)" of
+    # each previously tested callable to the result of testing that callable.
+    func_codeobj_to_is_valid = CacheLruStrong(CALLABLE_SIGNATURE_CACHE_SIZE)
+
+    # Register this cache for subsequent introspection.
+    _callable_signature_caches[id(func_codeobj_to_is_valid)] = (
+        func_codeobj_to_is_valid)
+
+    def is_func_pep484585_callable_signature_valid(func: object) -> bool:
+        '''
+        :data:`True` only if the signature of the passed callable is compatible
+        with the callable type hint this tester was created for.
+
+        Parameters
+        ----------
+        func : object
+            Callable to be tested.
+
+        Returns
+        -------
+        bool
+            :data:`True` only if this signature is compatible with this hint.
+        '''
+
+        # Pure-Python function underlying this callable if any *OR* "None"
+        # otherwise and the number of leading positional parameters of that
+        # function implicitly passed by that callable.
+        func_pure, func_args_bound_len = _get_func_pure_or_none(func)
+
+        # If this callable is *NOT* efficiently introspectable, silently accept
+        # this callable.
+        if func_pure is None:
+            return True
+        # Else, this callable is efficiently introspectable.
+
+        # Key uniquely identifying the signature of this callable.
+        func_key = (func_pure.__code__, func_args_bound_len)
+
+        # Attempt to return the previously memoized result of testing this
+        # callable.
+        try:
+            return func_codeobj_to_is_valid[func_key]  # type: ignore[return-value]
+        # If this callable has yet to be tested...
+        except KeyError:
+            # True only if the signature of this callable is compatible with
+            # this hint.
+            is_valid = get_func_pep484585_callable_signature_cause_or_none(
+                func=func, hint=hint) is None
+
+            # Memoize this result *BEFORE* returning this result.
+            func_codeobj_to_is_valid[func_key] = is_valid
+            return is_valid
+
+    # Return this tester.
+    return is_func_pep484585_callable_signature_valid
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_func_pure_or_none(func: object) -> tuple[Optional[FunctionType], int]:
+    '''
+    2-tuple ``(func_pure, func_args_bound_len)`` describing the **pure-Python
+    function** (i.e., :class:`types.FunctionType` object) underlying the passed
+    callable, where:
+
+    * ``func_pure`` is either:
+
+      * If this callable is a pure-Python function, this callable as is.
+      * If this callable is a method bound to a pure-Python function, that
+        function.
+      * Else, :data:`None`.
+
+    * ``func_args_bound_len`` is the number of leading positional parameters of
+      that function implicitly passed by this callable (i.e., ``1`` for bound
+      methods and ``0`` otherwise).
+
+    Parameters
+    ----------
+    func : object
+        Callable to be inspected.
+
+    Returns
+    -------
+    tuple[Optional[FunctionType], int]
+        2-tuple ``(func_pure, func_args_bound_len)`` as described above.
+    '''
+
+    # Type of this callable.
+    func_type = type(func)
+
+    # If this callable is a pure-Python function, return this function as is.
+    if func_type is FunctionType:
+        return func, 0  # type: ignore[return-value]
+    # Else, this callable is *NOT* a pure-Python function.
+    #
+    # If this callable is a bound method...
+    elif func_type is MethodBoundInstanceOrClassType:
+        # Function underlying this method.
+        func = func.__func__  # type: ignore[attr-defined]
+
+        # If that function is a pure-Python function, return that function.
+        if type(func) is FunctionType:
+            return func, 1  # type: ignore[return-value]
+        # Else, that function is *NOT* a pure-Python function.
+
+    # Else, this callable is *NOT* efficiently introspectable.
+    return None, 0
+
+
+def _is_subhint_or_unknown(
+    is_subhint: Callable[[Hint, Hint], bool],
+    subhint: Hint,
+    superhint: Hint,
+) -> bool:
+    '''
+    :data:`True` only if either the first passed hint is a subhint of the
+    second passed hint *or* this relation is unknown (i.e., either hint is a
+    stringified forward reference *or* is unsupported by the
+    :func:`beartype.door.is_subhint` tester).
+
+    Parameters
+    ----------
+    is_subhint : Callable[[Hint, Hint], bool]
+        The :func:`beartype.door.is_subhint` tester, passed by the caller to
+        avoid repeatedly importing that tester.
+    subhint : Hint
+        Hint to be tested as the subhint.
+    superhint : Hint
+        Hint to be tested as the superhint.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this relation either holds *or* is unknown.
+    '''
+
+    # If either hint is a stringified forward reference, this relation is
+    # unknown. Avoid resolving this reference, which requires the global scope
+    # of the callable annotated by this reference and is thus best deferred to
+    # the call-time type-checking of that callable (if any).
+    if isinstance(subhint, str) or isinstance(superhint, str):
+        return True
+    # Else, neither hint is a stringified forward reference.
+
+    # Attempt to return true only if this relation holds.
+    try:
+        return is_subhint(subhint, superhint)
+    # If either hint is unsupported by that tester, this relation is unknown.
+    except BeartypeDoorException:
+        return True
+
+# ....................{ PRIVATE ~ globals                  }....................
+_callable_signature_caches: WeakValueDictionary[int, CacheLruStrong] = (
+    WeakValueDictionary())
+'''
+**Callable signature cache registry** (i.e., weak dictionary mapping from the
+object id of each cache created by the
+:func:`.make_func_pep484585_callable_signature_tester` factory to that cache).
+
+This registry weakly refers to these caches, which are instead strongly
+referred to by the closures of the testers created by that factory. This
+registry thus never prolongs the lifetimes of these caches. This registry
+enables the :func:`beartype._util.cache.utilcacheinfo.cache_info` getter to
+introspect these otherwise closure-local caches.
+'''
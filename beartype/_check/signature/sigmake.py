@@ -21,10 +21,18 @@ This private submodule is *not* intended for importation by downstream callers.
 #* Rename this submodule to "makesig". *lol*
 
 # ....................{ IMPORTS                            }....................
-from beartype._data.check.code.datacodename import ARG_NAME_GETRANDBITS
+from beartype._check.code.codecursor import set_func_scope_cursor
+from beartype._check.code.codespecialize import (
+    set_func_scope_type_specializer)
+from beartype._check.code.codeunion import set_func_scope_union_profiler
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_CURSOR,
+    ARG_NAME_GETRANDBITS,
+)
 from beartype._conf.confmain import BeartypeConf
 from beartype._data.check.code.func.datacodefuncwrap import (
     CODE_SIGNATURE_SCOPE_ARG_format,
+    CODE_INIT_CURSOR_INT,
     CODE_INIT_RANDOM_INT,
 )
 from beartype._data.typing.datatyping import LexicalScope
@@ -93,6 +101,21 @@ def make_func_signature(
     assert isinstance(code_signature_prefix, str), (
         f'{repr(code_signature_prefix)} not string.')
 
+    # If the body of this wrapper requires a cursor, replace the cursor shared
+    # by all wrappers type-checking the same hints under the same configuration
+    # by a new cursor specific to this wrapper *BEFORE* declaring parameters.
+    set_func_scope_cursor(func_scope)
+
+    # If the body of this wrapper requires a union profiler, replace the union
+    # profiler shared by all such wrappers by a new union profiler specific to
+    # this wrapper *BEFORE* declaring parameters.
+    set_func_scope_union_profiler(func_scope, conf.union_reorder_calls)
+
+    # If the body of this wrapper requires a type specializer, similarly replace
+    # the placeholder type specializer by a new type specializer specific to
+    # this wrapper.
+    set_func_scope_type_specializer(func_scope, conf.specialize_calls)
+
     # Python code snippet declaring all optional private beartype-specific
     # parameters directly derived from the local scope established by the above
     # calls to the _code_check_args() and _code_check_return() functions.
@@ -143,6 +166,13 @@ def make_func_signature(
         # Else, this body requires *NO* such integer. In this case, preserve
         # this signature as is.
         ''
+    ) + (
+        # If the body of this wrapper requires a cursor integer, append code
+        # localizing the next such integer to this signature.
+        CODE_INIT_CURSOR_INT
+        if ARG_NAME_CURSOR in func_scope else
+        # Else, this body requires *NO* such integer.
+        ''
     )
 
     # Return this signature suffixed by zero or more preliminary statements.
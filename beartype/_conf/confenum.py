@@ -63,22 +63,52 @@ class BeartypeStrategy(Enum):
     O1 : EnumMemberType
         **Constant-time strategy** (i.e., the default ``O(1)`` strategy,
         type-checking a single randomly selected item of each container). As the
-        default, this strategy need *not* be explicitly enabled.
+        default, this strategy need *not* be explicitly enabled. Containers
+        *not* supporting efficient random access (e.g., sets, mappings) are
+        type-checked by selecting only their first item by default or, if the
+        :attr:`beartype.BeartypeConf.is_random_reiterable` option is enabled,
+        by usually selecting an item from only their first few items and
+        occasionally from *all* their items, preserving an amortized ``O(1)``
+        bound while eventually type-checking all items.
+    Ok : EnumMemberType
+        **Amortized full-coverage strategy** (i.e., the ``O(k)`` strategy,
+        type-checking the next slice of ``k`` items of each container on each
+        call). This strategy currently applies *only* to sequences (e.g., lists,
+        tuples). Each wrapper function generated under this strategy maintains
+        a private cursor advanced by ``k`` on each call, such that repeatedly
+        passing the same sequence ``obj`` to the same callable type-checks
+        *all* items of that sequence in at most ``ceil(len(obj) / k)`` calls
+        while each call still type-checks only ``k`` items. This strategy is
+        thus best suited to long-lived sequences repeatedly passed to the same
+        frequently called callable (e.g., caches, registries). All other
+        containers are type-checked as under the default
+        :attr:`BeartypeStrategy.O1` strategy.
     Ologn : EnumMemberType
         **Logarithmic-time strategy** (i.e., the ``O(log n)`` strategy,
         type-checking a randomly selected number of items ``log(len(obj))`` of
-        each container ``obj``). This strategy is **currently unimplemented.**
-        (*To be implemented by a future beartype release.*)
+        each container ``obj``). This strategy currently applies *only* to
+        sequences (e.g., lists, tuples), which this strategy partitions into
+        ``ceil(log2(len(obj) + 1))`` equally sized strata and then samples one
+        pseudo-random item from each stratum. All other containers are
+        type-checked as under the default :attr:`BeartypeStrategy.O1`
+        strategy.
     On : EnumMemberType
         **Linear-time strategy** (i.e., the ``O(n)`` strategy, type-checking
-        *all* items of a container). This strategy is **currently
-        unimplemented.** (*To be implemented by a future beartype release.*)
+        *all* items of a container). This strategy deeply type-checks *all*
+        items of *all* nested sequences, reiterables, quasiiterables that are
+        collections, and mappings (including both keys and values) passed to and
+        returned from callables enabling this strategy. Since this strategy
+        scales linearly with container size, this strategy is best reserved for
+        callables receiving small containers *or* callables for which
+        exhaustive type-checking outweighs runtime efficiency (e.g., data
+        ingestion and validation at trust boundaries).
     '''
 
     O0 = next_enum_member_value()
     O1 = next_enum_member_value()
     Ologn = next_enum_member_value()
     On = next_enum_member_value()
+    Ok = next_enum_member_value()
 
 
 @die_unless_enum_member_values_unique
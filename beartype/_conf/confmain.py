@@ -21,13 +21,23 @@ callers.
 
 #FIXME: [DOCOS] Document all newly defined configuration parameters in our
 #reST-formatted docos, please -- including:
+#* "check_budget_ns".
+#* "check_yield_every".
 #* "claw_decor_place_func".
 #* "claw_decor_place_type".
 #* "claw_is_pep526".
 #* "claw_skip_package_names".
+#* "code_cache_dir".
 #* "hint_overrides".
+#* "is_check_callable_signature".
+#* "is_check_memo".
+#* "is_lazy".
 #* "is_pep557_fields".
 #* "is_random".
+#* "is_random_reiterable".
+#* "random_seed".
+#* "specialize_calls".
+#* "union_reorder_calls".
 #* "violation_door_type".
 #* "violation_param_type".
 #* "violation_return_type".
@@ -78,6 +88,17 @@ class BeartypeConf(object):
 
     Attributes
     ----------
+    _check_budget_ns : Optional[int]
+        **Type-checking time budget** (i.e., positive integer governing the
+        maximum number of nanoseconds that each type-check of each parameter or
+        return iterates over container items under the
+        :attr:`BeartypeStrategy.On` strategy before silently halting) *or*
+        :data:`None` if those type-checks are unbudgeted.
+    _check_yield_every : Optional[int]
+        **Generator yield sampling interval** (i.e., positive integer governing
+        how frequently items yielded by synchronous and asynchronous generators
+        are type-checked, such that every ``n``-th item is type-checked) *or*
+        :data:`None` if those items are never type-checked.
     _claw_decor_place_func : BeartypeDecorPlace
         **Import hook callable decorator place** (i.e., relative position in
         existing chains of one or more decorators decorating user-defined
@@ -100,6 +121,11 @@ class BeartypeConf(object):
         :mod:`beartype.claw` subpackage -- especially the otherwise fragile
         :mod:`beartype.claw.beartype_all` import hook, which subjects *all*
         packages to runtime type-checking by default.
+    _code_cache_dir : Optional[str]
+        Dirname of the **persistent code object cache** (i.e., on-disk
+        directory to which code objects compiled from type-checking wrappers
+        are persisted across Python processes) *or* :data:`None` if those code
+        objects are *not* persisted.
     _conf_args : tuple
         Tuple of the values of *all* possible keyword parameters (in arbitrary
         order) configuring this configuration.
@@ -114,6 +140,14 @@ class BeartypeConf(object):
         source to target type hints), enabling callers to lie to both their
         users and all other packages other than :mod:`beartype`. See also the
         :meth:`__new__` method docstring.
+    _is_check_callable_signature : bool
+        :data:`True` only if type-checking the signatures of callables against
+        **callable type hints** (e.g., ``Callable[[int, str], bool]``). See also
+        the :meth:`__new__` method docstring.
+    _is_check_memo : bool
+        :data:`True` only if memoizing successful type-checks of **deeply
+        immutable containers** (e.g., tuples of integers). See also the
+        :meth:`__new__` method docstring.
     _is_color : Optional[bool]
         Tri-state boolean governing how and whether beartype colours
         **type-checking violations** (i.e.,
@@ -131,6 +165,10 @@ class BeartypeConf(object):
     _is_debug : bool
         :data:`True` only if debugging :mod:`beartype`. See also the
         :meth:`__new__` method docstring.
+    _is_lazy : bool
+        :data:`True` only if deferring the generation of each type-checking
+        wrapper function until the first call to that function. See also the
+        :meth:`__new__` method docstring.
     _is_pep484_tower : bool
         :data:`True` only if enabling support for the :pep:`484`-compliant
         implicit numeric tower. See also the :meth:`__new__` method docstring.
@@ -147,6 +185,10 @@ class BeartypeConf(object):
     _is_random : bool
         :data:`True` only if pseudo-random type-checking strategies type-check
         items of pure-Python sequences pseudo-randomly.
+    _is_random_reiterable : bool
+        :data:`True` only if pseudo-random type-checking strategies also
+        type-check items of **reiterables** (e.g., sets, mappings)
+        pseudo-randomly. See also the :meth:`__new__` method docstring.
     _is_violation_door_warn : bool
         :data:`True` only if :attr:`violation_door_type` is a warning subclass.
         Note that this is stored only as a negligible optimization to avoid
@@ -163,17 +205,35 @@ class BeartypeConf(object):
         :data:`True` only if the caller explicitly passed the
         :attr:`_warning_cls_on_decorator_exception` parameter. See
         also the :meth:`__new__` method docstring.
+    _random_seed : Optional[int]
+        **Pseudo-random seed** (i.e., integer seeding the pseudo-random number
+        generator generating the pseudo-random integers with which
+        :mod:`beartype` selects container items to be type-checked) *or*
+        :data:`None` if those integers are generated by the global pseudo-random
+        number generator of the standard :mod:`random` module.
     _repr : Optional[str]
         Either:
 
         * If the :func:`repr` builtin has yet to call the :meth:`__repr__`
           dunder method, :data:`None`.
         * Else, the machine-readable representation of this configuration,
+    _specialize_calls : Optional[int]
+        **Type specialization threshold** (i.e., positive integer governing the
+        number of calls each type-checking wrapper function profiles before
+        specializing the type-checks of its parameters and return to the types
+        most frequently passed and returned) *or* :data:`None` if those wrappers
+        are never specialized.
     _strategy : BeartypeStrategy
         **Type-checking strategy** (i.e., :class:`BeartypeStrategy` enumeration
         member) with which to implement all type-checks in the wrapper function
         dynamically generated by the :func:`beartype.beartype` decorator for
         the decorated callable.
+    _union_reorder_calls : Optional[int]
+        **Union reordering threshold** (i.e., positive integer governing the
+        number of union type-checks each type-checking wrapper function profiles
+        before reordering the child hints of those unions by descending
+        frequency of satisfaction) *or* :data:`None` if those wrappers type-check
+        those child hints in their declared order.
     _violation_door_type : TypeException
         **DOOR violation type** (i.e., type of exception raised by the
         :func:`beartype.door.die_if_unbearable` type-checker when the object
@@ -222,25 +282,35 @@ class BeartypeConf(object):
     # cache dunder methods. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
+        '_check_budget_ns',
+        '_check_yield_every',
         '_claw_decor_place_func',
         '_claw_decor_place_type',
         '_claw_is_pep526',
         '_claw_skip_package_names',
+        '_code_cache_dir',
         '_conf_args',
         '_conf_kwargs',
         '_hash',
         '_hint_overrides',
+        '_is_check_callable_signature',
+        '_is_check_memo',
         '_is_color',
         '_is_debug',
+        '_is_lazy',
         '_is_pep484_tower',
         '_is_pep557_fields',
         '_is_random',
+        '_is_random_reiterable',
         '_is_violation_door_warn',
         '_is_violation_param_warn',
         '_is_violation_return_warn',
         '_is_warning_cls_on_decorator_exception_set',
+        '_random_seed',
         '_repr',
+        '_specialize_calls',
         '_strategy',
+        '_union_reorder_calls',
         '_violation_door_type',
         '_violation_param_type',
         '_violation_return_type',
@@ -252,25 +322,35 @@ class BeartypeConf(object):
     # Squelch false negatives from mypy. This is absurd. This is mypy. See:
     #     https://github.com/python/mypy/issues/5941
     if TYPE_CHECKING:
+        _check_budget_ns: Optional[int]
+        _check_yield_every: Optional[int]
         _claw_decor_place_func: BeartypeDecorPlace
         _claw_decor_place_type: BeartypeDecorPlace
         _claw_is_pep526: bool
         _claw_skip_package_names: CollectionStrs
+        _code_cache_dir: Optional[str]
         _conf_args: tuple
         _conf_kwargs: DictStrToAny
         _hash: int
         _hint_overrides: FrozenDict
+        _is_check_callable_signature: bool
+        _is_check_memo: bool
         _is_color: BoolTristate
         _is_debug: bool
+        _is_lazy: bool
         _is_pep484_tower: bool
         _is_pep557_fields: bool
         _is_random: bool
+        _is_random_reiterable: bool
         _is_violation_door_warn: bool
         _is_violation_param_warn: bool
         _is_violation_return_warn: bool
         _is_warning_cls_on_decorator_exception_set: bool
+        _random_seed: Optional[int]
         _repr: Optional[str]
+        _specialize_calls: Optional[int]
         _strategy: BeartypeStrategy
+        _union_reorder_calls: Optional[int]
         _violation_door_type: TypeException
         _violation_param_type: TypeException
         _violation_return_type: TypeException
@@ -296,19 +376,29 @@ class BeartypeConf(object):
 
         # Uncomment us when implementing O(n) type-checking, please.
         # check_time_max_multiplier: Union[int, None] = 1000,
+        check_budget_ns: Optional[int] = None,
+        check_yield_every: Optional[int] = None,
         claw_decor_place_func: BeartypeDecorPlace = (
             BeartypeDecorPlace.LAST_BEFORE_DECOR_HOSTILE),
         claw_decor_place_type: BeartypeDecorPlace = (
             BeartypeDecorPlace.LAST),
         claw_is_pep526: bool = True,
         claw_skip_package_names: CollectionStrs = (),
+        code_cache_dir: Optional[str] = None,
         hint_overrides: FrozenDict = FROZENDICT_EMPTY,
+        is_check_callable_signature: bool = False,
+        is_check_memo: bool = False,
         is_color: BoolTristateUnpassable = ARG_VALUE_UNPASSED,  # pyright: ignore
         is_debug: bool = False,
+        is_lazy: bool = False,
         is_pep484_tower: bool = False,
         is_pep557_fields: bool = False,
         is_random: bool = True,
+        is_random_reiterable: bool = False,
+        random_seed: Optional[int] = None,
+        specialize_calls: Optional[int] = None,
         strategy: BeartypeStrategy = BeartypeStrategy.O1,
+        union_reorder_calls: Optional[int] = None,
         violation_door_type: Optional[TypeException] = None,
         violation_param_type: Optional[TypeException] = None,
         violation_return_type: Optional[TypeException] = None,
@@ -344,6 +434,65 @@ class BeartypeConf(object):
 
         Parameters
         ----------
+        check_budget_ns : Optional[int], default: None
+            **Type-checking time budget** (i.e., positive integer governing the
+            maximum number of nanoseconds that each type-check of each
+            parameter or return iterates over container items before silently
+            halting) *or* :data:`None` if type-checks are unbudgeted. Ignored
+            unless ``strategy`` is :attr:`BeartypeStrategy.On`, as all other
+            strategies already type-check only a constant or logarithmic number
+            of items of each container.
+
+            If this budget is exhausted while type-checking a container, the
+            remaining items of that container (and of all other containers
+            subsequently visited by the same type-check) are silently accepted
+            *without* being type-checked. Type-checks thus never raise false
+            positives but may (rarely) miss violations in the unvisited items.
+            The number of type-checks that exhausted their budgets is recorded
+            for subsequent introspection (e.g., to tune this budget) and
+            returned by the public
+            :func:`beartype.get_check_budget_exceeded_count` getter.
+
+            This budget is enforced by polling the monotonic
+            :func:`time.perf_counter_ns` clock once per
+            :data:`beartype._data.check.code.datacodelen.CHECK_BUDGET_ITEMS_PER_POLL`
+            container items and is thus a soft rather than hard ceiling.
+            Callables in latency-critical code paths (e.g., request handlers)
+            receiving arbitrarily large containers are the intended use case.
+
+            Defaults to :data:`None`.
+        check_yield_every : Optional[int], default: None
+            **Generator yield sampling interval** (i.e., positive integer
+            governing how frequently items yielded by synchronous and
+            asynchronous generators are type-checked, such that every ``n``-th
+            item is type-checked) *or* :data:`None` if those items are never
+            type-checked.
+
+            By default, :func:`beartype.beartype` type-checks only the generator
+            object returned by calling a synchronous generator factory annotated
+            as returning either ``Generator[{hint_yield}, {hint_send},
+            {hint_return}]``, ``Iterator[{hint_yield}]``, or
+            ``Iterable[{hint_yield}]`` -- *not* the items that generator yields.
+            If this interval is passed, the wrapper generated for that factory
+            lazily type-checks these items as the caller consumes them: every
+            ``n``-th item yielded by that generator (starting at the first) is
+            type-checked against ``{hint_yield}``, every non-:data:`None` value
+            sent into that generator is type-checked against ``{hint_send}``,
+            and the value returned from that generator is type-checked against
+            ``{hint_return}``. Since that wrapper is itself the generator
+            delegating to the decorated generator, items are neither copied nor
+            buffered and *no* additional proxy object or stack frame is
+            introduced. Passing ``1`` type-checks every yielded item; passing
+            larger intervals trades coverage for speed in streaming pipelines
+            yielding millions of items.
+
+            Asynchronous generator factories annotated as returning either
+            ``AsyncGenerator[{hint_yield}, {hint_send}]``,
+            ``AsyncIterator[{hint_yield}]``, or ``AsyncIterable[{hint_yield}]``
+            are type-checked similarly, except that asynchronous generators
+            cannot return values.
+
+            Defaults to :data:`None`.
         check_time_max_multiplier : Union[int, None] = 1000
             **Deadline multiplier** (i.e., positive integer instructing
             :mod:`beartype` to prematurely halt the current type-check when the
@@ -512,6 +661,47 @@ class BeartypeConf(object):
               the ``worst_package_evah`` package in entirety).
 
             Defaults to the empty tuple.
+        code_cache_dir : Optional[str], default: None
+            Dirname of the **persistent code object cache** (i.e., on-disk
+            directory to which code objects compiled from type-checking
+            wrappers dynamically generated by :func:`beartype.beartype` are
+            persisted across Python processes) *or* :data:`None` if those code
+            objects are *not* persisted. If this directory does *not* exist,
+            :mod:`beartype` creates this directory (accessible *only* by the
+            current user, with mode ``0o700``) on first persisting a code
+            object. Enabling this option reduces the cost of compiling each
+            wrapper on subsequent process startups to the cost of reading and
+            unmarshalling a single small file, which matters most for
+            applications decorating many thousands of callables at startup.
+
+            Each code object is cached under a stable hash of both the code
+            generated for that wrapper *and* the versions of both
+            :mod:`beartype` and the active Python interpreter, which then
+            implicitly invalidates stale code objects on upgrading either.
+            Since that code already embeds the effects of all other
+            configuration options, this hash need *not* embed this
+            configuration. Code objects are written to temporary files
+            atomically renamed into place, guaranteeing that concurrent
+            processes sharing this directory never read partially written
+            files. Filesystem errors (e.g., permission errors) are silently
+            ignored, in which case wrappers are compiled as usual.
+
+            Note that :mod:`beartype` still generates the code of each wrapper
+            on each process startup, as that code refers to in-memory objects
+            (e.g., the types referenced by type hints) that *cannot* be
+            persisted. Only the compilation of that code is avoided.
+
+            **This directory must be trusted and private** (i.e., writable
+            *only* by the current user). Code objects are loaded from this
+            directory with the :mod:`marshal` module and then executed without
+            validation. Any user able to write to this directory can thus
+            execute arbitrary code in every Python process enabling this
+            option. Never set this option to a shared or world-writable
+            directory (e.g., ``/tmp``). :mod:`beartype` preserves the
+            permissions of existing directories.
+
+            Defaults to :data:`None`, in which case code objects are *not*
+            persisted.
         hint_overrides : FrozenDict, default: FROZENDICT_EMPTY
             **Type hint overrides** (i.e., frozen dictionary mapping from
             arbitrary source to target type hints), enabling callers to lie to
@@ -559,6 +749,57 @@ class BeartypeConf(object):
                @beartype
                def lies(all_lies: list[int | float]) -> int | float:
                    return all_lies[0]
+        is_check_callable_signature : bool, optional
+            :data:`True` only if type-checking the signatures of callables
+            against **callable type hints** (i.e., ``typing.Callable[...]`` and
+            ``collections.abc.Callable[...]`` type hints). By default,
+            :func:`beartype.beartype` only shallowly type-checks objects against
+            these hints with the :func:`callable` builtin. Enabling this boolean
+            additionally type-checks that:
+
+            * Each passed pure-Python function or bound method accepts exactly
+              as many positional parameters as parameter hints subscripting
+              that hint *and* requires no keyword-only parameters (e.g., a
+              function accepting exactly two positional parameters for the hint
+              ``Callable[[int, str], bool]``).
+            * Each annotated parameter of that callable is annotated by a
+              superhint of the corresponding parameter hint (e.g., ``int`` or
+              ``int | None`` for the ``int`` parameter hint above).
+            * The annotated return of that callable is annotated by a subhint
+              of the return hint (e.g., ``bool`` for the ``bool`` return hint
+              above).
+
+            The result of inspecting each callable is memoized against the code
+            object underlying that callable in a bounded Least Recently Used
+            (LRU) cache specific to each such hint, reducing repeated
+            type-checks of the same callback to a single dictionary lookup.
+            Callables whose signatures are *not* efficiently introspectable
+            (e.g., C-based builtins, classes, and callable objects) together
+            with parameters annotated by stringified forward references are
+            silently accepted as is.
+
+            Defaults to :data:`False`.
+        is_check_memo : bool, optional
+            :data:`True` only if memoizing successful type-checks of **deeply
+            immutable containers** (i.e., tuples and frozen sets whose items
+            are recursively either instances of types *or* deeply immutable
+            containers, such as ``tuple[int, ...]`` and
+            ``frozenset[tuple[str, float]]``). Enabling this boolean reduces
+            repeated type-checks of the same container against the same hint
+            (e.g., the same configuration tuple passed through many
+            :func:`beartype.beartype`-decorated callables) to a single
+            dictionary lookup.
+
+            Memoization records each container as a strong reference in a
+            bounded Least Recently Used (LRU) cache specific to each such hint,
+            ensuring that the identity of each memoized container is
+            *never* reused by another object while memoized. Since a container
+            type-checked under a non-linear-time strategy may contain items
+            that have yet to be type-checked, this boolean is ignored unless
+            ``strategy`` is the :attr:`.BeartypeStrategy.On` linear-time
+            strategy *and* ``check_budget_ns`` is :data:`None`.
+
+            Defaults to :data:`False`.
         is_color : BoolTristateUnpassable
             Tri-state boolean governing how and whether beartype colours
             **type-checking violations** (i.e.,
@@ -612,6 +853,48 @@ class BeartypeConf(object):
               conditionally embedded in the returned signature *only* when
               enabling this boolean.
 
+            Defaults to :data:`False`.
+        is_lazy : bool, optional
+            :data:`True` only if **lazily decorating** callables (i.e.,
+            deferring the generation of the type-checking wrapper function for
+            each decorated callable until the first call to that callable).
+            Enabling this boolean instructs :func:`beartype.beartype` to
+            instead decorate each callable with a lightweight **trampoline**
+            (i.e., placeholder function preserving the name, docstring, and
+            signature of that callable) that, when first called:
+
+            #. Generates the real type-checking wrapper function for that
+               callable.
+            #. Replaces itself with that wrapper on the object owning that
+               callable where feasible (i.e., the module or class declaring
+               that callable under the same name). Subsequent calls to that
+               callable then directly call that wrapper.
+            #. Calls that wrapper.
+
+            The cost of decorating callables at importation time is thus
+            proportional to the number of callables actually called by the
+            active Python process rather than the number of callables
+            decorated. This is the common case in large codebases, most of
+            whose callables are never called by any given process. Caveats
+            include:
+
+            * Exceptions raised by :func:`beartype.beartype` on generating
+              wrapper functions (e.g., due to unsupported type hints) are
+              deferred until the first call to each callable. If the
+              :attr:`warning_cls_on_decorator_exception` option is enabled,
+              that call instead emits that warning *and* then calls the
+              undecorated callable (as do all subsequent calls).
+            * References to trampolines that :func:`beartype.beartype` is
+              unable to replace (e.g., trampolines imported into other modules
+              before their first call *or* wrapped by descriptors) continue to
+              call those trampolines, which then defer to the real wrapper at
+              the cost of a single additional function call.
+            * Asynchronous callables (i.e., coroutine and asynchronous
+              generator factories) and synchronous generator factories are
+              decorated eagerly, as trampolines would obscure their kind from
+              introspection (e.g., :func:`inspect.iscoroutinefunction`,
+              :func:`inspect.isgeneratorfunction`).
+
             Defaults to :data:`False`.
         is_pep484_tower : bool, optional
             :data:`True` only if enabling support for the :pep:`484`-compliant
@@ -675,6 +958,76 @@ class BeartypeConf(object):
               deterministic testing).
 
             Defaults to :data:`True`.
+        is_random_reiterable : bool, default: False
+            :data:`True` only if pseudo-random type-checking strategies also
+            type-check items of **reiterables** (i.e., collections that are
+            *not* sequences, including sets, frozen sets, dictionary views, and
+            mappings) pseudo-randomly. Ignored if ``is_random`` is
+            :data:`False`. Notably, if ``strategy`` is the default
+            :attr:`.BeartypeStrategy.O1` constant-time type-checking strategy
+            and this option is:
+
+            * :data:`True`, then :mod:`beartype` type-checks a single
+              pseudo-randomly selected item from each non-empty reiterable.
+              Since reiterables do *not* support random access, that item is
+              usually selected from only the first
+              :data:`beartype._data.check.code.datacodelen.REITERABLE_PREFIX_LEN`
+              items and occasionally from *all* items, preserving an amortized
+              :math:`O(1)` time bound while eventually type-checking all items.
+              This sampling is *not* free, however. Each type-check of a
+              reiterable then iterates over several items, costing roughly two
+              to three times as much as the default first-item type-check.
+            * :data:`False`, then :mod:`beartype` type-checks only the first
+              item from each non-empty reiterable in :math:`O(1)` time.
+
+            Defaults to :data:`False`.
+        random_seed : Optional[int], default: None
+            **Pseudo-random seed** (i.e., integer seeding a private
+            pseudo-random number generator generating the pseudo-random integers
+            with which :mod:`beartype` selects container items to be
+            type-checked) *or* :data:`None` if those integers are generated by
+            the global pseudo-random number generator of the standard
+            :mod:`random` module. Ignored if ``is_random`` is :data:`False`.
+
+            Passing a seed renders pseudo-random type-checking reproducible
+            across runs of the active Python interpreter (e.g., to reproduce a
+            type-checking violation detected by a prior test run). All
+            configurations passed the same seed share the same generator, whose
+            output then depends *only* on that seed and the order in which
+            :mod:`beartype`-generated type-checkers are called. Passing a seed
+            does *not* modify the state of the global generator of the
+            :mod:`random` module and thus does *not* interfere with unrelated
+            third-party code sharing that generator.
+
+            Defaults to :data:`None`.
+        specialize_calls : Optional[int], default: None
+            **Type specialization threshold** (i.e., positive integer governing
+            the number of calls each type-checking wrapper function profiles
+            before specializing the type-checks of its parameters and return to
+            the types most frequently passed and returned) *or* :data:`None` if
+            those wrappers are never specialized.
+
+            Callables are often **monomorphic** at runtime (i.e., passed and
+            returning objects of the same types on every call), yet their
+            wrappers test every call against the full type hints annotating
+            those callables: e.g., every child type of a union like ``int | str
+            | bytes`` and every registered subclass of an abstract base class
+            like :class:`collections.abc.Sequence`. If this threshold is passed,
+            each wrapper records the type of each parameter and return
+            annotated by a type hint reducible to an :func:`isinstance` check
+            against one or more types. After this many calls, that wrapper
+            regenerates its body such that each such type-check first tests
+            whether the type of that parameter or return is *exactly* the type
+            most frequently observed (e.g., ``type(param) is str``) *before*
+            falling back to the original type-check, then atomically swaps that
+            body in. In effect, this is an inline cache for type-checking.
+
+            Specialization preserves the set of objects satisfying each type
+            hint and thus never changes which objects violate type hints.
+            Currently, only wrappers generated by the :func:`beartype.beartype`
+            decorator are specialized.
+
+            Defaults to :data:`None`.
         strategy : BeartypeStrategy, default: BeartypeStrategy.O1
             **Type-checking strategy** (i.e., :class:`.BeartypeStrategy`
             enumeration member) with which to implement all type-checks in the
@@ -682,6 +1035,31 @@ class BeartypeConf(object):
             :func:`beartype.beartype` decorator for the decorated callable.
             Defaults to :attr: `BeartypeStrategy.O1`, the ``O(1)`` constant-time
             strategy.
+        union_reorder_calls : Optional[int], default: None
+            **Union reordering threshold** (i.e., positive integer governing the
+            number of union type-checks each type-checking wrapper function
+            profiles before reordering the child hints of those unions by
+            descending frequency of satisfaction) *or* :data:`None` if those
+            wrappers type-check those child hints in their declared order.
+
+            Type-checking a union (e.g., ``int | str | list[bytes]``) tests each
+            child hint of that union in turn until one is satisfied. If most
+            objects passed to a wrapper satisfy a child hint tested late (e.g.,
+            ``list[bytes]`` above), most type-checks needlessly test the
+            preceding child hints first. If this threshold is passed, each
+            wrapper counts which child hint satisfies each type-check of each
+            union. After this many such type-checks, that wrapper regenerates
+            its body with the child hints of each union reordered from most to
+            least frequently satisfied and atomically swaps that body in.
+            Subsequent type-checks then test the most frequently satisfied
+            child hints first *without* further profiling.
+
+            Profiling incurs one additional function call per union
+            type-check until this threshold is reached. Reordering preserves
+            the set of objects satisfying each union and thus never changes
+            which objects violate type hints.
+
+            Defaults to :data:`None`.
         violation_door_type : Optional[TypeException]
             **DOOR violation type** (i.e., type of exception raised by the
             :func:`beartype.door.die_if_unbearable` type-checker when the object
@@ -780,12 +1158,27 @@ class BeartypeConf(object):
         BeartypeConfParamException
             If either:
 
+            * ``check_budget_ns`` is neither :data:`None` *nor* a positive
+              integer.
+            * ``check_yield_every`` is neither :data:`None` *nor* a positive
+              integer.
+            * ``code_cache_dir`` is neither :data:`None` *nor* a non-empty
+              string.
+            * ``is_check_callable_signature`` is *not* a boolean.
+            * ``is_check_memo`` is *not* a boolean.
             * ``is_color`` is *not* a tri-state boolean.
             * ``is_debug`` is *not* a boolean.
+            * ``is_lazy`` is *not* a boolean.
             * ``is_pep484_tower`` is *not* a boolean.
             * ``is_pep557_fields`` is *not* a boolean.
+            * ``is_random_reiterable`` is *not* a boolean.
+            * ``random_seed`` is neither :data:`None` *nor* an integer.
+            * ``specialize_calls`` is neither :data:`None` *nor* a positive
+              integer.
             * ``strategy`` is *not* a :class:`BeartypeStrategy` enumeration
               member.
+            * ``union_reorder_calls`` is neither :data:`None` *nor* a positive
+              integer.
             * ``warning_cls_on_decorator_exception`` is neither :data:`None`
               *nor* a **warning category** (i.e., :class:`Warning` subclass).
         BeartypeConfShellVarException
@@ -861,17 +1254,27 @@ class BeartypeConf(object):
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
             # Efficiently hashable tuple of these parameters in arbitrary order.
             conf_args = (
+                check_budget_ns,
+                check_yield_every,
                 claw_decor_place_func,
                 claw_decor_place_type,
                 claw_is_pep526,
                 claw_skip_package_names,
+                code_cache_dir,
                 hint_overrides,
+                is_check_callable_signature,
+                is_check_memo,
                 is_color,
                 is_debug,
+                is_lazy,
                 is_pep484_tower,
                 is_pep557_fields,
                 is_random,
+                is_random_reiterable,
+                random_seed,
+                specialize_calls,
                 strategy,
+                union_reorder_calls,
                 violation_door_type,
                 violation_param_type,
                 violation_return_type,
@@ -894,17 +1297,27 @@ class BeartypeConf(object):
             # defined *AFTER* this method first attempts to efficiently reduce
             # to a noop by returning a previously instantiated configuration.
             conf_kwargs = dict(
+                check_budget_ns=check_budget_ns,
+                check_yield_every=check_yield_every,
                 claw_decor_place_func=claw_decor_place_func,
                 claw_decor_place_type=claw_decor_place_type,
                 claw_is_pep526=claw_is_pep526,
                 claw_skip_package_names=claw_skip_package_names,
+                code_cache_dir=code_cache_dir,
                 hint_overrides=hint_overrides,
+                is_check_callable_signature=is_check_callable_signature,
+                is_check_memo=is_check_memo,
                 is_color=is_color,
                 is_debug=is_debug,
+                is_lazy=is_lazy,
                 is_pep484_tower=is_pep484_tower,
                 is_pep557_fields=is_pep557_fields,
                 is_random=is_random,
+                is_random_reiterable=is_random_reiterable,
+                random_seed=random_seed,
+                specialize_calls=specialize_calls,
                 strategy=strategy,
+                union_reorder_calls=union_reorder_calls,
                 violation_door_type=violation_door_type,
                 violation_param_type=violation_param_type,
                 violation_return_type=violation_return_type,
@@ -971,6 +1384,8 @@ class BeartypeConf(object):
             # parameters from the "conf_kwargs" dictionary possibly modified by
             # the above call to the default_conf_kwargs() function rather than
             # the original passed values of these parameters.
+            self._check_budget_ns = conf_kwargs['check_budget_ns']  # pyright: ignore
+            self._check_yield_every = conf_kwargs['check_yield_every']  # pyright: ignore
             self._claw_decor_place_func = conf_kwargs[  # pyright: ignore
                 'claw_decor_place_func']
             self._claw_decor_place_type = conf_kwargs[  # pyright: ignore
@@ -978,13 +1393,23 @@ class BeartypeConf(object):
             self._claw_is_pep526 = conf_kwargs['claw_is_pep526']  # pyright: ignore
             self._claw_skip_package_names = conf_kwargs[
                 'claw_skip_package_names']  # pyright: ignore
+            self._code_cache_dir = conf_kwargs['code_cache_dir']  # pyright: ignore
             self._hint_overrides = conf_kwargs['hint_overrides']  # pyright: ignore
+            self._is_check_callable_signature = conf_kwargs[
+                'is_check_callable_signature']  # pyright: ignore
+            self._is_check_memo = conf_kwargs['is_check_memo']  # pyright: ignore
             self._is_color = conf_kwargs['is_color']  # pyright: ignore
             self._is_debug = conf_kwargs['is_debug']  # pyright: ignore
+            self._is_lazy = conf_kwargs['is_lazy']  # pyright: ignore
             self._is_pep484_tower = conf_kwargs['is_pep484_tower']  # pyright: ignore
             self._is_pep557_fields = conf_kwargs['is_pep557_fields']  # pyright: ignore
             self._is_random = conf_kwargs['is_random']  # pyright: ignore
+            self._is_random_reiterable = conf_kwargs[
+                'is_random_reiterable']  # pyright: ignore
+            self._random_seed = conf_kwargs['random_seed']  # pyright: ignore
+            self._specialize_calls = conf_kwargs['specialize_calls']  # pyright: ignore
             self._strategy = conf_kwargs['strategy']  # pyright: ignore
+            self._union_reorder_calls = conf_kwargs['union_reorder_calls']  # pyright: ignore
             self._violation_door_type = conf_kwargs['violation_door_type']  # pyright: ignore
             self._violation_param_type = conf_kwargs['violation_param_type']  # pyright: ignore
             self._violation_return_type = conf_kwargs['violation_return_type']  # pyright: ignore
@@ -1095,6 +1520,61 @@ class BeartypeConf(object):
     # __getattr__() approach destroyed that typing -- which then effectively
     # broke backward compatibility with end users using static type-checkers.
 
+    @property
+    def check_budget_ns(self) -> Optional[int]:
+        '''
+        **Type-checking time budget** (i.e., positive integer governing the
+        maximum number of nanoseconds that each type-check of each parameter or
+        return iterates over container items under the
+        :attr:`BeartypeStrategy.On` strategy before silently halting) *or*
+        :data:`None` if those type-checks are unbudgeted.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._check_budget_ns
+
+
+    @property
+    def check_yield_every(self) -> Optional[int]:
+        '''
+        **Generator yield sampling interval** (i.e., positive integer governing
+        how frequently items yielded by synchronous and asynchronous generators
+        are type-checked, such that every ``n``-th item is type-checked) *or*
+        :data:`None` if those items are never type-checked.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._check_yield_every
+
+
+    @property
+    def code_cache_dir(self) -> Optional[str]:
+        '''
+        Dirname of the **persistent code object cache** (i.e., on-disk
+        directory to which code objects compiled from type-checking wrappers
+        are persisted across Python processes) *or* :data:`None` if those code
+        objects are *not* persisted.
+
+        **This directory must be trusted and private**, as code objects loaded
+        from this directory are executed without validation.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._code_cache_dir
+
+
     @property
     def hint_overrides(self) -> FrozenDict:
         '''
@@ -1115,6 +1595,42 @@ class BeartypeConf(object):
         return self._hint_overrides
 
 
+    @property
+    def random_seed(self) -> Optional[int]:
+        '''
+        **Pseudo-random seed** (i.e., integer seeding the pseudo-random number
+        generator generating the pseudo-random integers with which
+        :mod:`beartype` selects container items to be type-checked) *or*
+        :data:`None` if those integers are generated by the global pseudo-random
+        number generator of the standard :mod:`random` module.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._random_seed
+
+
+    @property
+    def specialize_calls(self) -> Optional[int]:
+        '''
+        **Type specialization threshold** (i.e., positive integer governing the
+        number of calls each type-checking wrapper function profiles before
+        specializing the type-checks of its parameters and return to the types
+        most frequently passed and returned) *or* :data:`None` if those wrappers
+        are never specialized.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._specialize_calls
+
+
     @property
     def strategy(self) -> BeartypeStrategy:
         '''
@@ -1132,6 +1648,24 @@ class BeartypeConf(object):
         return self._strategy
 
 
+    @property
+    def union_reorder_calls(self) -> Optional[int]:
+        '''
+        **Union reordering threshold** (i.e., positive integer governing the
+        number of union type-checks each type-checking wrapper function profiles
+        before reordering the child hints of those unions by descending
+        frequency of satisfaction) *or* :data:`None` if those wrappers
+        type-check those child hints in their declared order.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._union_reorder_calls
+
+
     @property
     def warning_cls_on_decorator_exception(self) -> (
         Optional[TypeWarning]):
@@ -1149,6 +1683,36 @@ class BeartypeConf(object):
         return self._warning_cls_on_decorator_exception
 
     # ..................{ PROPERTIES ~ options : bool        }..................
+    @property
+    def is_check_callable_signature(self) -> bool:
+        '''
+        :data:`True` only if type-checking the signatures of callables against
+        **callable type hints** (e.g., ``Callable[[int, str], bool]``).
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._is_check_callable_signature
+
+
+    @property
+    def is_check_memo(self) -> bool:
+        '''
+        :data:`True` only if memoizing successful type-checks of **deeply
+        immutable containers** (e.g., tuples of integers).
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._is_check_memo
+
+
     @property
     def is_color(self) -> BoolTristate:
         '''
@@ -1189,6 +1753,21 @@ class BeartypeConf(object):
         return self._is_debug
 
 
+    @property
+    def is_lazy(self) -> bool:
+        '''
+        :data:`True` only if deferring the generation of each type-checking
+        wrapper function until the first call to that function.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._is_lazy
+
+
     @property
     def is_random(self) -> bool:
         '''
@@ -1203,6 +1782,22 @@ class BeartypeConf(object):
 
         return self._is_random
 
+
+    @property
+    def is_random_reiterable(self) -> bool:
+        '''
+        :data:`True` only if pseudo-random type-checking strategies also
+        type-check items of **reiterables** (e.g., sets, mappings)
+        pseudo-randomly.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._is_random_reiterable
+
     # ..................{ PROPERTIES ~ options : bool : pep  }..................
     @property
     def is_pep484_tower(self) -> bool:
@@ -156,9 +156,60 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
     # ..................{ MANUALLY                           }..................
     # Configuration options to be validated manually.
 
+    # If "check_budget_ns" is neither "None" *NOR* a positive integer, raise an
+    # exception.
+    #
+    # Note that booleans are integers and thus explicitly excluded here.
+    if not (
+        conf_kwargs['check_budget_ns'] is None or (
+            isinstance(conf_kwargs['check_budget_ns'], int) and
+            not isinstance(conf_kwargs['check_budget_ns'], bool) and
+            conf_kwargs['check_budget_ns'] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "check_budget_ns" '
+            f'value {repr(conf_kwargs["check_budget_ns"])} neither "None" nor '
+            f'positive integer.'
+        )
+    # Else, "check_budget_ns" is either "None" *OR* a positive integer.
+    #
+    # If "check_yield_every" is neither "None" *NOR* a positive integer, raise
+    # an exception.
+    #
+    # Note that booleans are integers and thus explicitly excluded here.
+    elif not (
+        conf_kwargs['check_yield_every'] is None or (
+            isinstance(conf_kwargs['check_yield_every'], int) and
+            not isinstance(conf_kwargs['check_yield_every'], bool) and
+            conf_kwargs['check_yield_every'] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "check_yield_every" '
+            f'value {repr(conf_kwargs["check_yield_every"])} neither "None" '
+            f'nor positive integer.'
+        )
+    # Else, "check_yield_every" is either "None" *OR* a positive integer.
+    #
+    # If "code_cache_dir" is neither "None" *NOR* a non-empty string, raise an
+    # exception.
+    elif not (
+        conf_kwargs['code_cache_dir'] is None or (
+            isinstance(conf_kwargs['code_cache_dir'], str) and
+            conf_kwargs['code_cache_dir']
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "code_cache_dir" '
+            f'value {repr(conf_kwargs["code_cache_dir"])} neither "None" nor '
+            f'non-empty string.'
+        )
+    # Else, "code_cache_dir" is either "None" *OR* a non-empty string.
+    #
     # If "claw_decor_place_func" is *NOT* an enumeration member, raise
     # an exception.
-    if not isinstance(
+    elif not isinstance(
         conf_kwargs['claw_decor_place_func'],
         BeartypeDecorPlace
     ):
@@ -232,6 +283,42 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
         )
     # Else, "is_color" is a tri-state boolean.
     #
+    # If "random_seed" is neither "None" *NOR* an integer, raise an exception.
+    #
+    # Note that booleans are integers and thus explicitly excluded here. While
+    # technically valid seeds, booleans passed as seeds almost certainly signify
+    # a caller error (e.g., confusing this parameter with "is_random").
+    elif not (
+        conf_kwargs['random_seed'] is None or (
+            isinstance(conf_kwargs['random_seed'], int) and
+            not isinstance(conf_kwargs['random_seed'], bool)
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "random_seed" '
+            f'value {repr(conf_kwargs["random_seed"])} neither "None" nor '
+            f'integer.'
+        )
+    # Else, "random_seed" is either "None" *OR* an integer.
+    #
+    # If "specialize_calls" is neither "None" *NOR* a positive integer, raise an
+    # exception.
+    #
+    # Note that booleans are integers and thus explicitly excluded here.
+    elif not (
+        conf_kwargs['specialize_calls'] is None or (
+            isinstance(conf_kwargs['specialize_calls'], int) and
+            not isinstance(conf_kwargs['specialize_calls'], bool) and
+            conf_kwargs['specialize_calls'] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "specialize_calls" '
+            f'value {repr(conf_kwargs["specialize_calls"])} neither "None" '
+            f'nor positive integer.'
+        )
+    # Else, "specialize_calls" is either "None" *OR* a positive integer.
+    #
     # If "strategy" is *NOT* an enumeration member, raise an exception.
     elif not isinstance(conf_kwargs['strategy'], BeartypeStrategy):
         raise BeartypeConfParamException(
@@ -241,6 +328,24 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
         )
     # Else, "strategy" is an enumeration member.
     #
+    # If "union_reorder_calls" is neither "None" *NOR* a positive integer, raise
+    # an exception.
+    #
+    # Note that booleans are integers and thus explicitly excluded here.
+    elif not (
+        conf_kwargs['union_reorder_calls'] is None or (
+            isinstance(conf_kwargs['union_reorder_calls'], int) and
+            not isinstance(conf_kwargs['union_reorder_calls'], bool) and
+            conf_kwargs['union_reorder_calls'] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "union_reorder_calls" '
+            f'value {repr(conf_kwargs["union_reorder_calls"])} neither "None" '
+            f'nor positive integer.'
+        )
+    # Else, "union_reorder_calls" is either "None" *OR* a positive integer.
+    #
     # If "violation_verbosity" is *NOT* an enumeration member, raise an
     # exception.
     elif not isinstance(
@@ -354,10 +459,14 @@ def sanify_conf_kwargs(conf_kwargs: DictStrToAny) -> None:
 
 # ....................{ PRIVATE ~ globals                  }....................
 _ARG_NAMES_BOOL = (
+    'is_check_callable_signature',
+    'is_check_memo',
     'is_debug',
+    'is_lazy',
     'is_pep484_tower',
     'is_pep557_fields',
     'is_random',
+    'is_random_reiterable',
 )
 '''
 Tuple of the names of all keyword parameters to the
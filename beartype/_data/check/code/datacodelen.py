@@ -25,3 +25,141 @@ Negative index relative to the end of any arbitrary newline-delimited Python
 code string suffixed by the boolean operator ``" or"`` required to strip that
 suffix from that substring.
 '''
+
+
+PEP586_LITERALS_SET_LEN_MIN = 4
+'''
+Minimum number of literal objects subscripting a :pep:`586`-compliant
+:class:`typing.Literal` type hint for type-checking code dynamically generated
+for that hint to test membership in a frozen set of those objects rather than
+test equality against each of those objects in turn.
+
+Hash-based membership costs roughly the same as two or three equality
+comparisons. Below this length, the chain of equality comparisons is thus
+faster on average; at or above this length, hash-based membership is faster
+and increasingly so with each additional literal object.
+'''
+
+
+REITERABLE_PREFIX_LEN = 64
+'''
+Number of leading items of each **reiterable** (i.e., collection that is *not* a
+sequence, including sets, frozensets, dictionary views, and mappings) from which
+type-checking code dynamically generated under the default
+:attr:`beartype.BeartypeStrategy.O1` strategy preferentially selects a
+pseudo-random item to be type-checked when the opt-in
+:attr:`beartype.BeartypeConf.is_random_reiterable` option is enabled. When that
+option is disabled (as it is by default), that code instead type-checks only
+the first item of each reiterable.
+
+Reiterables grant efficient non-random access to *only* their first items.
+Accessing the :math:`k`-th item of a reiterable thus requires iterating over the
+:math:`k - 1` preceding items in :math:`O(k)` time. To preserve an amortized
+:math:`O(1)` time bound that does *not* increase with reiterable size, that code
+instead:
+
+* Selects a pseudo-random item from *all* items of a reiterable of length
+  :math:`n` with probability ``REITERABLE_PREFIX_LEN / n``, costing :math:`O(n)`
+  time but only :math:`O(1)` amortized time.
+* Else selects a pseudo-random item from only the first
+  ``REITERABLE_PREFIX_LEN`` items of that reiterable, costing :math:`O(1)` time.
+
+Since every item of that reiterable thus has a non-zero probability of being
+type-checked on each call, repeated calls eventually type-check *all* items of
+that reiterable.
+
+This length was chosen empirically. Under CPython, iterating over this many set
+or dictionary items with the C-based :func:`itertools.islice` iterator costs
+less than ~200ns and thus remains negligible compared to the cost of calling the
+wrapper function performing that type-check.
+'''
+
+
+SEQUENCE_CURSOR_SLICE_LEN = 8
+'''
+Maximum number of items of each **sequence** (i.e., container satisfying the
+:class:`collections.abc.Sequence` protocol) type-checked by each call to a
+type-checking wrapper function generated under the
+:attr:`beartype.BeartypeStrategy.Ok` strategy.
+
+That strategy type-checks a contiguous slice of (at most) this many items of
+each sequence starting at a **cursor** (i.e., non-negative integer specific to
+that wrapper function incremented by this length on each call to that wrapper
+function), wrapping around to the start of that sequence as needed. Repeatedly
+passing the same sequence of length :math:`n` to the same wrapper function thus
+type-checks *all* items of that sequence in at most ``ceil(n / k)`` calls, where
+:math:`k` is this length, while each call still type-checks only :math:`O(k)`
+items.
+
+This length was chosen to balance the cost of each call against the number of
+calls required to type-check *all* items of a sequence.
+'''
+
+
+CHECK_BUDGET_ITEMS_PER_POLL = 16
+'''
+Number of container items type-checked between successive polls of the
+:func:`time.perf_counter_ns` clock by type-checking code dynamically generated
+under the :attr:`beartype.BeartypeConf.check_budget_ns` option.
+
+Polling that clock once per item would roughly double the cost of type-checking
+each item under the :attr:`beartype.BeartypeStrategy.On` strategy. Polling that
+clock once per this many items instead amortizes that cost to a negligible
+fraction of the cost of type-checking those items, at a cost of overshooting
+that budget by the time required to type-check at most this many items.
+'''
+
+
+CHECK_MEMO_CACHE_SIZE = 256
+'''
+Maximum number of **memoized piths** (i.e., objects previously type-checked to
+satisfy some type hint) persisted by the Least Recently Used (LRU) cache
+specific to each type-checking expression dynamically generated under the
+:attr:`beartype.BeartypeConf.is_check_memo` option.
+
+Since each such cache strongly refers to each memoized pith, this size also
+bounds the number of objects whose lifetimes each such cache may prolong.
+'''
+
+
+CALLABLE_SIGNATURE_CACHE_SIZE = 256
+'''
+Maximum number of **callable signatures** (i.e., code objects of callables
+previously type-checked against some callable type hint) persisted by the Least
+Recently Used (LRU) cache specific to each callable type hint type-checked
+under the :attr:`beartype.BeartypeConf.is_check_callable_signature` option.
+
+Since each such cache strongly refers to each such code object, this size also
+bounds the number of code objects whose lifetimes each such cache may prolong.
+'''
+
+
+FUNC_TEMPLATE_CACHE_SIZE = 256
+'''
+Maximum number of **wrapper templates** (i.e., type-checking wrapper functions
+previously generated for callables sharing the same code object, type hints,
+and configuration) persisted by the Least Recently Used (LRU) cache memoizing
+the decoration of those callables.
+
+Since each such template strongly refers to the code object of the callable
+that template was generated for, this size also bounds the number of code
+objects whose lifetimes that cache may prolong.
+'''
+
+
+FUNC_CHECKER_CACHE_SIZE = 1024
+'''
+Default maximum number of **type-checking functions** (i.e., testers and
+raisers dynamically generated by the
+:func:`beartype._check.checkmake.make_func_checker` factory for some triple
+``(hint, conf, exception_prefix)``) persisted by each Least Recently Used (LRU)
+cache memoizing that factory (e.g., the cache underlying the
+:func:`beartype.door.is_bearable` tester).
+
+Since each such function strongly refers to the type hint that function
+type-checks (and thus to all types and objects subscripting that hint), this
+size also bounds the number of dynamically constructed hints (e.g.,
+``typing.Literal[*runtime_values]``) whose lifetimes each such cache may
+prolong. Callers may resize each such cache at runtime by setting the
+:attr:`beartype._util.cache.map.utilmaplru.CacheLruStrong.size` property.
+'''
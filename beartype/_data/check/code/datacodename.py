@@ -50,6 +50,36 @@ type-checking a :func:`beartype.beartype`-decorated callable).
 '''
 
 
+ARG_NAME_CHECK_RETURN = f'{NAME_PREFIX}check_return'
+'''
+Name of the **private generator return raiser parameter** (i.e.,
+:mod:`beartype`-specific hidden parameter whose default value is the raiser
+function type-checking the value returned by the synchronous generator created
+by a :func:`beartype.beartype`-decorated generator factory, conditionally passed
+under the :attr:`beartype.BeartypeConf.check_yield_every` option).
+'''
+
+
+ARG_NAME_CHECK_SEND = f'{NAME_PREFIX}check_send'
+'''
+Name of the **private generator send raiser parameter** (i.e.,
+:mod:`beartype`-specific hidden parameter whose default value is the raiser
+function type-checking each value sent into the generator created by a
+:func:`beartype.beartype`-decorated generator factory, conditionally passed
+under the :attr:`beartype.BeartypeConf.check_yield_every` option).
+'''
+
+
+ARG_NAME_CHECK_YIELD = f'{NAME_PREFIX}check_yield'
+'''
+Name of the **private generator yield raiser parameter** (i.e.,
+:mod:`beartype`-specific hidden parameter whose default value is the raiser
+function type-checking items yielded by the generator created by a
+:func:`beartype.beartype`-decorated generator factory, conditionally passed
+under the :attr:`beartype.BeartypeConf.check_yield_every` option).
+'''
+
+
 ARG_NAME_CONF = f'{NAME_PREFIX}conf'
 '''
 Name of the **private beartype configuration parameter** (i.e.,
@@ -59,6 +89,21 @@ generated by the :func:`beartype.beartype` decorator).
 '''
 
 
+ARG_NAME_CURSOR = f'{NAME_PREFIX}cursor'
+'''
+Name of the **private cursor parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is an :func:`itertools.count` iterator specific to
+the current wrapper function, conditionally passed to wrappers generated by the
+:func:`beartype.beartype` decorator under the
+:attr:`beartype.BeartypeStrategy.Ok` strategy).
+
+See Also
+--------
+:func:`beartype._check.code.codecursor.make_cursor`
+    Further details.
+'''
+
+
 ARG_NAME_EXCEPTION_PREFIX = f'{NAME_PREFIX}exception_prefix'
 '''
 Name of the **private exception prefix parameter** (i.e.,
@@ -83,10 +128,17 @@ callable passed to each wrapper function generated by the
 ARG_NAME_GETRANDBITS = f'{NAME_PREFIX}getrandbits'
 '''
 Name of the **private getrandbits parameter** (i.e., :mod:`beartype`-specific
-parameter whose default value is the highly performant C-based
-:func:`random.getrandbits` function conditionally passed to wrappers generated
-by the :func:`beartype.beartype` decorator whose type-checking logic requires
-one or more random integers).
+parameter whose default value is either the highly performant C-based
+:func:`random.getrandbits` function *or* the equally performant
+:meth:`random.Random.getrandbits` method bound to a private generator seeded by
+the :attr:`beartype.BeartypeConf.random_seed` option, conditionally passed to
+wrappers generated by the :func:`beartype.beartype` decorator whose
+type-checking logic requires one or more random integers).
+
+See Also
+--------
+:func:`beartype._check.code.coderandom.get_conf_getrandbits`
+    Further details.
 '''
 
 
@@ -110,6 +162,38 @@ hint unconditionally passed to the wrapper function generated internally by the
 '''
 
 
+ARG_NAME_TYPE_SPECIALIZED_PREFIX = f'{NAME_PREFIX}type_specialized_'
+'''
+Substring prefixing the name of each **private specialized type parameter**
+(i.e., :mod:`beartype`-specific parameter whose default value is the type most
+frequently passed as a parameter or returned as a return, passed to wrappers
+regenerated by a :class:`beartype._check.code.codespecialize.TypeSpecializer`
+object).
+'''
+
+
+ARG_NAME_TYPE_SPECIALIZER = f'{NAME_PREFIX}type_specializer'
+'''
+Name of the **private type specializer parameter** (i.e.,
+:mod:`beartype`-specific parameter whose default value is a
+:class:`beartype._check.code.codespecialize.TypeSpecializer` object specific to
+the current wrapper function, conditionally passed to wrappers generated by the
+:func:`beartype.beartype` decorator under the
+:attr:`beartype.BeartypeConf.specialize_calls` option).
+'''
+
+
+ARG_NAME_UNION_PROFILER = f'{NAME_PREFIX}union_profiler'
+'''
+Name of the **private union profiler parameter** (i.e., :mod:`beartype`-specific
+parameter whose default value is a
+:class:`beartype._check.code.codeunion.UnionProfiler` object specific to the
+current wrapper function, conditionally passed to wrappers generated by the
+:func:`beartype.beartype` decorator under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option).
+'''
+
+
 ARG_NAME_WARN = f'{NAME_PREFIX}warn'
 '''
 Name of the **standard warn function** (i.e., :mod:`beartype`-specific
@@ -129,6 +213,24 @@ number of positional arguments passed to the current call).
 '''
 
 
+VAR_NAME_CHECK_DEADLINE_NS = f'{NAME_PREFIX}check_deadline_ns'
+'''
+Name of the local variable providing the **type-checking deadline** (i.e.,
+value of the :func:`time.perf_counter_ns` clock after which the current
+type-check silently halts iterating over container items under the
+:attr:`beartype.BeartypeConf.check_budget_ns` option).
+'''
+
+
+VAR_NAME_CURSOR_INT = f'{NAME_PREFIX}cursor_int'
+'''
+Name of the local variable providing a **cursor integer** (i.e., non-negative
+integer yielded by the iterator passed as the hidden parameter named
+:data:`.ARG_NAME_CURSOR` for subsequent use in type-checking the next slice of
+container items by the current call).
+'''
+
+
 VAR_NAME_RANDOM_INT = f'{NAME_PREFIX}random_int'
 '''
 Name of the local variable providing a **pseudo-random integer** (i.e.,
@@ -20,11 +20,14 @@ from beartype._data.check.code.datacodename import (
     ARG_NAME_EXCEPTION_PREFIX,
     ARG_NAME_GET_VIOLATION,
     ARG_NAME_RAISER_HINT,
+    ARG_NAME_TYPE_SPECIALIZED_PREFIX,
+    ARG_NAME_TYPE_SPECIALIZER,
     ARG_NAME_WARN,
     VAR_NAME_PITH_ROOT,
     VAR_NAME_RANDOM_INT,
     VAR_NAME_VIOLATION,
 )
+from beartype._data.typing.datatyping import CallableStrFormat
 
 # ....................{ CODE ~ signature                   }....................
 CODE_CHECKER_SIGNATURE = f'''{{code_signature_prefix}}def {{func_name}}(
@@ -93,6 +96,66 @@ Code snippet prefixing the type-check of a parameter or return of a decorated
 callable against the type hint annotating that parameter or return.
 '''
 
+# ....................{ CODE ~ check : specialize          }....................
+CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_PREFIX = '('
+'''
+Code snippet prefixing the :data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK`
+snippet.
+'''
+
+
+CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK = (
+    f'{CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_PREFIX}'
+    f'{ARG_NAME_TYPE_SPECIALIZER}('
+    f'{{check_index}}, {VAR_NAME_PITH_ROOT}, {{hint_types_expr}}) and ('
+)
+'''
+Code snippet prefixing the type-check of a parameter or return of a decorated
+callable against the type hint annotating that parameter or return under the
+:attr:`beartype.BeartypeConf.specialize_calls` option by recording the type of
+that parameter or return with the type specializer passed to the current
+wrapper.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{check_index}``, the integer uniquely identifying this type-check.
+* ``{hint_types_expr}``, the name of the hidden parameter whose value is the
+  tuple of all types this type-check is equivalent to an :func:`isinstance`
+  check against.
+'''
+
+
+CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD = (
+    f'(type({VAR_NAME_PITH_ROOT}) is '
+    f'{ARG_NAME_TYPE_SPECIALIZED_PREFIX}{{check_index}} or ('
+)
+'''
+Code snippet replacing the :data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK`
+snippet in a regenerated wrapper, efficiently accepting a parameter or return
+whose type is exactly the type most frequently observed by the type specializer
+*before* falling back to the original type-check.
+
+This snippet expects to be formatted with the same ``{check_index}`` named
+interpolation as that snippet.
+'''
+
+
+CODE_RAISER_FUNC_PITH_SPECIALIZE_NOOP = '(('
+'''
+Code snippet replacing the :data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK`
+snippet in a regenerated wrapper when the type most frequently observed by the
+type specializer violates the original type-check.
+'''
+
+
+CODE_RAISER_FUNC_PITH_SPECIALIZE_SUFFIX = '))'
+'''
+Code snippet suffixing the type-check prefixed by either the
+:data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK`,
+:data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD`, or
+:data:`.CODE_RAISER_FUNC_PITH_SPECIALIZE_NOOP` snippets.
+'''
+
 # ....................{ CODE ~ violation : get             }....................
 CODE_GET_HINT_OBJECT_VIOLATION = f''':
             {VAR_NAME_VIOLATION} = {ARG_NAME_GET_VIOLATION}(
@@ -168,3 +231,11 @@ Code snippet emitting the type-checking violation previously generated by the
 :data:`.CODE_HINT_ROOT_SUFFIX` or
 :data:`.PEP484_CODE_CHECK_NORETURN` code snippets as a non-fatal warning.
 '''
+
+# ....................{ FORMATTERS                         }....................
+# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
+# This is an absurd micro-optimization. *fight me, github developer community*
+CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD_format: CallableStrFormat = (
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_GUARD.format)
+CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK_format: CallableStrFormat = (
+    CODE_RAISER_FUNC_PITH_SPECIALIZE_HOOK.format)
@@ -23,7 +23,9 @@ from beartype._data.check.code.datacodename import (
 )
 from beartype._data.check.code.datacodeindent import CODE_INDENT_1
 from beartype._data.check.code.datacodename import (
+    ARG_NAME_CURSOR,
     ARG_NAME_GETRANDBITS,
+    VAR_NAME_CURSOR_INT,
     VAR_NAME_RANDOM_INT,
 )
 from beartype._data.typing.datatyping import CallableStrFormat
@@ -80,6 +82,21 @@ accepting one or more such arguments.
 '''
 
 
+CODE_INIT_CURSOR_INT = f'''
+    # Localize the cursor of this wrapper for subsequent indexation in
+    # type-checking the next slice of container items *AND* advance this cursor.
+    {VAR_NAME_CURSOR_INT} = next({ARG_NAME_CURSOR})'''
+'''
+Code snippet localizing the next **cursor integer** (i.e., non-negative integer
+yielded by the :func:`itertools.count` iterator specific to the current wrapper
+function) for subsequent use in type-checking the next slice of container items
+under the :attr:`beartype.BeartypeStrategy.Ok` strategy.
+
+Since the :func:`next` builtin advances C-based :func:`itertools.count`
+iterators atomically, this snippet is thread-safe under the GIL.
+'''
+
+
 CODE_INIT_RANDOM_INT = f'''
     # Generate and localize a sufficiently large pseudo-random integer for
     # subsequent indexation in type-checking randomly selected container items.
@@ -14,9 +14,13 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._data.check.code.datacodename import (
+    ARG_NAME_CHECK_RETURN,
+    ARG_NAME_CHECK_SEND,
+    ARG_NAME_CHECK_YIELD,
     ARG_NAME_FUNC,
     VAR_NAME_PITH_ROOT,
 )
+from beartype._data.typing.datatyping import CallableStrFormat
 
 # ....................{ CODE                               }....................
 # Note that outstanding deficiencies in CPython's Parser Expression Grammar
@@ -56,3 +60,139 @@ and returns).
 This snippet is an optimization for the common case in which the return of that
 factory is left unannotated.
 '''
+
+# ....................{ CODE ~ items                       }....................
+# This pure-Python code snippet is the "Formal Semantics" subsection of PEP 380
+# augmented with type-checking, exactly as the comparable PEP 525-compliant
+# snippet defined by the "datacodepep525" submodule. See commentary there.
+CODE_PEP342_RETURN_CHECKED_ITEMS = f'''
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # [BEGIN "yield from"] What follows is the pure-Python implementation of the
+    # "yield from" expression augmented with type-checking.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # Attempt to prime the inner generator by iterating that generator once.
+    try:
+        __beartype_gen_yield_pith = next({VAR_NAME_PITH_ROOT})
+    # If doing so raised a "StopIteration" exception, the inner generator
+    # finished immediately without yielding anything. Capture its return.
+    except StopIteration as __beartype_gen_stop:
+        __beartype_gen_return_pith = __beartype_gen_stop.value
+    # Else, doing so raised *NO* exception. In this case...
+    else:{{code_check_yield_init}}
+        # PEP 342-compliant bidirectional communication loop, shuttling values
+        # and exceptions between the caller above and inner generator below.
+        while True:{{code_check_yield}}
+            # Attempt to yield the value previously yielded by the inner
+            # generator up to the caller *AND* capture any value sent in.
+            try:
+                __beartype_gen_send_pith = yield __beartype_gen_yield_pith
+            # If the caller closed this outer generator, propagate this
+            # closure request to the inner generator *AND* re-raise.
+            except GeneratorExit:
+                {VAR_NAME_PITH_ROOT}.close()
+                raise
+            # If the caller threw an exception into this outer generator,
+            # propagate this exception to the inner generator *AND* capture the
+            # value that generator yields or returns in response.
+            except BaseException as __beartype_gen_exception:
+                try:
+                    __beartype_gen_yield_pith = {VAR_NAME_PITH_ROOT}.throw(
+                        __beartype_gen_exception)
+                except StopIteration as __beartype_gen_stop:
+                    __beartype_gen_return_pith = __beartype_gen_stop.value
+                    break
+            # Else, the caller either iterated this outer generator *OR* sent a
+            # value into this outer generator.
+            else:
+                try:
+                    # If the caller iterated this outer generator, iterate the
+                    # inner generator. This is the common case.
+                    if __beartype_gen_send_pith is None:
+                        __beartype_gen_yield_pith = next({VAR_NAME_PITH_ROOT})
+                    # Else, the caller sent a value into this outer generator.
+                    # Propagate this value to the inner generator.
+                    else:{{code_check_send}}
+                        __beartype_gen_yield_pith = {VAR_NAME_PITH_ROOT}.send(
+                            __beartype_gen_send_pith)
+                # If doing so raised a "StopIteration" exception, the inner
+                # generator finished. Capture its return *AND* halt looping.
+                except StopIteration as __beartype_gen_stop:
+                    __beartype_gen_return_pith = __beartype_gen_stop.value
+                    break
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # [END "yield from"]
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!{{code_check_return}}
+    return __beartype_gen_return_pith'''
+'''
+:pep:`342`-compliant code snippet facilitating full-blown bidirectional
+communication between the higher-level caller and lower-level synchronous
+generator factory wrapped by :func:`beartype.beartype`-driven type-checking
+*while* lazily type-checking the values yielded by, sent into, and returned
+from that generator under the :attr:`beartype.BeartypeConf.check_yield_every`
+option.
+
+Since the wrapper function declaring this snippet is itself the generator
+delegating to that generator, this snippet neither copies nor buffers these
+values *and* introduces no additional stack frame.
+'''
+
+
+CODE_PEP342_CHECK_YIELD_EVERY_INIT = '''
+        # Number of items remaining to be yielded before type-checking the next
+        # item, initialized to type-check the first item.
+        __beartype_gen_yield_countdown = 1'''
+'''
+:pep:`342`-compliant code snippet initializing the countdown governing which
+yielded items are type-checked by the :data:`.CODE_PEP342_CHECK_YIELD_EVERY`
+snippet.
+'''
+
+
+CODE_PEP342_CHECK_YIELD_EVERY = f'''
+            # If this is the n-th yielded item, reset this countdown *AND*
+            # type-check this item.
+            __beartype_gen_yield_countdown -= 1
+            if not __beartype_gen_yield_countdown:
+                __beartype_gen_yield_countdown = {{check_yield_every}}
+                {ARG_NAME_CHECK_YIELD}(__beartype_gen_yield_pith)'''
+'''
+:pep:`342`-compliant code snippet type-checking every ``n``-th item yielded by
+the inner generator, where ``n`` is the
+:attr:`beartype.BeartypeConf.check_yield_every` option exceeding 1.
+'''
+
+
+CODE_PEP342_CHECK_YIELD_ALL = f'''
+            # Type-check this yielded item.
+            {ARG_NAME_CHECK_YIELD}(__beartype_gen_yield_pith)'''
+'''
+:pep:`342`-compliant code snippet type-checking *every* item yielded by the
+inner generator, where the :attr:`beartype.BeartypeConf.check_yield_every`
+option is 1. This snippet avoids the countdown decrement otherwise performed
+for each item by the :data:`.CODE_PEP342_CHECK_YIELD_EVERY` snippet.
+'''
+
+
+CODE_PEP342_CHECK_SEND = f'''
+                        {ARG_NAME_CHECK_SEND}(__beartype_gen_send_pith)'''
+'''
+:pep:`342`-compliant code snippet type-checking each non-:data:`None` value
+sent into the outer generator *before* propagating that value to the inner
+generator.
+'''
+
+
+CODE_PEP342_CHECK_RETURN = f'''
+    {ARG_NAME_CHECK_RETURN}(__beartype_gen_return_pith)'''
+'''
+:pep:`342`-compliant code snippet type-checking the value returned from the
+inner generator.
+'''
+
+# ....................{ FORMATTERS                         }....................
+# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
+# This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP342_CHECK_YIELD_EVERY_format: CallableStrFormat = (
+    CODE_PEP342_CHECK_YIELD_EVERY.format)
+CODE_PEP342_RETURN_CHECKED_ITEMS_format: CallableStrFormat = (
+    CODE_PEP342_RETURN_CHECKED_ITEMS.format)
@@ -13,7 +13,17 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
-from beartype._data.check.code.datacodename import VAR_NAME_RANDOM_INT
+from beartype._data.check.code.datacodelen import (
+    REITERABLE_PREFIX_LEN,
+    SEQUENCE_CURSOR_SLICE_LEN,
+)
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_GETRANDBITS,
+    VAR_NAME_CHECK_DEADLINE_NS,
+    VAR_NAME_CURSOR_INT,
+    VAR_NAME_PITH_ROOT,
+    VAR_NAME_RANDOM_INT,
+)
 from beartype._data.typing.datatyping import CallableStrFormat
 
 # ....................{ CODE ~ container : collection      }....................
@@ -88,11 +98,140 @@ See :data:`.CODE_PEP484585_QUASIITERABLE` for further details.
 '''
 
 
+CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL = '''(
+{indent_curr}    # True only if this pith is of this container type *AND*...
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if *ALL* items of this container satisfy this hint.
+{indent_curr}    all(
+{indent_curr}        {hint_child_placeholder}
+{indent_curr}        for {pith_child_var_name} in {pith_curr_iterable_expr}
+{indent_curr}    )
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet generically type-checking
+*all* items of the current pith against *any* arbitrary kind of single-argument
+standard container type hint under the :math:`O(n)` linear-time
+:attr:`beartype.BeartypeStrategy.On` type-checking strategy.
+
+Caveats
+-------
+**This snippet iterates with a generator expression rather than a** ``for``
+**loop.** Since all code type-checking a pith is a single boolean expression
+embedded in an ``if not ...:`` conditional, statements (including ``for``
+loops) are syntactically prohibited here. Generator expressions passed to the
+:func:`all` builtin are the only means of iterating in an expression. Happily,
+:func:`all` short-circuits on the first item violating this hint *and* trivially
+returns :data:`True` for empty containers, obviating the need to explicitly
+guard against empty containers as :data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE`
+does.
+
+Assignment expressions embedded in the child code replacing the
+``{hint_child_placeholder}`` substring bind local variables in the scope of the
+current wrapper function rather than this generator expression, as required by
+:pep:`572`. Since the integer suffixing the name of each such variable is
+strictly greater than that suffixing the name of the ``{pith_child_var_name}``
+iteration variable of this generator expression, these assignment expressions
+are guaranteed to *never* rebind that iteration variable (which :pep:`572`
+prohibits as a syntax error).
+'''
+
+
+CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_TYPE = '''(
+{indent_curr}    # True only if this pith is of this container type *AND* either...
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and (
+{indent_curr}        # *ALL* items of this container are of this exact builtin
+{indent_curr}        # type, decided by C-based iteration *OR*...
+{indent_curr}        not any(map(
+{indent_curr}            {is_not_expr},
+{indent_curr}            map(type, {pith_curr_var_name}),
+{indent_curr}            {repeat_expr}({hint_child_expr}),
+{indent_curr}        )) or
+{indent_curr}        # *ALL* items of this container satisfy this hint, decided by
+{indent_curr}        # pure-Python iteration. This fallback is reached only if one or
+{indent_curr}        # more items are *NOT* of this exact type (e.g., are instances of
+{indent_curr}        # subclasses of this type).
+{indent_curr}        all(
+{indent_curr}            {hint_child_placeholder}
+{indent_curr}            for {pith_child_var_name} in {pith_curr_var_name}
+{indent_curr}        )
+{indent_curr}    )
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking *all* items of
+the current pith against a single-argument standard container type hint whose
+child hint is a **builtin type** (e.g., ``list[int]``, ``set[str]``) under the
+:math:`O(n)` linear-time :attr:`beartype.BeartypeStrategy.On` type-checking
+strategy.
+
+This snippet is an optimization of the more general
+:data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL` snippet. Calling the
+:func:`isinstance` builtin on each item from a generator expression incurs the
+overhead of resuming a pure-Python frame per item. This snippet instead first
+decides whether the type of each item of this container is this builtin type
+by passing the C-based :func:`operator.is_not` function to the C-based
+:func:`map` iterator, which avoids that overhead and reduces the cost of
+type-checking large homogeneous containers by roughly a quarter. Since the
+items of containers annotated by builtin types are almost always instances of
+exactly those types, the fallback to pure-Python iteration is rarely reached.
+
+Note that this snippet intentionally tests types by identity rather than
+equality (e.g., with the faster :func:`operator.countOf` function). Although
+builtin types are instances of the :class:`type` metaclass, the types of items
+are instances of arbitrary metaclasses -- including metaclasses overriding the
+``__eq__`` dunder method to spuriously report those types to be equal to this
+builtin type. Equality would thus erroneously accept such items.
+'''
+
+
 CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR = (
     '''next(iter({pith_curr_var_name}))''')
 '''
 :pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
-first item of the current reiterable pith.
+first item of the current reiterable pith, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` option is disabled.
+
+Callers may pass an arbitrary iterable expression as the
+``{pith_curr_var_name}`` format variable (e.g., ``muh_dict.values()``).
+'''
+
+
+CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR = (
+    f'''next({{islice_expr}}({{pith_curr_iterable_expr}}, {VAR_NAME_RANDOM_INT} % ({REITERABLE_PREFIX_LEN} + (len({{pith_curr_var_name}}) <= {REITERABLE_PREFIX_LEN} or {ARG_NAME_GETRANDBITS}(32) % len({{pith_curr_var_name}}) < {REITERABLE_PREFIX_LEN}) * (len({{pith_curr_var_name}}) - {REITERABLE_PREFIX_LEN})), None))''')
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding a
+pseudo-random item of the current non-empty reiterable pith in amortized
+:math:`O(1)` time, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` option is enabled.
+
+This expression iterates over the ``{pith_curr_iterable_expr}`` iterable (e.g.,
+``{pith_curr_var_name}`` itself, ``{pith_curr_var_name}.values()``) with the
+C-based :func:`itertools.islice` iterator (accessed as the hidden
+``{islice_expr}`` parameter) to the item whose 0-based index is the
+pseudo-random integer modulo either:
+
+* If this reiterable contains at most
+  :data:`beartype._data.check.code.datacodelen.REITERABLE_PREFIX_LEN` items,
+  the length of this reiterable.
+* Else if a second pseudo-random integer modulo the length of this reiterable
+  is less than that constant (i.e., with probability inversely proportional to
+  the length of this reiterable), the length of this reiterable.
+* Else, that constant.
+
+See :data:`beartype._data.check.code.datacodelen.REITERABLE_PREFIX_LEN` for
+further details.
+
+Caveats
+-------
+**This expression cannot contain ternary conditionals.** See
+:class:`beartype._check.cls.logic.logcls.HintLogicABC` for further commentary.
+The modulus selected above is thus computed arithmetically by multiplying a
+boolean by an integer rather than with a ternary conditional.
+
+**The second pseudo-random integer is not recoverable.** Code raising
+type-checking violations is passed *only* the first pseudo-random integer. That
+code thus considers *both* items that this expression could have selected. See
+:func:`beartype._check.code.coderandom.get_reiterable_item_indices` for further
+details.
 '''
 
 # ....................{ CODE ~ container : quasiiterable   }....................
@@ -114,8 +253,8 @@ CODE_PEP484585_QUASIITERABLE = f'''(
 {{indent_curr}}            isinstance({{pith_curr_var_name}}, {{sequence_abc_expr}}) and
 {{indent_curr}}            ({{pith_child_var_name}} := {{sequence_pith_child_expr}}) is {{pith_child_var_name}}
 {{indent_curr}}        # Else, this non-empty collection is a non-sequence reiterable.
-{{indent_curr}}        # In this case, localize the first item of this reiterable;
-{{indent_curr}}        ) or ({{pith_child_var_name}} := {CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR}) is {{pith_child_var_name}}
+{{indent_curr}}        # In this case, localize some item of this reiterable;
+{{indent_curr}}        ) or ({{pith_child_var_name}} := {{reiterable_pith_child_expr}}) is {{pith_child_var_name}}
 {{indent_curr}}     # True only if this item satisfies this hint.
 {{indent_curr}}     ) and {{hint_child_placeholder}})
 {{indent_curr}}    )
@@ -150,6 +289,35 @@ more values: e.g.,
     RuntimeError: Boolean value of Tensor with more than one value is ambiguous
 '''
 
+
+CODE_PEP484585_QUASIITERABLE_ALL = '''(
+{indent_curr}    # True only if this pith is of this iterable type *AND*...
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if either this iterable is not a collection *OR*...
+{indent_curr}    # See "CODE_PEP484585_QUASIITERABLE" for further details.
+{indent_curr}    (not isinstance({pith_curr_var_name}, {collection_abc_expr}) or
+{indent_curr}     # Else, this iterable is a collection and thus safely
+{indent_curr}     # reiterable at runtime. In this case, true only if *ALL*
+{indent_curr}     # items of this collection satisfy this hint.
+{indent_curr}     all(
+{indent_curr}         {hint_child_placeholder}
+{indent_curr}         for {pith_child_var_name} in {pith_curr_iterable_expr}
+{indent_curr}     )
+{indent_curr}    )
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet generically type-checking
+*all* items of the current pith against an **quasiiterable type hint** under the
+:math:`O(n)` linear-time :attr:`beartype.BeartypeStrategy.On` type-checking
+strategy.
+
+See Also
+--------
+:data:`.CODE_PEP484585_QUASIITERABLE`
+:data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL`
+    Further details.
+'''
+
 # ....................{ CODE ~ container : sequence        }....................
 CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR = (
     f'''{{pith_curr_var_name}}[{VAR_NAME_RANDOM_INT} % len({{pith_curr_var_name}})]''')
@@ -169,6 +337,234 @@ first item of the current sequence pith, intended to be applied when the
 :attr:`beartype.BeartypeConf.is_random` boolean is disabled.
 '''
 
+
+CODE_PEP484585_SEQUENCE_LOGN = '''(
+{indent_curr}    # True only if this pith is of this sequence type *AND*...
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if either this sequence is empty *OR*...
+{indent_curr}    (not len({pith_curr_var_name}) or (
+{indent_curr}        # Localize the number of items to be sampled from this sequence
+{indent_curr}        # (i.e., ceil(log2(len(sequence) + 1)), which is guaranteed to
+{indent_curr}        # be a positive integer for non-empty sequences) *AND*...
+{indent_curr}        ({pith_sample_len_var_name} := len({pith_curr_var_name}).bit_length()) and
+{indent_curr}        # Localize the stride between successively sampled items of
+{indent_curr}        # this sequence (i.e., the ceiling of the length of this
+{indent_curr}        # sequence divided by this number of samples, such that the
+{indent_curr}        # last stratum extends to the end of this sequence), which is
+{indent_curr}        # also guaranteed to be a positive integer for non-empty
+{indent_curr}        # sequences *AND*...
+{indent_curr}        ({pith_sample_stride_var_name} := -(-len({pith_curr_var_name}) // {pith_sample_len_var_name})) and
+{indent_curr}        # True only if *ALL* sampled items satisfy this hint.
+{indent_curr}        all(
+{indent_curr}            {hint_child_placeholder}
+{indent_curr}            for {pith_child_var_name} in map(
+{indent_curr}                {pith_curr_var_name}.__getitem__, range(
+{indent_curr}                    {pith_sample_start_expr},
+{indent_curr}                    len({pith_curr_var_name}),
+{indent_curr}                    {pith_sample_stride_var_name},
+{indent_curr}            ))
+{indent_curr}        )
+{indent_curr}    ))
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking a logarithmic
+number of items of the current sequence pith against a single-argument sequence
+type hint under the :math:`O(\\log n)` logarithmic-time
+:attr:`beartype.BeartypeStrategy.Ologn` type-checking strategy.
+
+This snippet partitions this sequence into at most
+``ceil(log2(len(sequence) + 1))`` contiguous **strata** (i.e., equally sized
+subsequences of ``ceil(len(sequence) / ceil(log2(len(sequence) + 1)))`` items,
+excluding the last stratum, which is truncated to the end of this sequence) and
+samples exactly one item from each stratum at the same offset into each stratum.
+Since strata collectively span this entire sequence, every item of this
+sequence (including the trailing items of sequences whose lengths are *not*
+divisible by the number of strata) is sampled by some offset. That offset is
+either:
+
+* If the :attr:`beartype.BeartypeConf.is_random` option is enabled, derived
+  from the same pseudo-random integer already localized to the local variable
+  named :data:`beartype._data.check.code.datacodename.VAR_NAME_RANDOM_INT` for
+  all other pseudo-random type-checks (i.e., one pseudo-random integer seeds all
+  samples at each nesting level). See
+  :data:`.CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR`.
+* Else, ``0``, sampling the first item of each stratum. See
+  :data:`.CODE_PEP484585_SEQUENCE_LOGN_NONRANDOM_START_EXPR`.
+
+Stratified sampling guarantees that sampled items are uniformly distributed
+across this sequence rather than clustered, which is statistically superior to
+independently sampling the same number of items with replacement.
+
+Caveats
+-------
+**The assignment expressions localizing the number of samples and stride must
+precede the generator expression.** :pep:`572` prohibits assignment expressions
+in the iterable expression of a comprehension.
+
+See Also
+--------
+:data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL`
+    Further details.
+'''
+
+
+CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR = (
+    f'''{VAR_NAME_RANDOM_INT} % {{pith_sample_stride_var_name}}''')
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
+0-based index of the first item sampled from the current sequence pith by the
+:data:`.CODE_PEP484585_SEQUENCE_LOGN` snippet, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` boolean is enabled.
+'''
+
+
+CODE_PEP484585_SEQUENCE_LOGN_NONRANDOM_START_EXPR = '0'
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
+0-based index of the first item sampled from the current sequence pith by the
+:data:`.CODE_PEP484585_SEQUENCE_LOGN` snippet, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` boolean is disabled.
+'''
+
+
+CODE_PEP484585_SEQUENCE_CURSOR = f'''(
+{{indent_curr}}    # True only if this pith is of this sequence type *AND*...
+{{indent_curr}}    isinstance({{pith_curr_assign_expr}}, {{hint_curr_expr}}) and
+{{indent_curr}}    # True only if *ALL* items in the next slice of this sequence satisfy
+{{indent_curr}}    # this hint, where this slice starts at the cursor of this wrapper and
+{{indent_curr}}    # wraps around to the start of this sequence as needed. Since this
+{{indent_curr}}    # slice of an empty sequence is also empty, this is trivially true
+{{indent_curr}}    # for empty sequences.
+{{indent_curr}}    all(
+{{indent_curr}}        {{hint_child_placeholder}}
+{{indent_curr}}        for {{pith_child_var_name}} in map(
+{{indent_curr}}            {{pith_curr_var_name}}.__getitem__, map(
+{{indent_curr}}            len({{pith_curr_var_name}}).__rmod__, range(
+{{indent_curr}}                {VAR_NAME_CURSOR_INT},
+{{indent_curr}}                {VAR_NAME_CURSOR_INT} + min(len({{pith_curr_var_name}}), {SEQUENCE_CURSOR_SLICE_LEN}),
+{{indent_curr}}        )))
+{{indent_curr}}    )
+{{indent_curr}})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking the next slice of
+(at most)
+:data:`beartype._data.check.code.datacodelen.SEQUENCE_CURSOR_SLICE_LEN` items
+of the current sequence pith against a single-argument sequence type hint under
+the amortized full-coverage :attr:`beartype.BeartypeStrategy.Ok` type-checking
+strategy.
+
+This slice starts at the 0-based index given by the **cursor integer** (i.e.,
+local variable named
+:data:`beartype._data.check.code.datacodename.VAR_NAME_CURSOR_INT`) modulo the
+length of this sequence. Since the cursor of each wrapper function advances by
+the length of this slice on each call to that function, successive calls passed
+the same sequence type-check successive slices of that sequence and thus
+eventually *all* items of that sequence.
+
+Each index of this slice is reduced modulo the length of this sequence by the
+bound :meth:`int.__rmod__` method of that length (i.e., ``len(seq).__rmod__(i)
+== i % len(seq)``), which efficiently wraps this slice around to the start of
+this sequence without a pure-Python lambda. Capping the length of this slice to
+that of this sequence avoids redundantly type-checking items of short sequences.
+
+See Also
+--------
+:data:`.CODE_PEP484585_SEQUENCE_LOGN`
+    Further details.
+'''
+
+# ....................{ CODE ~ budget                      }....................
+CODE_PEP484585_CHECK_BUDGET_ROOT = f'''((
+{{indent_curr}}    # Localize the deadline after which this type-check silently halts
+{{indent_curr}}    # iterating over container items *AND*...
+{{indent_curr}}    {VAR_NAME_CHECK_DEADLINE_NS} := {{perf_counter_ns_expr}}() + {{check_budget_ns}}) and
+{{indent_curr}}    # True only if this pith satisfies this hint.
+{{indent_curr}}    {{func_root_code}}
+{{indent_curr}})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet wrapping the code
+type-checking the root pith against the root hint with an assignment expression
+localizing the **type-checking deadline** (i.e., value of the
+:func:`time.perf_counter_ns` clock after which this type-check silently halts
+iterating over container items) under the
+:attr:`beartype.BeartypeConf.check_budget_ns` option.
+
+Since that clock is positive, this assignment expression is guaranteed to be
+truthy. Since this deadline is localized by the code type-checking each
+parameter and return rather than once per call, the time consumed by the
+decorated callable itself does *not* count against the budget of the return.
+'''
+
+
+CODE_PEP484585_CHECK_BUDGET_ITERABLE_EXPR = (
+    f'''{{iter_check_budget_expr}}({{pith_curr_iterable_expr}}, {VAR_NAME_CHECK_DEADLINE_NS})''')
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression wrapping an iterable over
+the items of the current container pith by a generator silently halting that
+iteration once the type-checking deadline localized by the
+:data:`.CODE_PEP484585_CHECK_BUDGET_ROOT` snippet has passed.
+
+See Also
+--------
+:func:`beartype._check.code.codebudget.iter_check_budget`
+    Further details.
+'''
+
+# ....................{ CODE ~ memo                        }....................
+CODE_PEP484585_CHECK_MEMO_ROOT = f'''(
+{{indent_curr}}    # True only if this pith was previously memoized as satisfying this
+{{indent_curr}}    # hint *OR*...
+{{indent_curr}}    {{check_memo_expr}}.get(id({VAR_NAME_PITH_ROOT})) is {VAR_NAME_PITH_ROOT} or (
+{{indent_curr}}        # True only if this pith satisfies this hint *AND*...
+{{indent_curr}}        {{func_root_code}} and
+{{indent_curr}}        # Memoize this pith as satisfying this hint. Since this method
+{{indent_curr}}        # returns "None", this negation is guaranteed to be true.
+{{indent_curr}}        not {{check_memo_expr}}.__setitem__(
+{{indent_curr}}            id({VAR_NAME_PITH_ROOT}), {VAR_NAME_PITH_ROOT})
+{{indent_curr}}    )
+{{indent_curr}})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet wrapping the code
+type-checking the root pith against the root hint with code memoizing successful
+type-checks of that pith under the :attr:`beartype.BeartypeConf.is_check_memo`
+option.
+
+This snippet memoizes each pith satisfying that hint into a bounded
+:class:`beartype._util.cache.map.utilmaplru.CacheLruStrong` cache mapping from
+the identifier of that pith to that pith itself. Since that cache strongly
+refers to that pith, that identifier *cannot* be reused by another object while
+that pith remains memoized; the identity test performed by this snippet thus
+guarantees that a memoized identifier refers to the current pith.
+
+Note that this snippet intentionally avoids calling the thread-safe but slower
+:meth:`.CacheLruStrong.__getitem__` method, instead calling the C-based
+:meth:`dict.get` method. Doing so does *not* refresh the memoized pith, which is
+then eventually evicted from that cache even if repeatedly type-checked. Since
+that merely incurs one redundant type-check per eviction, this is preferable to
+the cost of locking on each type-check.
+'''
+
+# ....................{ CODE ~ callable                    }....................
+CODE_PEP484585_CALLABLE = '''(
+{indent_curr}    # True only if this pith is callable *AND*...
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if the signature of this callable is compatible with
+{indent_curr}    # this hint.
+{indent_curr}    {callable_signature_tester_expr}({pith_curr_var_name})
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking the current pith
+against a **callable type hint** (i.e., ``typing.Callable[...]`` or
+``collections.abc.Callable[...]`` type hint) under the
+:attr:`beartype.BeartypeConf.is_check_callable_signature` option.
+
+The ``{callable_signature_tester_expr}`` format variable is a hidden parameter
+passed to the current wrapper function whose value is a tester created by the
+:func:`beartype._check.pep.pep484585.checkpep484585callable.make_func_pep484585_callable_signature_tester`
+factory, memoizing the compatibility of each callable against the code object
+underlying that callable.
+'''
+
 # ....................{ CODE ~ generic                     }....................
 CODE_PEP484585_GENERIC_PREFIX = '''(
 {indent_curr}    # True only if this pith is of this generic type.
@@ -264,34 +660,23 @@ See :data:`.CODE_PEP484585_QUASIITERABLE` for further details.
 '''
 
 
-CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR = (
-    '''next(iter({pith_curr_var_name}))''')
-'''
-:pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
-first key of the current mapping pith.
-'''
-
-
-CODE_PEP484585_MAPPING_VALUE_ONLY_PITH_CHILD_EXPR = (
-    '''next(iter({pith_curr_var_name}.values()))''')
-'''
-:pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
-first value of the current mapping pith when type-checking *only* the values of
-this mapping (i.e., when the keys of this mapping are ignorable).
-'''
-
-
 CODE_PEP484585_MAPPING_KEY_VALUE_PITH_CHILD_EXPR = (
     '''{pith_curr_var_name}[{pith_key_var_name}]''')
 '''
 :pep:`484`- and :pep:`585`-compliant Python expression efficiently yielding the
-first value of the current mapping pith when type-checking both the keys *and*
-values of this mapping (i.e., when the keys of this mapping are unignorable).
+value of the current mapping pith associated with the previously localized key
+when type-checking both the keys *and* values of this mapping (i.e., when the
+keys of this mapping are unignorable).
+
+Keys and values are otherwise accessed by the expression returned by the
+:func:`beartype._check.code.coderandom.make_reiterable_pith_child_expr` factory,
+which iterates over either this mapping itself or the values view of this
+mapping.
 '''
 
 
 CODE_PEP484585_MAPPING_KEY_ONLY = '''
-{indent_curr}        # True only if this key satisfies this hint.
+{indent_curr}        # True only if some key of this mapping satisfies this hint.
 {indent_curr}        {hint_key_placeholder}'''
 '''
 :pep:`484`- and :pep:`585`-compliant code snippet type-checking *only* the first
@@ -305,7 +690,7 @@ type-checking mappings with ignorable value child type hints (e.g.,
 
 
 CODE_PEP484585_MAPPING_VALUE_ONLY = '''
-{indent_curr}        # True only if this value satisfies this hint.
+{indent_curr}        # True only if some value of this mapping satisfies this hint.
 {indent_curr}        {hint_value_placeholder}'''
 '''
 :pep:`484`- and :pep:`585`-compliant code snippet type-checking *only* the first
@@ -319,8 +704,8 @@ type-checking mappings with ignorable key child type hints (e.g.,
 
 
 CODE_PEP484585_MAPPING_KEY_VALUE = f'''
-{{indent_curr}}        # Localize the first key of this mapping.
-{{indent_curr}}        ({{pith_key_var_name}} := {CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR}) is {{pith_key_var_name}} and
+{{indent_curr}}        # Localize some key of this mapping.
+{{indent_curr}}        ({{pith_key_var_name}} := {{pith_key_expr}}) is {{pith_key_var_name}} and
 {{indent_curr}}        # True only if this key satisfies this hint.
 {{indent_curr}}        {{hint_key_placeholder}} and
 {{indent_curr}}        # True only if this value satisfies this hint.
@@ -335,6 +720,75 @@ for type-checking mappings with ignorable key or value child type hints (e.g.,
 ``dict[object, str]``, ``dict[str, object]``).
 '''
 
+# ....................{ CODE ~ mapping : all               }....................
+CODE_PEP484585_MAPPING_KEY_ONLY_ALL = '''
+{indent_curr}        # True only if *ALL* keys of this mapping satisfy this hint.
+{indent_curr}        all(
+{indent_curr}            {hint_key_placeholder}
+{indent_curr}            for {pith_key_var_name} in {pith_curr_iterable_expr}
+{indent_curr}        )'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking *all* keys of
+the current pith against *only* the key child type hint subscripting a parent
+standard mapping type under the :math:`O(n)` linear-time
+:attr:`beartype.BeartypeStrategy.On` type-checking strategy.
+
+See Also
+--------
+:data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL`
+    Further details.
+'''
+
+
+CODE_PEP484585_MAPPING_VALUE_ONLY_ALL = '''
+{indent_curr}        # True only if *ALL* values of this mapping satisfy this hint.
+{indent_curr}        all(
+{indent_curr}            {hint_value_placeholder}
+{indent_curr}            for {pith_value_var_name} in {pith_curr_iterable_expr}
+{indent_curr}        )'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking *all* values of
+the current pith against *only* the value child type hint subscripting a parent
+standard mapping type under the :math:`O(n)` linear-time
+:attr:`beartype.BeartypeStrategy.On` type-checking strategy.
+
+See Also
+--------
+:data:`.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL`
+    Further details.
+'''
+
+
+CODE_PEP484585_MAPPING_KEY_VALUE_ALL = '''
+{indent_curr}        # True only if *ALL* key-value pairs of this mapping satisfy
+{indent_curr}        # these hints.
+{indent_curr}        all(
+{indent_curr}            # True only if this key satisfies this hint *AND*...
+{indent_curr}            {hint_key_placeholder} and
+{indent_curr}            # True only if this value satisfies this hint.
+{indent_curr}            {hint_value_placeholder}
+{indent_curr}            for {pith_key_var_name} in {pith_curr_iterable_expr}
+{indent_curr}        )'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking *all* key-value
+pairs of the current pith against both the key and value child type hints
+subscripting a parent standard mapping type under the :math:`O(n)` linear-time
+:attr:`beartype.BeartypeStrategy.On` type-checking strategy.
+
+Caveats
+-------
+**This snippet iterates over keys rather than key-value pairs** (i.e., ``for
+key in mapping`` rather than ``for key, value in mapping.items()``), accessing
+each value by indexing this mapping by the corresponding key. Why? Because
+iterating over key-value pairs would require two iteration variables, the
+latter of which would necessarily collide with the names of local variables
+assigned by assignment expressions in the code type-checking the former. Since
+:pep:`572` prohibits assignment expressions from rebinding iteration variables,
+that collision would raise a syntax error. Mapping lookups are :math:`O(1)` and
+thus a negligible cost in any case.
+'''
+
+
 # ....................{ CODE ~ tuple                       }....................
 CODE_PEP484585_TUPLE_FIXED_PREFIX = '''(
 {indent_curr}    # True only if this pith is a tuple.
@@ -435,16 +889,38 @@ to be a subclass of the subscripted child hint of a :pep:`484`- or
 # ....................{ FORMATTERS                         }....................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP484585_CALLABLE_format: CallableStrFormat = (
+    CODE_PEP484585_CALLABLE.format)
+CODE_PEP484585_CHECK_BUDGET_ROOT_format: CallableStrFormat = (
+    CODE_PEP484585_CHECK_BUDGET_ROOT.format)
+CODE_PEP484585_CHECK_BUDGET_ITERABLE_EXPR_format: CallableStrFormat = (
+    CODE_PEP484585_CHECK_BUDGET_ITERABLE_EXPR.format)
+CODE_PEP484585_CHECK_MEMO_ROOT_format: CallableStrFormat = (
+    CODE_PEP484585_CHECK_MEMO_ROOT.format)
 CODE_PEP484585_REITERABLE_OR_SEQUENCE_format: CallableStrFormat = (
     CODE_PEP484585_REITERABLE_OR_SEQUENCE.format)
+CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_format: CallableStrFormat = (
+    CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL.format)
+CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_TYPE_format: CallableStrFormat = (
+    CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL_TYPE.format)
 CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR_format: CallableStrFormat = (
     CODE_PEP484585_REITERABLE_PITH_CHILD_EXPR.format)
+CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR_format: CallableStrFormat = (
+    CODE_PEP484585_REITERABLE_RANDOM_PITH_CHILD_EXPR.format)
 CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR_format: CallableStrFormat = (
     CODE_PEP484585_SEQUENCE_RANDOM_PITH_CHILD_EXPR.format)
+CODE_PEP484585_SEQUENCE_CURSOR_format: CallableStrFormat = (
+    CODE_PEP484585_SEQUENCE_CURSOR.format)
+CODE_PEP484585_SEQUENCE_LOGN_format: CallableStrFormat = (
+    CODE_PEP484585_SEQUENCE_LOGN.format)
+CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR_format: CallableStrFormat = (
+    CODE_PEP484585_SEQUENCE_LOGN_RANDOM_START_EXPR.format)
 CODE_PEP484585_COLLECTION_format: CallableStrFormat = (
     CODE_PEP484585_COLLECTION.format)
 CODE_PEP484585_QUASIITERABLE_format: CallableStrFormat = (
     CODE_PEP484585_QUASIITERABLE.format)
+CODE_PEP484585_QUASIITERABLE_ALL_format: CallableStrFormat = (
+    CODE_PEP484585_QUASIITERABLE_ALL.format)
 CODE_PEP484585_GENERIC_CHILD_format: CallableStrFormat = (
     CODE_PEP484585_GENERIC_CHILD.format)
 CODE_PEP484585_MAPPING_format: CallableStrFormat = (
@@ -455,10 +931,12 @@ CODE_PEP484585_MAPPING_KEY_VALUE_format: CallableStrFormat = (
     CODE_PEP484585_MAPPING_KEY_VALUE.format)
 CODE_PEP484585_MAPPING_VALUE_ONLY_format: CallableStrFormat = (
     CODE_PEP484585_MAPPING_VALUE_ONLY.format)
-CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR_format: CallableStrFormat = (
-    CODE_PEP484585_MAPPING_KEY_ONLY_PITH_CHILD_EXPR.format)
-CODE_PEP484585_MAPPING_VALUE_ONLY_PITH_CHILD_EXPR_format: CallableStrFormat = (
-    CODE_PEP484585_MAPPING_VALUE_ONLY_PITH_CHILD_EXPR.format)
+CODE_PEP484585_MAPPING_KEY_ONLY_ALL_format: CallableStrFormat = (
+    CODE_PEP484585_MAPPING_KEY_ONLY_ALL.format)
+CODE_PEP484585_MAPPING_KEY_VALUE_ALL_format: CallableStrFormat = (
+    CODE_PEP484585_MAPPING_KEY_VALUE_ALL.format)
+CODE_PEP484585_MAPPING_VALUE_ONLY_ALL_format: CallableStrFormat = (
+    CODE_PEP484585_MAPPING_VALUE_ONLY_ALL.format)
 CODE_PEP484585_MAPPING_KEY_VALUE_PITH_CHILD_EXPR_format: CallableStrFormat = (
     CODE_PEP484585_MAPPING_KEY_VALUE_PITH_CHILD_EXPR.format)
 CODE_PEP484585_SUBCLASS_format: CallableStrFormat = (
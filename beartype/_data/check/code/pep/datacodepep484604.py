@@ -13,6 +13,7 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
+from beartype._data.check.code.datacodename import ARG_NAME_UNION_PROFILER
 from beartype._data.typing.datatyping import CallableStrFormat
 
 # ....................{ CODE                               }....................
@@ -66,6 +67,147 @@ snippet type-checking the current pith against *all* subscripted arguments of
 this parent hint has been generated.
 '''
 
+CODE_PEP484604_UNION_CHILD_NONPEP_EXPR = (
+    '''isinstance({pith_curr_expr}, {hint_curr_expr})''')
+'''
+:pep:`484`-compliant Python expression type-checking the current pith against
+*all* PEP-noncompliant child arguments subscripting a parent
+:class:`typing.Union` type hint.
+'''
+
+# ....................{ CODE ~ profile                     }....................
+CODE_PEP484604_UNION_PROFILE_PITH_INDEX_PLACEHOLDER = '$%UNION_PITH_INDEX/~'
+'''
+Placeholder substring to be globally replaced by the integer uniquely
+identifying the root pith type-checked by code type-checking the child hints of
+a parent :class:`typing.Union` type hint under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option.
+
+Since that code is memoized across *all* root piths annotated by the same root
+hint under the same configuration, that code *cannot* embed that integer. The
+higher-level factories embedding that code in each type-checking wrapper
+function instead replace this placeholder by that integer, enabling the union
+profiler passed to that wrapper to profile the same union annotating different
+root piths of that wrapper independently. This placeholder is intentionally
+syntactically invalid, guaranteeing that code failing to replace this
+placeholder fails to compile.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_MARKER = '# @beartype-union '
+'''
+:pep:`484`-compliant comment prefixing each line delimiting the code
+type-checking the current pith against each child hint subscripting a parent
+:class:`typing.Union` type hint under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option, suffixed by the
+substring ``{pith_index}:{union_index}`` uniquely identifying that union.
+
+These comments are syntactically inert. The
+:class:`beartype._check.code.codeunion.UnionProfiler` object regenerating the
+wrapper function embedding this code splits that code on these comments into
+the code type-checking these child hints *before* reordering that code.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_MARKER_END = '# @beartype-union-end '
+'''
+:pep:`484`-compliant comment prefixing the line terminating the code
+type-checking the current pith against *all* child hints subscripting a parent
+:class:`typing.Union` type hint under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option, suffixed by the
+substring ``{pith_index}:{union_index}`` uniquely identifying that union.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_HOOK_PREFIX = f'and {ARG_NAME_UNION_PROFILER}('
+'''
+:pep:`484`-compliant code snippet prefixing the line recording that the current
+pith satisfies the current child hint subscripting a parent
+:class:`typing.Union` type hint under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_HOOK = (
+    f'{CODE_PEP484604_UNION_PROFILE_HOOK_PREFIX}'
+    f'{CODE_PEP484604_UNION_PROFILE_PITH_INDEX_PLACEHOLDER}, '
+    f'{{union_index}}, {{hint_child_index}}) or'
+)
+'''
+:pep:`484`-compliant code snippet recording that the current pith satisfies the
+current child hint subscripting a parent :class:`typing.Union` type hint under
+the :attr:`beartype.BeartypeConf.union_reorder_calls` option.
+
+This snippet calls the union profiler passed to the current wrapper function,
+which unconditionally returns :data:`True`. Since this snippet occupies its own
+line, reordering the code type-checking these child hints reduces to replacing
+this line by the :data:`.CODE_PEP484604_UNION_REORDERED_CHILD_SUFFIX` snippet.
+'''
+
+
+_CODE_PEP484604_UNION_PROFILE_KEY = (
+    f'{CODE_PEP484604_UNION_PROFILE_PITH_INDEX_PLACEHOLDER}:{{union_index}}')
+'''
+Substring suffixing the :data:`.CODE_PEP484604_UNION_PROFILE_MARKER` and
+:data:`.CODE_PEP484604_UNION_PROFILE_MARKER_END` comments, uniquely identifying
+the current union type-checked by the current type-checking wrapper function.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_PREFIX = '''(
+{indent_curr}    # Localize this pith *BEFORE* type-checking this pith against the
+{indent_curr}    # child hints of this union, whose order may change at runtime.
+{indent_curr}    ({pith_curr_assign_expr}) is {pith_curr_var_name} and ('''
+'''
+:pep:`484`-compliant code snippet prefixing all code type-checking the current
+pith against each subscripted argument of a :class:`typing.Union` type hint under
+the :attr:`beartype.BeartypeConf.union_reorder_calls` option.
+
+Since the code type-checking these arguments may be reordered at runtime, *no*
+such code may localize this pith via an assignment expression. This snippet
+instead localizes this pith *before* all such code with an identity test that
+is trivially :data:`True`.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_CHILD = f'''
+{{indent_curr}}    {CODE_PEP484604_UNION_PROFILE_MARKER}{_CODE_PEP484604_UNION_PROFILE_KEY}
+{{indent_curr}}    ({{hint_child_expr}})
+{{indent_curr}}    {CODE_PEP484604_UNION_PROFILE_HOOK}'''
+'''
+:pep:`484`-compliant code snippet type-checking the current pith against the
+current child argument subscripting a parent :class:`typing.Union` type hint
+under the :attr:`beartype.BeartypeConf.union_reorder_calls` option *and*
+recording that this pith satisfies that argument.
+'''
+
+
+CODE_PEP484604_UNION_PROFILE_SUFFIX = f'''
+{{indent_curr}}    {CODE_PEP484604_UNION_PROFILE_MARKER_END}{_CODE_PEP484604_UNION_PROFILE_KEY}
+{{indent_curr}}    False
+{{indent_curr}}))'''
+'''
+:pep:`484`-compliant code snippet suffixing all code type-checking the current
+pith against each subscripted argument of a :class:`typing.Union` type hint under
+the :attr:`beartype.BeartypeConf.union_reorder_calls` option.
+
+Since every snippet preceding this snippet is suffixed by the boolean operator
+``" or"``, this snippet terminates that chain with :data:`False` rather than
+requiring that operator to be stripped from the last such snippet. Since that
+snippet may be reordered at runtime, that snippet is *not* necessarily last.
+'''
+
+
+CODE_PEP484604_UNION_REORDERED_CHILD_SUFFIX = 'or'
+'''
+:pep:`484`-compliant code snippet suffixing the code type-checking the current
+pith against the current child argument subscripting a parent
+:class:`typing.Union` type hint reordered under the
+:attr:`beartype.BeartypeConf.union_reorder_calls` option, replacing the
+:data:`.CODE_PEP484604_UNION_PROFILE_HOOK` snippet suffixing that code before
+that reordering.
+'''
+
 # ....................{ FORMATTERS                         }....................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
@@ -73,3 +215,11 @@ CODE_PEP484604_UNION_CHILD_PEP_format: CallableStrFormat = (
     CODE_PEP484604_UNION_CHILD_PEP.format)
 CODE_PEP484604_UNION_CHILD_NONPEP_format: CallableStrFormat = (
     CODE_PEP484604_UNION_CHILD_NONPEP.format)
+CODE_PEP484604_UNION_CHILD_NONPEP_EXPR_format: CallableStrFormat = (
+    CODE_PEP484604_UNION_CHILD_NONPEP_EXPR.format)
+CODE_PEP484604_UNION_PROFILE_CHILD_format: CallableStrFormat = (
+    CODE_PEP484604_UNION_PROFILE_CHILD.format)
+CODE_PEP484604_UNION_PROFILE_PREFIX_format: CallableStrFormat = (
+    CODE_PEP484604_UNION_PROFILE_PREFIX.format)
+CODE_PEP484604_UNION_PROFILE_SUFFIX_format: CallableStrFormat = (
+    CODE_PEP484604_UNION_PROFILE_SUFFIX.format)
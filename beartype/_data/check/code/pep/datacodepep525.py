@@ -14,9 +14,12 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._data.check.code.datacodename import (
+    ARG_NAME_CHECK_SEND,
+    ARG_NAME_CHECK_YIELD,
     ARG_NAME_FUNC,
     VAR_NAME_PITH_ROOT,
 )
+from beartype._data.typing.datatyping import CallableStrFormat
 
 # ....................{ CODE                               }....................
 # This pure-Python code snippet is *EXTREMELY* inspired by a comparable snippet
@@ -92,7 +95,7 @@ from beartype._data.check.code.datacodename import (
 # Lastly, note that Asynchronous generators *CANNOT* return values -- unlike
 # synchronous generators, which may. While the original snippet in PEP 380
 # handles such returns, the snippet below *CANNOT* and is thus somewhat terser.
-CODE_PEP525_RETURN_CHECKED = f'''
+CODE_PEP525_RETURN_CHECKED_ITEMS = f'''
     #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
     # [BEGIN "async yield from"] What follows is the pure-Python implementation
     # of the "async yield from" expression... if that existed, which it doesn't.
@@ -116,10 +119,10 @@ CODE_PEP525_RETURN_CHECKED = f'''
     # erroneously halt the inner generator by passing a "StopAsyncIteration"
     # exception to the athrow() method of this outer generator. Generators may
     # be prematurely halted *ONLY* by calling the aclose() method.
-    else:
+    else:{{code_check_yield_init}}
         # PEP 525-compliant bidirectional communication loop, shuttling values
         # and exceptions between the caller above and inner generator below.
-        while True:
+        while True:{{code_check_yield}}
             # Attempt to...
             try:
                 # Yield the value previously yielded by the inner generator up
@@ -177,7 +180,7 @@ CODE_PEP525_RETURN_CHECKED = f'''
                     # Note that *ONLY* the anext() method is efficiently
                     # accessible as a builtin. For unknown reasons, the asend()
                     # method is *NOT* and must instead be looked up explicitly.
-                    else:
+                    else:{{code_check_send}}
                         __beartype_agen_yield_pith = (
                             await {VAR_NAME_PITH_ROOT}.asend(
                                 __beartype_agen_send_pith))
@@ -228,6 +231,26 @@ https://github.com/beartype/beartype/issues/592#issuecomment-3559076610
 https://github.com/rbroderi/future-async-yield-from
     Pure-Python package generalizing the above commentary into a general-purpose
     solution applicable throughout the wider Python ecosystem.
+
+This snippet is a template whose ``{code_check_yield_init}``,
+``{code_check_yield}``, and ``{code_check_send}`` format variables are replaced
+by code lazily type-checking the values yielded by and sent into that generator
+under the :attr:`beartype.BeartypeConf.check_yield_every` option.
+'''
+
+
+CODE_PEP525_RETURN_CHECKED = CODE_PEP525_RETURN_CHECKED_ITEMS.format(
+    code_check_yield_init='', code_check_yield='', code_check_send='')
+'''
+:pep:`525`-compliant code snippet facilitating full-blown bidirectional
+communication between the higher-level caller and lower-level asynchronous
+generator factory wrapped by :func:`beartype.beartype`-driven type-checking
+*without* type-checking the values yielded by and sent into that generator.
+
+See Also
+--------
+:data:`.CODE_PEP525_RETURN_CHECKED_ITEMS`
+    Further details.
 '''
 
 
@@ -244,3 +267,55 @@ and returns).
 This snippet is an optimization for the common case in which the return of that
 factory is left unannotated.
 '''
+
+
+CODE_PEP525_CHECK_YIELD_EVERY_INIT = '''
+        # Number of items remaining to be yielded before type-checking the next
+        # item, initialized to type-check the first item.
+        __beartype_agen_yield_countdown = 1'''
+'''
+:pep:`525`-compliant code snippet initializing the countdown governing which
+yielded items are type-checked by the :data:`.CODE_PEP525_CHECK_YIELD_EVERY`
+snippet.
+'''
+
+
+CODE_PEP525_CHECK_YIELD_EVERY = f'''
+            # If this is the n-th yielded item, reset this countdown *AND*
+            # type-check this item.
+            __beartype_agen_yield_countdown -= 1
+            if not __beartype_agen_yield_countdown:
+                __beartype_agen_yield_countdown = {{check_yield_every}}
+                {ARG_NAME_CHECK_YIELD}(__beartype_agen_yield_pith)'''
+'''
+:pep:`525`-compliant code snippet type-checking every ``n``-th item yielded by
+the inner generator, where ``n`` is the
+:attr:`beartype.BeartypeConf.check_yield_every` option exceeding 1.
+'''
+
+
+CODE_PEP525_CHECK_YIELD_ALL = f'''
+            # Type-check this yielded item.
+            {ARG_NAME_CHECK_YIELD}(__beartype_agen_yield_pith)'''
+'''
+:pep:`525`-compliant code snippet type-checking *every* item yielded by the
+inner generator, where the :attr:`beartype.BeartypeConf.check_yield_every`
+option is 1.
+'''
+
+
+CODE_PEP525_CHECK_SEND = f'''
+                        {ARG_NAME_CHECK_SEND}(__beartype_agen_send_pith)'''
+'''
+:pep:`525`-compliant code snippet type-checking each non-:data:`None` value
+sent into the outer generator *before* propagating that value to the inner
+generator.
+'''
+
+# ....................{ FORMATTERS                         }....................
+# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
+# This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP525_CHECK_YIELD_EVERY_format: CallableStrFormat = (
+    CODE_PEP525_CHECK_YIELD_EVERY.format)
+CODE_PEP525_RETURN_CHECKED_ITEMS_format: CallableStrFormat = (
+    CODE_PEP525_RETURN_CHECKED_ITEMS.format)
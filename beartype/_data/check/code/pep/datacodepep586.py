@@ -56,8 +56,70 @@ snippet type-checking the current pith against *all* subscripted arguments of
 this parent hint has been generated.
 '''
 
+
+CODE_PEP586_LITERALS_HASHABLE = '''
+{{indent_curr}}        # True only if this pith is equal to one of these literals. If
+{{indent_curr}}        # this pith is of the exact type of one of these literals and thus
+{{indent_curr}}        # guaranteed to be hashable, decide this by hash-based membership
+{{indent_curr}}        # in a frozen set of these literals; else, this pith is an
+{{indent_curr}}        # instance of a subclass of such a type and thus possibly
+{{indent_curr}}        # unhashable, in which case decide this by a C-based linear search.
+{{indent_curr}}        ({pith_curr_var_name} in {hint_literals_set_expr}
+{{indent_curr}}         if type({pith_curr_var_name}) in {hint_literal_types_set_expr} else
+{{indent_curr}}         {pith_curr_var_name} in {hint_literals_tuple_expr})'''
+'''
+:pep:`586`-compliant code snippet type-checking the current pith against *all*
+hashable literal objects subscripting a :pep:`586`-compliant
+:class:`typing.Literal` type hint subscripted by many such objects.
+
+This snippet is an optimization of the more general
+:data:`.CODE_PEP586_LITERAL` snippet, which generates one equality comparison
+per literal object and thus both type-checks in :math:`O(n)` time *and*
+generates :math:`O(n)` code for type hints subscripted by :math:`n` literal
+objects. This snippet instead type-checks in :math:`O(1)` time *and* generates
+:math:`O(1)` code. Membership in a frozen set tests equality after hashing and
+thus preserves the semantics of that snippet, including the equality of
+booleans with integers (e.g., ``True == 1``). Since the
+:data:`.CODE_PEP586_PREFIX` snippet preceding both snippets merely rejects piths
+that are instances of *none* of the types of these literals, an integer pith
+equal to a boolean literal satisfies that hint *only* if that hint is also
+subscripted by one or more integer literals. For example, ``1`` satisfies
+``Literal[True, 2, 3, 4]`` but violates ``Literal[True, 'a', 'b', 'c']``.
+
+Since a subclass of a literal type may prohibit hashing (e.g., by setting the
+``__hash__`` dunder attribute to :data:`None`), this snippet reserves hash-based
+membership to piths whose types are exactly the types of these literals.
+'''
+
+
+CODE_PEP586_LITERALS_ENUM = '''
+{{indent_curr}}        # True only if this pith is one of these enumeration members,
+{{indent_curr}}        # decided by hash-based membership of the object identifier of this
+{{indent_curr}}        # pith in a frozen set of the identifiers of these members.
+{{indent_curr}}        id({pith_curr_var_name}) in {hint_literal_ids_set_expr}'''
+'''
+:pep:`586`-compliant code snippet type-checking the current pith against *all*
+literal objects subscripting a :pep:`586`-compliant :class:`typing.Literal` type
+hint subscripted by many identity-comparable enumeration members, as decided by
+the :func:`beartype._util.hint.pep.proposal.pep586.is_hint_pep586_literals_enum`
+tester.
+
+This snippet is an optimization of the :data:`.CODE_PEP586_LITERALS_HASHABLE`
+snippet. Hashing an enumeration member calls the pure-Python
+:meth:`enum.Enum.__hash__` method, whereas hashing the integer identifier of
+that member is performed in C. Since the prefix of this snippet already
+validates this pith to be an instance of the type of one of these members,
+this pith is guaranteed to be one of the members of that type, each of which
+is kept alive by that type. The identifiers of these members thus *never* refer
+to other objects.
+'''
+
 # ....................{ FORMATTERS                         }....................
 # str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
 # This is an absurd micro-optimization. *fight me, github developer community*
 CODE_PEP586_LITERAL_format: CallableStrFormat = CODE_PEP586_LITERAL.format
 CODE_PEP586_PREFIX_format: CallableStrFormat = CODE_PEP586_PREFIX.format
+CODE_PEP586_LITERALS_ENUM_format: CallableStrFormat = (
+    CODE_PEP586_LITERALS_ENUM.format)
+CODE_PEP586_LITERALS_HASHABLE_format: CallableStrFormat = (
+    CODE_PEP586_LITERALS_HASHABLE.format)
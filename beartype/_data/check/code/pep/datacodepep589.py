@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`589` **type-checking expression snippets** (i.e., triple-quoted
+pure-Python string constants formatted and concatenated together to dynamically
+generate boolean expressions type-checking arbitrary objects against
+:pep:`589`-compliant type hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.typing.datatyping import CallableStrFormat
+
+# ....................{ CODE                               }....................
+CODE_PEP589_PREFIX = '''(
+{indent_curr}    # True only if this pith is a mapping.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr})'''
+'''
+:pep:`589`-compliant code snippet prefixing all code type-checking the current
+pith against a :pep:`589`-compliant :class:`typing.TypedDict` subclass.
+
+Caveats
+-------
+**This snippet is formatted exactly once.** Unlike most other snippets, the
+code type-checking each key of this typed dictionary embeds the names of those
+keys as string literals, which may contain ``{`` and ``}`` characters that
+subsequent calls to the :meth:`str.format` method would erroneously interpret
+as format fields. All snippets defined by this submodule are thus formatted
+exactly once by the caller and then concatenated as is.
+'''
+
+
+CODE_PEP589_SUFFIX = '''
+{indent_curr})'''
+'''
+:pep:`589`-compliant code snippet suffixing all code type-checking the current
+pith against a :pep:`589`-compliant :class:`typing.TypedDict` subclass.
+'''
+
+
+CODE_PEP589_KEYS_REQUIRED = ''' and
+{indent_curr}    # True only if this mapping contains all required keys.
+{indent_curr}    {pith_curr_var_name}.keys() >= {hint_keys_required_expr}'''
+'''
+:pep:`589`-compliant code snippet type-checking the current pith to contain
+*all* required keys of a :pep:`589`-compliant :class:`typing.TypedDict`
+subclass.
+
+This snippet intentionally tests whether the keys view of this mapping is a
+superset of the frozen set of these keys rather than whether this frozen set is
+a subset of this keys view, as only the former defers to the C-based
+:meth:`dict_keys.__ge__` method directly.
+'''
+
+
+CODE_PEP589_VALUE = ''' and
+{indent_curr}    # True only if this value satisfies this value hint.
+{indent_curr}    ({hint_value_code})'''
+'''
+:pep:`589`-compliant code snippet type-checking the value of the current key
+of the current pith against the value type hint of that key declared by a
+:pep:`589`-compliant :class:`typing.TypedDict` subclass.
+'''
+
+
+CODE_PEP589_VALUE_OPTIONAL_EXPR = (
+    '''{hint_key_expr} not in {pith_curr_var_name} or {hint_value_code}''')
+'''
+:pep:`589`-compliant Python expression type-checking the value of the current
+**optional key** (i.e., key that need *not* be present) of the current pith
+against the value type hint of that key only if that key is present.
+'''
+
+
+CODE_PEP589_VALUE_SAMPLED_EXPR = (
+    '''{pith_key_index_expr} != {hint_key_index} or {hint_value_code}''')
+'''
+:pep:`589`-compliant Python expression type-checking the value of the current
+key of the current pith against the value type hint of that key only if that
+key is the key pseudo-randomly sampled for type-checking by the current call.
+
+The first such expression assigns the 0-based index of that sampled key to a
+local variable via an assignment expression; all subsequent such expressions
+merely access that variable. Exactly one value is thus deeply type-checked for
+each call, regardless of the number of keys declared by that typed dictionary.
+'''
+
+
+CODE_PEP589_KEY_INDEX_ASSIGN_EXPR = (
+    '''({pith_key_index_var_name} := {random_int} % {hint_keys_len})''')
+'''
+:pep:`589`-compliant Python expression assigning the 0-based index of the key
+pseudo-randomly sampled for type-checking by the current call to a local
+variable.
+'''
+
+
+CODE_PEP589_VALUE_PITH_CHILD_EXPR = (
+    '''{pith_curr_var_name}[{hint_key_expr}]''')
+'''
+:pep:`589`-compliant Python expression yielding the value of the current key of
+the current pith.
+'''
+
+# ....................{ FORMATTERS                         }....................
+# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
+# This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP589_KEY_INDEX_ASSIGN_EXPR_format: CallableStrFormat = (
+    CODE_PEP589_KEY_INDEX_ASSIGN_EXPR.format)
+CODE_PEP589_KEYS_REQUIRED_format: CallableStrFormat = (
+    CODE_PEP589_KEYS_REQUIRED.format)
+CODE_PEP589_PREFIX_format: CallableStrFormat = CODE_PEP589_PREFIX.format
+CODE_PEP589_SUFFIX_format: CallableStrFormat = CODE_PEP589_SUFFIX.format
+CODE_PEP589_VALUE_format: CallableStrFormat = CODE_PEP589_VALUE.format
+CODE_PEP589_VALUE_OPTIONAL_EXPR_format: CallableStrFormat = (
+    CODE_PEP589_VALUE_OPTIONAL_EXPR.format)
+CODE_PEP589_VALUE_PITH_CHILD_EXPR_format: CallableStrFormat = (
+    CODE_PEP589_VALUE_PITH_CHILD_EXPR.format)
+CODE_PEP589_VALUE_SAMPLED_EXPR_format: CallableStrFormat = (
+    CODE_PEP589_VALUE_SAMPLED_EXPR.format)
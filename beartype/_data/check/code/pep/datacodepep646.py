@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype :pep:`646` **type-checking expression snippets** (i.e., triple-quoted
+pure-Python string constants formatted and concatenated together to dynamically
+generate boolean expressions type-checking arbitrary objects against
+:pep:`646`-compliant type hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.check.code.datacodename import VAR_NAME_RANDOM_INT
+from beartype._data.typing.datatyping import CallableStrFormat
+
+# ....................{ CODE ~ tuple : fixed-variadic      }....................
+CODE_PEP646_TUPLE_FIXED_VARIADIC_PREFIX = '''(
+{indent_curr}    # True only if this pith is a tuple *AND*...
+{indent_curr}    isinstance({pith_curr_assign_expr}, tuple) and
+{indent_curr}    # True only if this tuple contains at least as many items as fixed
+{indent_curr}    # child hints subscripting this hint.
+{indent_curr}    len({pith_curr_var_name}) >= {hint_childs_fixed_len}'''
+'''
+:pep:`646`-compliant code snippet prefixing all code type-checking the current
+pith against a :pep:`646`-compliant **fixed-variadic tuple hint** (i.e., of the
+form ``tuple[{hint_prefix_1}, ..., *tuple[{hint_variadic}, ...],
+{hint_suffix_1}, ...]``).
+
+Caveats
+-------
+**All snippets defined by this submodule are formatted exactly once** by the
+caller and then concatenated as is, avoiding the need to brace-protect format
+variables deferred to subsequent calls to the :meth:`str.format` method.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_SUFFIX = '''
+{indent_curr})'''
+'''
+:pep:`646`-compliant code snippet suffixing all code type-checking the current
+pith against a :pep:`646`-compliant fixed-variadic tuple hint.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_FIXED_CHILD = ''' and
+{indent_curr}    # True only if this fixed item satisfies this child hint.
+{indent_curr}    {hint_child_placeholder}'''
+'''
+:pep:`646`-compliant code snippet type-checking the current **fixed item**
+(i.e., tuple item matched by a child hint either preceding or following the
+unpacked child hint subscripting a :pep:`646`-compliant fixed-variadic tuple
+hint) of the current pith against that child hint.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD = ''' and
+{indent_curr}    # True only if either this tuple contains *NO* variadic items *OR*
+{indent_curr}    # the selected variadic item satisfies the variadic child hint.
+{indent_curr}    (len({pith_curr_var_name}) == {hint_childs_fixed_len} or
+{indent_curr}     {hint_child_placeholder})'''
+'''
+:pep:`646`-compliant code snippet type-checking one **variadic item** (i.e.,
+tuple item matched by the unpacked child hint subscripting a
+:pep:`646`-compliant fixed-variadic tuple hint) of the current pith against the
+child hint constraining those items under a sublinear-time type-checking
+strategy.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_ALL = ''' and
+{indent_curr}    # True only if *ALL* variadic items of this tuple satisfy the
+{indent_curr}    # variadic child hint.
+{indent_curr}    all(
+{indent_curr}        {hint_child_placeholder}
+{indent_curr}        for {pith_child_var_name} in {pith_curr_iterable_expr}
+{indent_curr}    )'''
+'''
+:pep:`646`-compliant code snippet type-checking *all* variadic items of the
+current pith against the child hint constraining those items under the
+:math:`O(n)` linear-time :attr:`beartype.BeartypeStrategy.On` strategy.
+
+See Also
+--------
+:data:`beartype._data.check.code.pep.datacodepep484585.CODE_PEP484585_REITERABLE_OR_SEQUENCE_ALL`
+    Further details.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_ITERABLE_EXPR = (
+    '''{islice_expr}({pith_curr_var_name}, {hint_childs_prefix_len}, '''
+    '''{pith_variadic_stop_expr})''')
+'''
+:pep:`646`-compliant Python expression yielding an iterator over *all* variadic
+items of the current pith.
+
+This expression iterates with the C-based :func:`itertools.islice` iterator
+(accessed as the hidden ``{islice_expr}`` parameter) rather than slicing this
+tuple, which would inefficiently copy these items into a new tuple. The
+``{pith_variadic_stop_expr}`` format variable is either:
+
+* If one or more fixed child hints follow the unpacked child hint, the
+  :data:`.CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR` expression.
+* Else, :data:`None`, iterating up to the last item of this tuple.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR = (
+    '''len({pith_curr_var_name}) - {hint_childs_suffix_len}''')
+'''
+:pep:`646`-compliant Python expression yielding the 0-based index of the first
+trailing item of the current pith matched by the fixed child hints following
+the unpacked child hint.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_RANDOM_PITH_CHILD_EXPR = (
+    f'''{{pith_curr_var_name}}[{{hint_childs_prefix_len}} + '''
+    f'''{VAR_NAME_RANDOM_INT} % '''
+    f'''(len({{pith_curr_var_name}}) - {{hint_childs_fixed_len}})]''')
+'''
+:pep:`646`-compliant Python expression efficiently yielding a pseudo-randomly
+indexed variadic item of the current pith, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` option is enabled.
+
+Caveats
+-------
+**This expression assumes this tuple to contain one or more variadic items.**
+Callers are required to guard this expression accordingly, as the
+:data:`.CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD` snippet does.
+'''
+
+
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_NONRANDOM_PITH_CHILD_EXPR = (
+    '''{pith_curr_var_name}[{hint_childs_prefix_len}]''')
+'''
+:pep:`646`-compliant Python expression efficiently yielding the first variadic
+item of the current pith, intended to be applied when the
+:attr:`beartype.BeartypeConf.is_random` option is disabled.
+'''
+
+# ....................{ FORMATTERS                         }....................
+# str.format() methods, globalized to avoid inefficient dot lookups elsewhere.
+# This is an absurd micro-optimization. *fight me, github developer community*
+CODE_PEP646_TUPLE_FIXED_VARIADIC_FIXED_CHILD_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_FIXED_CHILD.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_PREFIX_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_PREFIX.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_SUFFIX_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_SUFFIX.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_ALL_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_CHILD_ALL.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_ITERABLE_EXPR_format: (
+    CallableStrFormat) = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_ITERABLE_EXPR.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_NONRANDOM_PITH_CHILD_EXPR_format: (
+    CallableStrFormat) = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_NONRANDOM_PITH_CHILD_EXPR.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_RANDOM_PITH_CHILD_EXPR_format: (
+    CallableStrFormat) = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_RANDOM_PITH_CHILD_EXPR.format)
+CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR_format: CallableStrFormat = (
+    CODE_PEP646_TUPLE_FIXED_VARIADIC_VARIADIC_STOP_EXPR.format)
@@ -29,7 +29,10 @@ from beartype._cave._cavefast import (
     MethodDecoratorBuiltinTypes,
     NoneType,
 )
-from beartype._data.typing.datatyping import TupleTypes
+from beartype._data.typing.datatyping import (
+    FrozenSetTypes,
+    TupleTypes,
+)
 from collections.abc import Set
 from pathlib import Path
 
@@ -76,6 +79,26 @@ Note that the :class:`Set` abstract base class (ABC) rather than the concrete
    False
 '''
 
+# ....................{ TYPES ~ builtin                    }....................
+TYPES_BUILTIN_SCALAR: FrozenSetTypes = frozenset((
+    bool,
+    bytes,
+    complex,
+    float,
+    int,
+    str,
+))
+'''
+Frozen set of all **builtin scalar types** (i.e., C-based builtin types whose
+instances are atomic values rather than containers), whose instances are almost
+always of exactly these types rather than of subclasses of these types.
+
+Code type-checking objects against these types thus tests whether the types of
+those objects are exactly these types *before* falling back to the
+:func:`isinstance` builtin, as the former is appreciably faster than the latter
+in the common case.
+'''
+
 # ....................{ TYPES ~ beartype                   }....................
 # Types of *ALL* objects that may be decorated by @beartype, intentionally
 # listed in descending order of real-world prevalence for negligible efficiency
@@ -60,12 +60,15 @@ from beartype._data.hint.sign.datahintsigns import (
     HintSignNumpyArray,
     HintSignNone,
     HintSignNoReturn,
+    HintSignNotRequired,
     HintSignOptional,
     HintSignOrderedDict,
     HintSignParamSpec,
     HintSignPattern,
     HintSignTypeAlias,
     HintSignProtocol,
+    HintSignReadOnly,
+    HintSignRequired,
     HintSignReversible,
     HintSignSelf,
     HintSignSequence,
@@ -365,6 +368,60 @@ type hint constraining *all* items contained in that container).
 # PEP-compliant type hints standardized by more recently released PEPs).
 # '''
 
+# ....................{ SETS ~ check : memo                }....................
+HINT_SIGNS_CHECK_MEMO_USEFUL: FrozenSetHintSign = frozenset((
+    # ..................{ PEP (484|585)                      }..................
+    HintSignFrozenSet,
+    HintSignPep484585TupleFixed,
+    HintSignPep484585TupleVariadic,
+
+    # ..................{ PEP 646                            }..................
+    HintSignPep646TupleFixedVariadic,
+))
+'''
+Frozen set of all **immutable container signs** (i.e., arbitrary objects
+uniquely identifying PEP-compliant type hints subscripted by one or more child
+hints describing the items of immutable builtin containers).
+
+Since the items of any object satisfying a hint identified by a sign in this
+set *cannot* be replaced, the code type-checking those items under the
+:attr:`beartype.BeartypeStrategy.On` strategy is safely memoizable under the
+:attr:`beartype.BeartypeConf.is_check_memo` option -- assuming those child
+hints are also safely memoizable.
+'''
+
+
+HINT_SIGNS_CHECK_MEMO_SAFE: FrozenSetHintSign = frozenset((
+    # ..................{ PEP 484                            }..................
+    HintSignOptional,
+    HintSignUnion,
+
+    # ..................{ PEP (484|585)                      }..................
+    HintSignFrozenSet,
+    HintSignPep484585TupleFixed,
+    HintSignPep484585TupleVariadic,
+
+    # ..................{ PEP 586                            }..................
+    HintSignLiteral,
+
+    # ..................{ PEP 646                            }..................
+    HintSignPep646TupleFixedVariadic,
+))
+'''
+Frozen set of all **memoizable signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints deeply type-checked by code whose result
+for any given object is invariant across the lifetime of that object, assuming
+all child hints subscripting those hints to also be identified by signs in this
+set *or* to be shallowly type-checked).
+
+This set intentionally excludes signs identifying hints whose satisfaction may
+change across the lifetime of an object, including:
+
+* Mutable containers (e.g., ``list[int]``), whose items may be replaced.
+* :pep:`593`-compliant ``typing.Annotated[...]`` hints, whose
+  :mod:`beartype.vale` validators may inspect arbitrary mutable state.
+'''
+
 # ....................{ SETS ~ kind                        }....................
 HINT_SIGNS_GENERIC: FrozenSetHintSign = frozenset((
     HintSignPep484585GenericSubbed,
@@ -612,6 +669,24 @@ attributes defined at class scope in dataclasses decorated by the
 of those dataclasses).
 '''
 
+# ....................{ SETS ~ pep : 589                   }....................
+HINT_SIGNS_PEP589_QUALIFIER: FrozenSetHintSign = frozenset((
+    # ..................{ PEP 655                            }..................
+    HintSignNotRequired,
+    HintSignRequired,
+
+    # ..................{ PEP 705                            }..................
+    HintSignReadOnly,
+))
+'''
+Frozen set of all :pep:`589`-compliant **typed dictionary qualifier signs**
+(i.e., arbitrary objects uniquely identifying PEP-compliant type qualifiers
+subscripted by the value type hints annotating the keys of
+:class:`typing.TypedDict` subclasses, which are already reflected by the
+``__required_keys__`` and ``__readonly_keys__`` dunder attributes of those
+subclasses and thus safely strippable from those value type hints).
+'''
+
 # ....................{ SETS ~ pep : 612                   }....................
 HINT_SIGNS_PEP612_CALLABLE_ARGLIST: FrozenSetHintSign = frozenset((
     # ..................{ PEP 612                            }..................
@@ -658,11 +733,6 @@ _HINT_SIGNS_SUPPORTED_SHALLOW: FrozenSetHintSign = frozenset((
     # ..................{ PEP 484                            }..................
     HintSignTypeVar,
 
-    # ..................{ PEP 589                            }..................
-    #FIXME: Shift into "HINT_SIGNS_SUPPORTED_DEEP" *AFTER* deeply type-checking
-    #typed dictionaries.
-    HintSignTypedDict,
-
     # ..................{ PEP 591                            }..................
     HintSignFinal,
 
@@ -674,11 +744,6 @@ _HINT_SIGNS_SUPPORTED_SHALLOW: FrozenSetHintSign = frozenset((
     # HintSignPep646TupleUnpacked,
     # HintSignPep646TypeVarTupleUnpacked,
 
-    # ..................{ PEP 646                            }..................
-    #FIXME: Shift into "HINT_SIGNS_SEQUENCE_ARGS_N" *AFTER* deeply type-checking
-    #PEP 646-compliant tuple hints.
-    HintSignPep646TupleFixedVariadic,
-
     # ..................{ PEP 647                            }..................
     HintSignTypeGuard,
 
@@ -763,7 +828,11 @@ HINT_SIGNS_SUPPORTED_DEEP: FrozenSetHintSign = (
     HINT_SIGNS_QUASIITERABLE |
     HINT_SIGNS_REITERABLE |
     HINT_SIGNS_SEQUENCE |
-    _HINT_SIGNS_SUPPORTED_DEEP_NONCONTAINER
+    _HINT_SIGNS_SUPPORTED_DEEP_NONCONTAINER |
+    # PEP 589-compliant typed dictionaries are containers whose values are
+    # type-checked by key rather than by iteration and thus belong to *NO*
+    # container sets above.
+    frozenset((HintSignTypedDict,))
 )
 '''
 Frozen set of all **deeply supported signs** (i.e., arbitrary objects uniquely
@@ -873,6 +873,21 @@ See Also
     Further details.
 '''
 
+# ....................{ PEP ~ 589                          }....................
+TupleHintPep589KeyTable = tuple[FrozenSetStrs, tuple[tuple[str, object], ...]]
+'''
+:pep:`585`-compliant type hint matching a :pep:`589`-compliant **key table**
+(i.e., 2-tuple ``(hint_keys_required, hint_key_hints)`` of the frozen set of the
+names of all required keys of a :class:`typing.TypedDict` subclass *and* the
+tuple of the 2-tuples ``(key_name, key_hint)`` of the name and value type hint
+of each key of that subclass).
+
+See Also
+--------
+:func:`beartype._util.hint.pep.proposal.pep589.get_hint_pep589_key_table`
+    Further details.
+'''
+
 # ....................{ PEP ~ (649|749)                    }....................
 # Objects defining PEP 649- and 749-compliant __annotate__() dunder methods are
 # either...
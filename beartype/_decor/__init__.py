@@ -64,19 +64,6 @@
 #explicit "TypeAlias". That constitutes full support for PEP 613 from our
 #side. Good enough! :p
 
-#FIXME: [SPEED] As a useful MACROoptimization, render the entire @beartype
-#toolchain thread-safe upfront rather than doing so piecemeal throughout the
-#toolchain. While the latter certainly works as well, the former is
-#*SUBSTANTIALLY* more efficient due to the non-trivial expense of each
-#threadsafe context manager. To do so:
-#* Simply wrap the body of the implementation of the @beartype decorator in a
-#  context manager locking on a globally declared lock: e.g.,
-#      with lock:
-#          ...
-#  Note that an "RLock" is neither needed nor desired here, as @beartype
-#  *NEVER* invokes itself recursively. A non-reentrant "Lock" suffices.
-#* Rip out all now-redundant "with lock:" expressions throughout the codebase.
-
 #FIXME: [SPEED] As a useful microoptimization, unroll *ALL* calls to the any()
 #and all() builtins into equivalent "for" loops in our critical path. Since we
 #typically pass these builtins generator comprehensions created and destroyed
@@ -16,22 +16,58 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype._check.checkmake import (
     make_code_raiser_func_pith_check,
     make_code_raiser_func_pep484_noreturn_check,
+    make_func_raiser_generator_pith,
 )
 from beartype._check.convert.convmain import sanify_hint_root_func
 from beartype._check.cls.call.calldatadecorfunc import (
     BeartypeCallDecorFuncData,
     prefix_decor_func_callable_return,
 )
-from beartype._check.cls.hint.hintsane import HINT_SANE_IGNORABLE
+from beartype._check.cls.hint.hintsane import (
+    HINT_SANE_IGNORABLE,
+    HintSane,
+)
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_CHECK_RETURN,
+    ARG_NAME_CHECK_SEND,
+    ARG_NAME_CHECK_YIELD,
+)
 from beartype._data.check.code.func.datacodefuncwrap import CODE_CALL_CHECKED_format
+from beartype._data.check.code.pep.datacodepep342 import (
+    CODE_PEP342_CHECK_RETURN,
+    CODE_PEP342_CHECK_SEND,
+    CODE_PEP342_CHECK_YIELD_ALL,
+    CODE_PEP342_CHECK_YIELD_EVERY_INIT,
+    CODE_PEP342_CHECK_YIELD_EVERY_format,
+    CODE_PEP342_RETURN_CHECKED,
+    CODE_PEP342_RETURN_CHECKED_ITEMS_format,
+)
+from beartype._data.check.code.pep.datacodepep525 import (
+    CODE_PEP525_CHECK_SEND,
+    CODE_PEP525_CHECK_YIELD_ALL,
+    CODE_PEP525_CHECK_YIELD_EVERY_INIT,
+    CODE_PEP525_CHECK_YIELD_EVERY_format,
+    CODE_PEP525_RETURN_CHECKED,
+    CODE_PEP525_RETURN_CHECKED_ITEMS_format,
+)
 from beartype._data.check.code.pep.datacodepep484 import PEP484_CODE_CHECK_NORETURN
 from beartype._data.check.error.dataerrmagic import EXCEPTION_PLACEHOLDER
 from beartype._data.func.datafuncarg import ARG_NAME_RETURN
+from beartype._data.hint.sign.datahintsigns import (
+    HintSignAsyncGenerator,
+    HintSignAsyncIterable,
+    HintSignAsyncIterator,
+    HintSignGenerator,
+    HintSignIterable,
+    HintSignIterator,
+)
 from beartype._data.kind.datakindiota import SENTINEL
 from beartype._data.typing.datatyping import LexicalScope
 from beartype._data.typing.datatypingport import Hint
 from beartype._util.error.utilerrraise import reraise_exception_placeholder
 from beartype._util.error.utilerrwarn import reissue_warnings_placeholder
+from beartype._util.hint.pep.utilpepget import get_hint_pep_args
+from beartype._util.hint.pep.utilpepsign import get_hint_pep_sign_or_none
 from beartype._util.kind.maplike.utilmapset import update_mapping
 from typing import NoReturn
 from warnings import catch_warnings
@@ -171,8 +207,8 @@ def code_check_return(decor_func: BeartypeCallDecorFuncData) -> str:
                 # this return.
                 code_return_check_prefix = CODE_CALL_CHECKED_format(
                     func_call_prefix=decor_func.func_wrapper_code_call_prefix)
-                code_return_check_suffix = (
-                    decor_func.func_wrapper_code_return_checked)
+                code_return_check_suffix = _code_check_return_generator(
+                    decor_func=decor_func, hint_sane=hint_sane)
 
                 # Full code snippet to be returned, consisting of:
                 # * Calling the decorated callable and localize its return
@@ -214,3 +250,232 @@ def code_check_return(decor_func: BeartypeCallDecorFuncData) -> str:
 
     # Return this code.
     return func_wrapper_code
+
+# ....................{ PRIVATE ~ coders                   }....................
+def _code_check_return_generator(
+    decor_func: BeartypeCallDecorFuncData, hint_sane: HintSane) -> str:
+    '''
+    Generate a Python code snippet returning the successfully type-checked
+    value returned by the decorated callable from the current wrapper function.
+
+    If the :attr:`beartype.BeartypeConf.check_yield_every` option is enabled
+    *and* the decorated callable is either:
+
+    * A synchronous generator factory annotated by a return hint of the form
+      ``Generator[{hint_yield}, {hint_send}, {hint_return}]``,
+      ``Iterator[{hint_yield}]``, or ``Iterable[{hint_yield}]``.
+    * An asynchronous generator factory annotated by a return hint of the form
+      ``AsyncGenerator[{hint_yield}, {hint_send}]``,
+      ``AsyncIterator[{hint_yield}]``, or ``AsyncIterable[{hint_yield}]``.
+
+    ...subscripted by one or more unignorable child hints, this snippet lazily
+    type-checks the values yielded by, sent into, and (for synchronous
+    generators) returned from the generator created by that factory against
+    these child hints as the caller consumes that generator. Else, this snippet
+    is simply the default snippet returning that value as is.
+
+    Parameters
+    ----------
+    decor_func : BeartypeCallDecorFuncData
+        Decorated callable to be type-checked.
+    hint_sane : HintSane
+        Metadata encapsulating the sanified hint annotating that callable's
+        return.
+
+    Returns
+    -------
+    str
+        Code returning the value returned by the decorated callable.
+    '''
+
+    # ..................{ LOCALS                             }..................
+    # Default code snippet returning this value as is.
+    code_return_checked = decor_func.func_wrapper_code_return_checked
+
+    # Generator yield sampling interval configured for this callable.
+    check_yield_every = decor_func.conf.check_yield_every
+
+    # If this option is disabled, return the default code snippet as is.
+    if check_yield_every is None:
+        return code_return_checked
+    # Else, this option is enabled.
+
+    # Sanified hint annotating this factory's return.
+    hint = hint_sane.hint
+
+    # Sign uniquely identifying this hint if any *OR* "None" otherwise.
+    hint_sign = get_hint_pep_sign_or_none(hint)
+
+    # If this callable is a synchronous generator factory...
+    if code_return_checked is CODE_PEP342_RETURN_CHECKED:
+        # If this hint is neither an iterable, iterator, *NOR* generator hint,
+        # return the default code snippet as is.
+        if hint_sign not in _HINT_SIGNS_RETURN_GENERATOR_SYNC_CHECKABLE:
+            return code_return_checked
+        # Else, this hint is such a hint.
+
+        # True only if this hint is subscripted by send and return child hints.
+        is_hint_send_return = hint_sign is HintSignGenerator
+    # Else, this callable is *NOT* a synchronous generator factory.
+    #
+    # If this callable is an asynchronous generator factory...
+    elif code_return_checked is CODE_PEP525_RETURN_CHECKED:
+        # If this hint is neither an asynchronous iterable, iterator, *NOR*
+        # generator hint, return the default code snippet as is.
+        if hint_sign not in _HINT_SIGNS_RETURN_GENERATOR_ASYNC_CHECKABLE:
+            return code_return_checked
+        # Else, this hint is such a hint.
+
+        # True only if this hint is subscripted by a send child hint. Note
+        # that asynchronous generators *CANNOT* return values.
+        is_hint_send_return = hint_sign is HintSignAsyncGenerator
+    # Else, this callable is neither. In this case, return the default code
+    # snippet as is.
+    else:
+        return code_return_checked
+
+    # Tuple of the zero or more child hints subscripting this hint.
+    hint_args = get_hint_pep_args(hint)
+
+    # If this hint is unsubscripted, return the default code snippet as is.
+    if not hint_args:
+        return code_return_checked
+    # Else, this hint is subscripted by one or more child hints.
+
+    # Raiser functions type-checking the values yielded by, sent into, and
+    # returned from the generator created by this factory if the corresponding
+    # child hints are both present and unignorable *OR* "None" otherwise.
+    #
+    # Note that "Iterable[...]" and "Iterator[...]" hints are subscripted by
+    # only a single child hint constraining yielded values.
+    func_check_yield = make_func_raiser_generator_pith(
+        decor_func=decor_func, hint=hint_args[0], pith_label='yield')
+    func_check_send = (
+        make_func_raiser_generator_pith(
+            decor_func=decor_func, hint=hint_args[1], pith_label='send')
+        if is_hint_send_return and len(hint_args) > 1 else
+        None
+    )
+    func_check_return = (
+        make_func_raiser_generator_pith(
+            decor_func=decor_func, hint=hint_args[2], pith_label='return')
+        if is_hint_send_return and len(hint_args) > 2 else
+        None
+    )
+
+    # If *ALL* of these child hints are ignorable, return the default code
+    # snippet. For synchronous generators, the C-based "yield from" expression
+    # is faster than the pure-Python equivalent generated below.
+    if (
+        func_check_yield is None and
+        func_check_send is None and
+        func_check_return is None
+    ):
+        return code_return_checked
+    # Else, one or more of these child hints are unignorable.
+
+    # ..................{ CODE                               }..................
+    # Snippets type-checking the values produced by this kind of generator.
+    (
+        code_check_yield_all,
+        code_check_yield_every_init,
+        code_check_yield_every_format,
+        code_check_send_snippet,
+        code_return_checked_items_format,
+    ) = (
+        (
+            CODE_PEP525_CHECK_YIELD_ALL,
+            CODE_PEP525_CHECK_YIELD_EVERY_INIT,
+            CODE_PEP525_CHECK_YIELD_EVERY_format,
+            CODE_PEP525_CHECK_SEND,
+            CODE_PEP525_RETURN_CHECKED_ITEMS_format,
+        )
+        if code_return_checked is CODE_PEP525_RETURN_CHECKED else
+        (
+            CODE_PEP342_CHECK_YIELD_ALL,
+            CODE_PEP342_CHECK_YIELD_EVERY_INIT,
+            CODE_PEP342_CHECK_YIELD_EVERY_format,
+            CODE_PEP342_CHECK_SEND,
+            CODE_PEP342_RETURN_CHECKED_ITEMS_format,
+        )
+    )
+
+    # Local scope of the current wrapper function.
+    func_wrapper_locals = decor_func.func_wrapper_locals
+
+    # Code snippets initializing and performing type-checks of yielded values,
+    # defaulting to the empty string (i.e., *NO* such type-checks).
+    code_check_yield_init = code_check_yield = ''
+
+    # If the yield child hint is unignorable...
+    if func_check_yield is not None:
+        # Expose this raiser to the current wrapper function as a hidden
+        # parameter.
+        func_wrapper_locals[ARG_NAME_CHECK_YIELD] = func_check_yield
+
+        # If type-checking *ALL* yielded values, avoid the countdown.
+        if check_yield_every == 1:
+            code_check_yield = code_check_yield_all
+        # Else, type-check only every n-th yielded value.
+        else:
+            code_check_yield_init = code_check_yield_every_init
+            code_check_yield = code_check_yield_every_format(
+                check_yield_every=check_yield_every)
+    # Else, the yield child hint is ignorable.
+
+    # Code snippet type-checking sent values if the send child hint is
+    # unignorable *OR* the empty string otherwise.
+    code_check_send = ''
+    if func_check_send is not None:
+        func_wrapper_locals[ARG_NAME_CHECK_SEND] = func_check_send
+        code_check_send = code_check_send_snippet
+
+    # If this generator is asynchronous, return the code snippet delegating to
+    # this generator while type-checking. Asynchronous generators *CANNOT*
+    # return values and thus require *NO* return type-checking.
+    if code_return_checked is CODE_PEP525_RETURN_CHECKED:
+        return code_return_checked_items_format(
+            code_check_yield_init=code_check_yield_init,
+            code_check_yield=code_check_yield,
+            code_check_send=code_check_send,
+        )
+    # Else, this generator is synchronous.
+
+    # Code snippet type-checking the returned value if the return child hint is
+    # unignorable *OR* the empty string otherwise.
+    code_check_return = ''
+    if func_check_return is not None:
+        func_wrapper_locals[ARG_NAME_CHECK_RETURN] = func_check_return
+        code_check_return = CODE_PEP342_CHECK_RETURN
+
+    # Return the code snippet delegating to this generator while type-checking.
+    return code_return_checked_items_format(
+        code_check_yield_init=code_check_yield_init,
+        code_check_yield=code_check_yield,
+        code_check_send=code_check_send,
+        code_check_return=code_check_return,
+    )
+
+# ....................{ PRIVATE ~ globals                  }....................
+_HINT_SIGNS_RETURN_GENERATOR_SYNC_CHECKABLE = frozenset((
+    HintSignGenerator,
+    HintSignIterable,
+    HintSignIterator,
+))
+'''
+Frozen set of all signs uniquely identifying return hints annotating synchronous
+generator factories whose child hints are lazily type-checkable by the
+:func:`._code_check_return_generator` function.
+'''
+
+
+_HINT_SIGNS_RETURN_GENERATOR_ASYNC_CHECKABLE = frozenset((
+    HintSignAsyncGenerator,
+    HintSignAsyncIterable,
+    HintSignAsyncIterator,
+))
+'''
+Frozen set of all signs uniquely identifying return hints annotating
+asynchronous generator factories whose child hints are lazily type-checkable by
+the :func:`._code_check_return_generator` function.
+'''
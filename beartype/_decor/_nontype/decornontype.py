@@ -17,10 +17,15 @@ from beartype.roar import (
     BeartypeDecorWrappeeException,
     BeartypeDecorWrapperException,
 )
+from beartype._cave._cavefast import FunctionType
+from beartype._check.code.codecursor import set_func_scope_cursor
+from beartype._check.code.coderegen import set_func_regenerator
 from beartype._check.cls.call.calldatadecorfunc import (
     cull_decor_func,
     make_decor_func,
 )
+from beartype._check.cls.call.calldatadecorfuncmin import (
+    BeartypeCallDecorFuncMinimalData)
 from beartype._conf.confmain import BeartypeConf
 from beartype._conf.confenum import BeartypeStrategy
 from beartype._decor._nontype._api.decorstandard import (
@@ -32,11 +37,25 @@ from beartype._decor._nontype._decornontypemap import (
     MODULE_TO_TYPE_NAME_TO_BEARTYPE_DECORATOR_get,
     MODULE_TO_SUPERTYPE_NAME_TO_BEARTYPE_DECORATOR_get,
 )
+from beartype._data.check.code.datacodelen import FUNC_TEMPLATE_CACHE_SIZE
+from beartype._data.check.code.datacodename import (
+    ARG_NAME_CALL_META,
+    ARG_NAME_CHECK_RETURN,
+    ARG_NAME_CHECK_SEND,
+    ARG_NAME_CHECK_YIELD,
+    ARG_NAME_FUNC,
+    ARG_NAME_TYPE_SPECIALIZER,
+    ARG_NAME_UNION_PROFILER,
+)
 from beartype._data.py.databuiltins import (
     BUILTINS_DICT,
     GLOBAL_SCOPE_BUILTINS_BASENAME,
 )
-from beartype._data.typing.datatyping import BeartypeableT
+from beartype._data.typing.datatyping import (
+    BeartypeableT,
+    LexicalScope,
+    TypeStack,
+)
 from beartype._decor._nontype._wrap.wrapmain import generate_code
 from beartype._util.bear.utilbearblack import is_object_blacklisted
 from beartype._util.bear.utilbearfunc import (
@@ -47,15 +66,30 @@ from beartype._util.api.standard.utilcontextlib import (
     get_func_contextlib_contextmanager_or_none)
 from beartype._util.api.standard.utilfunctools import (
     is_func_functools_lru_cache)
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.cache.utilcachelock import call_beartype_locked
+from beartype._util.error.utilerrwarn import get_warnings_issued_count
 from beartype._util.func.pep.utilfuncpep702 import (
     is_func_pep702_deprecated)
 from beartype._util.func.utilfuncmake import make_func
 from beartype._util.func.utilfuncscope import get_func_globals
-from beartype._util.func.utilfunctest import is_func_codeobjable
+from beartype._util.func.utilfunctest import (
+    is_func_async,
+    is_func_codeobjable,
+    is_func_sync_generator,
+)
 from beartype._util.func.utilfuncwrap import is_func_wrapper
-from beartype._util.module.utilmodget import get_object_module_name_or_none
+from beartype._util.hint.pep.proposal.pep749.pep649749annotate import (
+    get_hintable_pep649749_annotations,
+    set_pep649749_hintable_annotations,
+)
+from beartype._util.module.utilmodget import (
+    get_module_imported_or_none,
+    get_object_module_name_or_none,
+)
 from beartype._util.text.utiltextrepr import represent_object
 from collections.abc import Callable
+from functools import wraps
 from typing import (
     Optional,
     no_type_check,
@@ -469,6 +503,90 @@ def beartype_func(
         return func  # type: ignore[return-value]
     # Else, that callable is beartypeable. Let's do this, folks.
 
+    # If this configuration enables lazy decoration *AND* that callable is
+    # neither asynchronous nor a synchronous generator factory, defer the
+    # generation of the type-checking wrapper function for that callable until
+    # the first call to that callable by instead returning a trampoline
+    # generating that wrapper on that call.
+    #
+    # Note that asynchronous callables and synchronous generator factories are
+    # intentionally decorated eagerly. Trampolines are plain synchronous
+    # functions and would thus obscure the kind of these callables from
+    # introspection (e.g., inspect.iscoroutinefunction(),
+    # inspect.isgeneratorfunction()).
+    if conf.is_lazy and not (
+        is_func_async(func) or is_func_sync_generator(func)):
+        return _beartype_func_lazy(  # type: ignore[return-value]
+            func=func, conf=conf, func_wrapper=func_wrapper, **kwargs)
+    # Else, either this configuration disables lazy decoration *OR* that
+    # callable is either asynchronous or a synchronous generator factory. In
+    # either case, decorate that callable eagerly.
+
+    # Return a new callable wrapping that callable with type-checking.
+    return _beartype_func_checked(
+        func=func, conf=conf, func_wrapper=func_wrapper, **kwargs)
+
+# ....................{ PRIVATE ~ decorators : func        }....................
+def _beartype_func_checked(
+    func: BeartypeableT,
+    conf: BeartypeConf,
+    func_wrapper: Callable,
+    **kwargs
+) -> BeartypeableT:
+    '''
+    Eagerly decorate the passed beartypeable callable with dynamically
+    generated type-checking.
+
+    Parameters
+    ----------
+    func : BeartypeableT
+        Callable to be decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+    func_wrapper : Callable
+        Wrapper callable to be unwrapped. See the :func:`.beartype_func`
+        decorator for further details.
+
+    All remaining keyword parameters are passed as is to the
+    :meth:`beartype._check.cls.call.calldatadecorfunc.BeartypeCallDecorFuncData.reinit`
+    method.
+
+    Returns
+    -------
+    BeartypeableT
+        New pure-Python callable wrapping this callable with type-checking.
+    '''
+
+    # ....................{ TEMPLATE                       }....................
+    # Key uniquely identifying the wrapper template previously generated for
+    # callables sharing the same code object, type hints, and configuration as
+    # that callable if that callable is memoizable *OR* "None" otherwise.
+    func_template_key = _get_func_template_key_or_none(
+        func=func, conf=conf, func_wrapper=func_wrapper, **kwargs)
+
+    # If that callable is memoizable...
+    if func_template_key is not None:
+        # Attempt to rebind the wrapper template previously generated for a
+        # prior callable sharing the same key (e.g., a prior closure created by
+        # the same "def" statement) to that callable. Since rebinding a template
+        # avoids signature parsing, hint sanification, code generation, and
+        # compilation, doing so is substantially faster than decorating that
+        # callable from scratch.
+        try:
+            return _beartype_func_template(  # type: ignore[return-value]
+                func=func,
+                conf=conf,
+                func_template=_FUNC_TEMPLATE_KEY_TO_TEMPLATE[func_template_key],
+            )
+        # Else, *NO* such template has been generated yet. Generate one below.
+        except KeyError:
+            pass
+    # Else, that callable is unmemoizable.
+
+    # Total number of warnings issued *BEFORE* decorating that callable.
+    warnings_issued_count = get_warnings_issued_count()
+
     # ....................{ CODE                           }....................
     # Beartype call metadata describing that callable.
     decor_func = make_decor_func(
@@ -487,9 +605,22 @@ def beartype_func(
     # If that callable requires *NO* type-checking, silently reduce to a noop
     # and thus the identity decorator by returning that callable as is.
     if not func_wrapper_code:
+        # If that callable is memoizable, instruct subsequent decorations of
+        # callables sharing the same key to reduce to the same noop.
+        if func_template_key is not None:
+            _FUNC_TEMPLATE_KEY_TO_TEMPLATE[func_template_key] = None
+
+        # Return that callable as is.
         return func  # type: ignore[return-value]
     # Else, that callable requires type-checking. Let's *REALLY* do this, fam.
 
+    # True only if the type hint dictionary associated with the decorated
+    # callable is dirty. See the set_func_annotations_if_dirty() call below.
+    is_decoratee_annotations_dirty = (
+        func_template_key is not None and
+        tuple(decor_func.decoratee_annotations.items()) != func_template_key[2]
+    )
+
     # If the type hint dictionary associated with the decorated callable is
     # dirty (i.e., changed from the original "__annotations__" dunder dictionary
     # annotating that callable), register these changes in a manner compliant
@@ -500,7 +631,247 @@ def beartype_func(
     decor_func.set_func_annotations_if_dirty()
 
     # ....................{ SCOPE                          }....................
-    # Global scope of the type-checking wrapper function to be defined below,
+    # Global scope of the type-checking wrapper function defined below.
+    func_wrapper_globals = _get_func_wrapper_globals(
+        decor_func.func_wrappee_wrappee)
+
+    # ....................{ FUNC                           }....................
+    # Function wrapping that callable with type-checking to be returned.
+    #
+    # For efficiency, this wrapper accesses *ONLY* local rather than global
+    # attributes. The latter incur a minor performance penalty, since local
+    # attributes take precedence over global attributes, implying all global
+    # attributes are *ALWAYS* first looked up as local attributes before falling
+    # back to being looked up as global attributes.
+    func_checked = make_func(
+        func_name=decor_func.func_wrapper_name,
+        func_code=func_wrapper_code,
+        func_globals=func_wrapper_globals,
+
+        #FIXME: Ideally, we should also propagate the local scope of the
+        #unwrapped decorated callable onto the local scope of this wrapper. This
+        #is clearly complicated by the fact that we already use a fake local
+        #scope! Ergo, we'll need to composite these two scopes into a new
+        #unified scope -- with our fake local scope taking precedence. Since the
+        #latter *ONLY* defines "__beartype_"-prefixed variables, there should be
+        #*NO* conflict. Maybe? Let's give it a go, yo.
+        func_locals=decor_func.func_wrapper_locals,
+        func_wrapped=decor_func.func_wrapper,  # pyright: ignore
+        func_labeller=decor_func.label_func_wrapper,
+        func_code_cache_dir=conf.code_cache_dir,
+        is_debug=conf.is_debug,
+        exception_cls=BeartypeDecorWrapperException,
+    )
+
+    # Declare this wrapper to be generated by @beartype, which tests for the
+    # existence of this attribute above to avoid re-decorating callables
+    # already decorated by @beartype by efficiently reducing to a noop.
+    set_func_beartyped(func_checked)
+
+    # If this wrapper is passed one or more runtime profilers (e.g., profiling
+    # the child hints of unions), bind these profilers to a new regenerator of
+    # this wrapper *BEFORE* deinitializing this metadata.
+    set_func_regenerator(
+        func=func_checked,
+        func_name=decor_func.func_wrapper_name,
+        func_code=func_wrapper_code,
+        func_scope=decor_func.func_wrapper_locals,
+    )
+
+    # ....................{ TEMPLATE                       }....................
+    # If that callable is memoizable, the wrapper generated above is reusable
+    # by subsequent decorations of callables sharing the same key *ONLY* if
+    # that wrapper is passed *NO* hidden parameters specific to that callable
+    # other than those rebound by the _beartype_func_template() decorator:
+    # * Forward scopes resolving stringified forward references against the
+    #   local scope of that callable.
+    # * Runtime profilers and generator type-checkers, whose state is specific
+    #   to that wrapper.
+    #
+    # Likewise, that wrapper is reusable *ONLY* if decorating that callable
+    # issued *NO* warnings (e.g., deprecation warnings for deprecated hints),
+    # as rebinding a template would otherwise silently avoid reissuing those
+    # warnings for callables sharing the same key.
+    #
+    # In this case, cache a template of this wrapper *BEFORE* deinitializing
+    # this metadata.
+    if (
+        func_template_key is not None and
+        decor_func.decoratee_scope_forward is None and
+        get_warnings_issued_count() == warnings_issued_count and
+        not any(
+            arg_name in decor_func.func_wrapper_locals
+            for arg_name in _ARG_NAMES_UNTEMPLATABLE
+        )
+    ):
+        # Local scope of this wrapper, excluding both hidden parameters specific
+        # to that callable subsequently rebound by _beartype_func_template()
+        # *AND* this wrapper itself (previously defined into this scope by the
+        # make_func() factory).
+        func_wrapper_locals_template = decor_func.func_wrapper_locals.copy()
+        del func_wrapper_locals_template[ARG_NAME_CALL_META]
+        del func_wrapper_locals_template[ARG_NAME_FUNC]
+        del func_wrapper_locals_template[decor_func.func_wrapper_name]
+
+        # Cache a template of this wrapper. Since the type hint dictionary
+        # annotating that callable is mutable and thus modifiable by callers
+        # after this decoration, this template caches a shallow copy of that
+        # dictionary rather than that dictionary itself.
+        _FUNC_TEMPLATE_KEY_TO_TEMPLATE[func_template_key] = (
+            decor_func.func_wrapper_name,
+            func_wrapper_code,
+            func_wrapper_locals_template,
+            decor_func.decoratee_annotations.copy(),
+            is_decoratee_annotations_dirty,
+        )
+    # Else, that callable is unmemoizable.
+
+    # ....................{ RETURN                         }....................
+    # Deinitialize this beartype call metadata.
+    cull_decor_func(decor_func)
+
+    # Return this type-checking wrapper function.
+    return func_checked  # type: ignore[return-value]
+
+
+def _beartype_func_lazy(
+    func: BeartypeableT,
+    conf: BeartypeConf,
+    func_wrapper: Callable,
+    **kwargs
+) -> BeartypeableT:
+    '''
+    Lazily decorate the passed beartypeable synchronous non-generator callable
+    with dynamically generated type-checking under the
+    :attr:`beartype.BeartypeConf.is_lazy` option.
+
+    This decorator returns a **trampoline** (i.e., placeholder function
+    preserving the name, docstring, and signature of this callable) deferring
+    to the :func:`._beartype_func_checked` decorator on the first call to that
+    trampoline. That call then generates the real type-checking wrapper
+    function for this callable, replaces this trampoline with that wrapper on
+    the object owning this callable where feasible, and calls that wrapper.
+    Subsequent calls to this trampoline (e.g., via references to this
+    trampoline that could *not* be replaced) directly call that wrapper.
+
+    Parameters
+    ----------
+    func : BeartypeableT
+        Callable to be decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+    func_wrapper : Callable
+        Wrapper callable to be unwrapped. See the :func:`.beartype_func`
+        decorator for further details.
+
+    All remaining keyword parameters are passed as is to the
+    :meth:`beartype._check.cls.call.calldatadecorfunc.BeartypeCallDecorFuncData.reinit`
+    method on the first call to this trampoline.
+
+    Returns
+    -------
+    BeartypeableT
+        Trampoline lazily wrapping this callable with type-checking.
+    '''
+
+    # Type-checking wrapper function generated on the first call to the
+    # trampoline defined below if that trampoline has been called *OR* "None".
+    func_checked: Optional[Callable] = None
+
+    def check_func_lazy() -> None:
+        '''
+        Generate this wrapper if this trampoline has yet to do so.
+
+        This closure is only called while holding the coarse beartype lock.
+        Since another thread may have generated this wrapper between the
+        unlocked test performed by the trampoline below and this lock, this
+        closure retests whether this wrapper exists under this lock.
+        '''
+
+        # If this trampoline has yet to generate this wrapper, do so.
+        nonlocal func_checked
+        if func_checked is None:
+            # If this configuration requests that decoration raise fatal
+            # exceptions, generate this wrapper. Since this trampoline then
+            # retains no wrapper, each subsequent call to this trampoline
+            # reattempts (and thus re-raises) this decoration.
+            if conf.warning_cls_on_decorator_exception is None:
+                func_checked = _beartype_func_checked(
+                    func=func, conf=conf, func_wrapper=func_wrapper, **kwargs)
+            # Else, this configuration requests that decoration emit non-fatal
+            # warnings (e.g., as the "beartype.claw" import hooks do by
+            # default). In this case, mimic eager decoration under the
+            # _beartype_object_nonfatal() decorator by...
+            else:
+                # Attempt to generate this wrapper.
+                try:
+                    func_checked = _beartype_func_checked(
+                        func=func,
+                        conf=conf,
+                        func_wrapper=func_wrapper,
+                        **kwargs
+                    )
+                # If doing so raises an exception...
+                except Exception:
+                    # Avoid circular import dependencies.
+                    from beartype._decor.decorcore import (
+                        issue_warning_decorator_exception)
+
+                    # Coerce this exception into a warning.
+                    issue_warning_decorator_exception(obj=func, conf=conf)
+
+                    # Permanently defer to the undecorated callable, avoiding
+                    # reattempting this decoration on subsequent calls.
+                    func_checked = func
+
+            # Replace this trampoline with this wrapper on the object owning
+            # this callable where feasible.
+            _replace_func_lazy(
+                func_lazy=func_lazy,
+                func_checked=func_checked,
+                cls_stack=kwargs.get('cls_stack'),
+            )
+        # Else, this trampoline already generated this wrapper.
+
+    @wraps(func_wrapper)
+    def func_lazy(*args, **kwargs_call):
+
+        # If this trampoline has yet to generate this wrapper, thread-safely
+        # do so under the same coarse lock serializing all decorations.
+        if func_checked is None:
+            call_beartype_locked(check_func_lazy)
+        # Else, this trampoline already generated this wrapper.
+
+        # Defer to this wrapper.
+        return func_checked(*args, **kwargs_call)  # type: ignore[misc]
+
+    # Declare this trampoline to be generated by @beartype, preventing
+    # subsequent decorations from erroneously re-decorating this trampoline.
+    set_func_beartyped(func_lazy)
+
+    # Return this trampoline.
+    return func_lazy  # type: ignore[return-value]
+
+def _get_func_wrapper_globals(func: Callable) -> LexicalScope:
+    '''
+    Global scope of the type-checking wrapper function to be generated for the
+    passed unwrapped callable currently being decorated by
+    :func:`beartype.beartype`.
+
+    Parameters
+    ----------
+    func : Callable
+        Unwrapped callable currently being decorated.
+
+    Returns
+    -------
+    LexicalScope
+        Global scope of the type-checking wrapper function wrapping this
+        callable.
+    '''
+
+    # Global scope of the type-checking wrapper function to be returned,
     # initialized to the global scope of the currently decorated unwrapped
     # callable. This global scope is subsequently defined as the semantic union
     # of (in order):
@@ -517,7 +888,7 @@ def beartype_func(
     #
     #   In practice, this dictionary *ABSOLUTELY* needs to be explicitly
     #   specified. Failing to do so causes the type-checking wrapper function
-    #   dynamically generated by the make_func() factory function called below
+    #   dynamically generated by the make_func() factory function
     #   to lack implicit access to builtins and thus raise an unreadable
     #   exception on the first call to that wrapper function resembling:
     #       NameError: name 'len' is not defined
@@ -536,7 +907,7 @@ def beartype_func(
     #     type parameter scopes of parent callables of the currently decorated
     #     closure. See also unit tests in the
     #     test-specific "data_pep484ref_decor_pep695" data submodule.
-    func_wrapper_globals = get_func_globals(decor_func.func_wrappee_wrappee)
+    func_wrapper_globals = get_func_globals(func)
 
     # If the global scope of the currently decorated unwrapped callable either
     # fails to define the builtins scope under the standard dunder name expected
@@ -589,44 +960,270 @@ def beartype_func(
     # case, we charitably assume that callable knew what it was doing by
     # silently preserving this global scope unmodified.
 
-    # ....................{ FUNC                           }....................
-    # Function wrapping that callable with type-checking to be returned.
-    #
-    # For efficiency, this wrapper accesses *ONLY* local rather than global
-    # attributes. The latter incur a minor performance penalty, since local
-    # attributes take precedence over global attributes, implying all global
-    # attributes are *ALWAYS* first looked up as local attributes before falling
-    # back to being looked up as global attributes.
+    # Return this global scope.
+    return func_wrapper_globals
+
+def _beartype_func_template(
+    func: Callable,
+    conf: BeartypeConf,
+    func_template: Optional[tuple],
+) -> Callable:
+    '''
+    Decorate the passed beartypeable callable with type-checking by rebinding
+    the passed **wrapper template** (i.e., tuple describing a type-checking
+    wrapper function previously generated by the :func:`._beartype_func_checked`
+    decorator for a prior callable sharing the same code object, type hints, and
+    configuration as this callable) to this callable.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+    func_template : Optional[tuple]
+        Either:
+
+        * If that prior callable required type-checking, the 5-tuple
+          ``(func_wrapper_name, func_wrapper_code, func_wrapper_locals,
+          decoratee_annotations, is_decoratee_annotations_dirty)`` cached by
+          the :func:`._beartype_func_checked` decorator.
+        * Else, :data:`None`.
+
+    Returns
+    -------
+    Callable
+        Either:
+
+        * If this template is :data:`None`, this callable as is.
+        * Else, a new pure-Python callable wrapping this callable with
+          type-checking.
+    '''
+
+    # If that prior callable required *NO* type-checking, neither does this
+    # callable. In this case, reduce to the identity decorator.
+    if func_template is None:
+        return func
+    # Else, that prior callable required type-checking.
+
+    # Unpack this template.
+    (
+        func_wrapper_name,
+        func_wrapper_code,
+        func_wrapper_locals_template,
+        decoratee_annotations,
+        is_decoratee_annotations_dirty,
+    ) = func_template
+
+    # Type hint dictionary specific to this callable, shallowly copied from the
+    # dictionary cached by this template. Sharing the latter across all
+    # callables rebinding this template would erroneously propagate mutations
+    # of the type hint dictionary annotating any such callable to all others.
+    decoratee_annotations = decoratee_annotations.copy()
+
+    # If the prior decoration modified the type hint dictionary annotating that
+    # prior callable, propagate the same modifications onto this callable.
+    if is_decoratee_annotations_dirty:
+        set_pep649749_hintable_annotations(
+            hintable=func, annotations=decoratee_annotations)
+    # Else, that prior decoration preserved that dictionary as is.
+
+    # Local scope of the type-checking wrapper function defined below, rebinding
+    # the hidden parameters specific to that prior callable to this callable.
+    func_wrapper_locals = func_wrapper_locals_template.copy()
+    func_wrapper_locals[ARG_NAME_CALL_META] = BeartypeCallDecorFuncMinimalData(
+        conf=conf,
+        cls_stack=None,
+        decoratee=func,
+        decoratee_annotations=decoratee_annotations,
+        decoratee_scope_forward=None,
+    )
+    func_wrapper_locals[ARG_NAME_FUNC] = func
+
+    # If that wrapper was passed a cursor (e.g., under the amortized
+    # full-coverage "BeartypeStrategy.Ok" strategy), replace the cursor shared
+    # with that prior wrapper by a new cursor specific to this wrapper.
+    set_func_scope_cursor(func_wrapper_locals)
+
+    # Function wrapping this callable with type-checking. Since the code of
+    # this function is identical to that of the wrapper previously generated
+    # for that prior callable, the make_func() factory reuses the code object
+    # compiled for that wrapper.
     func_checked = make_func(
-        func_name=decor_func.func_wrapper_name,
+        func_name=func_wrapper_name,
         func_code=func_wrapper_code,
-        func_globals=func_wrapper_globals,
-
-        #FIXME: Ideally, we should also propagate the local scope of the
-        #unwrapped decorated callable onto the local scope of this wrapper. This
-        #is clearly complicated by the fact that we already use a fake local
-        #scope! Ergo, we'll need to composite these two scopes into a new
-        #unified scope -- with our fake local scope taking precedence. Since the
-        #latter *ONLY* defines "__beartype_"-prefixed variables, there should be
-        #*NO* conflict. Maybe? Let's give it a go, yo.
-        func_locals=decor_func.func_wrapper_locals,
-        func_wrapped=decor_func.func_wrapper,  # pyright: ignore
-        func_labeller=decor_func.label_func_wrapper,
+        func_globals=_get_func_wrapper_globals(func),
+        func_locals=func_wrapper_locals,
+        func_wrapped=func,
+        func_label=f'@beartyped {func_wrapper_name}() wrapper',
+        func_code_cache_dir=conf.code_cache_dir,
         is_debug=conf.is_debug,
         exception_cls=BeartypeDecorWrapperException,
     )
 
-    # Declare this wrapper to be generated by @beartype, which tests for the
-    # existence of this attribute above to avoid re-decorating callables
-    # already decorated by @beartype by efficiently reducing to a noop.
+    # Declare this wrapper to be generated by @beartype.
     set_func_beartyped(func_checked)
 
-    # ....................{ RETURN                         }....................
-    # Deinitialize this beartype call metadata.
-    cull_decor_func(decor_func)
+    # Return this wrapper.
+    return func_checked
 
-    # Return this type-checking wrapper function.
-    return func_checked  # type: ignore[return-value]
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_func_template_key_or_none(
+    func: Callable,
+    conf: BeartypeConf,
+    func_wrapper: Callable,
+    cls_stack: TypeStack = None,
+) -> Optional[tuple]:
+    '''
+    **Wrapper template key** (i.e., hashable tuple uniquely identifying the
+    type-checking wrapper function to be generated for the passed callable
+    across all callables sharing the same code object, type hints, and
+    configuration) if this callable is **memoizable** *or* :data:`None`
+    otherwise.
+
+    This key enables the :func:`._beartype_func_checked` decorator to avoid
+    repeatedly regenerating the same wrapper for distinct callables created by
+    the same ``def`` statement (e.g., closures decorated in loops or factories).
+    This callable is memoizable only if:
+
+    * This callable is a pure-Python function that neither wraps another
+      callable nor is decorated on behalf of another object.
+    * This callable is *not* a method of a class decorated by
+      :func:`beartype.beartype`, as the wrapper generated for that method
+      depends on that class. Caching that wrapper would also prevent that class
+      from being garbage-collected.
+    * All type hints annotating this callable are hashable *and* none are
+      stringified, as the referents of stringified hints depend on the scopes
+      of this callable.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable currently being decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+    func_wrapper : Callable
+        Wrapper callable to be unwrapped. See the :func:`.beartype_func`
+        decorator for further details.
+    cls_stack : TypeStack
+        **Type stack** (i.e., either tuple of zero or more arbitrary types
+        *or* :data:`None`). Defaults to :data:`None`.
+
+    Returns
+    -------
+    Optional[tuple]
+        Either:
+
+        * If this callable is memoizable, the 3-tuple ``(func_codeobj, conf,
+          func_hints)``, where ``func_hints`` is the tuple of all
+          ``(pith_name, hint)`` pairs annotating this callable.
+        * Else, :data:`None`.
+    '''
+
+    # If this callable is unmemoizable for any of the above reasons, return
+    # "None".
+    if (
+        func_wrapper is not func or
+        cls_stack or
+        not isinstance(func, FunctionType) or
+        is_func_wrapper(func)
+    ):
+        return None
+    # Else, this callable is a pure-Python function that is possibly
+    # memoizable.
+
+    # Tuple of all "(pith_name, hint)" pairs annotating this callable.
+    func_hints = tuple(get_hintable_pep649749_annotations(
+        hintable=func, exception_cls=BeartypeDecorWrappeeException).items())
+
+    # If any of these hints are stringified, return "None".
+    for _, hint in func_hints:
+        if isinstance(hint, str):
+            return None
+    # Else, *NO* hints are stringified.
+
+    # Key to be returned.
+    func_template_key = (func.__code__, conf, func_hints)
+
+    # If this key is unhashable (e.g., due to one or more unhashable hints),
+    # return "None".
+    try:
+        hash(func_template_key)
+    except TypeError:
+        return None
+    # Else, this key is hashable.
+
+    # Return this key.
+    return func_template_key
+
+# ....................{ PRIVATE ~ replacers                }....................
+def _replace_func_lazy(
+    func_lazy: Callable,
+    func_checked: Callable,
+    cls_stack: TypeStack,
+) -> None:
+    '''
+    Replace the passed trampoline previously returned by the
+    :func:`._beartype_func_lazy` decorator with the passed type-checking
+    wrapper function on the object owning that trampoline if feasible *or*
+    silently reduce to a noop otherwise.
+
+    The **owner** of this trampoline is either:
+
+    * If this trampoline decorates a method of a class decorated by
+      :func:`beartype.beartype`, that class.
+    * If this trampoline decorates a module-scoped callable, that module.
+
+    This replacer only replaces this trampoline if that owner still directly
+    binds this trampoline under the name of this trampoline. Trampolines
+    wrapped by descriptors (e.g., :class:`property`, :class:`staticmethod`),
+    nested in closures, or subsequently rebound are silently preserved as is.
+
+    Parameters
+    ----------
+    func_lazy : Callable
+        Trampoline to be replaced.
+    func_checked : Callable
+        Type-checking wrapper function to replace this trampoline with.
+    cls_stack : TypeStack
+        Either:
+
+        * If this trampoline decorates a method of a class, the **type stack**
+          (i.e., tuple of the one or more types lexically containing that
+          method).
+        * Else, :data:`None`.
+    '''
+
+    # Unqualified and fully-qualified names of this trampoline.
+    func_name = func_lazy.__name__
+    func_name_qualified = func_lazy.__qualname__
+
+    # Object owning this trampoline if any *OR* "None" otherwise.
+    func_owner: object = None
+
+    # If this trampoline decorates a method, this owner is the class directly
+    # declaring that method.
+    if cls_stack:
+        func_owner = cls_stack[-1]
+    # Else if this trampoline decorates a module-scoped callable (i.e., whose
+    # fully-qualified name is its unqualified name), this owner is the module
+    # declaring that callable if that module is still imported.
+    elif func_name_qualified == func_name:
+        func_owner = get_module_imported_or_none(
+            get_object_module_name_or_none(func_lazy))  # type: ignore[arg-type]
+    # Else, this trampoline decorates a nested callable owned by *NO* object.
+
+    # If this owner still directly binds this trampoline under this name,
+    # replace this trampoline with this wrapper on this owner.
+    if (
+        func_owner is not None and
+        getattr(func_owner, '__dict__', {}).get(func_name) is func_lazy
+    ):
+        setattr(func_owner, func_name, func_checked)
+    # Else, this owner does *NOT* directly bind this trampoline. Preserve this
+    # owner as is.
 
 # ....................{ PRIVATE ~ decorators : pure-python }....................
 def _beartype_pseudofunc(pseudofunc: BeartypeableT, **kwargs) -> BeartypeableT:
@@ -752,3 +1349,29 @@ def _beartype_pseudofunc(pseudofunc: BeartypeableT, **kwargs) -> BeartypeableT:
     pseudofunc_call_type_method_checked = beartype_func(
         func=pseudofunc_call_boundmethod, **kwargs)
     return pseudofunc_call_type_method_checked
+
+# ....................{ PRIVATE ~ globals                  }....................
+_ARG_NAMES_UNTEMPLATABLE = (
+    ARG_NAME_CHECK_RETURN,
+    ARG_NAME_CHECK_SEND,
+    ARG_NAME_CHECK_YIELD,
+    ARG_NAME_TYPE_SPECIALIZER,
+    ARG_NAME_UNION_PROFILER,
+)
+'''
+Tuple of the names of all hidden parameters whose values are specific to the
+type-checking wrapper function passed those parameters, preventing that
+wrapper from being cached as a template by the :func:`._beartype_func_checked`
+decorator.
+'''
+
+
+_FUNC_TEMPLATE_KEY_TO_TEMPLATE = CacheLruStrong(FUNC_TEMPLATE_CACHE_SIZE)
+'''
+**Wrapper template cache** (i.e., thread-safe Least Recently Used (LRU) cache
+mapping from the key returned by the :func:`._get_func_template_key_or_none`
+getter for each memoizable callable previously decorated by the
+:func:`._beartype_func_checked` decorator to the template rebound by the
+:func:`._beartype_func_template` decorator to subsequently decorated callables
+sharing that key).
+'''
@@ -25,6 +25,7 @@ from beartype._data.typing.datatyping import (
 )
 from beartype._decor._nontype.decornontype import beartype_nontype
 from beartype._decor._type.decortype import beartype_type
+from beartype._util.cache.utilcachelock import call_beartype_locked
 from beartype._util.cls.utilclstest import is_type_subclass
 from beartype._util.error.utilerrwarn import issue_warning
 from beartype._util.text.utiltextmunge import (
@@ -92,19 +93,110 @@ def beartype_object(
     '''
     # print(f'Decorating object {repr(obj)}...')
 
-    # Return either...
-    return (
-        _beartype_object_fatal(obj, conf=conf, **kwargs)
+    # Thread-safely decorate this beartypeable under the single coarse beartype
+    # lock and return the resulting decoration by deferring to either...
+    #
+    # Note that this lock is intentionally entered exactly once for the entire
+    # decoration here rather than piecemeal throughout the @beartype toolchain.
+    # Lower-level callables transitively called below (e.g., the memoized type
+    # attribute getters and setters called on decorating classes) detect that
+    # the active thread already holds this lock and avoid re-entering it.
+    return call_beartype_locked(
         # If this beartype configuration requests that this decorator raise
-        # fatal exceptions at decoration time, defer to the lower-level
-        # decorator doing so;
+        # fatal exceptions at decoration time, the lower-level decorator doing
+        # so;
+        _beartype_object_fatal
         if conf.warning_cls_on_decorator_exception is None else
         # Else, this beartype configuration requests that this decorator emit
-        # fatal warnings at decoration time. In this case, defer to the
-        # lower-level decorator doing so.
-        _beartype_object_nonfatal(obj, conf=conf, **kwargs)
+        # fatal warnings at decoration time. In this case, the lower-level
+        # decorator doing so.
+        _beartype_object_nonfatal,
+        obj,
+        conf=conf,
+        **kwargs
+    )
+
+# ....................{ WARNERS                            }....................
+def issue_warning_decorator_exception(obj: object, conf: BeartypeConf) -> None:
+    '''
+    Coerce the exception currently being handled, raised by the
+    :func:`beartype.beartype` decorator on failing to decorate the passed
+    **beartypeable** (i.e., pure-Python callable or class), into a non-fatal
+    warning of the category configured by the
+    :attr:`beartype.BeartypeConf.warning_cls_on_decorator_exception` option.
+
+    Callers should call this function *only* from within an ``except:`` block,
+    as this function embeds the traceback of the exception currently being
+    handled into this warning.
+
+    Parameters
+    ----------
+    obj : object
+        **Beartypeable** that :func:`beartype.beartype` failed to decorate.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., dataclass encapsulating all flags,
+        options, settings, and other metadata configuring the current decoration
+        of the decorated callable or class).
+
+    Warns
+    -----
+    warning_category
+        Unconditionally.
+    '''
+
+    # Category of warning to be emitted.
+    warning_cls: TypeWarning = conf.warning_cls_on_decorator_exception  # type: ignore[assignment]
+    assert is_type_subclass(warning_cls, Warning), (
+        f'{repr(warning_cls)} not warning category.')
+
+    # Original lower-level error message to be embedded in the higher-level
+    # warning message to be emitted below.
+    error_message = format_exc()
+
+    #FIXME: Once, we thought this truncation was useful. Having actually
+    #*USED* @beartype in the real world, however, we now regard this
+    #truncation is the ultimate horror that prevents debugging. Lessons!
+    # # Original lower-level error message to be embedded in the higher-level
+    # # warning message to be emitted below, defined as either...
+    # error_message = (
+    #     # If this exception is beartype-specific, this exception's message
+    #     # is probably human-readable as is. In this case, maximize brevity
+    #     # and readability by coercing *ONLY* this message (rather than both
+    #     # this message *AND* traceback) truncated to a reasonable maximum
+    #     # length into a warning message.
+    #     # truncate_str(text=label_exception_message(exception), max_len=1024)
+    #     label_exception_message(exception)
+    #     if isinstance(exception, BeartypeException) else
+    #     # Else, this exception is *NOT* beartype-specific. In this case,
+    #     # this exception's message is probably *NOT* human-readable as is.
+    #     # Prepend that non-human-readable message by this exception's
+    #     # traceback for disambiguity and debuggability. Note that the
+    #     # format_exc() function appends this exception's message to this
+    #     # traceback and thus suffices as is.
+    #     format_exc()
+    # )
+
+    # Human-readable substring prefixing the warning message to be emitted.
+    # This substring contextually describes this beartypeable, capitalized
+    # such that the first character is uppercase.
+    warning_message_prefix = uppercase_str_char_first(
+        f'{prefix_object(obj=obj, is_color=conf.is_color, is_context=True)}'
+        f'not decoratable by @beartype, as:'
     )
 
+    # Lower-level exception message, indented by globally replacing *EVERY*
+    # newline in this message with a newline followed by four spaces. Doing
+    # so visually offsets this lower-level exception message from the
+    # higher-level warning message embedding this exception message below.
+    error_message = f'\n{error_message}'.replace('\n', '\n    ')
+
+    # Higher-level warning message to be emitted, embedding this lower-level
+    # exception message as an indented substring.
+    warning_message = f'{warning_message_prefix}{error_message}'
+
+    # Emit this message under this category.
+    issue_warning(warning_cls=warning_cls, message=warning_message)
+
 # ....................{ PRIVATE ~ decorators               }....................
 def _beartype_object_fatal(obj: BeartypeableT, **kwargs) -> BeartypeableT:
     '''
@@ -226,58 +318,8 @@ def _beartype_object_nonfatal(
     # If doing so unexpectedly raises an exception, coerce that fatal exception
     # into a non-fatal warning for nebulous safety.
     except Exception:
-        # Category of warning to be emitted.
-        warning_cls: TypeWarning = conf.warning_cls_on_decorator_exception  # type: ignore[assignment]
-        assert is_type_subclass(warning_cls, Warning), (
-            f'{repr(warning_cls)} not warning category.')
-
-        # Original lower-level error message to be embedded in the higher-level
-        # warning message to be emitted below.
-        error_message = format_exc()
-
-        #FIXME: Once, we thought this truncation was useful. Having actually
-        #*USED* @beartype in the real world, however, we now regard this
-        #truncation is the ultimate horror that prevents debugging. Lessons!
-        # # Original lower-level error message to be embedded in the higher-level
-        # # warning message to be emitted below, defined as either...
-        # error_message = (
-        #     # If this exception is beartype-specific, this exception's message
-        #     # is probably human-readable as is. In this case, maximize brevity
-        #     # and readability by coercing *ONLY* this message (rather than both
-        #     # this message *AND* traceback) truncated to a reasonable maximum
-        #     # length into a warning message.
-        #     # truncate_str(text=label_exception_message(exception), max_len=1024)
-        #     label_exception_message(exception)
-        #     if isinstance(exception, BeartypeException) else
-        #     # Else, this exception is *NOT* beartype-specific. In this case,
-        #     # this exception's message is probably *NOT* human-readable as is.
-        #     # Prepend that non-human-readable message by this exception's
-        #     # traceback for disambiguity and debuggability. Note that the
-        #     # format_exc() function appends this exception's message to this
-        #     # traceback and thus suffices as is.
-        #     format_exc()
-        # )
-
-        # Human-readable substring prefixing the warning message to be emitted.
-        # This substring contextually describes this beartypeable, capitalized
-        # such that the first character is uppercase.
-        warning_message_prefix = uppercase_str_char_first(
-            f'{prefix_object(obj=obj, is_color=conf.is_color, is_context=True)}'
-            f'not decoratable by @beartype, as:'
-        )
-
-        # Lower-level exception message, indented by globally replacing *EVERY*
-        # newline in this message with a newline followed by four spaces. Doing
-        # so visually offsets this lower-level exception message from the
-        # higher-level warning message embedding this exception message below.
-        error_message = f'\n{error_message}'.replace('\n', '\n    ')
-
-        # Higher-level warning message to be emitted, embedding this lower-level
-        # exception message as an indented substring.
-        warning_message = f'{warning_message_prefix}{error_message}'
-
-        # Emit this message under this category.
-        issue_warning(warning_cls=warning_cls, message=warning_message)
+        # Coerce this exception into a warning.
+        issue_warning_decorator_exception(obj=obj, conf=conf)
 
     # Return this object unmodified, as @beartype failed to successfully wrap
     # this object with a type-checking class or callable. So it goes, fam.
@@ -56,8 +56,18 @@ class CacheUnboundedStrong(object):
                                # <-- after entering this branch, bad stuff!
            cache[key] = value  # <-- We may overwrite another thread's work.
 
+    Reads are lock-free. Each method first looks up the passed key *without*
+    locking, only acquiring the lock on a cache miss and then rechecking that
+    key under that lock (i.e., double-checked locking). Since cache hits vastly
+    outnumber cache misses, concurrent readers thus scale across threads under
+    free-threaded CPython rather than serializing on this lock.
+
     Attributes
     ----------
+    _hits : int
+        Number of lookups finding the passed key in this cache. Since hits are
+        recorded *without* locking, this number is only approximate under
+        concurrent access.
     _key_to_value : dict[Hashable, object]
         Internal **backing store** (i.e., thread-unsafe dictionary of unlimited
         size mapping from strongly referenced arbitrary keys onto strongly
@@ -67,6 +77,8 @@ class CacheUnboundedStrong(object):
     _key_to_value_set : Callable
         The :meth:`self._key_to_value.__setitem__` dunder method, classified
         for efficiency.
+    _misses : int
+        Number of lookups failing to find the passed key in this cache.
     _lock : AbstractContextManager
         **Instance-specific thread lock** (i.e., low-level thread locking
         mechanism implemented as a highly efficient C extension, defined as an
@@ -84,10 +96,12 @@ class CacheUnboundedStrong(object):
     # @beartype decorations. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
+        '_hits',
         '_key_to_value',
         '_key_to_value_get',
         '_key_to_value_set',
         '_lock',
+        '_misses',
     )
 
     # ..................{ INITIALIZER                        }..................
@@ -109,10 +123,20 @@ class CacheUnboundedStrong(object):
         '''
 
         # Initialize all instance variables.
+        self._hits = 0
         self._key_to_value: dict[Hashable, object] = {}
         self._key_to_value_get = self._key_to_value.get
         self._key_to_value_set = self._key_to_value.__setitem__
         self._lock: AbstractContextManager = lock_type()  # type: ignore[assignment]
+        self._misses = 0
+
+    # ..................{ DUNDERS                            }..................
+    def __len__(self) -> int:
+        '''
+        Number of key-value pairs cached by this cache.
+        '''
+
+        return len(self._key_to_value)
 
     # ..................{ GETTERS                            }..................
     def cache_or_get_cached_value(
@@ -158,16 +182,38 @@ class CacheUnboundedStrong(object):
         # cache_or_get_cached_func_return_passed_arg() method.
         #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+        # Value previously cached under this key if any *OR* the sentinel
+        # placeholder otherwise.
+        #
+        # Note that this lookup is intentionally performed *WITHOUT* locking.
+        # Since keys are only ever added to (rather than removed from) this
+        # cache outside of the clear() method, a hit here is guaranteed to be
+        # valid. Dictionary lookups are atomic under both GIL-enabled and
+        # free-threaded CPython, enabling cache hits to scale across threads
+        # rather than serializing on this lock.
+        value_old = self._key_to_value_get(key, _SENTINEL)
+
+        # If this key has already been cached, record this hit and return this
+        # value as is.
+        if value_old is not _SENTINEL:
+            self._hits += 1
+            return value_old
+        # Else, this key has yet to be cached.
+
         # Thread-safely...
         with self._lock:
-            # Value previously cached under this key if any *OR* the sentinel
+            # Value previously cached under this key by another thread between
+            # the above lookup and this lock if any *OR* the sentinel
             # placeholder otherwise.
             value_old = self._key_to_value_get(key, _SENTINEL)
 
-            # If this key has already been cached, return this value as is.
+            # If this key has already been cached, record this hit and return
+            # this value as is.
             if value_old is not _SENTINEL:
+                self._hits += 1
                 return value_old
-            # Else, this key has yet to be cached.
+            # Else, this key has yet to be cached. Record this miss.
+            self._misses += 1
 
             # Cache this key with this value.
             self._key_to_value_set(key, value)
@@ -235,16 +281,32 @@ class CacheUnboundedStrong(object):
 
         # Attempt to...
         try:
+            # Value previously cached under this key if any *OR* the sentinel
+            # placeholder otherwise, intentionally looked up *WITHOUT* locking.
+            # See the cache_or_get_cached_value() method for further details.
+            value_old = self._key_to_value_get(key, _SENTINEL)
+
+            # If this key has already been cached, record this hit and return
+            # this value as is.
+            if value_old is not _SENTINEL:
+                self._hits += 1
+                return value_old
+            # Else, this key has yet to be cached.
+
             # Thread-safely...
             with self._lock:
-                # Value previously cached under this key if any *OR* the
+                # Value previously cached under this key by another thread
+                # between the above lookup and this lock if any *OR* the
                 # sentinel placeholder otherwise.
                 value_old = self._key_to_value_get(key, _SENTINEL)
 
-                # If this key has already been cached, return this value as is.
+                # If this key has already been cached, record this hit and
+                # return this value as is.
                 if value_old is not _SENTINEL:
+                    self._hits += 1
                     return value_old
-                # Else, this key has yet to be cached.
+                # Else, this key has yet to be cached. Record this miss.
+                self._misses += 1
 
                 # New value created by this factory function, localized for
                 # negligible efficiency to avoid the unnecessary subsequent
@@ -274,3 +336,34 @@ class CacheUnboundedStrong(object):
         with self._lock:
             # Clear your head and be at peace, one-liner.
             self._key_to_value.clear()
+
+    # ..................{ COPIERS                            }..................
+    def copy(self) -> dict[Hashable, object]:
+        '''
+        Shallow copy of the backing store of this cache (i.e., new dictionary
+        mapping from each key to the value cached by this cache at the time of
+        this call).
+        '''
+
+        # Thread-safely...
+        with self._lock:
+            # Return a shallow copy of this backing store.
+            return self._key_to_value.copy()
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def hits(self) -> int:
+        '''
+        Number of lookups finding the passed key in this cache.
+        '''
+
+        return self._hits
+
+
+    @property
+    def misses(self) -> int:
+        '''
+        Number of lookups failing to find the passed key in this cache.
+        '''
+
+        return self._misses
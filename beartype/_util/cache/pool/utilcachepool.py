@@ -16,17 +16,12 @@ This private submodule is *not* intended for importation by downstream callers.
 #methods defined below when the "BeartypeConfig.is_debug" parameter is "True"
 #for the current call to the @beartype decorator, please.
 
-#FIXME: Optimize the KeyPool.{acquire,release}() methods defined below. Rather
-#than unconditionally wrapping the bodies of each in a thread-safe
-#"self._thread_lock" context manager, we might be able to leverage the GIL by
-#only doing so "if threading.active_count():". Profile us up, please.
-
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilCachedKeyPoolException
 from beartype._data.typing.datatyping import TypeOrCallable
 from collections import defaultdict
 from collections.abc import Hashable
-from threading import Lock
+from threading import local
 
 # ....................{ CLASSES                            }....................
 class KeyPool(object):
@@ -38,37 +33,31 @@ class KeyPool(object):
     Key pools are thread-safe by design and thus safely usable as module-scoped
     globals accessed from module-scoped callables.
 
+    Design
+    ------
+    Key pools are **per-thread scratch pools.** Each thread transparently
+    acquires and releases pool items from and to its own private pools, which
+    no other thread ever accesses. Key pools thus require *no* thread locking
+    and scale linearly across threads -- including under free-threaded CPython
+    (i.e., :pep:`703`-compliant builds disabling the Global Interpreter Lock
+    (GIL)), where a single coarse lock shared between all threads would
+    otherwise serialize all concurrent :func:`beartype.beartype` decorations.
+
+    Since pool items are only ever scratch space acquired and released within
+    the same call by the same thread, partitioning pools across threads is
+    safe. The only cost is space: each thread lazily allocates its own pool
+    items on first acquisition.
+
     Attributes
     ----------
-    _key_to_pool : defaultdict
-        Dictionary mapping from an **arbitrary key** (i.e., hashable object) to
-        corresponding **pool** (i.e., list of zero or more arbitrary objects
-        referred to as "pool items" cached under that key). For both efficiency
-        and simplicity, this dictionary is defined as a :class:`defaultdict`
-        implicitly initializing missing keys on initial access to the empty
-        list.
-    _pool_item_id_to_is_acquired : dict
-        Dictionary mapping from the unique object identifier of a **pool item**
-        (i.e., arbitrary object cached under a pool of the :attr:`_key_to_pool`
-        dictionary) to a boolean that is either:
-
-        * :data:`True` if that item is currently **acquired** (i.e., most
-          recently returned by a call to the :meth:`acquire` method).
-        * :data:`False` if that item is currently **released** (i.e., most
-          recently passed to a call to the :meth:`release` method).
     _pool_item_maker : Callable
         Caller-defined factory callable internally called by the
         :meth:`acquire` method on attempting to acquire a non-existent object
         from an **empty pool. See :meth:`__init__` for further details.
-    _thread_lock : Lock
-        **Non-reentrant instance-specific thread lock** (i.e., low-level thread
-        locking mechanism implemented as a highly efficient C extension,
-        defined as an instance variable for non-reentrant reuse by the public
-        API of this class). Although CPython, the canonical Python interpreter,
-        *does* prohibit conventional multithreading via its Global Interpreter
-        Lock (GIL), CPython still coercively preempts long-running threads at
-        arbitrary execution points. Ergo, multithreading concerns are *not*
-        safely ignorable -- even under CPython.
+    _thread_local : _KeyPoolThreadLocal
+        **Thread-local pool state** (i.e., object whose attributes are
+        transparently specific to the active thread). See the
+        :class:`._KeyPoolThreadLocal` type for further details.
     '''
 
     # ..................{ CLASS VARIABLES                    }..................
@@ -77,10 +66,8 @@ class KeyPool(object):
     # @beartype decorations. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
-        '_key_to_pool',
-        '_pool_item_id_to_is_acquired',
         '_pool_item_maker',
-        '_thread_lock',
+        '_thread_local',
     )
 
     # ..................{ INITIALIZER                        }..................
@@ -95,7 +82,8 @@ class KeyPool(object):
             :meth:`acquire` method on attempting to acquire a non-existent
             object from an **empty pool** (i.e., either a missing key *or* an
             empty list of an existing key of the underlying
-            :attr:`_key_to_pool` dictionary). That method initializes the empty
+            :attr:`_KeyPoolThreadLocal.key_to_pool` dictionary of the active
+            thread). That method initializes the empty
             pool in question by calling this factory with the key associated
             with that pool and appending the object created and returned by
             this factory to that pool. This factory is thus expected to have a
@@ -112,18 +100,7 @@ class KeyPool(object):
         self._pool_item_maker = item_maker
 
         # Initialize all remaining instance variables.
-        #
-        # Note that "defaultdict" instances *MUST* be initialized with
-        # positional rather than keyword parameters. For unknown reasons,
-        # initializing such an instance with a keyword parameter causes that
-        # instance to silently behave like a standard dictionary instead: e.g.,
-        #
-        #     >>> dd = defaultdict(default_factory=list)
-        #     >>> dd['ee']
-        #     KeyError: 'ee'
-        self._key_to_pool: dict[Hashable, list] = defaultdict(list)
-        self._pool_item_id_to_is_acquired: dict[int, bool] = {}
-        self._thread_lock = Lock()
+        self._thread_local = _KeyPoolThreadLocal()
 
     # ..................{ METHODS                            }..................
     def acquire(
@@ -172,61 +149,63 @@ class KeyPool(object):
             If this key is unhashable and thus *not* a key.
         '''
 
-        # In a thread-safe manner...
-        with self._thread_lock:
-            #FIXME: This logic can *PROBABLY* be optimized into:
-            #    if not is_debug:
-            #        try:
-            #            return self._key_to_pool[key].pop()
-            #        except IndexError:
-            #            return self._pool_item_maker(key)
-            #    else:
-            #        try:
-            #            pool_item = self._key_to_pool[key].pop()
-            #        except IndexError:
-            #            pool_item = self._pool_item_maker(key)
-            #
-            #        # Record this item to have now been acquired.
-            #        self._pool_item_id_to_is_acquired[id(pool_item)] = True
-            #
-            #        return pool_item
-            #
-            #That said, this introduces additional complexity that will require
-            #unit testing. So, only do so if the above is actually profiled as
-            #being faster. It almost certainly is, but let's be certain please.
-
-            # List associated with this key.
-            #
-            # If this is the first access of this key, this "defaultdict"
-            # implicitly creates a new list and associates this key with that
-            # list; else, this is the list previously associated with this key.
-            #
-            # Note that this statement implicitly raises a "TypeError"
-            # exception if this key is unhashable, which is certainly more
-            # efficient than our explicitly validating this constraint.
-            pool = self._key_to_pool[key]
-
-            # Pool item associated with this key, defined as either...
-            pool_item = (
-                # The last item popped (i.e., removed) from this list...
-                pool.pop()
-                # If the list associated with this key is non-empty (i.e., this
-                # method has been called less frequently than the corresponding
-                # release() method for this key);
-                if pool else
-                # Else, the list associated with this key is empty (i.e., this
-                # method has been called more frequently than the release()
-                # method for this key). In this case, an arbitrary object
-                # associated with this key.
-                self._pool_item_maker(key)
-            )
-
-            # If debugging, record this item to have now been acquired.
-            if is_debug:
-                self._pool_item_id_to_is_acquired[id(pool_item)] = True
-
-            # Return this item.
-            return pool_item
+        # Thread-local pool state of the active thread. Since no other thread
+        # ever accesses this state, *NO* thread locking is required.
+        thread_local = self._thread_local
+
+        #FIXME: This logic can *PROBABLY* be optimized into:
+        #    if not is_debug:
+        #        try:
+        #            return thread_local.key_to_pool[key].pop()
+        #        except IndexError:
+        #            return self._pool_item_maker(key)
+        #    else:
+        #        try:
+        #            pool_item = thread_local.key_to_pool[key].pop()
+        #        except IndexError:
+        #            pool_item = self._pool_item_maker(key)
+        #
+        #        # Record this item to have now been acquired.
+        #        thread_local.pool_item_id_to_is_acquired[id(pool_item)] = True
+        #
+        #        return pool_item
+        #
+        #That said, this introduces additional complexity that will require
+        #unit testing. So, only do so if the above is actually profiled as
+        #being faster. It almost certainly is, but let's be certain please.
+
+        # List associated with this key.
+        #
+        # If this is the first access of this key, this "defaultdict"
+        # implicitly creates a new list and associates this key with that
+        # list; else, this is the list previously associated with this key.
+        #
+        # Note that this statement implicitly raises a "TypeError"
+        # exception if this key is unhashable, which is certainly more
+        # efficient than our explicitly validating this constraint.
+        pool = thread_local.key_to_pool[key]
+
+        # Pool item associated with this key, defined as either...
+        pool_item = (
+            # The last item popped (i.e., removed) from this list...
+            pool.pop()
+            # If the list associated with this key is non-empty (i.e., this
+            # method has been called less frequently than the corresponding
+            # release() method for this key);
+            if pool else
+            # Else, the list associated with this key is empty (i.e., this
+            # method has been called more frequently than the release()
+            # method for this key). In this case, an arbitrary object
+            # associated with this key.
+            self._pool_item_maker(key)
+        )
+
+        # If debugging, record this item to have now been acquired.
+        if is_debug:
+            thread_local.pool_item_id_to_is_acquired[id(pool_item)] = True
+
+        # Return this item.
+        return pool_item
 
 
     def release(
@@ -271,24 +250,75 @@ class KeyPool(object):
             item is ineligible for release.
         '''
 
-        # In a thread-safe manner...
-        with self._thread_lock:
-            # If debugging...
-            if is_debug:
-                # Integer uniquely identifying this previously acquired pool
-                # item.
-                item_id = id(item)
-
-                # If this item was *NOT* previously acquired, raise an
-                # exception.
-                if not self._pool_item_id_to_is_acquired.get(item_id, False):
-                    raise _BeartypeUtilCachedKeyPoolException(
-                        f'Unacquired key pool item {repr(item)} '
-                        f'not releasable.'
-                    )
-
-                # Record this item to have now been released.
-                self._pool_item_id_to_is_acquired[item_id] = False
-
-            # Append this item to the pool associated with this key.
-            self._key_to_pool[key].append(item)
+        # Thread-local pool state of the active thread. Since no other thread
+        # ever accesses this state, *NO* thread locking is required.
+        thread_local = self._thread_local
+
+        # If debugging...
+        if is_debug:
+            # Integer uniquely identifying this previously acquired pool
+            # item.
+            item_id = id(item)
+
+            # If this item was *NOT* previously acquired, raise an
+            # exception.
+            if not thread_local.pool_item_id_to_is_acquired.get(item_id, False):
+                raise _BeartypeUtilCachedKeyPoolException(
+                    f'Unacquired key pool item {repr(item)} '
+                    f'not releasable.'
+                )
+
+            # Record this item to have now been released.
+            thread_local.pool_item_id_to_is_acquired[item_id] = False
+
+        # Append this item to the pool associated with this key.
+        thread_local.key_to_pool[key].append(item)
+
+# ....................{ PRIVATE ~ CLASSES                  }....................
+class _KeyPoolThreadLocal(local):
+    '''
+    **Key pool thread-local state** (i.e., object whose attributes are
+    transparently specific to the active thread, privately encapsulating all
+    mutable state of a single :class:`.KeyPool` for that thread).
+
+    The :class:`threading.local` superclass implicitly calls the
+    :meth:`__init__` method defined below on the first access of this object
+    from each thread, lazily initializing empty pools specific to that thread.
+
+    Attributes
+    ----------
+    key_to_pool : defaultdict
+        Dictionary mapping from an **arbitrary key** (i.e., hashable object) to
+        corresponding **pool** (i.e., list of zero or more arbitrary objects
+        referred to as "pool items" cached under that key). For both efficiency
+        and simplicity, this dictionary is defined as a :class:`defaultdict`
+        implicitly initializing missing keys on initial access to the empty
+        list.
+    pool_item_id_to_is_acquired : dict
+        Dictionary mapping from the unique object identifier of a **pool item**
+        (i.e., arbitrary object cached under a pool of the :attr:`key_to_pool`
+        dictionary) to a boolean that is either:
+
+        * :data:`True` if that item is currently **acquired** (i.e., most
+          recently returned by a call to the :meth:`.KeyPool.acquire` method).
+        * :data:`False` if that item is currently **released** (i.e., most
+          recently passed to a call to the :meth:`.KeyPool.release` method).
+    '''
+
+    # ..................{ INITIALIZER                        }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this thread-local state to empty pools for the active
+        thread.
+        '''
+
+        # Note that "defaultdict" instances *MUST* be initialized with
+        # positional rather than keyword parameters. For unknown reasons,
+        # initializing such an instance with a keyword parameter causes that
+        # instance to silently behave like a standard dictionary instead: e.g.,
+        #
+        #     >>> dd = defaultdict(default_factory=list)
+        #     >>> dd['ee']
+        #     KeyError: 'ee'
+        self.key_to_pool: dict[Hashable, list] = defaultdict(list)
+        self.pool_item_id_to_is_acquired: dict[int, bool] = {}
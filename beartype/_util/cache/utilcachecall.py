@@ -27,6 +27,7 @@ from beartype._util.func.arg.utilfuncargtest import (
 )
 from beartype._util.text.utiltextlabel import label_callable
 from beartype._data.kind.datakindiota import SENTINEL
+from collections.abc import Callable
 from functools import wraps
 
 # ....................{ DECORATORS ~ callable              }....................
@@ -170,8 +171,10 @@ def callable_cached(func: CallableT) -> CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
+    # get() and setdefault() methods of this dictionary, localized for
+    # efficiency.
     args_flat_to_return_value_get = args_flat_to_return_value.get
+    args_flat_to_return_value_setdefault = args_flat_to_return_value.setdefault
 
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
@@ -181,6 +184,10 @@ def callable_cached(func: CallableT) -> CallableT:
     # get() method of this dictionary, localized for efficiency.
     args_flat_to_exception_get = args_flat_to_exception.get
 
+    # Register these dictionaries for subsequent introspection.
+    _callable_cached_caches.append(
+        (func, args_flat_to_return_value, args_flat_to_exception))
+
     # ....................{ CLOSURE                        }....................
     @wraps(func)
     def _callable_cached(*args):
@@ -248,8 +255,17 @@ def callable_cached(func: CallableT) -> CallableT:
             try:
                 # Call this parameter with these parameters and cache the value
                 # returned by this call to these parameters.
-                return_value = args_flat_to_return_value[args_flat] = func(
-                    *args)
+                #
+                # Note that this cache is intentionally *NOT* thread-locked.
+                # Dictionary lookups and insertions are atomic under both
+                # GIL-enabled and free-threaded CPython, enabling cache hits to
+                # scale across threads. If two threads concurrently miss on
+                # the same parameters, both call this callable; setdefault()
+                # then guarantees that both threads return the same value
+                # (i.e., whichever was cached first), preserving the identity
+                # of memoized singletons.
+                return_value = args_flat_to_return_value_setdefault(
+                    args_flat, func(*args))
             # If this call raised an exception...
             except Exception as exception:
                 # Cache this exception to these parameters.
@@ -412,8 +428,10 @@ def method_cached_arg_by_id(func: CallableT) -> CallableT:
     # if any (i.e., if that call did *NOT* raise an exception).
     args_flat_to_return_value: dict[tuple, object] = {}
 
-    # get() method of this dictionary, localized for efficiency.
+    # get() and setdefault() methods of this dictionary, localized for
+    # efficiency.
     args_flat_to_return_value_get = args_flat_to_return_value.get
+    args_flat_to_return_value_setdefault = args_flat_to_return_value.setdefault
 
     # Dictionary mapping a tuple of all flattened parameters passed to each
     # prior call of the decorated callable with the exception raised by that
@@ -423,6 +441,10 @@ def method_cached_arg_by_id(func: CallableT) -> CallableT:
     # get() method of this dictionary, localized for efficiency.
     args_flat_to_exception_get = args_flat_to_exception.get
 
+    # Register these dictionaries for subsequent introspection.
+    _callable_cached_caches.append(
+        (func, args_flat_to_return_value, args_flat_to_exception))
+
     # ....................{ CLOSURE                        }....................
     @wraps(func)
     def _method_cached(self_or_cls, arg):
@@ -480,8 +502,17 @@ def method_cached_arg_by_id(func: CallableT) -> CallableT:
             try:
                 # Call this parameter with these parameters and cache the value
                 # returned by this call to these parameters.
-                return_value = args_flat_to_return_value[args_flat] = func(
-                    self_or_cls, arg)
+                #
+                # Note that this cache is intentionally *NOT* thread-locked.
+                # Dictionary lookups and insertions are atomic under both
+                # GIL-enabled and free-threaded CPython, enabling cache hits to
+                # scale across threads. If two threads concurrently miss on
+                # the same parameters, both call this callable; setdefault()
+                # then guarantees that both threads return the same value
+                # (i.e., whichever was cached first), preserving the identity
+                # of memoized singletons.
+                return_value = args_flat_to_return_value_setdefault(
+                    args_flat, func(self_or_cls, arg))
             # If this call raised an exception...
             except Exception as exception:
                 # Cache this exception to these parameters.
@@ -604,6 +635,25 @@ def property_cached(func: CallableT) -> CallableT:
     # Return this wrapper method.
     return local_attrs['property_method_cached']
 
+# ....................{ PRIVATE ~ globals                  }....................
+_callable_cached_caches: list[tuple[Callable, dict, dict]] = []
+'''
+**Callable cache registry** (i.e., list of one 3-tuple
+``(func, args_flat_to_return_value, args_flat_to_exception)`` for each callable
+``func`` memoized by either the :func:`callable_cached` or
+:func:`method_cached_arg_by_id` decorators, where ``args_flat_to_return_value``
+and ``args_flat_to_exception`` are the dictionaries memoizing the values
+returned and exceptions raised by that callable).
+
+This registry is appended to *only* at decoration time and thus *only* grows
+with the number of memoized callables defined by this codebase. This registry
+enables the :func:`beartype._util.cache.utilcacheinfo.cache_info` getter to
+introspect these otherwise closure-local dictionaries.
+
+Note that these decorators intentionally record neither hits nor misses. See
+the "Efficiency" section of the :func:`callable_cached` docstring.
+'''
+
 # ....................{ PRIVATE ~ constants : var          }....................
 _CALLABLE_CACHED_VAR_NAME_PREFIX = '__beartype_cached__'
 '''
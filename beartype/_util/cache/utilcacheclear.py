@@ -50,6 +50,13 @@ def clear_caches() -> None:
       dictionary).
     * The **type hint wrapper cache** (i.e., private
       :data:`beartype._door._cls.doormeta._HINT_TO_WRAPPER` cache).
+
+    See Also
+    --------
+    :func:`beartype._util.cache.utilcacheinfo.cache_info`
+        Sibling getter reporting the size, effectiveness, and approximate
+        memory footprint of these caches, enabling callers to decide whether to
+        call this function.
     '''
     # print('Clearing all \"beartype._check\" caches...')
 
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **persistent code object cache** utilities (i.e., low-level
+callables persisting code objects compiled from code snippets dynamically
+generated by :mod:`beartype` to an on-disk cache directory across Python
+processes under the :attr:`beartype.BeartypeConf.code_cache_dir` option).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._metaverse import VERSION
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from marshal import (
+    dumps as marshal_dumps,
+    loads as marshal_loads,
+)
+from os import (
+    close as os_close,
+    makedirs,
+    replace as os_replace,
+    unlink,
+    write as os_write,
+)
+from os.path import join as path_join
+from re import compile as re_compile
+from sys import implementation
+from tempfile import mkstemp
+from types import CodeType
+
+# ....................{ COMPILERS                          }....................
+def compile_code_cached(
+    code: str, code_filename: str, code_cache_dir: str) -> CodeType:
+    '''
+    Code object compiled in ``exec`` mode from the passed code snippet,
+    persisted to (and subsequently loaded from) the passed on-disk cache
+    directory across Python processes.
+
+    This compiler first attempts to load a code object previously compiled from
+    the same code snippet by the same version of both :mod:`beartype` and the
+    active Python interpreter from this directory. If no such code object
+    exists, this compiler compiles this code snippet as usual *and* then
+    marshals the resulting code object into this directory. Since:
+
+    * Each code object is cached under a filename derived from a stable hash of
+      this code snippet and these versions, callers need *not* invalidate this
+      directory on upgrading either :mod:`beartype` or Python.
+    * Each code object is marshalled into a uniquely named temporary file that
+      is then atomically renamed to its final filename, concurrent writers
+      (e.g., worker processes decorating the same callables at startup) never
+      expose partially written files to concurrent readers. If two writers race
+      to cache the same code object, the last rename silently wins; since both
+      files are identical, this is harmless.
+    * Filesystem errors (e.g., permission errors, full disks) and corrupted
+      cache files are silently ignored, this compiler reduces to the
+      :func:`compile` builtin on *any* failure to either read from or write to
+      this directory.
+
+    **This directory must be trusted and private** (i.e., writable *only* by
+    the current user). Code objects loaded from this directory are unmarshalled
+    with the :mod:`marshal` module *and* then executed without validation.
+    Writing to this directory is thus equivalent to executing arbitrary code in
+    every Python process loading code objects from this directory. This
+    compiler creates this directory (if needed) with mode ``0o700`` but
+    preserves the permissions of existing directories.
+
+    Code snippets generated by :mod:`beartype` embed the names of hidden
+    parameters synthesized from the object ids of arbitrary objects (e.g.,
+    ``__beartype_object_140590975400960``). Since object ids vary across Python
+    processes, this compiler **canonicalizes** each such name to an ordinal
+    name (e.g., ``__beartype_object_0``) *before* hashing and compiling that
+    snippet *and* then restores the original names in the returned code object.
+    Doing so enables code objects to be shared across Python processes.
+
+    Parameters
+    ----------
+    code : str
+        Code snippet to be compiled.
+    code_filename : str
+        Filename to be embedded in the returned code object (i.e., as the
+        ``co_filename`` attribute of that code object *and* all code objects
+        transitively nested in that code object). Since this filename is
+        typically unique to the active Python process, this filename is
+        intentionally excluded from the hash under which this code object is
+        cached *and* embedded into code objects loaded from this directory.
+    code_cache_dir : str
+        Absolute or relative dirname of the cache directory to persist this code
+        object to. If this directory does *not* exist, this compiler creates
+        this directory with mode ``0o700`` on first caching a code object.
+
+    Returns
+    -------
+    CodeType
+        Code object compiled from this code snippet.
+
+    Raises
+    ------
+    SyntaxError
+        If this code snippet is syntactically invalid.
+    '''
+    assert isinstance(code, str), f'{repr(code)} not string.'
+    assert isinstance(code_filename, str), f'{repr(code_filename)} not string.'
+    assert isinstance(code_cache_dir, str), (
+        f'{repr(code_cache_dir)} not string.')
+
+    # Dictionary mapping from each canonical name to the corresponding
+    # process-specific name of each hidden parameter in this code snippet.
+    code_names_canonical: dict = {}
+
+    # Code snippet canonicalized by the above mapping, preserving line numbers.
+    code_canonical = _CODE_NAME_PROCESS_SPECIFIC_REGEX.sub(
+        lambda code_name_match: _canonicalize_code_name(
+            code_name_match.group(0), code_names_canonical),
+        code,
+    )
+
+    # Dictionary mapping from each canonical name to the corresponding
+    # process-specific name, inverted from the above mapping.
+    code_names_restored = {
+        code_name_canonical: code_name
+        for code_name, code_name_canonical in code_names_canonical.items()
+    }
+
+    # Absolute or relative filename of the file caching this code object.
+    code_cache_filename = path_join(
+        code_cache_dir, f'{_hash_code(code_canonical)}{_CODE_CACHE_FILETYPE}')
+
+    # ....................{ LOAD                           }....................
+    # Attempt to load this code object from this file.
+    try:
+        with open(code_cache_filename, 'rb') as code_cache_file:
+            code_compiled = marshal_loads(code_cache_file.read())
+
+        # If this file contains a code object, return this code object with
+        # both this filename and these process-specific names embedded into
+        # this code object.
+        if isinstance(code_compiled, CodeType):
+            return _replace_code(
+                code_compiled, code_filename, code_names_restored)
+        # Else, this file is corrupted. Silently recompile this code object.
+    # If this file does *NOT* exist, is unreadable, or is corrupted, silently
+    # recompile this code object.
+    except (OSError, EOFError, TypeError, ValueError):
+        pass
+
+    # ....................{ COMPILE                        }....................
+    # Code object compiled from this canonicalized code snippet.
+    code_compiled = compile(code_canonical, code_filename, 'exec')
+
+    # ....................{ SAVE                           }....................
+    # Attempt to atomically cache this code object to this file.
+    try:
+        # Create this directory if needed, accessible *ONLY* by the current
+        # user. Since code objects loaded from this directory are subsequently
+        # executed, other users able to write to this directory could otherwise
+        # inject arbitrary code into this process. Note that this mode is
+        # ignored for existing directories, whose permissions are preserved.
+        makedirs(code_cache_dir, mode=0o700, exist_ok=True)
+
+        # Low-level file handle and filename of a new uniquely named temporary
+        # file residing in the same directory (and thus filesystem) as this
+        # file, guaranteeing the rename below to be atomic.
+        code_cache_fd, code_cache_filename_temp = mkstemp(
+            dir=code_cache_dir, suffix=_CODE_CACHE_FILETYPE_TEMP)
+
+        # Attempt to...
+        try:
+            # Marshal this code object into this temporary file.
+            try:
+                os_write(code_cache_fd, marshal_dumps(code_compiled))
+            finally:
+                os_close(code_cache_fd)
+
+            # Atomically rename this temporary file to this file, replacing
+            # any file of the same name concurrently cached by another writer.
+            os_replace(code_cache_filename_temp, code_cache_filename)
+        # If doing so fails, remove this temporary file *BEFORE* reraising.
+        except BaseException:
+            unlink(code_cache_filename_temp)
+            raise
+    # If caching this code object fails for *ANY* filesystem-specific reason,
+    # silently ignore this failure. Caching is merely an optimization.
+    except OSError:
+        pass
+
+    # Return this code object with these process-specific names embedded.
+    return _replace_code(code_compiled, code_filename, code_names_restored)
+
+# ....................{ PRIVATE ~ constants                }....................
+_CODE_CACHE_FILETYPE = '.marshal'
+'''
+Filetype of each file cached by the :func:`.compile_code_cached` compiler.
+'''
+
+
+_CODE_CACHE_FILETYPE_TEMP = f'{_CODE_CACHE_FILETYPE}.tmp'
+'''
+Filetype of each temporary file written by the :func:`.compile_code_cached`
+compiler *before* atomically renaming that file to its final filename.
+'''
+
+
+_CODE_HASH_PREFIX = (
+    f'{VERSION}\0{implementation.cache_tag}\0{MAGIC_NUMBER.hex()}\0'
+).encode()
+'''
+Byte string prefixing each code snippet hashed by the :func:`._hash_code`
+hasher, uniquely identifying the versions of both :mod:`beartype` and the
+active Python interpreter.
+
+Since the :mod:`marshal` format is specific to each Python version *and* the
+code generated by :mod:`beartype` is specific to each :mod:`beartype` version,
+code objects cached by different such versions are guaranteed to be cached
+under different hashes.
+'''
+
+_CODE_NAME_CANONICAL_PREFIX = '__beartype_object_'
+'''
+Substring prefixing each canonical name synthesized by the
+:func:`._canonicalize_code_name` function, intentionally identical to the
+substring prefixing the process-specific names it replaces.
+'''
+
+
+_CODE_NAME_PROCESS_SPECIFIC_REGEX = re_compile(
+    rf'\b{_CODE_NAME_CANONICAL_PREFIX}[a-z_]*[0-9]+\b')
+'''
+Compiled regular expression matching each **process-specific name** (i.e.,
+name of a hidden parameter synthesized by the
+:func:`beartype._util.func.utilfuncscope.add_func_scope_attr` function from the
+object id of an arbitrary object) in code snippets generated by
+:mod:`beartype`.
+'''
+
+# ....................{ PRIVATE ~ canonicalizers           }....................
+def _canonicalize_code_name(
+    code_name: str, code_names_canonical: dict) -> str:
+    '''
+    Canonical name uniquely corresponding to the passed process-specific name,
+    synthesized from the number of process-specific names previously
+    canonicalized into the passed dictionary.
+
+    Parameters
+    ----------
+    code_name : str
+        Process-specific name to be canonicalized.
+    code_names_canonical : dict
+        Dictionary mapping from each process-specific name previously
+        canonicalized to the corresponding canonical name, modified in-place.
+
+    Returns
+    -------
+    str
+        Canonical name corresponding to this process-specific name.
+    '''
+
+    # Canonical name previously synthesized for this name if any *OR* "None".
+    code_name_canonical = code_names_canonical.get(code_name)
+
+    # If *NO* such name has been synthesized, synthesize and record this name.
+    if code_name_canonical is None:
+        code_name_canonical = code_names_canonical[code_name] = (
+            f'{_CODE_NAME_CANONICAL_PREFIX}{len(code_names_canonical)}')
+
+    # Return this canonical name.
+    return code_name_canonical
+
+# ....................{ PRIVATE ~ hashers                  }....................
+def _hash_code(code: str) -> str:
+    '''
+    Stable hexadecimal hash of the passed code snippet (i.e., hash guaranteed
+    to be identical across Python processes) and the versions of both
+    :mod:`beartype` and the active Python interpreter.
+
+    Parameters
+    ----------
+    code : str
+        Code snippet to be hashed.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash of this code snippet.
+    '''
+
+    # Return this hash. Note that the builtin hash() function is intentionally
+    # *NOT* called here, as the hashes of strings are randomized across Python
+    # processes by default.
+    return sha256(_CODE_HASH_PREFIX + code.encode()).hexdigest()
+
+# ....................{ PRIVATE ~ replacers                }....................
+def _replace_code(
+    code: CodeType,
+    code_filename: str,
+    code_names_restored: dict,
+) -> CodeType:
+    '''
+    Shallow copy of the passed code object whose filename *and* the filenames
+    of all code objects transitively nested in that code object (e.g.,
+    functions defined by that code object) are replaced by the passed filename
+    *and* whose canonical names are restored to the corresponding
+    process-specific names in the passed dictionary.
+
+    Parameters
+    ----------
+    code : CodeType
+        Code object to be copied.
+    code_filename : str
+        Filename to be embedded in that copy.
+    code_names_restored : dict
+        Dictionary mapping from each canonical name to the corresponding
+        process-specific name to be embedded in that copy.
+
+    Returns
+    -------
+    CodeType
+        Shallow copy of this code object embedding this filename and these
+        names.
+    '''
+
+    # Restore these names in the names of (in order):
+    # * Global and attribute names accessed by this code object.
+    # * Local names (including parameters) declared by this code object.
+    # * Local names (including parameters) captured by closures nested in this
+    #   code object, some of which are also listed in the local names above.
+    # * Closure names captured by this code object from enclosing code objects.
+    # * String constants (e.g., the names of keyword-only parameters passed to
+    #   the "BUILD_CONST_KEY_MAP" instruction) embedded in this code object.
+    return code.replace(
+        co_filename=code_filename,
+        co_names=_replace_code_names(code.co_names, code_names_restored),
+        co_varnames=_replace_code_names(code.co_varnames, code_names_restored),
+        co_cellvars=_replace_code_names(code.co_cellvars, code_names_restored),
+        co_freevars=_replace_code_names(code.co_freevars, code_names_restored),
+        co_consts=tuple(
+            _replace_code(code_const, code_filename, code_names_restored)
+            if isinstance(code_const, CodeType) else
+            code_names_restored.get(code_const, code_const)
+            if isinstance(code_const, str) else
+            _replace_code_names(code_const, code_names_restored)
+            if isinstance(code_const, tuple) else
+            code_const
+            for code_const in code.co_consts
+        ),
+    )
+
+
+def _replace_code_names(names: tuple, code_names_restored: dict) -> tuple:
+    '''
+    Tuple of the passed items whose canonical names are restored to the
+    corresponding process-specific names in the passed dictionary.
+
+    Parameters
+    ----------
+    names : tuple
+        Tuple of arbitrary items (typically, names) to be restored.
+    code_names_restored : dict
+        Dictionary mapping from each canonical name to the corresponding
+        process-specific name.
+
+    Returns
+    -------
+    tuple
+        Tuple of these items with these names restored.
+    '''
+
+    # Return a new tuple restoring all restorable strings in this tuple.
+    return tuple(
+        code_names_restored.get(name, name) if isinstance(name, str) else name
+        for name in names
+    )
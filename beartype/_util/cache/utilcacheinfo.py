@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **cache introspectors** (i.e., low-level callables reporting the
+size, effectiveness, and approximate memory footprint of global caches
+distributed throughout the :mod:`beartype` codebase).
+
+This private submodule complements the sibling
+:mod:`beartype._util.cache.utilcacheclear` submodule, enabling callers to decide
+which caches to clear *before* clearing them.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from collections.abc import (
+    Iterable,
+    Mapping,
+)
+from sys import getsizeof
+from typing import Optional
+
+# ....................{ CLASSES                            }....................
+class BeartypeCacheInfo(object):
+    '''
+    **Beartype cache statistics** (i.e., object describing the size,
+    effectiveness, and approximate memory footprint of a single global cache
+    internally leveraged throughout the :mod:`beartype` codebase at the time
+    this object was created).
+
+    Attributes are named after those of the comparable named tuple returned by
+    the :meth:`functools.lru_cache.cache_info` method for familiarity.
+
+    Attributes
+    ----------
+    currsize : int
+        Number of entries currently cached by this cache.
+    hits : Optional[int]
+        Either:
+
+        * If this cache records hits, the number of lookups finding the passed
+          key in this cache. Since hits are typically recorded *without*
+          locking, this number is only approximate under concurrent access.
+        * Else, :data:`None`. Notably, the
+          :func:`beartype._util.cache.utilcachecall.callable_cached` decorator
+          intentionally records neither hits nor misses for efficiency.
+    maxsize : Optional[int]
+        Either:
+
+        * If this cache is bounded, the maximum number of entries cached by
+          this cache before evicting the least recently used entry.
+        * Else, :data:`None`.
+    misses : Optional[int]
+        Either:
+
+        * If this cache records misses, the number of lookups failing to find
+          the passed key in this cache.
+        * Else, :data:`None`.
+    nbytes : int
+        **Approximate shallow memory footprint** (i.e., number of bytes
+        consumed by the container underlying this cache *and* each key and
+        value directly cached by that container, excluding all objects
+        transitively referred to by those keys and values). Since those
+        objects are commonly shared with other caches and with user code, this
+        is a lower bound on the memory that clearing this cache would release.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to reduce space
+    # consumption.
+    __slots__ = (
+        'currsize',
+        'hits',
+        'maxsize',
+        'misses',
+        'nbytes',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        currsize: int,
+        nbytes: int,
+
+        # Optional parameters.
+        hits: Optional[int] = None,
+        misses: Optional[int] = None,
+        maxsize: Optional[int] = None,
+    ) -> None:
+        '''
+        Initialize this cache statistics.
+
+        See the class docstring for further details.
+        '''
+        assert isinstance(currsize, int), f'{repr(currsize)} not integer.'
+        assert isinstance(nbytes, int), f'{repr(nbytes)} not integer.'
+
+        # Classify all passed parameters.
+        self.currsize = currsize
+        self.hits = hits
+        self.maxsize = maxsize
+        self.misses = misses
+        self.nbytes = nbytes
+
+    # ..................{ DUNDERS                            }..................
+    def __repr__(self) -> str:
+        '''
+        Machine-readable representation of this cache statistics.
+        '''
+
+        return (
+            f'{self.__class__.__name__}('
+            f'currsize={repr(self.currsize)}, '
+            f'nbytes={repr(self.nbytes)}, '
+            f'hits={repr(self.hits)}, '
+            f'misses={repr(self.misses)}, '
+            f'maxsize={repr(self.maxsize)}'
+            f')'
+        )
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def hit_rate(self) -> Optional[float]:
+        '''
+        **Hit rate** (i.e., ratio in the range ``[0.0, 1.0]`` of hits to all
+        lookups) of this cache if this cache records both hits and misses *and*
+        this cache has been looked up at least once *or* :data:`None`
+        otherwise.
+        '''
+
+        # If this cache records neither hits nor misses, return "None".
+        if self.hits is None or self.misses is None:
+            return None
+        # Else, this cache records both hits and misses.
+
+        # Total number of lookups of this cache.
+        lookups = self.hits + self.misses
+
+        # Return either the ratio of hits to lookups if this cache has been
+        # looked up at least once *OR* "None" otherwise.
+        return self.hits / lookups if lookups else None
+
+# ....................{ GETTERS                            }....................
+def cache_info() -> dict[str, BeartypeCacheInfo]:
+    '''
+    Dictionary mapping from the fully-qualified name of each internal cache
+    leveraged throughout the :mod:`beartype` codebase to a new
+    :class:`.BeartypeCacheInfo` object describing the current size,
+    effectiveness, and approximate memory footprint of that cache.
+
+    This getter reports on *all* caches cleared by the
+    :func:`beartype._util.cache.utilcacheclear.clear_caches` function as well as
+    all bounded code object and wrapper template caches and the closure-local
+    caches of *all* callables memoized by the
+    :func:`beartype._util.cache.utilcachecall.callable_cached` and
+    :func:`beartype._util.cache.utilcachecall.method_cached_arg_by_id`
+    decorators (keyed by the fully-qualified names of those callables).
+
+    This getter also reports on caches created on demand (e.g., one cache per
+    type hint memoized by the :attr:`beartype.BeartypeConf.is_check_memo`
+    option). Since these caches are numerous and anonymous, each family of
+    these caches is reported in aggregate as a single cache keyed by the
+    fully-qualified name of the weak registry of these caches, whose
+    statistics are the sums of the statistics of all caches in that family
+    that have yet to be garbage-collected (including the ``maxsize``
+    attribute, which is then the total capacity of those caches).
+
+    This getter is thread-safe. Each cache is shallowly copied before being
+    introspected, avoiding iteration over a cache concurrently modified by
+    another thread. This getter is *not* intended to be called in the critical
+    path, however; the cost of each call is linear in the total number of
+    cached entries.
+
+    Returns
+    -------
+    dict[str, BeartypeCacheInfo]
+        Dictionary mapping from cache names to cache statistics.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+       >>> from beartype import cache_info
+       >>> from beartype.door import is_bearable
+       >>> is_bearable(['Oh,', 'brave', 'new', 'world!'], list[str])
+       True
+       >>> cache_info()[
+       ...     'beartype.door._func.doorfunc._HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER']
+       BeartypeCacheInfo(currsize=1, nbytes=..., hits=0, misses=1, maxsize=1024)
+
+       >>> # Rank all caches by approximate memory footprint.
+       >>> sorted(
+       ...     cache_info().items(),
+       ...     key=lambda item: item[1].nbytes,
+       ...     reverse=True,
+       ... )[:3]
+    '''
+
+    # Defer possibly heavyweight imports. Whereas importing this submodule is a
+    # common occurrence, cache introspection and thus calls to this function are
+    # a comparatively rarer occurrence. We optimize for the common case.
+    from beartype.door._cls.doormeta import _HINT_TO_WRAPPER
+    from beartype.door._func.doorfunc import (
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER,
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER,
+    )
+    from beartype._check.checkmake import (
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR)
+    from beartype._check.code.codemain import _HINT_CONF_TO_CHECK_EXPR
+    from beartype._check.code.codescope import _tuple_union_to_tuple_union
+    from beartype._check.convert._convcoerce import _hint_repr_to_hint
+    from beartype._check.forward.reference._cls.fwdrefmeta import (
+        _ref_proxy_to_resolved_hint,
+        _ref_proxy_to_resolved_type,
+    )
+    from beartype._check.cls.hint.hintsane import _HINT_TO_HINTSANE
+    from beartype._check.code.codememo import _check_memo_caches
+    from beartype._check.pep.pep484585.checkpep484585callable import (
+        _callable_signature_caches)
+    from beartype._conf.confmain import _beartype_conf_args_to_conf
+    from beartype._decor._nontype.decornontype import (
+        _FUNC_TEMPLATE_KEY_TO_TEMPLATE)
+    from beartype._util.cache.map.utilmapunbounded import CacheUnboundedStrong
+    from beartype._util.cache.utilcachecall import _callable_cached_caches
+    from beartype._util.cache.utilcacheobjattr import (
+        _MODULE_NAME_TO_ATTR_NAME_TO_VALUE)
+    from beartype._util.func.utilfuncmake import _FUNC_CODE_TO_CODEOBJ
+    from beartype._util.hint.pep.proposal.pep589 import (
+        _HINT_PEP589_TO_KEY_TABLE)
+
+    # Dictionary mapping from cache names to cache statistics to be returned.
+    cache_name_to_info: dict[str, BeartypeCacheInfo] = {}
+
+    # For the fully-qualified name of each global cache and that cache...
+    for cache_name, cache in (
+        ('beartype.door._cls.doormeta._HINT_TO_WRAPPER', _HINT_TO_WRAPPER),
+        (
+            'beartype.door._func.doorfunc.'
+            '_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER',
+            _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER,
+        ),
+        (
+            'beartype.door._func.doorfunc.'
+            '_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER',
+            _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER,
+        ),
+        (
+            'beartype._check.checkmake.'
+            '_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR',
+            _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER_GENERATOR,
+        ),
+        (
+            'beartype._check.code.codemain._HINT_CONF_TO_CHECK_EXPR',
+            _HINT_CONF_TO_CHECK_EXPR,
+        ),
+        (
+            'beartype._check.code.codescope._tuple_union_to_tuple_union',
+            _tuple_union_to_tuple_union,
+        ),
+        (
+            'beartype._check.convert._convcoerce._hint_repr_to_hint',
+            _hint_repr_to_hint,
+        ),
+        (
+            'beartype._check.forward.reference._cls.fwdrefmeta.'
+            '_ref_proxy_to_resolved_hint',
+            _ref_proxy_to_resolved_hint,
+        ),
+        (
+            'beartype._check.forward.reference._cls.fwdrefmeta.'
+            '_ref_proxy_to_resolved_type',
+            _ref_proxy_to_resolved_type,
+        ),
+        (
+            'beartype._check.cls.hint.hintsane._HINT_TO_HINTSANE',
+            _HINT_TO_HINTSANE,
+        ),
+        (
+            'beartype._conf.confmain._beartype_conf_args_to_conf',
+            _beartype_conf_args_to_conf,
+        ),
+        (
+            'beartype._decor._nontype.decornontype.'
+            '_FUNC_TEMPLATE_KEY_TO_TEMPLATE',
+            _FUNC_TEMPLATE_KEY_TO_TEMPLATE,
+        ),
+        (
+            'beartype._util.func.utilfuncmake._FUNC_CODE_TO_CODEOBJ',
+            _FUNC_CODE_TO_CODEOBJ,
+        ),
+        (
+            'beartype._util.hint.pep.proposal.pep589._HINT_PEP589_TO_KEY_TABLE',
+            _HINT_PEP589_TO_KEY_TABLE,
+        ),
+    ):
+        # If this cache is a bounded LRU cache, describe this cache with the
+        # statistics recorded by this cache.
+        if isinstance(cache, CacheLruStrong):
+            cache_copy = dict.copy(cache)
+            cache_info_curr = BeartypeCacheInfo(
+                currsize=len(cache_copy),
+                nbytes=_get_mapping_nbytes(cache_copy),
+                hits=cache.hits,
+                misses=cache.misses,
+                maxsize=cache.size,
+            )
+        # Else if this cache is an unbounded cache, describe this cache with the
+        # statistics recorded by this cache.
+        elif isinstance(cache, CacheUnboundedStrong):
+            cache_copy = cache.copy()
+            cache_info_curr = BeartypeCacheInfo(
+                currsize=len(cache_copy),
+                nbytes=_get_mapping_nbytes(cache_copy),
+                hits=cache.hits,
+                misses=cache.misses,
+            )
+        # Else, this cache is a plain dictionary recording *NO* statistics.
+        else:
+            cache_copy = cache.copy()  # type: ignore[attr-defined]
+            cache_info_curr = BeartypeCacheInfo(
+                currsize=len(cache_copy),
+                nbytes=_get_mapping_nbytes(cache_copy),
+            )
+
+        # Map the name of this cache to these statistics.
+        cache_name_to_info[cache_name] = cache_info_curr
+
+    # Shallow copy of the object attribute cache, a nested dictionary mapping
+    # from module names to dictionaries mapping from attribute names to values.
+    module_name_to_attr_name_to_value = (
+        _MODULE_NAME_TO_ATTR_NAME_TO_VALUE.copy())
+
+    # Describe this cache, additionally counting all nested dictionaries.
+    cache_name_to_info[
+        'beartype._util.cache.utilcacheobjattr.'
+        '_MODULE_NAME_TO_ATTR_NAME_TO_VALUE'
+    ] = BeartypeCacheInfo(
+        currsize=sum(
+            len(attr_name_to_value)
+            for attr_name_to_value in module_name_to_attr_name_to_value.values()
+        ),
+        nbytes=getsizeof(module_name_to_attr_name_to_value) + sum(
+            _get_object_nbytes(module_name) +
+            _get_mapping_nbytes(attr_name_to_value.copy())
+            for module_name, attr_name_to_value in (
+                module_name_to_attr_name_to_value.items())
+        ),
+    )
+
+    # For each callable memoized by a caching decorator and the dictionaries
+    # memoizing the values returned and exceptions raised by that callable...
+    for func, args_flat_to_return_value, args_flat_to_exception in (
+        # Shallow copy of this registry, avoiding iteration over this registry
+        # while concurrently appended to by another thread.
+        _callable_cached_caches.copy()):
+        # Shallow copies of these dictionaries.
+        args_flat_to_return_value = args_flat_to_return_value.copy()
+        args_flat_to_exception = args_flat_to_exception.copy()
+
+        # Describe these dictionaries as a single cache named after this
+        # callable.
+        cache_name_to_info[f'{func.__module__}.{func.__qualname__}'] = (
+            BeartypeCacheInfo(
+                currsize=(
+                    len(args_flat_to_return_value) +
+                    len(args_flat_to_exception)
+                ),
+                nbytes=(
+                    _get_mapping_nbytes(args_flat_to_return_value) +
+                    _get_mapping_nbytes(args_flat_to_exception)
+                ),
+            ))
+
+    # For the fully-qualified name of each weak registry of bounded LRU caches
+    # created on demand, that registry, and whether these caches record hits
+    # and misses, describe all caches in this registry as a single cache.
+    #
+    # Note that type-checking wrapper functions look up memoized piths by
+    # directly calling the lock-free dict.get() method, which records neither
+    # hits nor misses for efficiency.
+    for cache_name, caches, is_cache_stats in (
+        (
+            'beartype._check.code.codememo._check_memo_caches',
+            _check_memo_caches,
+            False,
+        ),
+        (
+            'beartype._check.pep.pep484585.checkpep484585callable.'
+            '_callable_signature_caches',
+            _callable_signature_caches,
+            True,
+        ),
+    ):
+        # Strong references to all caches in a shallow copy of this registry,
+        # avoiding iteration over this registry while concurrently modified by
+        # another thread *AND* preventing these caches from being
+        # garbage-collected while being introspected.
+        cache_name_to_info[cache_name] = _get_caches_lru_info(
+            caches=list(caches.copy().values()), is_stats=is_cache_stats)
+
+    # Return this dictionary.
+    return cache_name_to_info
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_caches_lru_info(
+    caches: Iterable[CacheLruStrong], is_stats: bool) -> BeartypeCacheInfo:
+    '''
+    New :class:`.BeartypeCacheInfo` object describing the passed bounded LRU
+    caches in aggregate (i.e., as a single cache whose statistics are the sums
+    of the statistics of these caches).
+
+    Parameters
+    ----------
+    caches : Iterable[CacheLruStrong]
+        Bounded LRU caches to be described.
+    is_stats : bool
+        :data:`True` only if these caches are looked up *only* via methods
+        recording hits and misses. If :data:`False`, the hits and misses of the
+        returned object are both :data:`None`.
+
+    Returns
+    -------
+    BeartypeCacheInfo
+        Statistics describing these caches in aggregate.
+    '''
+
+    # Aggregate statistics describing these caches.
+    currsize = nbytes = hits = misses = maxsize = 0
+
+    # For each such cache...
+    for cache in caches:
+        # Shallow copy of this cache.
+        cache_copy = dict.copy(cache)
+
+        # Accumulate the statistics describing this cache.
+        currsize += len(cache_copy)
+        nbytes += _get_mapping_nbytes(cache_copy)
+        hits += cache.hits
+        misses += cache.misses
+        maxsize += cache.size
+
+    # Return these statistics.
+    return BeartypeCacheInfo(
+        currsize=currsize,
+        nbytes=nbytes,
+        hits=hits if is_stats else None,
+        misses=misses if is_stats else None,
+        maxsize=maxsize,
+    )
+
+def _get_mapping_nbytes(mapping: Mapping) -> int:
+    '''
+    **Approximate shallow memory footprint** (i.e., number of bytes consumed by
+    the passed mapping *and* each key and value directly contained in that
+    mapping, excluding all objects transitively referred to by those keys and
+    values) of the passed mapping.
+
+    Caveats
+    -------
+    **Callers should pass a shallow copy of the desired mapping** rather than
+    that mapping itself, avoiding iteration over a mapping concurrently
+    modified by another thread.
+
+    Parameters
+    ----------
+    mapping : Mapping
+        Mapping to be measured.
+
+    Returns
+    -------
+    int
+        Approximate shallow memory footprint of this mapping.
+    '''
+
+    # Return the sum of the sizes of this mapping and each key and value of this
+    # mapping.
+    return getsizeof(mapping) + sum(
+        _get_object_nbytes(key) + _get_object_nbytes(value)
+        for key, value in mapping.items()
+    )
+
+
+def _get_object_nbytes(obj: object) -> int:
+    '''
+    **Approximate shallow memory footprint** (i.e., number of bytes consumed by
+    the passed object, excluding all objects transitively referred to by that
+    object) of the passed object if that object is safely sizable *or* ``0``
+    otherwise.
+
+    Caveats
+    -------
+    **This getter silently ignores all exceptions raised by the**
+    ``__sizeof__()`` **dunder method of that object.** Cached keys and values
+    are arbitrary user-defined objects, any of which may define a broken
+    ``__sizeof__()`` dunder method raising an arbitrary exception. Although
+    the :func:`sys.getsizeof` function accepts a default returned in that
+    case, that function only returns that default on :exc:`TypeError`
+    exceptions and otherwise propagates all other exceptions (e.g.,
+    :exc:`ValueError`). Reporting cache statistics should *never* raise
+    exceptions merely because some cached object is broken.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be measured.
+
+    Returns
+    -------
+    int
+        Either:
+
+        * If the :func:`sys.getsizeof` function successfully sizes this object,
+          the approximate shallow memory footprint of this object.
+        * Else, ``0``.
+    '''
+
+    # Attempt to return the size of this object.
+    try:
+        return getsizeof(obj, 0)
+    # If sizing this object raised *ANY* exception, silently size this object as
+    # zero bytes.
+    except Exception:
+        return 0
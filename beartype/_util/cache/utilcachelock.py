@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **coarse thread lock utilities** (i.e., low-level callables
+serializing all :func:`beartype.beartype` decorations and all mutations of
+global state shared with those decorations under a single non-reentrant thread
+lock).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.typing.datatyping import T
+from collections.abc import Callable
+from threading import (
+    Lock,
+    local,
+)
+
+# ....................{ PRIVATE ~ classes                  }....................
+class _BeartypeLockThreadLocal(local):
+    '''
+    **Beartype lock thread-local state** (i.e., object whose attributes are
+    transparently specific to the active thread, recording whether that thread
+    currently holds the :data:`._beartype_lock`).
+
+    Attributes
+    ----------
+    lock_depth : int
+        Number of nested calls to either the :func:`.call_beartype_locked`
+        function or the :meth:`.BeartypeLock.__enter__` method from the active
+        thread that have yet to return. If this integer is non-zero, the active
+        thread currently holds the :data:`._beartype_lock`. Since that lock is
+        non-reentrant, nested calls test this integer to avoid deadlocking on
+        that lock (e.g., when decorating a class decorates the methods of that
+        class).
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Default this integer for each thread as a class rather than instance
+    # variable, avoiding the need to define an __init__() method called on the
+    # first access of this object from each thread.
+    lock_depth = 0
+
+# ....................{ PRIVATE ~ globals                  }....................
+_beartype_lock = Lock()
+'''
+**Coarse beartype thread lock** (i.e., low-level non-reentrant thread locking
+mechanism implemented as a highly efficient C extension, serializing *all*
+:func:`beartype.beartype` decorations and all mutations of global state shared
+with those decorations).
+
+Callers should *not* directly enter this lock. Callers should instead either
+call the :func:`.call_beartype_locked` function *or* enter the
+:data:`.beartype_lock` context manager, both of which safely enter this lock
+only if the active thread does *not* already hold this lock.
+
+Caveats
+-------
+**Code run while holding this lock must never import modules that might
+concurrently decorate objects from another thread.** Doing so would deadlock
+the active thread (waiting on the import lock of that module) against that
+other thread (waiting on this lock).
+'''
+
+# ....................{ GLOBALS ~ state                    }....................
+beartype_lock_state = _BeartypeLockThreadLocal()
+'''
+**Beartype lock thread-local state** (i.e., per-thread record of whether the
+active thread currently holds the :data:`._beartype_lock`).
+
+Callers in the critical path may directly test the
+:attr:`._BeartypeLockThreadLocal.lock_depth` integer of this object to call
+unlocked implementations when the active thread already holds that lock (e.g.,
+while decorating), avoiding even the negligible cost of entering the
+:data:`.beartype_lock` context manager.
+'''
+
+# ....................{ CLASSES                            }....................
+class BeartypeLock(object):
+    '''
+    **Coarse beartype thread lock context manager** (i.e., object entering the
+    non-reentrant :data:`._beartype_lock` on entering the outermost ``with``
+    statement of the active thread and exiting that lock on exiting that
+    statement).
+
+    Nested ``with`` statements from the same thread are permitted. Rather than
+    re-entering that non-reentrant lock (and thus deadlocking), nested
+    statements merely increment and decrement a thread-local depth counter.
+
+    This context manager is intended for callers requiring the coarse beartype
+    lock across a large block of code. Callers only requiring that lock across
+    a single call should prefer the faster :func:`.call_beartype_locked`
+    function instead.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # @beartype decorations. Slotting has been shown to reduce read and write
+    # costs by approximately ~10%, which is non-trivial.
+    __slots__ = ()
+
+    # ..................{ DUNDERS                            }..................
+    def __enter__(self) -> None:
+        '''
+        Enter the coarse beartype lock if the active thread does *not* already
+        hold that lock.
+        '''
+
+        # Thread-local state of the active thread, localized for efficiency.
+        thread_local = beartype_lock_state
+
+        # If the active thread does *NOT* already hold this lock, enter it.
+        if not thread_local.lock_depth:
+            _beartype_lock.acquire()
+        # Else, the active thread already holds this lock.
+
+        # Record this nesting.
+        thread_local.lock_depth += 1
+
+
+    def __exit__(self, *args) -> None:
+        '''
+        Exit the coarse beartype lock if this is the outermost ``with``
+        statement of the active thread entering that lock.
+        '''
+
+        # Thread-local state of the active thread, localized for efficiency.
+        thread_local = beartype_lock_state
+
+        # Record this unnesting.
+        thread_local.lock_depth -= 1
+
+        # If this is the outermost statement, exit this lock.
+        if not thread_local.lock_depth:
+            _beartype_lock.release()
+        # Else, this is a nested statement.
+
+# ....................{ GLOBALS                            }....................
+beartype_lock = BeartypeLock()
+'''
+**Coarse beartype thread lock context manager singleton** (i.e., object safely
+entering the non-reentrant :data:`._beartype_lock` from ``with`` statements).
+'''
+
+# ....................{ CALLERS                            }....................
+def call_beartype_locked(func: Callable[..., T], *args, **kwargs) -> T:
+    '''
+    Call the passed callable passed the passed positional and keyword
+    parameters while holding the coarse beartype lock and return the value
+    returned by this call.
+
+    If the active thread already holds this lock (e.g., due to this call being
+    transitively nested in a parent call to this function from the same
+    thread), this function instead calls this callable *without* reentering
+    this lock. Doing so both avoids deadlocking on this non-reentrant lock
+    *and* strips all redundant thread locking from the body of each
+    :func:`beartype.beartype` decoration, reducing each nested call to a single
+    thread-local attribute lookup.
+
+    Parameters
+    ----------
+    func : Callable[..., T]
+        Callable to be called.
+
+    All remaining parameters are passed as is to this callable.
+
+    Returns
+    -------
+    T
+        Value returned by this callable.
+    '''
+
+    # Thread-local state of the active thread, localized for efficiency.
+    thread_local = beartype_lock_state
+
+    # If the active thread already holds this lock, call this callable as is.
+    if thread_local.lock_depth:
+        return func(*args, **kwargs)
+    # Else, the active thread does *NOT* already hold this lock.
+
+    # Thread-safely...
+    with _beartype_lock:
+        # Record the active thread to now hold this lock *BEFORE* calling this
+        # callable, which may transitively call this function again.
+        thread_local.lock_depth = 1
+
+        # Attempt to call this callable and return the value returned by this
+        # call.
+        try:
+            return func(*args, **kwargs)
+        # Regardless of whether this call raised an exception, record the
+        # active thread to no longer hold this lock.
+        finally:
+            thread_local.lock_depth = 0
@@ -273,6 +273,46 @@ def is_type_builtin_or_fake(cls: type) -> bool:
     # declaring all builtin types.
     return cls_module_name == BUILTINS_MODULE_NAME
 
+# ....................{ TESTERS ~ final                    }....................
+def is_type_final(cls: type) -> bool:
+    '''
+    :data:`True` only if the passed class is **final** (i.e., *cannot* be
+    subclassed or has been explicitly declared to be final).
+
+    This tester returns :data:`True` only if either:
+
+    * This class is a C-based type that the active Python interpreter prohibits
+      from being subclassed (e.g., :class:`bool`, :class:`types.FunctionType`).
+    * This class was decorated by the :pep:`591`-compliant
+      :func:`typing.final` decorator, which sets the ``__final__`` dunder
+      attribute on that class under Python >= 3.11. Note that this decorator
+      is merely advisory; static type-checkers prohibit subclassing that class,
+      but the active Python interpreter does *not*.
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    cls : type
+        Class to be inspected.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this class is final.
+    '''
+    assert isinstance(cls, type), f'{repr(cls)} not type.'
+
+    # Return true only if either...
+    return (
+        # This class prohibits subclassing *OR*...
+        not cls.__flags__ & _TPFLAGS_BASETYPE or
+        # This class was decorated by @typing.final.
+        cls.__dict__.get('__final__', False) is True
+    )
+
 # ....................{ TESTERS ~ subclass                 }....................
 def is_type_subclass(
     cls: object, base_classes: TypeOrTupleTypes) -> bool:
@@ -390,3 +430,11 @@ def is_type_subclass_proper(
             cls is base_classes
         )
     )
+
+# ....................{ PRIVATE ~ globals                  }....................
+_TPFLAGS_BASETYPE = 1 << 10
+'''
+Bit flag set in the ``__flags__`` dunder attribute of each C-based type
+permitting subclassing, mirroring the ``Py_TPFLAGS_BASETYPE`` macro defined by
+the CPython C API.
+'''
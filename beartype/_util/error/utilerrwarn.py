@@ -105,6 +105,25 @@ def warnings_ignored(
                 simplefilter('ignore', category=warning_cls)
                 yield
 
+# ....................{ GETTERS                            }....................
+def get_warnings_issued_count() -> int:
+    '''
+    Total number of warnings issued by the :func:`.issue_warning` warner for
+    the lifetime of the active Python process.
+
+    Callers may compare the values returned by two calls to this getter to
+    decide whether arbitrary intervening logic issued one or more warnings
+    (e.g., to avoid caching the results of that logic, which would otherwise
+    silently prevent those warnings from being reissued).
+
+    Returns
+    -------
+    int
+        Total number of warnings issued so far.
+    '''
+
+    return _warnings_issued_count
+
 # ....................{ WARNERS                            }....................
 # If the active Python interpreter targets Python >= 3.12, the standard
 # warnings.warn() function supports the optional "skip_file_prefixes" parameter
@@ -125,6 +144,10 @@ if IS_PYTHON_AT_LEAST_3_12:
         warning_cls: TypeWarning = UserWarning,
     ) -> None:
 
+        # Record that another warning is being issued.
+        global _warnings_issued_count
+        _warnings_issued_count += 1
+
         # The warning you gave us is surely our last!
         warn(  # type: ignore[call-overload]
             message,
@@ -157,6 +180,10 @@ else:
         warning_cls: TypeWarning = UserWarning,
     ) -> None:
 
+        # Record that another warning is being issued.
+        global _warnings_issued_count
+        _warnings_issued_count += 1
+
         # Time to cry your tears! Now cry!
         warn(message, warning_cls)
 
@@ -356,3 +383,16 @@ def reissue_warnings_placeholder(
             lineno=warning_info.lineno,
             source=warning_info.source,
         )
+
+# ....................{ PRIVATE ~ globals                  }....................
+_warnings_issued_count = 0
+'''
+Total number of warnings issued by the :func:`.issue_warning` warner for the
+lifetime of the active Python process.
+
+Note that this counter is intentionally *not* thread-safe, as locking on each
+issued warning would be overkill. Concurrent warners may (albeit rarely) lose
+increments. Since callers only use this counter to decide whether caching is
+safe, the worst case is merely a warning that is not reissued on a later
+cache hit.
+'''
@@ -312,6 +312,42 @@ def get_codeobject_filename(codeobj: CallableCodeObjectType) -> Optional[str]:
     # this metadata. Yes, this is awful. Yes, this is the Python ecosystem.
     return getattr(codeobj, 'co_filename', None)
 
+# ....................{ REPLACERS                          }....................
+def replace_codeobject_filename(
+    codeobj: CallableCodeObjectType, filename: str) -> CallableCodeObjectType:
+    '''
+    Shallow copy of the passed code object whose filename *and* the filenames
+    of all code objects transitively nested in that code object (e.g.,
+    functions defined by that code object) are replaced by the passed filename.
+
+    Parameters
+    ----------
+    codeobj : CallableCodeObjectType
+        Code object to be copied.
+    filename : str
+        Filename to be embedded in that copy.
+
+    Returns
+    -------
+    CallableCodeObjectType
+        Shallow copy of this code object embedding this filename.
+    '''
+    assert isinstance(codeobj, CallableCodeObjectType), (
+        f'{repr(codeobj)} not code object.')
+    assert isinstance(filename, str), f'{repr(filename)} not string.'
+
+    # Return a copy of this code object embedding both this filename *AND*
+    # copies of all nested code objects embedding this filename.
+    return codeobj.replace(
+        co_filename=filename,
+        co_consts=tuple(
+            replace_codeobject_filename(codeobj_const, filename)
+            if isinstance(codeobj_const, CallableCodeObjectType) else
+            codeobj_const
+            for codeobj_const in codeobj.co_consts
+        ),
+    )
+
 # ....................{ GETTERS ~ attribute                }....................
 #FIXME: Unit test us up, please. *sigh*
 def get_codeobject_basename(codeobj: CallableCodeObjectType) -> str:
@@ -16,6 +16,9 @@ from beartype._data.typing.datatyping import (
     LexicalScope,
     TypeException,
 )
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.cache.utilcachedisk import compile_code_cached
+from beartype._util.func.utilfunccodeobj import replace_codeobject_filename
 from beartype._util.text.utiltextlabel import label_exception_message
 from beartype._util.text.utiltextmunge import number_str_lines
 from beartype._util.utilobjget import get_object_name
@@ -38,6 +41,7 @@ def make_func(
     func_label: Optional[str] = None,
     func_labeller: Optional[Callable[[], str]] = None,
     func_wrapped: Optional[Callable] = None,
+    func_code_cache_dir: Optional[str] = None,
     is_debug: bool = False,
     exception_cls: TypeException = _BeartypeUtilCallableException,
 ) -> Callable:
@@ -99,6 +103,13 @@ def make_func(
         * ``__name__``, providing this function's unqualified name.
 
         Defaults to :data:`None`.
+    func_code_cache_dir : str | None
+        Dirname of the **persistent code object cache** (i.e., on-disk
+        directory to which the code object compiled from this code snippet is
+        persisted across Python processes) if any *or* :data:`None` otherwise.
+        If non-:data:`None`, this factory defers to the
+        :func:`beartype._util.cache.utilcachedisk.compile_code_cached` compiler
+        rather than the :func:`compile` builtin. Defaults to :data:`None`.
     is_debug : bool, optional
         :data:`True` only if this function is being debugged. If :data:`True`,
         then the definition (including signature and body) of this function is:
@@ -266,7 +277,39 @@ def make_func(
         # willing to constrain the passed "func_code" to a single statement. In
         # casual testing, there is very little performance difference between
         # the two (with an imperceptibly slight edge going to "single").
-        func_code_compiled = compile(func_code, func_filename, 'exec')
+        #
+        # Since structurally identical callables (e.g., methods of the same
+        # name annotated by the same type hints) are typically decorated into
+        # identical code snippets, first attempt to reuse the code object
+        # previously compiled from this exact code snippet by a prior call to
+        # this factory. Code objects are immutable and bind *NO* scope. Reusing
+        # a code object is thus safe, as executing that code object below
+        # rebinds the default values of the hidden parameters of that function
+        # against the passed scopes. Only the filename embedded in that code
+        # object need be replaced with the filename unique to this function.
+        try:
+            func_code_compiled = replace_codeobject_filename(
+                _FUNC_CODE_TO_CODEOBJ[func_code], func_filename)
+        # If this factory has yet to compile this code snippet...
+        except KeyError:
+            # If the caller requested that code objects be persisted across
+            # Python processes, defer to a compiler loading this code object
+            # from the on-disk cache directory if previously compiled *OR*
+            # compiling and saving this code object to that directory
+            # otherwise.
+            func_code_compiled = (
+                compile(func_code, func_filename, 'exec')
+                if func_code_cache_dir is None else
+                compile_code_cached(
+                    code=func_code,
+                    code_filename=func_filename,
+                    code_cache_dir=func_code_cache_dir,
+                )
+            )
+
+            # Cache this code object for reuse by subsequent calls passed the
+            # same code snippet.
+            _FUNC_CODE_TO_CODEOBJ[func_code] = func_code_compiled
         assert func_name not in func_locals
 
         # Define that function. For obscure and likely uninteresting reasons,
@@ -370,6 +413,28 @@ def make_func(
     # Return that function.
     return func
 
+# ....................{ PRIVATE ~ globals                  }....................
+_FUNC_CODE_TO_CODEOBJ_SIZE = 512
+'''
+Maximum number of code objects cached by the :data:`._FUNC_CODE_TO_CODEOBJ`
+cache.
+
+Since each key of that cache is a code snippet typically ranging from one to
+several kilobytes in length, this capacity bounds the memory consumed by that
+cache to a few megabytes in the worst case.
+'''
+
+
+_FUNC_CODE_TO_CODEOBJ = CacheLruStrong(_FUNC_CODE_TO_CODEOBJ_SIZE)
+'''
+**Code object cache** (i.e., thread-safe Least Recently Used (LRU) cache
+mapping from each code snippet previously compiled by the :func:`.make_func`
+factory to the code object compiled from that snippet).
+
+This cache enables the cost of compiling functions to scale with the number of
+structurally distinct functions rather than the total number of functions.
+'''
+
 # ....................{ FACTORIES ~ method                 }....................
 #FIXME: Preserved in the likelihood that we'll want a bound method factory again
 #at some point. *sigh*
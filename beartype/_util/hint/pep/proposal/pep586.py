@@ -11,11 +11,13 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar import BeartypeDecorHintPep586Exception
+from beartype._cave._cavefast import EnumType
 from beartype._data.cls.datacls import TYPES_PEP586_ARG
 from beartype._data.typing.datatypingport import Hint
 from beartype._data.typing.datatyping import TypeException
 from beartype._data.hint.sign.datahintsigns import HintSignLiteral
 from beartype._util.text.utiltextjoin import join_delimited_disjunction_types
+from enum import Flag
 
 # ....................{ VALIDATORS                         }....................
 def die_unless_hint_pep586(
@@ -147,6 +149,96 @@ def die_unless_hint_pep586(
             )
         # Else, this argument is valid as a literal argument.
 
+# ....................{ TESTERS                            }....................
+def is_hint_pep586_literals_hashable(hint_literals: tuple) -> bool:
+    '''
+    :data:`True` only if *all* literal objects in the passed tuple are
+    **hashable** (i.e., passable to the :func:`hash` builtin without raising
+    exceptions) and thus permissible as items of a :class:`frozenset`.
+
+    Literal objects are almost always hashable, as :pep:`586` constrains literal
+    objects to be booleans, byte strings, integers, strings, :data:`None`, or
+    enumeration members. Since enumeration members are instances of
+    user-defined types, however, enumeration members *can* be unhashable.
+
+    Parameters
+    ----------
+    hint_literals : tuple
+        Tuple of zero or more literal objects subscripting a :pep:`586`-compliant
+        type hint, typically returned by the :func:`.get_hint_pep586_literals`
+        getter.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if *all* these literal objects are hashable.
+    '''
+
+    # Attempt to hash all these literal objects.
+    try:
+        for hint_literal in hint_literals:
+            hash(hint_literal)
+    # If hashing any literal object raises a type error, that object is
+    # unhashable. In this case, return false.
+    except TypeError:
+        return False
+
+    # Else, all these literal objects are hashable. Return true.
+    return True
+
+
+def is_hint_pep586_literals_enum(hint_literals: tuple) -> bool:
+    '''
+    :data:`True` only if *all* literal objects in the passed tuple are
+    **identity-comparable enumeration members** (i.e., members of
+    :class:`enum.Enum` subclasses whose equality reduces to identity between
+    members of the same subclass).
+
+    Members of the same enumeration are singletons; aliases of the same value
+    are the same object. Any instance of an enumeration type with one or more
+    members is thus one of those members, as such types are unsubclassable.
+    Membership in a set of enumeration members may thus be decided by the
+    object identifiers of those members, avoiding the pure-Python
+    :meth:`enum.Enum.__hash__` method.
+
+    This tester rejects enumerations defining or inheriting a custom
+    ``__eq__()`` dunder method from a user-defined enumeration, which could
+    declare distinct members to be equal. Enumerations inheriting that method
+    from a builtin mixin type (e.g., :class:`int` for :class:`enum.IntEnum`)
+    are accepted, as distinct members of the same enumeration have distinct
+    values and thus compare unequal under that method.
+
+    This tester also rejects :class:`enum.Flag` members, as composite flags
+    (e.g., ``Color.RED | Color.BLUE``) are pseudo-members dynamically created on
+    demand rather than predefined singletons.
+
+    Parameters
+    ----------
+    hint_literals : tuple
+        Tuple of zero or more literal objects subscripting a :pep:`586`-compliant
+        type hint, typically returned by the :func:`.get_hint_pep586_literals`
+        getter.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if *all* these literal objects are
+        identity-comparable enumeration members.
+    '''
+
+    # Return true only if this tuple is non-empty *AND*...
+    return bool(hint_literals) and all(
+        # This literal object is an enumeration member *AND*...
+        isinstance(type(hint_literal), EnumType) and
+        # This member is *NOT* a flag *AND*...
+        not isinstance(hint_literal, Flag) and
+        # The type of this member resolves the "__eq__" dunder method to that of
+        # a builtin type rather than a user-defined type.
+        _get_type_eq_owner(type(hint_literal)).__module__ == 'builtins'
+        # For each literal object subscripting this hint...
+        for hint_literal in hint_literals
+    )
+
 # ....................{ GETTERS                            }....................
 #FIXME: Unit test us up, please.
 def get_hint_pep586_literals(
@@ -201,3 +293,31 @@ def get_hint_pep586_literals(
 
     # Return the standard tuple of all literals subscripting this hint.
     return hint.__args__  # pyright: ignore
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_type_eq_owner(cls: type) -> type:
+    '''
+    First type in the method resolution order (MRO) of the passed type
+    defining the ``__eq__()`` dunder method.
+
+    Parameters
+    ----------
+    cls : type
+        Type to be inspected.
+
+    Returns
+    -------
+    type
+        First type in the MRO of this type defining that method.
+    '''
+
+    # For each type in the MRO of this type, return the first such type
+    # directly defining this method.
+    for cls_mro in cls.__mro__:
+        if '__eq__' in cls_mro.__dict__:
+            return cls_mro
+    # Else, *NO* type in this MRO defines this method, which should *NEVER*
+    # happen, as the root "object" superclass defines this method.
+
+    # Fallback to the root "object" superclass.
+    return object  # pragma: no cover
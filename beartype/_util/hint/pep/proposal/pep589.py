@@ -11,8 +11,19 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
+from beartype._cave._cavefast import HintPep484749RefTypes
+from beartype._data.typing.datatyping import (
+    FrozenSetStrs,
+    TupleHintPep589KeyTable,
+)
+from beartype._util.cls.utilclsmake import make_type
 from beartype._util.cls.utilclstest import is_type_subclass
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_14
+from beartype._util.text.utiltextidentifier import is_identifier
+from typing import (
+    ForwardRef,
+    get_type_hints,
+)
 
 # ....................{ TESTERS                            }....................
 def is_hint_pep589(hint: object) -> bool:
@@ -128,7 +139,222 @@ def is_hint_pep589(hint: object) -> bool:
             _TYPED_DICT_UNIQUE_ATTR_NAMES_LEN)
     )
 
+# ....................{ GETTERS                            }....................
+def get_hint_pep589_key_table(hint: type) -> TupleHintPep589KeyTable:
+    '''
+    **Key table** (i.e., 2-tuple ``(hint_keys_required, hint_key_hints)``
+    describing all keys declared by the passed :pep:`589`-compliant **typed
+    dictionary** (i.e., :class:`typing.TypedDict` subclass), where:
+
+    * ``hint_keys_required`` is the frozen set of the names of all **required
+      keys** (i.e., keys that *must* be present in all dictionaries satisfying
+      this typed dictionary).
+    * ``hint_key_hints`` is the tuple of zero or more 2-tuples ``(key_name,
+      key_hint)`` of the name and value type hint of each key declared by this
+      typed dictionary (including keys inherited from typed dictionary
+      superclasses) in declaration order.
+
+    This getter is memoized for efficiency. Since introspecting the annotations
+    of a typed dictionary is non-trivial, this table is precomputed once at
+    decoration time by the
+    :func:`beartype._check.convert._reduce._pep.redpep589.reduce_hint_pep589`
+    reducer and then reused by code generated for each callable annotated by
+    this typed dictionary.
+
+    Each value type hint is stripped of all :pep:`655`- and :pep:`705`-compliant
+    **type qualifiers** (i.e., :obj:`typing.Required`,
+    :obj:`typing.NotRequired`, and :obj:`typing.ReadOnly`), as these qualifiers
+    are already reflected by the ``__required_keys__`` dunder attribute of this
+    typed dictionary.
+
+    Each value type hint is resolved independently of all other value type
+    hints, such that one unresolvable forward reference fails to impact the
+    resolution of any other value type hint. Each value type hint that is an
+    unresolvable forward reference is then either:
+
+    * If that reference is to a possibly ``.``-delimited name (e.g.,
+      ``'UndefinedType'``), preserved as a :class:`typing.ForwardRef` object
+      relative to the module declaring this typed dictionary, deferring the
+      resolution of that reference to the forward reference proxies generated
+      for that object by :mod:`beartype` at call time.
+    * Else, that reference is to an arbitrary expression (e.g.,
+      ``'list[UndefinedType]'``) that *cannot* be proxied. In this case, that
+      reference is reduced to the ignorable :class:`object` superclass. Since
+      that expression could become resolvable later (e.g., after the module
+      declaring this typed dictionary defines that type), this table is then
+      *not* memoized.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary to be inspected.
+
+    Returns
+    -------
+    TupleHintPep589KeyTable
+        Key table describing this typed dictionary.
+    '''
+
+    # Defer heavyweight imports prohibited at global scope.
+    from beartype._data.hint.sign.datahintsignset import (
+        HINT_SIGNS_PEP589_QUALIFIER)
+    from beartype._util.hint.pep.utilpepget import get_hint_pep_args
+    from beartype._util.hint.pep.utilpepsign import get_hint_pep_sign_or_none
+
+    # Key table previously memoized for this typed dictionary if any *OR*
+    # "None" otherwise.
+    hint_key_table = _HINT_PEP589_TO_KEY_TABLE.get(hint)
+
+    # If this table was previously memoized, return this table as is.
+    if hint_key_table is not None:
+        return hint_key_table
+    # Else, this table has yet to be memoized.
+
+    # Frozen set of the names of all required keys of this typed dictionary.
+    hint_keys_required: FrozenSetStrs = frozenset(hint.__required_keys__)  # type: ignore[attr-defined]
+
+    # True only if one or more value type hints of this typed dictionary are
+    # unresolvable forward references reduced to the "object" superclass below,
+    # in which case this table is *NOT* memoized.
+    is_hint_key_hint_ignored = False
+
+    # Attempt to resolve all forward references annotating this typed
+    # dictionary against the global scope of the module declaring this typed
+    # dictionary, preserving both "typing.Annotated[...]" hints and type
+    # qualifiers stripped below.
+    try:
+        hint_key_to_hint = get_type_hints(hint, include_extras=True)
+    # If doing so raises *ANY* exception whatsoever (e.g., a "NameError" due to
+    # a forward reference to an undefined type), fallback to resolving each
+    # value type hint of this typed dictionary independently.
+    except Exception:
+        hint_key_to_hint = {
+            key_name: _resolve_hint_pep589_key_hint(
+                hint=hint, key_name=key_name, key_hint=key_hint)
+            for key_name, key_hint in hint.__annotations__.items()
+        }
+
+    # List of all 2-tuples "(key_name, key_hint)" to be returned.
+    hint_key_hints = []
+
+    # For the name and value type hint of each key of this typed dictionary...
+    for key_name, key_hint in hint_key_to_hint.items():
+        # While this value type hint is a type qualifier (e.g.,
+        # "typing.NotRequired[int]"), reduce this qualifier to the child type
+        # hint subscripting this qualifier (e.g., "int").
+        while get_hint_pep_sign_or_none(key_hint) in (
+            HINT_SIGNS_PEP589_QUALIFIER):
+            key_hint = get_hint_pep_args(key_hint)[0]
+
+        # If this value type hint is an unresolved forward reference to an
+        # arbitrary expression rather than a name, reduce this reference to the
+        # ignorable "object" superclass. See the docstring for details.
+        if isinstance(key_hint, HintPep484749RefTypes) and not (
+            isinstance(key_hint, ForwardRef) and
+            is_identifier(key_hint.__forward_arg__)
+        ):
+            key_hint = object
+            is_hint_key_hint_ignored = True
+        # Else, this value type hint is either resolved *OR* an unresolved
+        # forward reference to a name deferred to call time.
+
+        # Record this key.
+        hint_key_hints.append((key_name, key_hint))
+
+    # Key table describing this typed dictionary.
+    hint_key_table = (hint_keys_required, tuple(hint_key_hints))
+
+    # If *NO* value type hint of this typed dictionary was ignored, memoize this
+    # table.
+    if not is_hint_key_hint_ignored:
+        _HINT_PEP589_TO_KEY_TABLE[hint] = hint_key_table
+    # Else, one or more value type hints of this typed dictionary were ignored.
+    # Avoid memoizing this table, enabling those hints to be resolved later.
+
+    # Return this table.
+    return hint_key_table
+
+# ....................{ PRIVATE ~ resolvers                }....................
+def _resolve_hint_pep589_key_hint(
+    hint: type, key_name: str, key_hint: object) -> object:
+    '''
+    Value type hint of the key with the passed name declared by the passed
+    :pep:`589`-compliant **typed dictionary** (i.e., :class:`typing.TypedDict`
+    subclass), resolved against the global scope of the module declaring this
+    typed dictionary independently of all other keys of this typed dictionary.
+
+    Parameters
+    ----------
+    hint : type
+        Typed dictionary declaring this key.
+    key_name : str
+        Name of this key.
+    key_hint : object
+        Possibly unresolved value type hint annotating this key.
+
+    Returns
+    -------
+    object
+        Either:
+
+        * If this value type hint is resolvable, this hint resolved.
+        * Else if this value type hint is an unresolvable forward reference to a
+          possibly ``.``-delimited name, a :class:`typing.ForwardRef` object
+          referring to that name relative to the module declaring this typed
+          dictionary.
+        * Else, this value type hint as is.
+    '''
+
+    # Attempt to resolve this value type hint by resolving the annotations of a
+    # new placeholder type declared by the same module as this typed dictionary
+    # annotated by *ONLY* this value type hint.
+    try:
+        return get_type_hints(
+            make_type(
+                type_name=hint.__name__,
+                type_module_name=hint.__module__,
+                type_scope={'__annotations__': {key_name: key_hint}},
+            ),
+            include_extras=True,
+        )[key_name]
+    # If doing so raises *ANY* exception whatsoever, this value type hint is an
+    # unresolvable forward reference (possibly nested in another hint).
+    except Exception:
+        pass
+
+    # Name or expression referred to by this forward reference if this hint is
+    # a forward reference *OR* "None" otherwise.
+    key_hint_ref = (
+        key_hint.__forward_arg__
+        if isinstance(key_hint, ForwardRef) else
+        key_hint
+        if isinstance(key_hint, str) else
+        None
+    )
+
+    # Return either...
+    return (
+        # If this reference refers to a name, a forward reference to this name
+        # relative to the module declaring this typed dictionary;
+        ForwardRef(key_hint_ref, module=hint.__module__)
+        if key_hint_ref is not None and is_identifier(key_hint_ref) else
+        # Else, this hint as is.
+        key_hint
+    )
+
 # ....................{ PRIVATE ~ globals                  }....................
+_HINT_PEP589_TO_KEY_TABLE: dict[type, TupleHintPep589KeyTable] = {}
+'''
+Dictionary mapping from each :pep:`589`-compliant **typed dictionary** (i.e.,
+:class:`typing.TypedDict` subclass) to the **key table** previously returned by
+the :func:`.get_hint_pep589_key_table` getter for that typed dictionary.
+
+This dictionary memoizes *only* key tables whose value type hints are either
+resolved *or* forward references to names deferred to call time. Key tables
+reducing one or more unresolvable forward references to the :class:`object`
+superclass are intentionally *not* memoized.
+'''
+
 # The is_hint_pep589() tester defined above uniquely identifies "TypedDict"
 # subclasses as types declaring *ALL* of:
 _TYPED_DICT_UNIQUE_ATTR_NAMES = frozenset((
@@ -13,7 +13,11 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
-from beartype.typing import Tuple
+from beartype.roar import BeartypeDecorHintPep646Exception
+from beartype.typing import (
+    Any,
+    Tuple,
+)
 from beartype._data.typing.datatypingport import (
     Hint,
     TupleHints,
@@ -25,9 +29,11 @@ from beartype._data.hint.sign.datahintsigns import (
     HintSignPep484585TupleFixed,
     HintSignPep484585TupleVariadic,
     HintSignPep646TupleFixedVariadic,
+    HintSignPep646TupleUnpacked,
 )
 from beartype._data.hint.sign.datahintsignset import (
     HINT_SIGNS_PEP646_TUPLE_HINT_CHILD_UNPACKED)
+from beartype._util.cache.utilcachecall import callable_cached
 from beartype._util.hint.pep.proposal.pep484.pep484 import (
     HINT_PEP484_TUPLE_EMPTY)
 from beartype._util.hint.pep.proposal.pep585 import (
@@ -310,6 +316,106 @@ def get_hint_pep484585646_tuple_args_unpacked_if_needed(
     # Return this tuple.
     return hint_args
 
+@callable_cached
+def get_hint_pep646_tuple_fixed_variadic_args(
+    hint: Hint) -> Tuple[TupleHints, Hint, TupleHints]:
+    '''
+    3-tuple ``(hints_prefix, hint_variadic, hints_suffix)`` describing the
+    passed :pep:`646`-compliant **fixed-variadic tuple hint** (i.e., parent
+    tuple hint subscripted by exactly one :pep:`646`-compliant unpacked child
+    hint matching a variable number of tuple items, possibly preceded and/or
+    followed by one or more fixed child hints matching exactly one tuple item
+    each), where:
+
+    * ``hints_prefix`` is the tuple of the zero or more fixed child hints
+      preceding that unpacked child hint, constraining the leading items of
+      tuples satisfying this hint.
+    * ``hint_variadic`` is the child hint constraining the zero or more
+      remaining items of those tuples, defined as either:
+
+      * If that unpacked child hint is an unpacked variable-length child tuple
+        hint (e.g., the ``*tuple[str, ...]`` in ``tuple[int, *tuple[str, ...],
+        float]``), the child child hint subscripting that hint (e.g., ``str``).
+      * Else, that unpacked child hint is an unpacked type variable tuple
+        (e.g., the ``*Ts`` in ``tuple[int, *Ts, float]``). Since type variable
+        tuples constrain the *number* rather than the *types* of these items,
+        the ignorable :obj:`typing.Any` singleton.
+    * ``hints_suffix`` is the tuple of the zero or more fixed child hints
+      following that unpacked child hint, constraining the trailing items of
+      tuples satisfying this hint.
+
+    This getter is memoized for efficiency. Since this getter is called both by
+    the :func:`beartype._check.convert._reduce._pep.pep646.redpep646tuple.reduce_hint_pep646_tuple`
+    reducer *and* by code generators subsequently type-checking against this
+    hint, the latter merely access the 3-tuple precomputed by the former.
+
+    Caveats
+    -------
+    **This getter assumes this hint to have already been validated** by the
+    above reducer to be subscripted by exactly one unpacked child hint that is
+    *not* an unpacked fixed-length child tuple hint (e.g., ``*tuple[str,
+    bytes]``). The latter are trivially reducible to :pep:`585`-compliant
+    fixed-length tuple hints and thus never passed to this getter.
+
+    Parameters
+    ----------
+    hint : Hint
+        Fixed-variadic tuple hint to be inspected.
+
+    Returns
+    -------
+    Tuple[TupleHints, Hint, TupleHints]
+        3-tuple ``(hints_prefix, hint_variadic, hints_suffix)`` as described
+        above.
+
+    Raises
+    ------
+    BeartypeDecorHintPep646Exception
+        If this hint is subscripted by *no* unpacked child hints.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilpepget import get_hint_pep_args
+    from beartype._util.hint.pep.utilpepsign import get_hint_pep_sign_or_none
+
+    # Tuple of the one or more child hints subscripting this parent tuple hint.
+    hint_childs = get_hint_pep_args(hint)
+
+    # For the 0-based index of each child hint subscripting this parent tuple
+    # hint as well as that child hint...
+    for hint_child_index, hint_child in enumerate(hint_childs):
+        # Sign uniquely identifying this child hint if this child hint is
+        # PEP-compliant *OR* "None" otherwise.
+        hint_child_sign = get_hint_pep_sign_or_none(hint_child)
+
+        # If this child hint is the unpacked child hint of this parent hint...
+        if hint_child_sign in HINT_SIGNS_PEP646_TUPLE_HINT_CHILD_UNPACKED:
+            # Return a 3-tuple of the fixed child hints preceding this unpacked
+            # child hint, the child hint constraining all items matched by this
+            # unpacked child hint, and the fixed child hints following this
+            # unpacked child hint.
+            return (
+                hint_childs[:hint_child_index],
+                # If this child hint is an unpacked variable-length child tuple
+                # hint, the first child child hint subscripting this hint
+                # (e.g., "str" in "*tuple[str, ...]");
+                get_hint_pep484585646_tuple_args_unpacked_if_needed(
+                    hint_child)[0]
+                if hint_child_sign is HintSignPep646TupleUnpacked else
+                # Else, this child hint is an unpacked type variable tuple. In
+                # this case, the ignorable "typing.Any" singleton.
+                Any,
+                hint_childs[hint_child_index + 1:],
+            )
+        # Else, this child hint is a fixed child hint.
+
+    # Raise an exception. The caller guarantees this hint to be subscripted by
+    # one unpacked child hint. Nonetheless...
+    raise BeartypeDecorHintPep646Exception(  # pragma: no cover
+        f'PEP 646 tuple type hint {repr(hint)} '
+        f'subscripted by no PEP 646 unpacked child hints.'
+    )
+
 # ....................{ DISAMBIGUATORS                     }....................
 #FIXME: Unit test us up, please.
 def disambiguate_hint_pep484585646_tuple_sign(hint: Hint) -> HintSign:
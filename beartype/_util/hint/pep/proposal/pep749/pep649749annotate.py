@@ -437,9 +437,9 @@ if IS_PYTHON_AT_LEAST_3_14:
     # Defer version-specific imports.
     from annotationlib import get_annotations  # type: ignore[import-not-found]
     from beartype._util.error.utilerrget import get_name_error_attr_name
+    from beartype._util.cache.utilcachelock import beartype_lock
     from beartype._util.cache.utilcacheobjattr import (
         ObjectAttrTypes,
-        object_attr_cache_lock,
         get_object_attr_cached_or_sentinel,
         set_object_attr_cached,
     )
@@ -619,7 +619,7 @@ if IS_PYTHON_AT_LEAST_3_14:
 
         # ....................{ PREAMBLE                   }....................
         # Thread-safely...
-        with object_attr_cache_lock:
+        with beartype_lock:
             # ....................{ CACHE                  }....................
             # If this hintable is *NOT* actually a hintable, raise an exception.
             # Amusingly, the simplest means of implementing this validation is
@@ -64,6 +64,7 @@ from beartype.door._func.doorfunc import (
     die_if_unbearable as die_if_unbearable,
     is_bearable as is_bearable,
     is_subhint as is_subhint,
+    set_door_cache_size as set_door_cache_size,
 )
 
 # ....................{ DUNDERS                            }....................
@@ -40,21 +40,22 @@ process).
 # whereas the API defined by this submodule is expected to unconditionally
 # operate as expected regardless of the current context.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.roar import BeartypeDoorCacheException
 from beartype._check.checkmake import (
-    TupleHintConfStr,
     make_code_raiser_hint_object_check,
     make_code_tester_check,
     make_func_checker,
 )
 from beartype._conf.confmain import BeartypeConf
 from beartype._conf.confcommon import BEARTYPE_CONF_DEFAULT
-from beartype._data.typing.datatyping import CallableRaiserOrTester
+from beartype._data.check.code.datacodelen import FUNC_CHECKER_CACHE_SIZE
 from beartype._data.typing.datatypingport import (
     Hint,
     HintBare,
     TypeIs,
 )
 from beartype._data.typing.datatyping import T
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
 
 # ....................{ VALIDATORS                         }....................
 def die_if_unbearable(
@@ -310,16 +311,68 @@ def is_subhint(subhint: Hint, superhint: Hint) -> bool:
     # The one-liner is mightier than the... many-liner.
     return TypeHint(subhint).is_subhint(TypeHint(superhint))
 
+# ....................{ SETTERS                            }....................
+def set_door_cache_size(size: int) -> None:
+    '''
+    Set the capacity of the caches memoizing the type-checking functions
+    dynamically generated by the :func:`.die_if_unbearable` and
+    :func:`.is_bearable` functions to the passed size, evicting the least
+    recently used functions exceeding this capacity.
+
+    These caches default to a capacity of :data:`.FUNC_CHECKER_CACHE_SIZE`
+    functions each. Apps type-checking against many dynamically constructed
+    hints (e.g., ``typing.Literal[*runtime_values]``) may reduce this capacity
+    to reduce memory consumption *or* increase this capacity to reduce the
+    costs of regenerating evicted functions.
+
+    Parameters
+    ----------
+    size : int
+        **Cache capacity** (i.e., maximum number of type-checking functions
+        held in each such cache).
+
+    Raises
+    ------
+    BeartypeDoorCacheException
+        If this capacity is either *not* an integer *or* is a **non-positive
+        integer** (i.e., less than 1).
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+       >>> from beartype.door import is_bearable, set_door_cache_size
+       >>> set_door_cache_size(64)
+       >>> is_bearable(42, int)
+       True
+    '''
+
+    # If this capacity is *NOT* a positive integer, raise an exception. Note
+    # that booleans are integers and thus explicitly excluded.
+    if not (
+        isinstance(size, int) and
+        not isinstance(size, bool) and
+        size > 0
+    ):
+        raise BeartypeDoorCacheException(
+            f'Door cache size {repr(size)} not positive integer.')
+    # Else, this capacity is a positive integer.
+
+    # Resize these caches, evicting the least recently used functions.
+    _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER.size = size
+    _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER.size = size
+
 # ....................{ PRIVATE ~ globals                  }....................
-_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER: (
-    dict[TupleHintConfStr, CallableRaiserOrTester]) = {}
+_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER = CacheLruStrong(
+    FUNC_CHECKER_CACHE_SIZE)
 '''
-**Type-checking raiser function factory cache** (i.e., dictionary mapping from
-each 3-tuple ``(hint, conf, exception_prefix)`` of the same triple of parameters
-passed to each call of the :func:`.make_func_checker` function factory to the
-raiser function dynamically generated by that factory).
+**Type-checking raiser function factory cache** (i.e., size-bounded Least
+Recently Used (LRU) cache mapping from each 3-tuple ``(hint, conf,
+exception_prefix)`` of the same triple of parameters passed to each call of the
+:func:`.make_func_checker` function factory to the raiser function dynamically
+generated by that factory).
 
-This dictionary effectively memoizes that factory for the proper subset of
+This cache effectively memoizes that factory for the proper subset of
 type hints whose type-checking code is safely memoizable. Thankfully, most type
 hints are safely memoizable. Exceptions include the so-called "uncachable" type
 hints, defined as:
@@ -331,23 +384,29 @@ hints, defined as:
 * Parent type hints transitively subscripted by one or more child type hints
   having such a sanification.
 
-Caveats
--------
-**This cache is currently non-thread-safe.** Why? Efficiency. Guaranteeing
-thread-safety would require securing the critical slice with thread-locking
-primitives, harming efficiency and thus the whole point of caching. Thankfully,
-cached values are *never* directly exposed to end users. Thread-locking this
-cache would only uselessly inhibit efficiency for no tangible benefit.
+This cache is intentionally bounded. Callers commonly construct type hints
+dynamically (e.g., ``typing.Literal[*runtime_values]``,
+``list[DynamicModel]``). Since each function cached here strongly refers to
+the hint that function type-checks, an unbounded cache would prolong the
+lifetimes of all such hints, their functions, and all types subscripting those
+hints indefinitely. This cache instead evicts the least recently used function
+on exceeding the :data:`.FUNC_CHECKER_CACHE_SIZE` capacity by default. Resize
+this cache at runtime by calling the public :func:`.set_door_cache_size`
+function.
+
+This cache also records hit and miss counts in its
+:attr:`.CacheLruStrong.hits` and :attr:`.CacheLruStrong.misses` properties.
 '''
 
 
-_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER: (
-    dict[TupleHintConfStr, CallableRaiserOrTester]) = {}
+_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER = CacheLruStrong(
+    FUNC_CHECKER_CACHE_SIZE)
 '''
-**Type-checking tester function factory cache** (i.e., dictionary mapping from
-each 3-tuple ``(hint, conf, exception_prefix)`` of the same triple of parameters
-passed to each call of the :func:`.make_func_checker` function factory to the
-tester function dynamically generated by that factory).
+**Type-checking tester function factory cache** (i.e., size-bounded Least
+Recently Used (LRU) cache mapping from each 3-tuple ``(hint, conf,
+exception_prefix)`` of the same triple of parameters passed to each call of the
+:func:`.make_func_checker` function factory to the tester function dynamically
+generated by that factory).
 
 See Also
 --------
@@ -64,6 +64,7 @@ from beartype.roar._roarexc import (
     BeartypeConfException as BeartypeConfException,
     BeartypeConfParamException as BeartypeConfParamException,
     BeartypeConfShellVarException as BeartypeConfShellVarException,
+    BeartypeDoorCacheException as BeartypeDoorCacheException,
     BeartypeDoorException as BeartypeDoorException,
     BeartypeDoorIsSubhintException as BeartypeDoorIsSubhintException,
     BeartypeDoorNonpepException as BeartypeDoorNonpepException,
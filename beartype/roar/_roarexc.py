@@ -1520,6 +1520,18 @@ class BeartypeDoorException(BeartypeException):
     pass
 
 
+class BeartypeDoorCacheException(BeartypeDoorException):
+    '''
+    **Decidedly Object-Oriented Runtime-checking (DOOR) cache exception.**
+
+    This exception is raised at call time from the
+    :func:`beartype.door.set_door_cache_size` function when passed an invalid
+    cache capacity (e.g., a non-positive integer).
+    '''
+
+    pass
+
+
 class BeartypeDoorHintViolation(BeartypeCallHintViolation):
     '''
     **Beartype object-oriented type-checking exception.**
@@ -122,6 +122,84 @@ def test_lrucachestrong_two_pass() -> None:
     assert next(lru_cache_items) == LRU_CACHE_ITEM_B
 
 
+def test_lrucachestrong_stats() -> None:
+    """
+    Test the hit and miss counters and resizable capacity of the
+    :func:`beartype._util.cache.map.utilmaplru.CacheLruStrong` class.
+    """
+
+    # Defer test-specific imports.
+    from beartype._util.cache.map.utilmaplru import CacheLruStrong
+
+    lru_cache = CacheLruStrong(size=3)
+    assert lru_cache.size == 3
+    assert lru_cache.hits == lru_cache.misses == 0
+
+    # Cache three key-value pairs.
+    lru_cache['KEY_A'] = 'VALUE_A'
+    lru_cache['KEY_B'] = 'VALUE_B'
+    lru_cache['KEY_C'] = 'VALUE_C'
+
+    # Confirm one hit and one miss to be recorded.
+    assert lru_cache['KEY_A'] == 'VALUE_A'
+    with raises(KeyError):
+        lru_cache['KEY_D']
+    assert lru_cache.hits == 1
+    assert lru_cache.misses == 1
+
+    # Confirm shrinking this cache to evict the least recently used pairs,
+    # preserving the most recently accessed pair.
+    lru_cache.size = 1
+    assert lru_cache.size == 1
+    assert len(lru_cache) == 1
+    assert 'KEY_A' in lru_cache
+
+    # Confirm resizing this cache to an invalid capacity to raise an exception.
+    with raises(_BeartypeUtilCacheLruException):
+        lru_cache.size = 0
+
+
+def test_lrucachestrong_get_or_sentinel() -> None:
+    """
+    Test the lock-free
+    :meth:`beartype._util.cache.map.utilmaplru.CacheLruStrong.get_or_sentinel`
+    getter.
+    """
+
+    # Defer test-specific imports.
+    from beartype._data.kind.datakindiota import SENTINEL
+    from beartype._util.cache.map.utilmaplru import CacheLruStrong
+
+    lru_cache = CacheLruStrong(size=2)
+
+    # Cache two key-value pairs.
+    lru_cache['KEY_A'] = 'VALUE_A'
+    lru_cache['KEY_B'] = 'VALUE_B'
+
+    # Confirm one hit and one miss to be recorded.
+    assert lru_cache.get_or_sentinel('KEY_A') == 'VALUE_A'
+    assert lru_cache.get_or_sentinel('KEY_C') is SENTINEL
+    assert lru_cache.hits == 1
+    assert lru_cache.misses == 1
+
+    # Confirm caching a third pair to preserve the least recently cached but
+    # recently referenced pair, evicting the unreferenced pair instead.
+    lru_cache['KEY_C'] = 'VALUE_C'
+    assert set(lru_cache.keys()) == {'KEY_A', 'KEY_C'}
+
+    # Confirm caching a fourth pair to evict the least recently used pair, as
+    # the prior eviction refreshed and unreferenced the referenced pair.
+    lru_cache['KEY_D'] = 'VALUE_D'
+    assert set(lru_cache.keys()) == {'KEY_A', 'KEY_D'}
+
+    # Confirm clearing this cache to also clear all referenced keys.
+    lru_cache.get_or_sentinel('KEY_A')
+    assert lru_cache._keys_referenced
+    lru_cache.clear()
+    assert not lru_cache
+    assert not lru_cache._keys_referenced
+
+
 def test_lrucachestrong_fail() -> None:
     """
     Test unsuccessful usage of the
@@ -132,3 +132,40 @@ def test_key_pool_fail() -> None:
     # Verify releasing a non-existent object elicits a roar
     with raises(_BeartypeUtilCachedKeyPoolException):
         key_pool.release(key='I should roar', item=object(), is_debug=True)
+
+
+def test_key_pool_thread() -> None:
+    '''
+    Test that the :class:`beartype._util.cache.pool.utilcachepool.KeyPool` type
+    isolates pools between threads.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache.pool.utilcachepool import KeyPool
+    from threading import Thread
+
+    # Key pool to be tested, seeding empty pools with new empty lists.
+    key_pool = KeyPool(item_maker=lambda key: [])
+
+    # Acquire and release a pool item from the main thread.
+    main_item = key_pool.acquire(key='Ancestral', is_debug=True)
+    key_pool.release(key='Ancestral', item=main_item, is_debug=True)
+
+    # List of all pool items acquired by a child thread below.
+    thread_items = []
+
+    def acquire_in_thread() -> None:
+        thread_items.append(key_pool.acquire(key='Ancestral', is_debug=True))
+
+    # Acquire a pool item from a child thread.
+    thread = Thread(target=acquire_in_thread)
+    thread.start()
+    thread.join()
+
+    # Assert that child thread to have acquired a new pool item rather than
+    # the item released to the pool of the main thread.
+    assert len(thread_items) == 1
+    assert thread_items[0] is not main_item
+
+    # Assert the main thread to reacquire its previously released item.
+    assert key_pool.acquire(key='Ancestral', is_debug=True) is main_item
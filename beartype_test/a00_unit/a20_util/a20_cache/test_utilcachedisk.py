@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype persistent code object cache unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.utilcachedisk` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_compile_code_cached(tmp_path) -> None:
+    '''
+    Test the
+    :func:`beartype._util.cache.utilcachedisk.compile_code_cached` compiler.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Abstract path encapsulating a temporary directory unique to this unit
+        test, created in the base temporary directory.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype._util.cache.utilcachedisk import compile_code_cached
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # Code snippet defining an arbitrary function.
+    CODE = (
+        'def the_poet_wandering(on):\n'
+        '    return on + 1\n'
+    )
+
+    # Dirname of a cache directory that has yet to be created.
+    code_cache_dir = str(tmp_path / 'through_arabie')
+
+    # ..................{ PASS                               }..................
+    # For each process-specific filename to embed in compiled code objects...
+    for code_filename in ('<and_persia>', '<and_the_wild_carmanian_waste>'):
+        # Code object compiled from this snippet, either compiled on the first
+        # iteration *OR* loaded from this directory on the second.
+        code_compiled = compile_code_cached(
+            code=CODE,
+            code_filename=code_filename,
+            code_cache_dir=code_cache_dir,
+        )
+
+        # Assert that this code object embeds this filename, including in the
+        # nested code object of the function defined by this code object.
+        assert code_compiled.co_filename == code_filename
+        func_scope = {}
+        exec(code_compiled, func_scope)
+        assert func_scope['the_poet_wandering'].__code__.co_filename == (
+            code_filename)
+
+        # Assert that the function defined by this code object behaves as
+        # expected.
+        assert func_scope['the_poet_wandering'](1) == 2
+
+        # Assert that this directory now contains exactly one cached code
+        # object *AND* no temporary files.
+        code_cache_files = list((tmp_path / 'through_arabie').iterdir())
+        assert len(code_cache_files) == 1
+        assert code_cache_files[0].suffix == '.marshal'
+
+    # Assert that this compiler created this directory accessible *ONLY* by the
+    # current user.
+    assert (tmp_path / 'through_arabie').stat().st_mode & 0o777 == 0o700
+
+    # Corrupt this cached code object.
+    code_cache_files[0].write_bytes(b'And o\'er the aerial mountains')
+
+    # Assert that this compiler silently recompiles a corrupted code object
+    # *AND* then replaces that corrupted code object.
+    code_compiled = compile_code_cached(
+        code=CODE,
+        code_filename='<which_pour_down>',
+        code_cache_dir=code_cache_dir,
+    )
+    assert code_compiled.co_filename == '<which_pour_down>'
+    assert code_cache_files[0].read_bytes() != (
+        b'And o\'er the aerial mountains')
+
+    # Assert that this compiler silently compiles code snippets when this cache
+    # directory is unwritable (e.g., due to being an existing file).
+    code_cache_filename = tmp_path / 'indus_and_oxus'
+    code_cache_filename.write_text('from their icy caves,')
+    code_compiled = compile_code_cached(
+        code=CODE,
+        code_filename='<in_joy_and_exultation>',
+        code_cache_dir=str(code_cache_filename),
+    )
+    assert code_compiled.co_filename == '<in_joy_and_exultation>'
+
+    # Assert that this compiler shares a single cached code object between code
+    # snippets differing only in process-specific hidden parameter names *AND*
+    # restores those names in each code object loaded from that cache.
+    code_cache_dir = str(tmp_path / 'the_lone_and_dark_abode')
+    for obj_id in ('140590975400960', '140061077519360'):
+        code_obj_name = f'__beartype_object_{obj_id}'
+        code_compiled = compile_code_cached(
+            code=(
+                f'def the_wandering_poet(\n'
+                f'    on, *, {code_obj_name}={code_obj_name}):\n'
+                f'    return isinstance(on, {code_obj_name})\n'
+            ),
+            code_filename='<of_arabie>',
+            code_cache_dir=code_cache_dir,
+        )
+        func_scope = {code_obj_name: int}
+        exec(code_compiled, func_scope)
+        assert func_scope['the_wandering_poet'](1) is True
+        assert func_scope['the_wandering_poet']('1') is False
+        assert func_scope['the_wandering_poet'].__kwdefaults__ == {
+            code_obj_name: int}
+    assert len(list((tmp_path / 'the_lone_and_dark_abode').iterdir())) == 1
+
+    # Assert that this compiler restores those names in code objects capturing
+    # those names as closure cell and free variables.
+    code_cache_dir = str(tmp_path / 'with_shadowy_hair')
+    for obj_id in ('140590975400960', '140061077519360'):
+        code_obj_name = f'__beartype_object_{obj_id}'
+        code_compiled = compile_code_cached(
+            code=(
+                f'def the_lone_poet(on, {code_obj_name}):\n'
+                f'    def held_on():\n'
+                f'        return isinstance(on, {code_obj_name})\n'
+                f'    return held_on()\n'
+            ),
+            code_filename='<of_arabie>',
+            code_cache_dir=code_cache_dir,
+        )
+        func_scope = {}
+        exec(code_compiled, func_scope)
+        func = func_scope['the_lone_poet']
+        assert func(1, int) is True
+        assert func('1', int) is False
+        assert code_obj_name in func.__code__.co_varnames
+        assert code_obj_name in func.__code__.co_cellvars
+    assert len(list((tmp_path / 'with_shadowy_hair').iterdir())) == 1
+
+    # ..................{ FAIL                               }..................
+    # Assert that this compiler raises the expected exception when passed a
+    # syntactically invalid code snippet.
+    with raises(SyntaxError):
+        compile_code_cached(
+            code='def held_on(his_way:\n',
+            code_filename='<till_through>',
+            code_cache_dir=code_cache_dir,
+        )
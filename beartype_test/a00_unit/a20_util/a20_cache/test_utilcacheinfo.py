@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype cache introspector unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.utilcacheinfo` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                             }....................
+def test_cache_info() -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcacheinfo.cache_info` getter.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import cache_info
+    from beartype.door import (
+        TypeHint,
+        is_bearable,
+    )
+    from beartype._util.cache.utilcacheinfo import BeartypeCacheInfo
+    from beartype._util.hint.utilhintget import get_hint_repr
+
+    # Fully-qualified names of caches exercised below.
+    TESTER_CACHE_NAME = (
+        'beartype.door._func.doorfunc.'
+        '_HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER'
+    )
+    WRAPPER_CACHE_NAME = 'beartype.door._cls.doormeta._HINT_TO_WRAPPER'
+
+    # Arbitrary type hint unlikely to have been previously cached.
+    hint = tuple[frozenset[bytes], ...]
+
+    # Statistics describing these caches *BEFORE* exercising these caches.
+    cache_name_to_info_old = cache_info()
+    tester_info_old = cache_name_to_info_old[TESTER_CACHE_NAME]
+    wrapper_info_old = cache_name_to_info_old[WRAPPER_CACHE_NAME]
+
+    # Exercise these caches with one miss followed by one hit each.
+    for _ in range(2):
+        assert is_bearable((frozenset((b'Ariel',)),), hint) is True
+        TypeHint(hint)
+
+    # Statistics describing these caches *AFTER* exercising these caches.
+    cache_name_to_info = cache_info()
+    assert all(
+        isinstance(cache_info_curr, BeartypeCacheInfo)
+        for cache_info_curr in cache_name_to_info.values()
+    )
+
+    # Assert the tester cache to be bounded and to have recorded this traffic.
+    tester_info = cache_name_to_info[TESTER_CACHE_NAME]
+    assert tester_info.maxsize is not None
+    assert tester_info.currsize >= 1
+    assert tester_info.hits >= tester_info_old.hits + 1
+    assert tester_info.misses >= tester_info_old.misses + 1
+    assert 0.0 < tester_info.hit_rate < 1.0
+    assert tester_info.nbytes > 0
+
+    # Assert the "TypeHint" cache to be unbounded and to have recorded this
+    # traffic.
+    wrapper_info = cache_name_to_info[WRAPPER_CACHE_NAME]
+    assert wrapper_info.maxsize is None
+    assert wrapper_info.hits >= wrapper_info_old.hits + 1
+    assert wrapper_info.misses >= wrapper_info_old.misses + 1
+
+    # Assert the forward reference proxy and configuration caches to be
+    # reported as plain dictionaries recording *NO* hits or misses.
+    for cache_name in (
+        'beartype._check.forward.reference._cls.fwdrefmeta.'
+        '_ref_proxy_to_resolved_hint',
+        'beartype._conf.confmain._beartype_conf_args_to_conf',
+    ):
+        cache_info_curr = cache_name_to_info[cache_name]
+        assert cache_info_curr.hits is None
+        assert cache_info_curr.misses is None
+        assert cache_info_curr.hit_rate is None
+
+    # Assert memoized callables to be reported under their qualified names.
+    get_hint_repr(hint)
+    get_hint_repr_info = cache_info()[
+        f'{get_hint_repr.__module__}.{get_hint_repr.__qualname__}']
+    assert get_hint_repr_info.currsize >= 1
+    assert get_hint_repr_info.hits is None
+    assert repr(get_hint_repr_info).startswith('BeartypeCacheInfo(')
+
+
+def test_cache_info_registries() -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcacheinfo.cache_info` getter
+    against caches created on demand and reported in aggregate.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+        cache_info,
+    )
+    from collections.abc import Callable
+
+    # Fully-qualified names of the registries of these caches.
+    MEMO_CACHES_NAME = 'beartype._check.code.codememo._check_memo_caches'
+    SIGNATURE_CACHES_NAME = (
+        'beartype._check.pep.pep484585.checkpep484585callable.'
+        '_callable_signature_caches'
+    )
+
+    # Statistics describing these caches *BEFORE* creating more such caches.
+    cache_name_to_info_old = cache_info()
+    memo_info_old = cache_name_to_info_old[MEMO_CACHES_NAME]
+    signature_info_old = cache_name_to_info_old[SIGNATURE_CACHES_NAME]
+
+    @beartype(conf=BeartypeConf(
+        strategy=BeartypeStrategy.On, is_check_memo=True))
+    def of_the_wide_world(and_wandered: tuple[bytes, ...]) -> int:
+        '''
+        Arbitrary callable memoizing successful type-checks of its parameter.
+        '''
+
+        return len(and_wandered)
+
+    @beartype(conf=BeartypeConf(is_check_callable_signature=True))
+    def through_the_dim(and_wilder: Callable[[bytes], int]) -> int:
+        '''
+        Arbitrary callable type-checking the signature of its parameter.
+        '''
+
+        return and_wilder(b'rocks')
+
+    # Exercise these caches.
+    assert of_the_wide_world((b'he', b'sought')) == 2
+    assert through_the_dim(len) == 5
+    assert through_the_dim(lambda spring_of_life: 1) == 1
+
+    # Statistics describing these caches *AFTER* creating more such caches.
+    cache_name_to_info = cache_info()
+    memo_info = cache_name_to_info[MEMO_CACHES_NAME]
+    signature_info = cache_name_to_info[SIGNATURE_CACHES_NAME]
+
+    # Assert that the memoization caches are reported in aggregate, recording
+    # neither hits nor misses.
+    assert memo_info.maxsize > memo_info_old.maxsize
+    assert memo_info.currsize >= 1
+    assert memo_info.nbytes > 0
+    assert memo_info.hits is None
+    assert memo_info.misses is None
+
+    # Assert that the callable signature caches are reported in aggregate,
+    # recording misses.
+    assert signature_info.maxsize > signature_info_old.maxsize
+    assert signature_info.currsize >= 1
+    assert signature_info.misses >= signature_info_old.misses + 1
+
+
+def test_cache_info_sizeof_broken() -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcacheinfo.cache_info` getter
+    against caches containing objects whose ``__sizeof__()`` dunder methods
+    raise exceptions *other* than :exc:`TypeError`, which the
+    :func:`sys.getsizeof` function propagates rather than sizing as its
+    default.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import cache_info
+    from beartype._util.cache.utilcachecall import callable_cached
+    from pytest import raises
+    from sys import getsizeof
+
+    class ThePoetsBlood(object):
+        '''
+        Arbitrary class whose ``__sizeof__()`` dunder method is broken.
+        '''
+
+        def __sizeof__(self) -> int:
+            raise ValueError('That image sleeps not in his heart.')
+
+    # Instance of this class.
+    that_image = ThePoetsBlood()
+
+    # Assert that sizing this instance with a default propagates this
+    # exception, validating the precondition of this test.
+    with raises(ValueError):
+        getsizeof(that_image, 0)
+
+    @callable_cached
+    def in_his_heart(sleeps_not: int) -> ThePoetsBlood:
+        '''
+        Arbitrary memoized callable returning this instance.
+        '''
+
+        return that_image
+
+    # Memoize this instance as the value returned by this callable.
+    assert in_his_heart(1) is that_image
+
+    # Statistics describing all caches, including this callable.
+    cache_name_to_info = cache_info()
+
+    # Assert that these statistics describe this callable, sizing this broken
+    # instance as zero bytes rather than raising this exception.
+    in_his_heart_info = cache_name_to_info[
+        f'{in_his_heart.__module__}.{in_his_heart.__qualname__}']
+    assert in_his_heart_info.currsize == 1
+    assert in_his_heart_info.nbytes > 0
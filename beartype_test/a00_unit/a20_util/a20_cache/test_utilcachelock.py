@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype coarse thread lock unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.utilcachelock` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                             }....................
+def test_call_beartype_locked() -> None:
+    '''
+    Test the
+    :func:`beartype._util.cache.utilcachelock.call_beartype_locked` function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache.utilcachelock import (
+        beartype_lock,
+        beartype_lock_state,
+        call_beartype_locked,
+    )
+    from pytest import raises
+    from threading import Thread
+
+    # Assert the active thread to *NOT* initially hold this lock.
+    assert beartype_lock_state.lock_depth == 0
+
+    def nest_locks(depth: int) -> int:
+        '''
+        Recursively nest the coarse beartype lock to the passed depth by
+        alternating between the functional and context manager APIs, returning
+        the lock depth observed at the innermost nesting.
+        '''
+
+        # If this is the innermost nesting, return the observed lock depth.
+        if not depth:
+            return beartype_lock_state.lock_depth
+
+        # Else, nest again. Neither API deadlocks on this non-reentrant lock.
+        with beartype_lock:
+            return call_beartype_locked(nest_locks, depth - 1)
+
+    # Assert that nesting this lock from the same thread does *NOT* deadlock.
+    assert nest_locks(3) > 0
+
+    # Assert the active thread to release this lock after nesting.
+    assert beartype_lock_state.lock_depth == 0
+
+    def raise_exception() -> None:
+        raise ValueError('Of some ill-wonted thing.')
+
+    # Assert that exceptions raised while holding this lock release this lock.
+    with raises(ValueError):
+        call_beartype_locked(raise_exception)
+    assert beartype_lock_state.lock_depth == 0
+
+    # List of the lock depths observed by a child thread below.
+    thread_lock_depths = []
+
+    def get_thread_lock_depth() -> None:
+        thread_lock_depths.append(beartype_lock_state.lock_depth)
+
+    # Assert that lock state is specific to each thread. Although the main
+    # thread holds this lock, a child thread does *NOT*.
+    with beartype_lock:
+        thread = Thread(target=get_thread_lock_depth)
+        thread.start()
+        thread.join()
+    assert thread_lock_depths == [0]
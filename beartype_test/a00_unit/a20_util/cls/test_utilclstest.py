@@ -118,3 +118,36 @@ def test_is_type_builtin_or_fake() -> None:
 
     # Assert this tester rejects an arbitrary non-builtin type.
     assert is_type_builtin_or_fake(Class) is False
+
+
+def test_is_type_final() -> None:
+    '''
+    Test the :func:`beartype._util.cls.utilclstest.is_type_final` tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cls.utilclstest import is_type_final
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_11
+    from beartype_test.a00_unit.data.data_type import Class
+    from types import FunctionType
+    from typing import final
+
+    # Final class decorated by the @typing.final decorator.
+    @final
+    class FinalClass(object): pass
+
+    # Assert this tester accepts C-based types prohibiting subclassing.
+    assert is_type_final(bool) is True
+    assert is_type_final(FunctionType) is True
+    assert is_type_final(type(None)) is True
+
+    # Assert this tester rejects subclassable types.
+    assert is_type_final(int) is False
+    assert is_type_final(object) is False
+    assert is_type_final(Class) is False
+
+    # If the active Python interpreter targets Python >= 3.11, the
+    # @typing.final decorator records finality. In this case, assert this
+    # tester accepts classes decorated by that decorator.
+    if IS_PYTHON_AT_LEAST_3_11:
+        assert is_type_final(FinalClass) is True
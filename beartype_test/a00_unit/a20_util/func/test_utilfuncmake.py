@@ -153,6 +153,32 @@ def to_strive_to_seek_to_find(and_not_to_yield: str) -> str:
     assert 'def to_strive_to_seek_to_find(' in func_cache_code
     assert 'return and_not_to_yield' in func_cache_code
 
+    # Two callables created from the same code snippet with different scopes,
+    # exercising the reuse of code objects compiled from identical snippets.
+    push_off, sitting_well = (
+        make_func(
+            func_name='the_sounding_furrows',
+            func_code='''
+def the_sounding_furrows(for_my_purpose_holds=for_my_purpose_holds) -> str:
+    return for_my_purpose_holds
+''',
+            func_locals={'for_my_purpose_holds': for_my_purpose_holds},
+            func_wrapped=func_wrapped,
+        )
+        for for_my_purpose_holds, func_wrapped in (
+            ('To sail beyond the sunset',
+             we_are_not_now_that_strength_which_in_old_days),
+            ('and the baths', func_labeller),
+        )
+    )
+
+    # Assert that these callables share the same bytecode but embed distinct
+    # filenames *AND* bind the default values passed by their own scopes.
+    assert push_off.__code__.co_code == sitting_well.__code__.co_code
+    assert push_off.__code__.co_filename != sitting_well.__code__.co_filename
+    assert push_off() == 'To sail beyond the sunset'
+    assert sitting_well() == 'and the baths'
+
     # ....................{ FAIL                           }....................
     # Assert that attempting to pass both the "func_label" and "func_labeller"
     # parameters raises the expected exception.
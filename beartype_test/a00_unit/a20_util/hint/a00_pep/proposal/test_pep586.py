@@ -104,3 +104,83 @@ def test_is_hint_pep586() -> None:
         with raises(BeartypeDecorHintPep586Exception):
             die_unless_hint_pep586(Literal[
                 26, "hello world", b"hello world", True, object(), _Color.RED])
+
+
+def test_is_hint_pep586_literals() -> None:
+    '''
+    Test the
+    :func:`beartype._util.hint.pep.proposal.pep586.is_hint_pep586_literals_enum`
+    and
+    :func:`beartype._util.hint.pep.proposal.pep586.is_hint_pep586_literals_hashable`
+    testers.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._util.hint.pep.proposal.pep586 import (
+        is_hint_pep586_literals_enum,
+        is_hint_pep586_literals_hashable,
+    )
+    from enum import (
+        Enum,
+        Flag,
+        IntEnum,
+    )
+
+    # ....................{ LOCALS                         }....................
+    class _Color(Enum):
+        '''
+        Arbitrary enumeration whose members are identity-comparable.
+        '''
+
+        RED = 0
+        BLUE = 1
+
+
+    class _Number(IntEnum):
+        '''
+        Arbitrary integer enumeration whose members are identity-comparable.
+        '''
+
+        ONE = 1
+
+
+    class _Permission(Flag):
+        '''
+        Arbitrary flag enumeration whose members are *not* identity-comparable.
+        '''
+
+        READ = 1
+
+
+    class _Shade(Enum):
+        '''
+        Arbitrary enumeration whose members are neither identity-comparable nor
+        hashable.
+        '''
+
+        GREY = 0
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, _Shade)
+
+        __hash__ = None  # type: ignore[assignment]
+
+    # ....................{ PASS                           }....................
+    # Assert the enumeration tester accepts identity-comparable members.
+    assert is_hint_pep586_literals_enum((_Color.RED, _Color.BLUE, _Number.ONE))
+
+    # Assert the hashable tester accepts hashable literal objects.
+    assert is_hint_pep586_literals_hashable(
+        (None, True, 42, b'bytes', 'str', _Color.RED))
+
+    # ....................{ FAIL                           }....................
+    # Assert the enumeration tester rejects the empty tuple, non-members, flag
+    # members, and members of enumerations defining custom equality.
+    assert is_hint_pep586_literals_enum(()) is False
+    assert is_hint_pep586_literals_enum((_Color.RED, 0)) is False
+    assert is_hint_pep586_literals_enum((_Permission.READ,)) is False
+    assert is_hint_pep586_literals_enum((_Shade.GREY,)) is False
+
+    # Assert the hashable tester rejects unhashable literal objects.
+    assert is_hint_pep586_literals_hashable((42, _Shade.GREY)) is False
@@ -87,3 +87,75 @@ def test_is_hint_pep589() -> None:
     # only two of the requisite three dunder attributes necessarily defined by
     # the "typing.TypedDict" superclass.
     assert is_hint_pep589(NonTypedDict) is False
+
+
+def test_get_hint_pep589_key_table(monkeypatch) -> None:
+    '''
+    Test the
+    :func:`beartype._util.hint.pep.proposal.pep589.get_hint_pep589_key_table`
+    getter.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        :mod:`pytest` fixture allowing various state associated with the active
+        Python process to be temporarily changed for the duration of this test.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._util.hint.pep.proposal.pep589 import (
+        get_hint_pep589_key_table)
+    from sys import modules as module_name_to_module
+    from types import ModuleType
+    from typing import ForwardRef
+
+    # ....................{ LOCALS                         }....................
+    # Arbitrary module declaring a typed dictionary annotated by both resolvable
+    # and unresolvable stringified forward references, registered with the
+    # standard module cache for the duration of this test.
+    module = ModuleType('the_wave_that_died')
+    monkeypatch.setitem(module_name_to_module, module.__name__, module)
+    exec(
+        'from typing import TypedDict\n'
+        'class ThouArtThePath(TypedDict):\n'
+        '    of_that: "str"\n'
+        '    unresting_sound: "TheDeathOfLove"\n'
+        '    the_wave: "list[TheRiverOfThyThoughts]"\n',
+        module.__dict__,
+    )
+    ThouArtThePath = module.ThouArtThePath
+
+    # ....................{ PASS                           }....................
+    # Assert this getter resolves each value type hint independently, such that
+    # unresolvable forward references fail to impact resolvable hints.
+    hint_keys_required, hint_key_hints = get_hint_pep589_key_table(
+        ThouArtThePath)
+    assert hint_keys_required == {'of_that', 'unresting_sound', 'the_wave'}
+    assert hint_key_hints == (
+        ('of_that', str),
+        # Assert this getter preserves unresolvable forward references to names
+        # as forward references relative to the module declaring this typed
+        # dictionary, deferring their resolution to call time.
+        (
+            'unresting_sound',
+            ForwardRef('TheDeathOfLove', module=module.__name__),
+        ),
+        # Assert this getter reduces unresolvable forward references to
+        # arbitrary expressions to the ignorable "object" superclass.
+        ('the_wave', object),
+    )
+
+    # Assert this getter avoids memoizing key tables reducing unresolvable
+    # forward references, instead resolving these references once resolvable.
+    module.TheDeathOfLove = bytes
+    module.TheRiverOfThyThoughts = int
+    assert get_hint_pep589_key_table(ThouArtThePath)[1] == (
+        ('of_that', str),
+        ('unresting_sound', bytes),
+        ('the_wave', list[int]),
+    )
+
+    # Assert this getter memoizes key tables resolving all forward references.
+    assert get_hint_pep589_key_table(ThouArtThePath) is (
+        get_hint_pep589_key_table(ThouArtThePath))
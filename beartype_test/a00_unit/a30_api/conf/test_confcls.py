@@ -61,16 +61,26 @@ def test_conf_dataclass() -> None:
     # * The unqualified basenames of and all public fields of this class.
     BEAR_CONF_REPR_SUBSTRS = (
         'BeartypeConf',
+        'check_budget_ns',
+        'check_yield_every',
         'claw_decor_place_func',
         'claw_decor_place_type',
         'claw_is_pep526',
         'claw_skip_package_names',
+        'code_cache_dir',
         'hint_overrides',
+        'is_check_callable_signature',
+        'is_check_memo',
         'is_color',
         'is_debug',
+        'is_lazy',
         'is_pep484_tower',
         'is_pep557_fields',
         'is_random',
+        'is_random_reiterable',
+        'random_seed',
+        'specialize_calls',
+        'union_reorder_calls',
         'strategy',
         'violation_door_type',
         'violation_param_type',
@@ -90,16 +100,26 @@ def test_conf_dataclass() -> None:
     # All possible keyword arguments initialized to non-default values with
     # which to instantiate a non-default beartype configuration.
     BEAR_CONF_NONDEFAULT_KWARGS = dict(
+        check_budget_ns=0xBEA2,
+        check_yield_every=0xBEA2,
         claw_decor_place_func=BeartypeDecorPlace.LAST,
         claw_decor_place_type=BeartypeDecorPlace.FIRST,
         claw_is_pep526=False,
         claw_skip_package_names=('Made_contrast_with', 'the_universe',),
+        code_cache_dir='Its_lone_and_dark_abode',
         hint_overrides=BEAR_HINT_OVERRIDES_NONEMPTY,
+        is_check_callable_signature=True,
+        is_check_memo=True,
         is_color=True,
         is_debug=True,
+        is_lazy=True,
         is_pep484_tower=True,
         is_pep557_fields=True,
         is_random=False,
+        is_random_reiterable=True,
+        random_seed=0xBEA2,
+        specialize_calls=0xBEA2,
+        union_reorder_calls=0xBEA2,
         strategy=BeartypeStrategy.Ologn,
         violation_door_type=RuntimeError,
         violation_param_type=TypeError,
@@ -174,18 +194,28 @@ def test_conf_dataclass() -> None:
 
     # ....................{ PASS ~ properties              }....................
     # Assert that the default configuration contains the expected fields.
+    assert BEAR_CONF_DEFAULT.check_budget_ns is None
+    assert BEAR_CONF_DEFAULT.check_yield_every is None
     assert BEAR_CONF_DEFAULT.claw_decor_place_func is (
         BeartypeDecorPlace.LAST_BEFORE_DECOR_HOSTILE)
     assert BEAR_CONF_DEFAULT.claw_decor_place_type is (
         BeartypeDecorPlace.LAST)
     assert BEAR_CONF_DEFAULT.claw_is_pep526 is True
     assert BEAR_CONF_DEFAULT.claw_skip_package_names == ()
+    assert BEAR_CONF_DEFAULT.code_cache_dir is None
     assert BEAR_CONF_DEFAULT.hint_overrides is FROZENDICT_EMPTY
+    assert BEAR_CONF_DEFAULT.is_check_callable_signature is False
+    assert BEAR_CONF_DEFAULT.is_check_memo is False
     assert BEAR_CONF_DEFAULT.is_color is None
     assert BEAR_CONF_DEFAULT.is_debug is False
+    assert BEAR_CONF_DEFAULT.is_lazy is False
     assert BEAR_CONF_DEFAULT.is_pep484_tower is False
     assert BEAR_CONF_DEFAULT.is_pep557_fields is False
     assert BEAR_CONF_DEFAULT.is_random is True
+    assert BEAR_CONF_DEFAULT.is_random_reiterable is False
+    assert BEAR_CONF_DEFAULT.random_seed is None
+    assert BEAR_CONF_DEFAULT.specialize_calls is None
+    assert BEAR_CONF_DEFAULT.union_reorder_calls is None
     assert BEAR_CONF_DEFAULT.strategy is BeartypeStrategy.O1
     assert BEAR_CONF_DEFAULT.violation_door_type is (
         BeartypeDoorHintViolation)
@@ -200,6 +230,8 @@ def test_conf_dataclass() -> None:
     assert BEAR_CONF_DEFAULT._is_warning_cls_on_decorator_exception_set is False
 
     # Assert that the non-default configuration contains the expected fields.
+    assert BEAR_CONF_NONDEFAULT.check_budget_ns == 0xBEA2
+    assert BEAR_CONF_NONDEFAULT.check_yield_every == 0xBEA2
     assert BEAR_CONF_NONDEFAULT.claw_decor_place_func is (
         BeartypeDecorPlace.LAST)
     assert BEAR_CONF_NONDEFAULT.claw_decor_place_type is (
@@ -207,13 +239,21 @@ def test_conf_dataclass() -> None:
     assert BEAR_CONF_NONDEFAULT.claw_is_pep526 is False
     assert BEAR_CONF_NONDEFAULT.claw_skip_package_names == (
         'Made_contrast_with', 'the_universe',)
+    assert BEAR_CONF_NONDEFAULT.code_cache_dir == 'Its_lone_and_dark_abode'
     assert BEAR_CONF_NONDEFAULT.hint_overrides == (
         BEAR_HINT_OVERRIDES_NONEMPTY | _hint_overrides_pep484_tower())
+    assert BEAR_CONF_NONDEFAULT.is_check_callable_signature is True
+    assert BEAR_CONF_NONDEFAULT.is_check_memo is True
     assert BEAR_CONF_NONDEFAULT.is_color is True
     assert BEAR_CONF_NONDEFAULT.is_debug is True
+    assert BEAR_CONF_NONDEFAULT.is_lazy is True
     assert BEAR_CONF_NONDEFAULT.is_pep484_tower is True
     assert BEAR_CONF_NONDEFAULT.is_pep557_fields is True
     assert BEAR_CONF_NONDEFAULT.is_random is False
+    assert BEAR_CONF_NONDEFAULT.is_random_reiterable is True
+    assert BEAR_CONF_NONDEFAULT.random_seed == 0xBEA2
+    assert BEAR_CONF_NONDEFAULT.specialize_calls == 0xBEA2
+    assert BEAR_CONF_NONDEFAULT.union_reorder_calls == 0xBEA2
     assert BEAR_CONF_NONDEFAULT.strategy is BeartypeStrategy.Ologn
     assert BEAR_CONF_NONDEFAULT.violation_door_type is RuntimeError
     assert BEAR_CONF_NONDEFAULT.violation_param_type is TypeError
@@ -300,6 +340,20 @@ def test_conf_dataclass() -> None:
     # ....................{ FAIL ~ raise                   }....................
     # Assert that instantiating a configuration with an invalid parameter raises
     # the expected exception.
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_budget_ns=(
+            'The lightning of the noontide ocean'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_budget_ns=True)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_budget_ns=0)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_yield_every=(
+            'Of the dark earth, and the bare caves of Thule,'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_yield_every=True)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_yield_every=0)
     with raises(BeartypeConfParamException):
         BeartypeConf(claw_decor_place_func=(
             "High 'mid the shifting domes of sheeted spray"))
@@ -309,6 +363,10 @@ def test_conf_dataclass() -> None:
     with raises(BeartypeConfParamException):
         BeartypeConf(claw_is_pep526=(
             'The fountains mingle with the river'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(code_cache_dir=b'Hung their gray heads')
+    with raises(BeartypeConfParamException):
+        BeartypeConf(code_cache_dir='')
     with raises(BeartypeConfParamException):
         BeartypeConf(claw_skip_package_names=('A pine,', 'Rock-rooted,'))
     with raises(BeartypeConfParamException):
@@ -326,12 +384,20 @@ def test_conf_dataclass() -> None:
     with raises(BeartypeConfParamException):
         BeartypeConf(hint_overrides=(
             'Wildered, and wan, and panting, she returned.'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_check_callable_signature=(
+            'Rolled round the mountains, and the mighty sea'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_check_memo=(
+            'Of that serene and solemn atmosphere,'))
     with raises(BeartypeConfParamException):
         BeartypeConf(is_color=(
             'And many sounds, and much of life and death.'))
     with raises(BeartypeConfParamException):
         BeartypeConf(is_debug=(
             'Interpret, or make felt, or deeply feel.'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_lazy='Not for the wanderer, but for the wise')
     with raises(BeartypeConfParamException):
         BeartypeConf(is_pep484_tower=(
             'In the calm darkness of the moonless nights,'))
@@ -341,9 +407,33 @@ def test_conf_dataclass() -> None:
     with raises(BeartypeConfParamException):
         BeartypeConf(is_random=(
             'Their wisdom long since fled.—Two wings this orb'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_random_reiterable=(
+            'Of endless wanderings round the sun were strung;'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(random_seed=(
+            'Possess for flight, and all, with music sweet,'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(random_seed=True)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(specialize_calls=(
+            'Of all that is most beauteous, imaged there'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(specialize_calls=False)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(specialize_calls=-1)
     with raises(BeartypeConfParamException):
         BeartypeConf(strategy=(
             'By all, but which the wise, and great, and good'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_calls=(
+            'Interpret, or make felt, or deeply feel.'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_lazy='Not for the wanderer, but for the wise')
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_calls=True)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_calls=0)
     with raises(BeartypeConfParamException):
         BeartypeConf(violation_door_type=(
             'A vision to the sleep of him who spurned'))
@@ -389,6 +479,10 @@ def test_conf_dataclass() -> None:
 
     # Assert that attempting to modify any public read-only property of this
     # dataclass raises the expected exception.
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.check_budget_ns = 0xBEA2
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.check_yield_every = 0xBEA2
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.claw_decor_place_func = (
             BeartypeDecorPlace.FIRST)
@@ -399,18 +493,34 @@ def test_conf_dataclass() -> None:
         BEAR_CONF_DEFAULT.claw_is_pep526 = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.claw_skip_package_names = ('q','w','e')
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.code_cache_dir = 'Its_lone_and_dark_abode'
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.hint_overrides = {}
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.is_check_callable_signature = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.is_check_memo = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_color = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_debug = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.is_lazy = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_pep484_tower = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_pep557_fields = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_random = False
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.is_random_reiterable = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.random_seed = 0xBEA2
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.specialize_calls = 0xBEA2
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.union_reorder_calls = 0xBEA2
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.strategy = BeartypeStrategy.O0
     with raises(AttributeError):
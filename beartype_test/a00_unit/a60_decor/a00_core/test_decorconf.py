@@ -73,6 +73,298 @@ def test_decor_conf() -> None:
         beartype(conf='Within the daedal earth; lightning, and rain,')
 
 # ....................{ TESTS ~ bool                       }....................
+def test_decor_conf_code_cache_dir(tmp_path) -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``code_cache_dir`` parameter.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Abstract path encapsulating a temporary directory unique to this unit
+        test, created in the base temporary directory.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ LOCALS                             }..................
+    # Beartype configuration persisting code objects to a temporary directory.
+    conf = BeartypeConf(code_cache_dir=str(tmp_path))
+
+    # ..................{ CALLABLES                          }..................
+    def the_fountains_mingle(with_the_river: int) -> int:
+        '''
+        Arbitrary callable to be repeatedly decorated below.
+        '''
+
+        return with_the_river + 1
+
+    # ..................{ PASS                               }..................
+    # Wrappers type-checking this callable, where the first wrapper compiles
+    # and persists its code object *AND* the second wrapper loads that object.
+    and_the_rivers = beartype(conf=conf)(the_fountains_mingle)
+    with_the_ocean = beartype(conf=conf)(the_fountains_mingle)
+
+    # Assert that exactly one code object was persisted.
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Assert that both wrappers behave as expected and embed process-specific
+    # filenames in their code objects.
+    for func_checked in (and_the_rivers, with_the_ocean):
+        assert func_checked(1) == 2
+        with raises_uncached(BeartypeCallHintParamViolation):
+            func_checked('The winds of heaven mix for ever')
+        assert 'the_fountains_mingle' in func_checked.__code__.co_filename
+
+
+def test_decor_conf_is_check_callable_signature() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``is_check_callable_signature`` parameter.
+
+    This unit test validates that :mod:`beartype` correctly type-checks the
+    signatures of passed callables against callable type hints *and* memoizes
+    the results of doing so against the code objects of those callables.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import Callable
+    from typing import Optional
+
+    # ..................{ LOCALS                             }..................
+    # Beartype configuration type-checking the signatures of callables.
+    conf = BeartypeConf(is_check_callable_signature=True)
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=conf)
+    def the_everlasting_universe(of_things: Callable[[int, str], bool]) -> (
+        Callable[[int, str], bool]):
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        type-checking the signatures of passed callables, returning the passed
+        callable as is.
+        '''
+
+        # Return this callable as is.
+        return of_things
+
+
+    @beartype
+    def flows_through_the_mind(and_rolls: Callable[[int, str], bool]) -> (
+        Callable[[int, str], bool]):
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        *not* type-checking the signatures of passed callables, returning the
+        passed callable as is.
+        '''
+
+        # Return this callable as is.
+        return and_rolls
+
+
+    def its_rapid_waves(now_dark: int, now_glittering: str) -> bool:
+        '''
+        Arbitrary callable whose signature is compatible with the callable type
+        hint annotating the above callables.
+        '''
+
+        return bool(now_dark)
+
+
+    def now_reflecting_gloom(now_lending: int) -> bool:
+        '''
+        Arbitrary callable accepting too few parameters.
+        '''
+
+        return bool(now_lending)
+
+
+    def now_lending_splendour(where_from: str, secret_springs: str) -> bool:
+        '''
+        Arbitrary callable whose first parameter is annotated by a hint that is
+        *not* a superhint of the corresponding parameter hint.
+        '''
+
+        return bool(where_from)
+
+
+    def the_source_of_human_thought(
+        its_tribute: int, brings: str) -> bytes:
+        '''
+        Arbitrary callable whose return is annotated by a hint that is *not* a
+        subhint of the return hint.
+        '''
+
+        return b'Of waters'
+
+
+    def with_a_sound(
+        but_half: int, its_own: str, *, of_waters: bool) -> bool:
+        '''
+        Arbitrary callable requiring a keyword-only parameter.
+        '''
+
+        return of_waters
+
+
+    class SuchAsAFeebleBrook(object):
+        '''
+        Arbitrary class defining a method whose signature is compatible with the
+        callable type hint annotating the above callables *after* binding.
+        '''
+
+        def will_oft_assume(
+            self, in_the_wild_woods: Optional[int], *args: object) -> bool:
+            return True
+
+    # ..................{ PASS                               }..................
+    # Assert that the former callable accepts callables whose signatures are
+    # compatible with this hint *OR* are not efficiently introspectable, both
+    # on the first call (inspecting these signatures) and subsequent calls
+    # (memoized).
+    for _ in range(2):
+        assert the_everlasting_universe(its_rapid_waves) is its_rapid_waves
+        assert the_everlasting_universe(
+            lambda among_the_mountains, lone: True) is not None
+        assert the_everlasting_universe(
+            SuchAsAFeebleBrook().will_oft_assume) is not None
+        assert the_everlasting_universe(max) is max
+
+    # Assert that the latter callable accepts callables whose signatures are
+    # incompatible with this hint.
+    assert flows_through_the_mind(now_reflecting_gloom) is now_reflecting_gloom
+
+    # ..................{ FAIL                               }..................
+    # Assert that the former callable rejects callables whose signatures are
+    # incompatible with this hint, both on the first call and subsequent calls
+    # (memoized).
+    for _ in range(2):
+        for func_bad in (
+            now_reflecting_gloom,
+            now_lending_splendour,
+            the_source_of_human_thought,
+            with_a_sound,
+        ):
+            with raises_uncached(BeartypeCallHintParamViolation):
+                the_everlasting_universe(func_bad)
+
+    # Assert that the former callable rejects uncallable objects.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_everlasting_universe('Where waterfalls around it leap for ever')
+
+
+def test_decor_conf_is_check_memo() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``is_check_memo`` parameter under the
+    **linear-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.On`).
+
+    This unit test validates that :mod:`beartype` correctly memoizes successful
+    type-checks of deeply immutable containers *without* memoizing either
+    unsuccessful type-checks *or* type-checks of mutable containers.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype._util.cache.map.utilmaplru import CacheLruStrong
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ LOCALS                             }..................
+    # Beartype configuration enabling memoization under linear-time checking.
+    conf = BeartypeConf(strategy=BeartypeStrategy.On, is_check_memo=True)
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=conf)
+    def the_awful_shadow(
+        of_some_unseen_power: tuple[frozenset[int], ...]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        memoizing successful type-checks of deeply immutable containers.
+        '''
+
+        # Return an arbitrary integer derived from this parameter.
+        return len(of_some_unseen_power)
+
+
+    @beartype(conf=conf)
+    def floats_though_unseen(amongst_us: tuple[list[int], ...]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        that *cannot* memoize type-checks of mutable containers nested in
+        immutable containers.
+        '''
+
+        # Return an arbitrary integer derived from this parameter.
+        return len(amongst_us)
+
+    # ..................{ PASS                               }..................
+    # Arbitrary deeply immutable container satisfying the former callable.
+    visiting = (frozenset((1, 2)), frozenset((3,)))
+
+    # Assert that the former callable accepts this container both on the first
+    # call (performing a type-check) and subsequent calls (memoized).
+    assert the_awful_shadow(visiting) == 2
+    assert the_awful_shadow(visiting) == 2
+
+    # Memoization caches passed as hidden parameters to these wrappers.
+    the_awful_shadow_memos = [
+        func_default
+        for func_default in the_awful_shadow.__kwdefaults__.values()
+        if isinstance(func_default, CacheLruStrong)
+    ]
+    floats_though_unseen_memos = [
+        func_default
+        for func_default in floats_though_unseen.__kwdefaults__.values()
+        if isinstance(func_default, CacheLruStrong)
+    ]
+
+    # Assert that the former wrapper memoized this container.
+    assert len(the_awful_shadow_memos) == 1
+    assert visiting in the_awful_shadow_memos[0].values()
+
+    # Assert that the latter wrapper memoizes nothing.
+    assert not floats_though_unseen_memos
+
+    # Arbitrary immutable container of mutable containers satisfying the latter
+    # callable.
+    this_various_world = ([1, 2], [3])
+    assert floats_though_unseen(this_various_world) == 2
+
+    # ..................{ FAIL                               }..................
+    # Assert that the former callable rejects an invalid container, both on the
+    # first call and subsequent calls (i.e., violations are *NOT* memoized).
+    for _ in range(2):
+        with raises_uncached(BeartypeCallHintParamViolation):
+            the_awful_shadow((frozenset((1,)), frozenset(('inconstant',))))
+
+    # Assert that the latter callable rejects a previously valid container
+    # subsequently mutated to be invalid (i.e., type-checks of containers whose
+    # validity is mutable are *NOT* memoized).
+    this_various_world[1].append('with an inconstant wing')
+    with raises_uncached(BeartypeCallHintParamViolation):
+        floats_though_unseen(this_various_world)
+
+
 def test_decor_conf_is_debug(capsys) -> None:
     '''
     Test the :func:`beartype.beartype` decorator passed the optional ``conf``
@@ -156,16 +448,455 @@ def test_decor_conf_is_debug(capsys) -> None:
     # print(f'code_lines: {code_lines}\nstdout_lines: {stdout_lines}')
     assert len(code_lines) == len(stdout_lines)
 
-    # For each printed and original line of source code underlying the
-    # _earthquake() function...
-    for code_line, stdout_line in zip(code_lines, stdout_lines):
-        # Assert that this original line of source code is a substring of this
-        # printed line of source code -- which contains additional:
-        # * Prefixing substrings (e.g., line numbers).
-        # * Suffixing substrings (e.g., diagnostic comments).
-        assert code_line in stdout_line
+    # For each printed and original line of source code underlying the
+    # _earthquake() function...
+    for code_line, stdout_line in zip(code_lines, stdout_lines):
+        # Assert that this original line of source code is a substring of this
+        # printed line of source code -- which contains additional:
+        # * Prefixing substrings (e.g., line numbers).
+        # * Suffixing substrings (e.g., diagnostic comments).
+        assert code_line in stdout_line
+
+
+def test_decor_conf_is_lazy() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``is_lazy`` parameter.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeDecorHintNonpepException,
+    )
+    from beartype._util.bear.utilbearfunc import is_func_beartyped
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import Iterator
+    from inspect import (
+        iscoroutinefunction,
+        isgeneratorfunction,
+        signature,
+    )
+    from pytest import (
+        raises,
+        warns,
+    )
+    from warnings import (
+        catch_warnings,
+        simplefilter,
+    )
+
+    # ..................{ LOCALS                             }..................
+    # @beartype decorator enabling lazy decoration.
+    lazybeartype = beartype(conf=BeartypeConf(is_lazy=True))
+
+    # ..................{ CALLABLES                          }..................
+    @lazybeartype
+    def the_wilderness(has_a_mysterious: int) -> int:
+        '''
+        Arbitrary callable lazily decorated by :func:`beartype.beartype`.
+        '''
+
+        return has_a_mysterious + 1
+
+    @lazybeartype
+    def tongue_which_teaches(awful_doubt: 42) -> None:
+        '''
+        Arbitrary callable annotated by an unsupported type hint lazily
+        decorated by :func:`beartype.beartype`.
+        '''
+
+        pass
+
+    @lazybeartype
+    async def or_faith_so_mild(so_solemn: str) -> str:
+        '''
+        Arbitrary coroutine factory lazily decorated by
+        :func:`beartype.beartype`.
+        '''
+
+        return so_solemn
+
+    @lazybeartype
+    def so_simple(so_serene: str) -> Iterator[str]:
+        '''
+        Arbitrary synchronous generator factory lazily decorated by
+        :func:`beartype.beartype`.
+        '''
+
+        yield so_serene
+
+    # ..................{ CLASSES                            }..................
+    @lazybeartype
+    class SoSereneThatMan(object):
+        '''
+        Arbitrary class lazily decorated by :func:`beartype.beartype`.
+        '''
+
+        def but_for_such_faith(self, with_nature: str) -> str:
+            return with_nature + ' reconciled'
+
+    # Trampoline decorating the method declared by this class.
+    but_for_such_faith_lazy = SoSereneThatMan.__dict__['but_for_such_faith']
+
+    # ..................{ PASS                               }..................
+    # Assert that this trampoline preserves the metadata of this callable.
+    assert is_func_beartyped(the_wilderness)
+    assert the_wilderness.__name__ == 'the_wilderness'
+    assert str(signature(the_wilderness)) == '(has_a_mysterious: int) -> int'
+
+    # Assert that this trampoline defers to a type-checking wrapper.
+    assert the_wilderness(1) == 2
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_wilderness('Thou hast a voice, great Mountain')
+
+    # Assert that coroutine factories are decorated eagerly and thus remain
+    # coroutine factories.
+    assert iscoroutinefunction(or_faith_so_mild)
+
+    # Assert that synchronous generator factories are decorated eagerly and thus
+    # remain synchronous generator factories.
+    assert isgeneratorfunction(so_simple)
+    assert list(so_simple('that man')) == ['that man']
+    with raises_uncached(BeartypeCallHintParamViolation):
+        next(so_simple(b'may be'))
+
+    # Assert that calling this method replaces this trampoline on this class
+    # with a type-checking wrapper.
+    assert SoSereneThatMan().but_for_such_faith('with') == 'with reconciled'
+    assert SoSereneThatMan.__dict__['but_for_such_faith'] is not (
+        but_for_such_faith_lazy)
+    with raises_uncached(BeartypeCallHintParamViolation):
+        SoSereneThatMan().but_for_such_faith(b'to repeal large codes')
+
+    # Assert that exceptions raised on generating type-checking wrappers are
+    # coerced into warnings on the first call to the decorated callable under a
+    # configuration requesting that decoration emit non-fatal warnings, which
+    # then permanently defers to the undecorated callable.
+    @beartype(conf=BeartypeConf(
+        is_lazy=True, warning_cls_on_decorator_exception=UserWarning))
+    def so_solemn_so_serene(that_man: 'NoSuchThing[int') -> str:
+        '''
+        Arbitrary callable annotated by an invalid stringified type hint
+        lazily decorated by :func:`beartype.beartype` emitting non-fatal
+        warnings.
+        '''
+
+        return that_man
+
+    with warns(UserWarning):
+        assert so_solemn_so_serene('may be') == 'may be'
+    with catch_warnings():
+        simplefilter('error')
+        assert so_solemn_so_serene(b'in such faith') == b'in such faith'
+
+    # ..................{ FAIL                               }..................
+    # Assert that exceptions raised on generating type-checking wrappers are
+    # deferred until the first call to the decorated callable *AND* re-raised
+    # on each subsequent call.
+    for _ in range(2):
+        with raises(BeartypeDecorHintNonpepException):
+            tongue_which_teaches(42)
+
+# ....................{ TESTS ~ int                        }....................
+def test_decor_conf_check_budget_ns() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``check_budget_ns`` parameter under the
+    **linear-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.On`).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    type-checks that exhaustively type-check all container items when their
+    time budgets suffice *and* silently halt when their time budgets do not.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+        get_check_budget_exceeded_count,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(
+        strategy=BeartypeStrategy.On, check_budget_ns=10**10))
+    def the_wilderness(has_a_mysterious_tongue: list[list[int]]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling linear-time type-checking under a time budget (ten seconds)
+        sufficiently generous to exhaustively type-check all items.
+        '''
+
+        # Return an arbitrary integer derived from this parameter.
+        return len(has_a_mysterious_tongue)
+
+
+    @beartype(conf=BeartypeConf(
+        strategy=BeartypeStrategy.On, check_budget_ns=1))
+    def which_teaches(awful_doubt: list[list[int]]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling linear-time type-checking under a time budget (one nanosecond)
+        guaranteed to be exhausted before type-checking any items.
+        '''
+
+        # Return an arbitrary integer derived from this parameter.
+        return len(awful_doubt)
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary nested list whose items *ALL* satisfy the above hints except
+    # the last item of the last nested list.
+    or_faith_so_mild = [[0]*32 for _ in range(32)]
+    or_faith_so_mild[-1][-1] = 'Or faith so mild, so solemn, so serene,'
+
+    # ..................{ PASS                               }..................
+    # Assert that these callables accept valid nested containers.
+    assert the_wilderness([[1, 2], [3]]) == 2
+    assert which_teaches([[1, 2], [3]]) == 2
+
+    # Number of type-checks that have exhausted their time budgets *BEFORE*
+    # calling the latter callable below.
+    budget_exceeded_count_old = get_check_budget_exceeded_count()
+
+    # Assert that the latter callable silently accepts an invalid nested
+    # container, whose only invalid item the time budget of that callable
+    # prevents that callable from type-checking.
+    assert which_teaches(or_faith_so_mild) == 32
+
+    # Assert that exactly one type-check exhausted its time budget above.
+    assert get_check_budget_exceeded_count() == budget_exceeded_count_old + 1
+
+    # ..................{ FAIL                               }..................
+    # Assert that the former callable rejects the same invalid nested container
+    # by raising the expected type-checking violation.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_wilderness(or_faith_so_mild)
+
+
+# ....................{ TESTS ~ strategy                   }....................
+def test_decor_conf_union_reorder_calls() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``union_reorder_calls`` parameter.
+
+    This unit test validates that :mod:`beartype` correctly regenerates
+    type-checking wrappers with union child hints reordered after the
+    configured number of satisfied child hints *and* that those wrappers
+    type-check identically before and after that regeneration.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.door import is_bearable
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ LOCALS                             }..................
+    # Beartype configuration reordering union child hints after three
+    # satisfied child hints.
+    conf = BeartypeConf(union_reorder_calls=3)
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=conf)
+    def the_everlasting_universe(
+        of_things: int | list[str] | None) -> int | list[str] | None:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        reordering union child hints.
+        '''
+
+        # Return this parameter as is.
+        return of_things
+
+    # ..................{ PASS                               }..................
+    # Code object of this wrapper *BEFORE* reordering.
+    flows_through_the_mind = the_everlasting_universe.__code__
+
+    # Assert that this wrapper accepts objects satisfying the last PEP-compliant
+    # child hint of this union enough times to reorder this union.
+    for _ in range(3):
+        assert the_everlasting_universe(['rolls its rapid waves']) == [
+            'rolls its rapid waves']
+
+    # Assert that this wrapper was regenerated with a new code object.
+    assert the_everlasting_universe.__code__ is not flows_through_the_mind
+
+    # Assert that this wrapper still accepts objects satisfying each child
+    # hint of this union.
+    assert the_everlasting_universe(42) == 42
+    assert the_everlasting_universe(None) is None
+    assert the_everlasting_universe(['Now dark']) == ['Now dark']
+
+    # Assert that a statement-level type-checker similarly reordering union
+    # child hints returns the expected booleans before and after reordering.
+    for _ in range(4):
+        assert is_bearable(['now glittering'], list[str] | int, conf=conf)
+    assert is_bearable(42, list[str] | int, conf=conf) is True
+    assert is_bearable(b'now reflecting gloom', list[str] | int, conf=conf) is (
+        False)
+
+    # ..................{ FAIL                               }..................
+    # Assert that this wrapper still rejects objects satisfying no child hint of
+    # this union by raising the expected violation.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_everlasting_universe([b'Now lending splendour'])
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_everlasting_universe(0.5)
+
+
+def test_decor_conf_union_reorder_calls_pith() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``union_reorder_calls`` parameter with respect
+    to multiple parameters annotated by the same union.
+
+    This unit test validates that :mod:`beartype` profiles and reorders the
+    child hints of the same union annotating different parameters of the same
+    callable independently.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.vale import Is
+    from typing import Annotated
+
+    # ..................{ LOCALS                             }..................
+    # List of the labels of all child hints of the union defined below in the
+    # order these child hints were type-checked.
+    hint_childs_checked = []
+
+    # Union of two child hints, each appending its label to this list when
+    # type-checked.
+    hint_union = (
+        Annotated[object, Is[lambda obj: bool(
+            hint_childs_checked.append('str') or isinstance(obj, str))]] |
+        Annotated[object, Is[lambda obj: bool(
+            hint_childs_checked.append('list') or isinstance(obj, list))]]
+    )
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(union_reorder_calls=6))
+    def down_the_ravine(of_arve: hint_union, power_in_likeness: hint_union):
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        reordering the child hints of the same union annotating two parameters.
+        '''
+
+        # Return these parameters as is.
+        return (of_arve, power_in_likeness)
+
+    # ..................{ PASS                               }..................
+    # Pass the first parameter only strings and the second parameter only lists
+    # enough times to reorder this union.
+    for _ in range(3):
+        down_the_ravine('Thus thou, Ravine of Arve', ['dark, deep Ravine'])
+
+    # Assert that the regenerated wrapper type-checks the first parameter
+    # against the string child hint first *AND* the second parameter against
+    # the list child hint first.
+    hint_childs_checked.clear()
+    down_the_ravine('Thou many-coloured,', ['many-voiced vale'])
+    assert hint_childs_checked == ['str', 'list']
+
+
+def test_decor_conf_specialize_calls() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``specialize_calls`` parameter.
+
+    This unit test validates that :mod:`beartype` correctly regenerates
+    type-checking wrappers specialized to observed types after the configured
+    number of calls *and* that those wrappers type-check identically before and
+    after that regeneration, including when also reordering union child hints.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeCallHintReturnViolation,
+    )
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import Sequence
+
+    # ..................{ CLASSES                            }..................
+    class TheLoneChair(str):
+        '''
+        Arbitrary subclass of a builtin type, whose instances fail the guards
+        specialized to that type and thus fall back to the original type-checks.
+        '''
+
+        pass
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(specialize_calls=3, union_reorder_calls=3))
+    def the_lone_chair(
+        of_a_mind: int | str | None,
+        which_passively: Sequence,
+        now_renders: int | list[str],
+    ) -> int | bytes:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        both specializing type-checks and reordering union child hints.
+        '''
+
+        # Return either the first item of this sequence if non-empty *OR*
+        # arbitrary bytes otherwise.
+        return which_passively[0] if which_passively else b'and receives'
+
+    # ..................{ PASS                               }..................
+    # Code object of this wrapper *BEFORE* specialization.
+    fast_influencings = the_lone_chair.__code__
+
+    # Assert that this wrapper accepts monomorphic parameters enough times to
+    # specialize this wrapper.
+    for _ in range(3):
+        assert the_lone_chair('Rolling', (), ['like']) == b'and receives'
+
+    # Assert that this wrapper was regenerated with a new code object.
+    assert the_lone_chair.__code__ is not fast_influencings
+
+    # Assert that this wrapper still accepts parameters satisfying these hints
+    # but failing the guards specialized to the observed types.
+    assert the_lone_chair(42, [42], 0) == 42
+    assert the_lone_chair(None, b'', []) == b'and receives'
+    assert the_lone_chair(TheLoneChair('Holding an unremitting'), (), 1) == (
+        b'and receives')
+
+    # ..................{ FAIL                               }..................
+    # Assert that this wrapper still rejects parameters and returns violating
+    # these hints by raising the expected violations.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_lone_chair(b'interchange', (), 0)
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_lone_chair('With the clear universe', {'of things'}, 0)
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_lone_chair('around', (), [b'Mont Blanc'])
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        the_lone_chair('My own, my human mind', (0.5,), 0)
+
 
-# ....................{ TESTS ~ strategy                   }....................
 def test_decor_conf_strategy_O0() -> None:
     '''
     Test the :func:`beartype.beartype` decorator passed the optional ``conf``
@@ -383,6 +1114,580 @@ def test_decor_conf_strategy_O1_nonrandom() -> None:
         with raises_uncached(BeartypeCallHintParamViolation):
             possessed_for_glory(the_gods_approach, the_dazzling_globe)
 
+
+def test_decor_conf_strategy_O1_reiterable() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter retaining the **default constant-time strategy** (i.e.,
+    :attr:`beartype.BeartypeStrategy.O1`) with respect to **reiterables** (i.e.,
+    collections that are *not* sequences, including sets and mappings).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    non-deterministic type-checks eventually type-checking *all* items (rather
+    than merely the first item) of reiterables across repeated calls if and only
+    if the opt-in :attr:`beartype.BeartypeConf.is_random_reiterable` option is
+    enabled.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary beartype configuration enabling pseudo-random selection of
+    # reiterable items and seeding the pseudo-random number generator selecting
+    # those items, rendering this test deterministic.
+    conf = BeartypeConf(is_random_reiterable=True, random_seed=0xB0A7)
+
+    # Arbitrary set and dictionary such that only the last item violates the
+    # type hints annotating the callables below. The length of each exceeds the
+    # number of leading items that @beartype preferentially selects from,
+    # exercising the amortized selection of items from the remainder.
+    the_lone_and_level_sands = set(range(127))
+    the_lone_and_level_sands.add('Round the decay')
+    stretch_far_away = dict.fromkeys(range(127), 'Of that colossal wreck,')
+    stretch_far_away[127] = b'boundless and bare'
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=conf)
+    def of_that_colossal_wreck(boundless_and_bare: set[int]) -> int:
+        '''
+        Arbitrary callable type-checking a set.
+        '''
+
+        return len(boundless_and_bare)
+
+    @beartype(conf=conf)
+    def the_lone_and_level(sands_stretch: dict[int, str]) -> int:
+        '''
+        Arbitrary callable type-checking a dictionary.
+        '''
+
+        return len(sands_stretch)
+
+    @beartype
+    def nothing_beside_remains(round_the_decay: set[int]) -> int:
+        '''
+        Arbitrary callable type-checking a set under the default configuration.
+        '''
+
+        return len(round_the_decay)
+
+    # ..................{ PASS                               }..................
+    # Assert that repeatedly calling a callable decorated by the default
+    # configuration type-checks only the first item of this set and thus never
+    # raises a type-checking violation.
+    for _ in range(1000):
+        assert nothing_beside_remains(the_lone_and_level_sands) == 128
+
+    # ..................{ FAIL                               }..................
+    # For each such callable and reiterable...
+    for func, pith in (
+        (of_that_colossal_wreck, the_lone_and_level_sands),
+        (the_lone_and_level, stretch_far_away),
+    ):
+        # Assert that repeatedly calling this callable eventually raises the
+        # expected type-checking violation, where the number of calls is chosen
+        # to render the probability of never type-checking the last item of
+        # this reiterable vanishingly small.
+        with raises(BeartypeCallHintParamViolation):
+            for _ in range(1000000):
+                func(pith)
+
+
+def test_decor_conf_strategy_O1_random_seed() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``random_seed`` parameter while still
+    retaining the **default constant-time strategy** (i.e.,
+    :attr:`beartype.BeartypeStrategy.O1`).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    non-deterministic type-checks that are nonetheless reproducible (i.e.,
+    select the same sequence of container items across runs) for this use case.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from random import Random
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary seed passed to *NO* other beartype configuration across this
+    # test suite, guaranteeing the private generator seeded by this seed to
+    # remain in its initial state on the first call to the callable below.
+    RANDOM_SEED = 0xFAC3D0
+
+    # Pseudo-random number generator seeded by the same seed, mirroring the
+    # private generator seeded by @beartype below.
+    random_mirror = Random(RANDOM_SEED)
+
+    # Arbitrary pure-Python non-empty sequence containing two or more items
+    # such that only the items at odd indices *VIOLATE* the type hint
+    # annotating the callable below.
+    the_thunder_and_the_sun = [
+        'To the sound of the thunder and the sun,',
+        b'That roar and shine beyond the ocean-main,',
+        'A voice went forth from the deep silence won',
+        b'By the long watches of the Titan train;',
+        'And the great seasons wheeled their course again',
+    ]
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(random_seed=RANDOM_SEED))
+    def and_made_reply(an_answer_from_the_deep: list[str]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling seeded constant-time type-checking.
+        '''
+
+        # Trivialize this one-liner to the max, Captain!
+        return len(an_answer_from_the_deep)
+
+    # ..................{ PASS ~ FAIL                        }..................
+    # For a sufficiently large number of iterations, where "sufficiently large"
+    # is arbitrarily chosen so as to (hopefully) exercise both valid and invalid
+    # items of the above sequence...
+    for _ in range(42):
+        # 0-based index of the item of this sequence that this callable is
+        # expected to type-check on this call, predicted by this mirror.
+        item_index = random_mirror.getrandbits(32) % len(
+            the_thunder_and_the_sun)
+
+        # Tuple of the exception types expected to be raised by this call.
+        exception_types = (
+            (BeartypeCallHintParamViolation,) if item_index % 2 else ())
+
+        # Attempt to call this callable. If this call raises an exception not
+        # expected to be raised, this exception is implicitly re-raised.
+        try:
+            and_made_reply(the_thunder_and_the_sun)
+        # If this call raised an expected exception, silently reduce to a noop.
+        except exception_types:
+            pass
+        # Else, this call raised *NO* exception. In this case, assert that this
+        # call was *NOT* expected to raise an exception.
+        else:
+            assert not exception_types
+
+
+def test_decor_conf_strategy_Ok() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **amortized full-coverage strategy** (i.e.,
+    :attr:`beartype.BeartypeStrategy.Ok`).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    type-checks type-checking the next slice of each sequence on each call to
+    each type-checking wrapper, each of which maintains its own cursor.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype._data.check.code.datacodelen import SEQUENCE_CURSOR_SLICE_LEN
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary list of three strings *SATISFYING* the hints annotating the
+    # callables defined below.
+    the_sun = [
+        'The sun, the swift, the ever-living sun,',
+        'Rolls his swift course from out the eastern sky,',
+        'Nor waits for thee; no living thing may run',
+    ]
+
+    # Arbitrary list of strings such that *ONLY* the last item *VIOLATES* these
+    # hints, where this list is two slices long plus one item.
+    the_stars = the_sun * SEQUENCE_CURSOR_SLICE_LEN
+    the_stars[2 * SEQUENCE_CURSOR_SLICE_LEN:] = [
+        b'The stars that roll in everlasting skies']
+
+    # Arbitrary list shorter than a slice such that *ONLY* the last item
+    # *VIOLATES* these hints.
+    the_moon = the_sun.copy()
+    the_moon[-1] = b'The moon that walks in silver majesty'
+
+    # ..................{ LOCALS ~ callables                 }..................
+    @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.Ok))
+    def the_swift(ever_living: list[str]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling amortized full-coverage type-checking.
+        '''
+
+        return len(ever_living)
+
+    @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.Ok))
+    def rolls_his_course(from_the_eastern_sky: list[str]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling amortized full-coverage type-checking, annotated by the same
+        hint under the same configuration as the prior callable.
+        '''
+
+        return len(from_the_eastern_sky)
+
+    # ..................{ PASS                               }..................
+    # Assert that these callables accept empty and valid non-empty sequences.
+    assert the_swift([]) == 0
+    assert the_swift(the_sun) == 3
+
+    # Assert that the latter callable accepts an invalid sequence whose invalid
+    # item resides outside the first slice of that sequence. Since the latter
+    # callable has yet to be called, that callable type-checks that slice.
+    assert rolls_his_course(the_stars) == len(the_stars)
+
+    # ..................{ FAIL                               }..................
+    # Assert that the former callable rejects an invalid sequence shorter than
+    # a slice regardless of the current cursor of that callable.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_swift(the_moon)
+
+    # Assert that the latter callable accepts this invalid sequence while its
+    # cursor resides in the second slice *BEFORE* rejecting this sequence when
+    # its cursor reaches the third slice containing the invalid item. Since
+    # each callable maintains its own cursor, prior calls to the former callable
+    # have *NO* effect on the cursor of the latter callable.
+    assert rolls_his_course(the_stars) == len(the_stars)
+    with raises_uncached(BeartypeCallHintParamViolation):
+        rolls_his_course(the_stars)
+
+
+def test_decor_conf_strategy_Ologn() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **logarithmic-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.Ologn`).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    type-checks sampling one item from each of a logarithmic number of strata
+    of each sequence for this use case.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary list of eight strings, which this strategy partitions into four
+    # strata of two strings each, all *SATISFYING* the hints annotating the
+    # callables defined below.
+    the_wilderness = [
+        'The wilderness has a mysterious tongue',
+        'Which teaches awful doubt, or faith so mild,',
+        'So solemn, so serene, that man may be,',
+        'But for such faith, with Nature reconciled;',
+        'Thou hast a voice, great Mountain, to repeal',
+        'Large codes of fraud and woe; not understood',
+        'By all, but which the wise, and great, and good',
+        'Interpret, or make felt, or deeply feel.',
+    ]
+
+    # Arbitrary list of eight items such that *ALL* items of the third stratum
+    # *VIOLATE* these hints. Since this strategy samples one item from each
+    # stratum, this strategy is guaranteed to detect this violation regardless
+    # of the pseudo-random offset into each stratum.
+    the_fields = the_wilderness.copy()
+    the_fields[4] = b'The fields, the lakes, the forests, and the streams,'
+    the_fields[5] = b'Ocean, and all the living things that dwell'
+
+    # Arbitrary list of eight items such that only the first item of the third
+    # stratum *VIOLATES* these hints. Since this strategy samples the first item
+    # of each stratum when randomization is disabled, this strategy is
+    # guaranteed to detect this violation in that case.
+    within_the_daedal_earth = the_wilderness.copy()
+    within_the_daedal_earth[4] = b'Within the daedal earth; lightning, and rain,'
+
+    # Arbitrary list of eleven items whose length is *NOT* divisible by the
+    # four strata this strategy partitions this list into, such that only the
+    # first item of the last (truncated) stratum *VIOLATES* these hints. Since
+    # the last stratum extends to the end of this list, this strategy is
+    # guaranteed to detect this violation when randomization is disabled.
+    and_hurricane_the_torpor = the_wilderness + the_wilderness[:3]
+    and_hurricane_the_torpor[9] = b'Earthquake, and fiery flood, and hurricane,'
+
+    # Arbitrary list of 101 items whose length is *NOT* divisible by the seven
+    # strata this strategy partitions this list into, such that only the last
+    # item *VIOLATES* these hints. Since strata collectively span this entire
+    # list, this strategy is guaranteed to eventually detect this violation
+    # when randomization is enabled.
+    of_the_year = ['The torpor of the year when feeble dreams'] * 100 + [
+        b'Visit the hidden buds, or dreamless sleep']
+
+    # ..................{ LOCALS ~ callables                 }..................
+    @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.Ologn))
+    def earthquake(and_fiery_flood: list[str]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling pseudo-random logarithmic-time type-checking.
+        '''
+
+        return len(and_fiery_flood)
+
+    @beartype(conf=BeartypeConf(
+        strategy=BeartypeStrategy.Ologn, is_random=False))
+    def and_hurricane(the_torpor: tuple[str, ...]) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling deterministic logarithmic-time type-checking.
+        '''
+
+        return len(the_torpor)
+
+    # ..................{ PASS                               }..................
+    # Assert that these callables accept empty and valid non-empty sequences.
+    assert earthquake([]) == 0
+    assert earthquake(the_wilderness) == 8
+    assert and_hurricane(()) == 0
+    assert and_hurricane(tuple(the_wilderness)) == 8
+
+    # ..................{ FAIL                               }..................
+    # For a sufficiently large number of iterations, where "sufficiently large"
+    # is arbitrarily chosen so as to (hopefully) expose any accidental
+    # non-stratified sampling...
+    for _ in range(42):
+        # Assert that these callables reject invalid sequences whose invalid
+        # items are *NOT* the first items by raising the expected violation.
+        with raises_uncached(BeartypeCallHintParamViolation):
+            earthquake(the_fields)
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_hurricane(tuple(the_fields))
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_hurricane(tuple(within_the_daedal_earth))
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_hurricane(tuple(and_hurricane_the_torpor))
+
+    # Number of calls passed the list whose only violating item is its last
+    # item that raised the expected violation.
+    violations = 0
+
+    # For a sufficiently large number of iterations, where "sufficiently large"
+    # is chosen such that the probability of never sampling that item (i.e.,
+    # (14/15)**1000 for the fifteen-item strata of this list) is negligible...
+    for _ in range(1000):
+        # Attempt to pass that list.
+        try:
+            earthquake(of_the_year)
+        # If doing so raised the expected violation, record this violation.
+        except BeartypeCallHintParamViolation:
+            violations += 1
+
+    # Assert that some call sampled and thus rejected the last item.
+    assert violations
+
+
+def test_decor_conf_strategy_On() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **linear-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.On`).
+
+    This unit test validates that :mod:`beartype` correctly generates
+    exhaustive type-checks visiting *all* items of *all* nested containers for
+    this use case.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import Iterable
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
+    def and_the_eternal_sky(
+        full_of_light: list[list[str]],
+        and_of_the_sun: dict[str, frozenset[int]],
+        floating_island: Iterable[str] = (),
+    ) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling linear-time type-checking accepting nested sequences, nested
+        mappings of reiterables, and quasiiterables.
+        '''
+
+        # Trivialize this one-liner to the max, Captain!
+        return len(full_of_light) + len(and_of_the_sun)
+
+    # ..................{ LOCALS                             }..................
+    # Arbitrary nested list whose items *ALL* satisfy the above hints.
+    the_lightning_of_the_noon = [
+        ['And the eternal sky, full of light,'],
+        [],
+        ['And of the sun, a floating island,', 'Whose summits lie'],
+    ]
+
+    # Arbitrary nested list whose items *ALL* satisfy the above hints except the
+    # last item of the last item, which no constant-time strategy is guaranteed
+    # to ever type-check.
+    the_ocean_floods = [
+        ['The ocean floods, and the earth below'],
+        ['Its shade, like a chaos', b'lie over the deep'],
+    ]
+
+    # Arbitrary mapping whose items *ALL* satisfy the above hints.
+    the_crimson_sunset = {
+        'Beneath the crimson sunset': frozenset((1, 2, 3)),
+        'Whose waves': frozenset(),
+    }
+
+    # Arbitrary mapping whose items *ALL* satisfy the above hints except the
+    # last value of the last key.
+    where_the_winds = {
+        'Where the winds': frozenset((1,)),
+        'Dwell and the clouds': frozenset((2, 'hover')),
+    }
+
+    # ..................{ PASS                               }..................
+    # Assert that this callable accepts valid nested containers.
+    assert and_the_eternal_sky(
+        the_lightning_of_the_noon, the_crimson_sunset) == 5
+    assert and_the_eternal_sky(
+        [], {}, the_lightning_of_the_noon[2]) == 0
+
+    # ..................{ FAIL                               }..................
+    # For a sufficiently large number of iterations, where "sufficiently large"
+    # is arbitrarily chosen so as to (hopefully) expose any accidental
+    # non-exhaustive type-checking...
+    for _ in range(42):
+        # Assert that this callable rejects an invalid nested sequence whose
+        # only invalid item is *NOT* the first item by raising the expected
+        # type-checking violation.
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_the_eternal_sky(the_ocean_floods, the_crimson_sunset)
+
+        # Assert that this callable rejects an invalid nested mapping whose only
+        # invalid item is *NOT* the first item by raising the expected
+        # type-checking violation.
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_the_eternal_sky(the_lightning_of_the_noon, where_the_winds)
+
+        # Assert that this callable rejects an invalid quasiiterable whose only
+        # invalid item is *NOT* the first item by raising the expected
+        # type-checking violation.
+        with raises_uncached(BeartypeCallHintParamViolation):
+            and_the_eternal_sky(
+                the_lightning_of_the_noon, the_crimson_sunset, ('Dwell', 0xBEEF))
+
+def test_decor_conf_strategy_On_type_builtin() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **linear-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.On`) on
+    containers type hinted as containing instances of builtin types.
+
+    This unit test validates that :mod:`beartype` correctly generates
+    type-checks deciding whether *all* items are of the exact builtin type with
+    C-based iteration, which then fall back to pure-Python iteration for items
+    that are instances of subclasses of that type.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
+    def the_sunlight_on(
+        the_sea: list[int], the_moonlight: tuple[float, ...], kisses: set[str],
+    ) -> int:
+        '''
+        Arbitrary callable decorated by a :func:`beartype.beartype` decorator
+        enabling linear-time type-checking.
+        '''
+
+        # Return an arbitrary integer derived from these parameters.
+        return len(the_sea) + len(the_moonlight) + len(kisses)
+
+    # ..................{ CLASSES                            }..................
+    class WhatIsAllThisSweetWork(str):
+        '''
+        Arbitrary subclass of a builtin type.
+        '''
+
+        pass
+
+    class AllThingsByALaw(type):
+        '''
+        Arbitrary metaclass whose classes are equal to *all* objects.
+        '''
+
+        __eq__ = lambda cls, other: True
+        __hash__ = type.__hash__
+
+    class WhatAreAllThese(object, metaclass=AllThingsByALaw):
+        '''
+        Arbitrary class equal to *all* objects (including builtin types).
+        '''
+
+        pass
+
+    # ..................{ PASS                               }..................
+    # Assert that this callable accepts containers whose items are all of the
+    # exact builtin types annotating these containers.
+    assert the_sunlight_on(list(range(64)), (0.5,) * 64, {'worth'}) == 129
+
+    # Assert that this callable accepts containers whose items are instances of
+    # subclasses of those builtin types.
+    assert the_sunlight_on(
+        [1, True, 2], (), {'If thou', WhatIsAllThisSweetWork('kiss not me')}
+    ) == 5
+
+    # Assert that this callable accepts empty containers.
+    assert the_sunlight_on([], (), set()) == 0
+
+    # ..................{ FAIL                               }..................
+    # Assert that this callable rejects containers whose only invalid items are
+    # the last items of those containers by raising the expected violations.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_sunlight_on(list(range(64)) + ['And the sunlight'], (), set())
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_sunlight_on([], (0.5,) * 64 + (b'clasps the earth',), set())
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_sunlight_on([], (), {'And the moonbeams', b'kiss the sea'})
+
+    # Assert that this callable rejects containers whose invalid items are
+    # instances of types whose metaclasses spuriously report those types to be
+    # equal to these builtin types, which *MUST* be compared by identity.
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_sunlight_on([1, WhatAreAllThese()], (), set())
+    with raises_uncached(BeartypeCallHintParamViolation):
+        the_sunlight_on([], (), {'If thou', WhatAreAllThese()})
+
+
 # ....................{ PRIVATE ~ callables                }....................
 def _earthquake(and_fiery_flood: int, and_hurricane: int) -> bool:
     '''
@@ -139,6 +139,140 @@ def test_decor_nontype_wrapper_type() -> None:
     assert that_echoes_not_my_thoughts(('A', 'gloomy', 'smile',)) == [
         'A', 'gloomy', 'smile']
 
+# ....................{ TESTS ~ closure                    }....................
+def test_decor_nontype_closure_template() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on **closures repeatedly
+    created by the same** ``def`` **statement** (e.g., closures decorated in
+    loops), whose decorations reuse the same wrapper template.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeCallHintReturnViolation,
+    )
+    from pytest import raises
+
+    # ....................{ FACTORIES                      }....................
+    def make_closure(the_spirit_of_sweet_human_love: str):
+        '''
+        Factory creating and returning a new closure decorated by
+        :func:`.beartype`, returning the passed string.
+        '''
+
+        @beartype
+        def has_sent(a_vision: list[str]) -> str:
+            '''
+            Arbitrary closure decorated by :func:`.beartype`.
+            '''
+
+            # If passed *NO* items, return an invalid value.
+            if not a_vision:
+                return len(the_spirit_of_sweet_human_love)  # type: ignore[return-value]
+
+            # Else, return a valid value.
+            return the_spirit_of_sweet_human_love + a_vision[0]
+
+        # Return this closure.
+        return has_sent
+
+    # ....................{ LOCALS                         }....................
+    # Closures created by the same "def" statement.
+    to_the_sleep = make_closure('To the sleep ')
+    of_him_who = make_closure('Of him who ')
+
+    # ....................{ PASS                           }....................
+    # Assert that each closure is decorated by a distinct wrapper wrapping the
+    # closure it decorates.
+    assert to_the_sleep is not of_him_who
+    assert to_the_sleep.__wrapped__ is not of_him_who.__wrapped__
+    assert to_the_sleep(['spurned']) == 'To the sleep spurned'
+    assert of_him_who(['spurned']) == 'Of him who spurned'
+
+    # ....................{ FAIL                           }....................
+    # Assert that each wrapper raises violations describing its own closure.
+    for has_sent in (to_the_sleep, of_him_who):
+        with raises(BeartypeCallHintParamViolation):
+            has_sent([b'her choicest gifts.'])
+        with raises(BeartypeCallHintReturnViolation) as exception_info:
+            has_sent([])
+        assert str(len(has_sent.__wrapped__(['']))) in str(
+            exception_info.value)
+
+
+def test_decor_nontype_closure_template_Ok() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on **closures repeatedly
+    created by the same** ``def`` **statement** under the **amortized
+    full-coverage strategy** (i.e., :attr:`beartype.BeartypeStrategy.Ok`),
+    whose decorations reuse the same wrapper template but *not* the same
+    cursor or type hint dictionary.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype._data.check.code.datacodelen import SEQUENCE_CURSOR_SLICE_LEN
+    from beartype_test._util.error.pyterrraise import raises_uncached
+
+    # ....................{ FACTORIES                      }....................
+    def make_closure():
+        '''
+        Factory creating and returning a new closure decorated by
+        :func:`.beartype` under the amortized full-coverage strategy.
+        '''
+
+        @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.Ok))
+        def the_fountains(mingle_with: list[str]) -> int:
+            '''
+            Arbitrary closure decorated by :func:`.beartype`.
+            '''
+
+            return len(mingle_with)
+
+        # Return this closure.
+        return the_fountains
+
+    # ....................{ LOCALS                         }....................
+    # Closures created by the same "def" statement.
+    the_river = make_closure()
+    and_the_rivers = make_closure()
+
+    # Arbitrary list of strings such that *ONLY* the last item *VIOLATES* the
+    # hint annotating these closures, where this list is one slice long plus
+    # one item.
+    with_the_ocean = ['The winds of heaven mix for ever'] * (
+        SEQUENCE_CURSOR_SLICE_LEN + 1)
+    with_the_ocean[-1] = b'With a sweet emotion'
+
+    # ....................{ PASS                           }....................
+    # Assert that each closure has its own type hint dictionary.
+    assert the_river.__annotations__ is not and_the_rivers.__annotations__
+
+    # Assert that the former closure accepts this invalid list while its cursor
+    # resides in the first slice, advancing *ONLY* its own cursor.
+    assert the_river(with_the_ocean) == len(with_the_ocean)
+
+    # Assert that the latter closure also accepts this invalid list. Since each
+    # closure maintains its own cursor, the prior call to the former closure
+    # has *NO* effect on the cursor of the latter closure.
+    assert and_the_rivers(with_the_ocean) == len(with_the_ocean)
+
+    # ....................{ FAIL                           }....................
+    # Assert that each closure rejects this invalid list when its own cursor
+    # reaches the second slice containing the invalid item.
+    for the_fountains in (the_river, and_the_rivers):
+        with raises_uncached(BeartypeCallHintParamViolation):
+            the_fountains(with_the_ocean)
+
 # ....................{ TESTS ~ fail : wrappee             }....................
 def test_decor_nontype_type_fail() -> None:
     '''
@@ -145,8 +145,12 @@ def test_decor_pep342_sync_generator_api() -> None:
 
     # ....................{ IMPORTS                        }....................
     # Defer test-specific imports.
-    from beartype import beartype
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
     from collections.abc import Generator
+    from itertools import product
     from pytest import raises
     from typing import Any
 
@@ -164,6 +168,15 @@ def test_decor_pep342_sync_generator_api() -> None:
         Generator[int, str, bytes],
     )
 
+    # Tuple of all beartype configurations with which to repeatedly configure
+    # the decoration of that factory, including configurations lazily
+    # type-checking the yields, sends, and returns of that generator.
+    CONFS = (
+        BeartypeConf(),
+        BeartypeConf(check_yield_every=1),
+        BeartypeConf(check_yield_every=2),
+    )
+
     # Arbitrary list to be appended to by the "finally:" block of the non-empty
     # synchronous generator why_do_i_know_ye() defined below, enabling logic
     # below to validate that that block was run as expected *AFTER* the caller
@@ -212,9 +225,10 @@ def test_decor_pep342_sync_generator_api() -> None:
 
     # ....................{ LOOP                           }....................
     # For each return hint with which to repeatedly annotate the non-empty
-    # synchronous generator factory declared below...
-    for hint_return in HINTS_RETURN:
-        @beartype
+    # synchronous generator factory declared below and each configuration with
+    # which to repeatedly decorate that factory...
+    for hint_return, conf in product(HINTS_RETURN, CONFS):
+        @beartype(conf=conf)
         def why_do_i_know_ye(yield_int_max: int) -> hint_return:
             '''
             :func:`beartype.beartype`-decorated non-empty synchronous generator
@@ -417,3 +431,89 @@ def test_decor_pep342_sync_generator_api() -> None:
         # nothing further to yield and has thus been exhausted (finalized).
         with raises(StopIteration):
             next(thus_distraught)
+
+
+def test_decor_pep342_sync_generator_check_yield_every() -> None:
+    '''
+    Test :func:`beartype.beartype`-decorated synchronous generators configured
+    by the :attr:`beartype.BeartypeConf.check_yield_every` option to lazily
+    type-check the values yielded by, sent into, and returned from those
+    generators.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintReturnViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import (
+        Generator,
+        Iterator,
+    )
+
+    # ....................{ CALLABLES                      }....................
+    @beartype(conf=BeartypeConf(check_yield_every=1))
+    def the_winds_were_withered(
+        items: list, return_value: object) -> Generator[int, str, bytes]:
+        '''
+        :func:`beartype.beartype`-decorated synchronous generator type-checking
+        *all* yields, sends, and returns, yielding the passed items *and* then
+        returning the passed value.
+        '''
+
+        # For each passed item, yield this item *AND* yield the length of each
+        # string sent into this generator in response.
+        for item in items:
+            sent_str = yield item
+            while sent_str is not None:
+                sent_str = yield len(sent_str)
+
+        # Return the passed value.
+        return return_value
+
+
+    @beartype(conf=BeartypeConf(check_yield_every=2))
+    def in_the_stagnant_air(items: list) -> Iterator[int]:
+        '''
+        :func:`beartype.beartype`-decorated synchronous generator type-checking
+        only every other yield, yielding the passed items.
+        '''
+
+        # Yield the passed items.
+        yield from items
+
+    # ....................{ PASS                           }....................
+    # Assert that these generators yield, receive, and return valid values.
+    and_the_clouds_perished = the_winds_were_withered(
+        [0, 1], b'And the clouds perish\'d')
+    assert next(and_the_clouds_perished) == 0
+    assert and_the_clouds_perished.send('Darkness had no need') == 20
+    assert next(and_the_clouds_perished) == 1
+    with raises_uncached(StopIteration) as exception_info:
+        next(and_the_clouds_perished)
+    assert exception_info.value.value == b'And the clouds perish\'d'
+
+    # Assert that the latter generator silently accepts invalid values that
+    # this configuration skips (i.e., every second, fourth, and so on yield).
+    assert list(in_the_stagnant_air([1, 'Of aid from them', 3])) == [
+        1, 'Of aid from them', 3]
+
+    # ....................{ FAIL                           }....................
+    # Assert that these generators raise the expected violations when yielding,
+    # receiving, or returning invalid values.
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        list(the_winds_were_withered([0, 'She was the Universe'], b''))
+
+    darkness_had_no_need = the_winds_were_withered([0, 1], b'')
+    next(darkness_had_no_need)
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        darkness_had_no_need.send(b'Of aid from them')
+
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        list(the_winds_were_withered([0, 1], 'She was the Universe'))
+
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        list(in_the_stagnant_air([1, 2, 'And the clouds perish\'d']))
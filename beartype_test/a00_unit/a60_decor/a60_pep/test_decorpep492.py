@@ -121,3 +121,34 @@ async def test_decor_pep492_async_coroutine() -> None:
 
             # Return an arbitrary object (sorta) satisfying this return hint.
             return 'Time will decay us but time can be left blank'
+
+
+async def test_decor_pep492_async_coroutine_frames() -> None:
+    '''
+    Test that decorating **coroutines** (i.e., asynchronous non-generator
+    functions) with the :func:`beartype.beartype` decorator adds exactly one
+    stack frame to the call stack of those coroutines.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from traceback import extract_stack
+
+    # ....................{ CALLABLES                      }....................
+    async def a_thing_of_beauty(text: str) -> int:
+        '''
+        Undecorated coroutine returning the current stack depth.
+        '''
+
+        # Return the current stack depth.
+        return len(extract_stack())
+
+    # @beartype-decorated coroutine returning the current stack depth.
+    is_a_joy_for_ever = beartype(a_thing_of_beauty)
+
+    # ....................{ PASS                           }....................
+    # Assert that the high-level wrapper awaiting this coroutine adds exactly
+    # one stack frame.
+    assert await is_a_joy_for_ever('Its loveliness increases;') == (
+        await a_thing_of_beauty('it will never') + 1)
@@ -433,3 +433,80 @@ async def test_decor_pep525_async_generator_api() -> None:
         # nothing further to yield and has thus been exhausted (finalized).
         with raises(StopAsyncIteration):
             await anext(thus_distraught)
+
+
+async def test_decor_pep525_async_generator_check_yield_every() -> None:
+    '''
+    Test :func:`beartype.beartype`-decorated asynchronous generators configured
+    by the :attr:`beartype.BeartypeConf.check_yield_every` option to lazily
+    type-check the values yielded by and sent into those generators.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintReturnViolation
+    from beartype_test._util.error.pyterrraise import raises_uncached
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+    )
+
+    # ....................{ CALLABLES                      }....................
+    @beartype(conf=BeartypeConf(check_yield_every=1))
+    async def the_wandering_airs(items: list) -> AsyncGenerator[int, str]:
+        '''
+        :func:`beartype.beartype`-decorated asynchronous generator
+        type-checking *all* yields and sends, yielding the passed items.
+        '''
+
+        # For each passed item, yield this item *AND* yield the length of each
+        # string sent into this generator in response.
+        for item in items:
+            sent_str = yield item
+            while sent_str is not None:
+                sent_str = yield len(sent_str)
+
+
+    @beartype(conf=BeartypeConf(check_yield_every=2))
+    async def of_the_dark_streams(items: list) -> AsyncIterator[int]:
+        '''
+        :func:`beartype.beartype`-decorated asynchronous generator
+        type-checking only every other yield, yielding the passed items.
+        '''
+
+        # Yield the passed items.
+        for item in items:
+            yield item
+
+    # ....................{ PASS                           }....................
+    # Assert that these generators yield and receive valid values.
+    that_fold_the_dark = the_wandering_airs([0, 1])
+    assert await that_fold_the_dark.__anext__() == 0
+    assert await that_fold_the_dark.asend('The champak odours') == 18
+    assert await that_fold_the_dark.__anext__() == 1
+    with raises_uncached(StopAsyncIteration):
+        await that_fold_the_dark.__anext__()
+
+    # Assert that the latter generator silently accepts invalid values that
+    # this configuration skips (i.e., every second, fourth, and so on yield).
+    assert [item async for item in of_the_dark_streams(
+        [1, 'Fail on the dark', 3])] == [1, 'Fail on the dark', 3]
+
+    # ....................{ FAIL                           }....................
+    # Assert that these generators raise the expected violations when yielding
+    # or receiving invalid values.
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        [item async for item in the_wandering_airs([0, 'The nightingale'])]
+
+    on_the_dark_silent_stream = the_wandering_airs([0, 1])
+    await on_the_dark_silent_stream.__anext__()
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        await on_the_dark_silent_stream.asend(b'Its sweet dreams')
+
+    with raises_uncached(BeartypeCallHintReturnViolation):
+        [item async for item in of_the_dark_streams(
+            ['And the champak', 2])]
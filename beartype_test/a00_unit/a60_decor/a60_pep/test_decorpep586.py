@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2026 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype decorator** :pep:`586`-compliant **literal unit tests**.
+
+This submodule unit tests :pep:`586` support implemented in the
+:func:`beartype.beartype` decorator.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_decor_pep586_literals_many() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on :pep:`586`-compliant
+    :obj:`typing.Literal` type hints subscripted by enough literal objects to
+    be type-checked by hash-based membership rather than by a chain of equality
+    comparisons.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype.typing import Literal
+    from enum import (
+        Enum,
+        IntEnum,
+    )
+    from pytest import raises
+
+    # ....................{ CLASSES                        }....................
+    class ThePoetsBlood(Enum):
+        '''
+        Arbitrary enumeration whose members are identity-comparable.
+        '''
+
+        THAT_EVER_STILL = 0
+        BURNS_WITHIN = 1
+        HIS_EARLY_YOUTH = 2
+        HAD_WANDERED = 3
+        AWAY = 4
+
+
+    class AlastorEnum(IntEnum):
+        '''
+        Arbitrary integer enumeration whose members are identity-comparable
+        despite inheriting the :meth:`int.__eq__` dunder method.
+        '''
+
+        AND_SILENCE = 0
+        TOO_ENAMOURED = 1
+        OF_THAT_VOICE = 2
+        LOCKS_ITS = 3
+        MUTE_MUSIC = 4
+
+
+    class TheSpiritOfSolitude(int):
+        '''
+        Arbitrary :class:`int` subclass whose instances are unhashable.
+        '''
+
+        __hash__ = None  # type: ignore[assignment]
+
+    # ....................{ CALLABLES                      }....................
+    @beartype
+    def by_solemn_vision(status: Literal[tuple(range(200))]) -> int:  # type: ignore[valid-type]
+        '''
+        Arbitrary callable annotated by a literal subscripted by many integers.
+        '''
+
+        return status
+
+
+    @beartype
+    def and_bright_silver_dream(member: Literal[
+        ThePoetsBlood.THAT_EVER_STILL,
+        ThePoetsBlood.BURNS_WITHIN,
+        ThePoetsBlood.HIS_EARLY_YOUTH,
+        ThePoetsBlood.HAD_WANDERED,
+    ]) -> ThePoetsBlood:
+        '''
+        Arbitrary callable annotated by a literal subscripted by many
+        enumeration members.
+        '''
+
+        return member
+
+
+    @beartype
+    def his_infancy_was_nurtured(member: Literal[
+        AlastorEnum.AND_SILENCE,
+        AlastorEnum.TOO_ENAMOURED,
+        AlastorEnum.OF_THAT_VOICE,
+        AlastorEnum.LOCKS_ITS,
+    ]) -> AlastorEnum:
+        '''
+        Arbitrary callable annotated by a literal subscripted by many integer
+        enumeration members.
+        '''
+
+        return member
+
+
+    @beartype
+    def every_sight_and_sound(literal: Literal[
+        None, True, 42, b'From the vast earth', 'and ambient air'],
+    ) -> object:
+        '''
+        Arbitrary callable annotated by a literal subscripted by many literal
+        objects of differing types.
+        '''
+
+        return literal
+
+    # ....................{ PASS                           }....................
+    # Assert these callables return the passed literal objects.
+    assert by_solemn_vision(0) == 0
+    assert by_solemn_vision(199) == 199
+    assert and_bright_silver_dream(ThePoetsBlood.HAD_WANDERED) is (
+        ThePoetsBlood.HAD_WANDERED)
+    assert his_infancy_was_nurtured(AlastorEnum.LOCKS_ITS) is (
+        AlastorEnum.LOCKS_ITS)
+    assert every_sight_and_sound(None) is None
+    assert every_sight_and_sound(b'From the vast earth') == (
+        b'From the vast earth')
+
+    # Assert these callables preserve the equality of booleans and integers
+    # implied by the equality comparisons type-checking fewer literal objects.
+    assert by_solemn_vision(True) is True
+    assert every_sight_and_sound(True) is True
+
+    # Assert a callable annotated by a literal subscripted by many integers
+    # accepts an unhashable instance of an integer subclass equal to one of
+    # those integers rather than raising an unexpected "TypeError".
+    assert by_solemn_vision(TheSpiritOfSolitude(7)) == 7
+
+    # ....................{ FAIL                           }....................
+    # Assert these callables raise the expected violation when passed objects
+    # of the expected types unequal to any of these literal objects.
+    with raises(BeartypeCallHintParamViolation):
+        by_solemn_vision(200)
+    with raises(BeartypeCallHintParamViolation):
+        and_bright_silver_dream(ThePoetsBlood.AWAY)
+    with raises(BeartypeCallHintParamViolation):
+        his_infancy_was_nurtured(AlastorEnum.MUTE_MUSIC)
+    with raises(BeartypeCallHintParamViolation):
+        every_sight_and_sound('Sent to his heart')
+    with raises(BeartypeCallHintParamViolation):
+        by_solemn_vision(TheSpiritOfSolitude(200))
+
+    # Assert these callables raise the expected violation when passed objects
+    # of unexpected types equal to one of these literal objects.
+    with raises(BeartypeCallHintParamViolation):
+        by_solemn_vision(7.0)
+    with raises(BeartypeCallHintParamViolation):
+        his_infancy_was_nurtured(1)
@@ -374,3 +374,87 @@ def test_door_is_bearable_warnings(iter_hints_piths_meta) -> None:
         with hint_pith_meta.warns_warnings_expected():
             is_bearable(
                 hint_pith_meta.pith, hint_meta.hint, conf=hint_meta.conf)
+
+# ....................{ TESTS ~ cache                      }....................
+def test_door_is_bearable_cache() -> None:
+    '''
+    Test that the :class:`beartype.door.is_bearable` tester function memoizes
+    tester functions into a size-bounded cache evicting the least recently used
+    tester functions, resizable by the public
+    :func:`beartype.door.set_door_cache_size` setter.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype.door import (
+        die_if_unbearable,
+        is_bearable,
+        set_door_cache_size,
+    )
+    from beartype.door._func.doorfunc import (
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER,
+        _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER,
+    )
+    from beartype.roar import BeartypeDoorCacheException
+    from beartype._data.check.code.datacodelen import FUNC_CHECKER_CACHE_SIZE
+    from pytest import raises
+    from typing import Literal
+
+    # ....................{ LOCALS                         }....................
+    # Checker function factory caches to be tested, localized for brevity.
+    func_raiser_cache = _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_RAISER
+    func_tester_cache = _HINT_CONF_EXCEPTION_PREFIX_TO_FUNC_TESTER
+
+    # ....................{ PASS                           }....................
+    # Attempt to...
+    try:
+        # Type-check objects against many dynamically constructed hints under
+        # the default capacity, populating both caches.
+        for literal_value in range(8):
+            assert is_bearable(literal_value, Literal[literal_value]) is True
+            die_if_unbearable(literal_value, Literal[literal_value])
+
+        # Assert both caches to contain at least these checkers.
+        assert len(func_raiser_cache) >= 8
+        assert len(func_tester_cache) >= 8
+
+        # Shrink these caches to a trivial capacity.
+        set_door_cache_size(2)
+
+        # Assert this resizing to have evicted all but the most recent
+        # checkers from both caches.
+        assert func_raiser_cache.size == func_tester_cache.size == 2
+        assert len(func_raiser_cache) == 2
+        assert len(func_tester_cache) == 2
+
+        # Type-check objects against yet more dynamically constructed hints.
+        for literal_value in range(8, 16):
+            assert is_bearable(literal_value, Literal[literal_value]) is True
+
+        # Assert this cache to remain bounded by this capacity.
+        assert len(func_tester_cache) == 2
+
+        # Assert re-type-checking against the most recent hint to hit.
+        func_tester_cache_hits = func_tester_cache.hits
+        assert is_bearable(15, Literal[15]) is True
+        assert func_tester_cache.hits == func_tester_cache_hits + 1
+
+        # Assert re-type-checking against an evicted hint to miss.
+        func_tester_cache_misses = func_tester_cache.misses
+        assert is_bearable(8, Literal[8]) is True
+        assert func_tester_cache.misses == func_tester_cache_misses + 1
+    # Restore these caches to their default capacity.
+    finally:
+        set_door_cache_size(FUNC_CHECKER_CACHE_SIZE)
+
+    # Assert these caches to have been restored.
+    assert func_raiser_cache.size == FUNC_CHECKER_CACHE_SIZE
+    assert func_tester_cache.size == FUNC_CHECKER_CACHE_SIZE
+
+    # ....................{ FAIL                           }....................
+    # Assert that this setter raises the expected exception when passed
+    # invalid capacities *AND* preserves the current capacity.
+    for size_bad in (0, -1, 2.0, True, '1024', None):
+        with raises(BeartypeDoorCacheException):
+            set_door_cache_size(size_bad)
+        assert func_tester_cache.size == FUNC_CHECKER_CACHE_SIZE
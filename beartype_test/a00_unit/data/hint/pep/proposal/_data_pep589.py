@@ -75,21 +75,6 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
             I_gaze_on_thee: Union[bytes, type[Exception]]
 
 
-        #FIXME: Note that even this fails to suffice, thanks to *CRAY-CRAY*
-        #subclassing logic that absolutely no one has ever exercised, but which
-        #we'll nonetheless need to support. And I quoth:
-        #    The totality flag only applies to items defined in the body of the
-        #    TypedDict definition. Inherited items won't be affected, and
-        #    instead use totality of the TypedDict type where they were defined.
-        #    This makes it possible to have a combination of required and
-        #    non-required keys in a single TypedDict type.
-        #
-        #Ergo, we need to additionally declare yet another new class subclassing
-        #"ToMuse" but *NOT* explicitly subclassed with a "total" keyword
-        #parameter. This clearly gets *EXTREMELY* ugly *EXTREMELY* fast, as
-        #we'll now need to iterate over "hint.__mro__" in our code generation
-        #algorithm. Well, I suppose we technically needed to do that anyway...
-        #but still. Yikes!
         class ToMuse(TypedDict, total=False):
             '''
             Arbitrary non-empty typed dictionary annotated to require zero or
@@ -127,12 +112,13 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                         # object embeds the representation of the expected type.
                         exception_str_match_regexes=(r'\bMapping\b',),
                     ),
-                    #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                    # # Non-empty dictionary.
-                    # PithSatisfiedMetadata({
-                    #     'Corinthian bodachean kinslayers lay': (
-                    #         'wedded weal‐kith with in‐'),
-                    # }),
+                    # Non-empty dictionary. Since typed dictionaries are
+                    # structurally subtyped, keys *NOT* declared by this typed
+                    # dictionary are permitted.
+                    PithSatisfiedMetadata({
+                        'Corinthian bodachean kinslayers lay': (
+                            'wedded weal‐kith with in‐'),
+                    }),
                 ),
             ),
 
@@ -161,32 +147,35 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                         # object embeds the representation of the expected type.
                         exception_str_match_regexes=(r'\bMapping\b',),
                     ),
-                    # #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                    # # Empty dictionary.
-                    # PithUnsatisfiedMetadata(
-                    #     pith={},
-                    #     # Match that the exception message raised for this object
-                    #     # embeds the expected number of key-value pairs.
-                    #     exception_str_match_regexes=(r'\b2\b',),
-                    # ),
-                    # # Non-empty dictionary of the expected keys but *NOT* values.
-                    # PithUnsatisfiedMetadata(
-                    #     pith={
-                    #         'and_when': 'Matricidally',
-                    #         'I_gaze_on_thee': (
-                    #             'Hatchet‐cachepotting, '
-                    #             'Scossetting mock misrule by'
-                    #         ),
-                    #     },
-                    #     # Match that the exception message raised for this object
-                    #     # embeds:
-                    #     # * The name of the unsatisfied key.
-                    #     # * The expected types of this key's value.
-                    #     exception_str_match_regexes=(
-                    #         r'\bI_gaze_on_thee\b',
-                    #         r'\bbytes\b',
-                    #     ),
-                    # ),
+                    # Empty dictionary.
+                    PithUnsatisfiedMetadata(
+                        pith={},
+                        # Match that the exception message raised for this object
+                        # embeds the names of the missing required keys.
+                        exception_str_match_regexes=(
+                            r'\bmissing required keys\b',
+                            r'\band_when\b',
+                            r'\bI_gaze_on_thee\b',
+                        ),
+                    ),
+                    # Non-empty dictionary of the expected keys but *NOT* values.
+                    PithUnsatisfiedMetadata(
+                        pith={
+                            'and_when': b'Matricidally',
+                            'I_gaze_on_thee': (
+                                'Hatchet‐cachepotting, '
+                                'Scossetting mock misrule by'
+                            ),
+                        },
+                        # Match that the exception message raised for this object
+                        # embeds:
+                        # * The name of the first unsatisfied key.
+                        # * The expected type of this key's value.
+                        exception_str_match_regexes=(
+                            r'\band_when\b',
+                            r'\bstr\b',
+                        ),
+                    ),
                 ),
             ),
 
@@ -222,26 +211,25 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                         # object embeds the representation of the expected type.
                         exception_str_match_regexes=(r'\bMapping\b',),
                     ),
-                    # #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                    # # Non-empty dictionary of the expected keys but *NOT* values.
-                    # PithUnsatisfiedMetadata(
-                    #     pith={
-                    #         'on_my_own': (
-                    #             'Psyche’s Maidenly‐enladened, '
-                    #             'aidful Lads‐lickspittling Potenc‐ies —',
-                    #         ),
-                    #         'separate_fantasy': (
-                    #             'Psychedelic metal‐metastasized, glib'),
-                    #     },
-                    #     # Match that the exception message raised for this object
-                    #     # embeds:
-                    #     # * The name of the unsatisfied key.
-                    #     # * The expected types of this key's value.
-                    #     exception_str_match_regexes=(
-                    #         r'\bseparate_fantasy\b',
-                    #         r'\bbytes\b',
-                    #     ),
-                    # ),
+                    # Non-empty dictionary of the expected keys but *NOT* values.
+                    PithUnsatisfiedMetadata(
+                        pith={
+                            'on_my_own': (
+                                'Psyche’s Maidenly‐enladened, '
+                                'aidful Lads‐lickspittling Potenc‐ies —',
+                            ),
+                            'separate_fantasy': (
+                                'Psychedelic metal‐metastasized, glib'),
+                        },
+                        # Match that the exception message raised for this object
+                        # embeds:
+                        # * The name of the first unsatisfied key.
+                        # * The expected type of this key's value.
+                        exception_str_match_regexes=(
+                            r'\bon_my_own\b',
+                            r'\bstr\b',
+                        ),
+                    ),
                 ),
             ),
 
@@ -257,7 +245,7 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                         {
                             'and_when': (
                                 'Matriculating ‘over‐sized’ '
-                                'research urchin Haunts of',
+                                'research urchin Haunts of'
                             ),
                             'I_gaze_on_thee': b"Stands - to",
                         },
@@ -279,41 +267,41 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                         # object embeds the representation of the expected type.
                         exception_str_match_regexes=(r'\bMapping\b',),
                     ),
-                    # #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                    # # List of empty dictionaries.
-                    # PithUnsatisfiedMetadata(
-                    #     pith=[{}, {},],
-                    #     # Match that the exception message raised for this object
-                    #     # embeds the expected number of key-value pairs.
-                    #     exception_str_match_regexes=(r'\b2\b',),
-                    # ),
-                    # # List of non-empty dictionaries, only one of which fails to
-                    # # define both the expected keys and values.
-                    # PithUnsatisfiedMetadata(
-                    #     pith=[
-                    #         {
-                    #             'and_when': (
-                    #                 'Diased capitalization of (or into)'),
-                    #             'I_gaze_on_thee': (
-                    #                 b'Witheringly dithering, dill husks of'),
-                    #         },
-                    #         {
-                    #             'and_when': (
-                    #                 'Will, like Whitewash‐ed, musky'),
-                    #             'I_gaze_on_thee': 'Likenesses injecting',
-                    #         },
-                    #     ],
-                    #     # Match that the exception message raised for this object
-                    #     # embeds:
-                    #     # * The index of the unsatisfied dictionary.
-                    #     # * The name of the unsatisfied key.
-                    #     # * The expected types of this key's value.
-                    #     exception_str_match_regexes=(
-                    #         r'\b1\b',
-                    #         r'\bI_gaze_on_thee\b',
-                    #         r'\bbytes\b',
-                    #     ),
-                    # ),
+                    # List of empty dictionaries.
+                    PithUnsatisfiedMetadata(
+                        pith=[{}, {},],
+                        # Match that the exception message raised for this object
+                        # embeds the names of the missing required keys.
+                        exception_str_match_regexes=(
+                            r'\bmissing required keys\b',
+                            r'\band_when\b',
+                        ),
+                    ),
+                    # List of non-empty dictionaries, all of which define the
+                    # expected keys but *NOT* values.
+                    PithUnsatisfiedMetadata(
+                        pith=[
+                            {
+                                'and_when': (
+                                    b'Diased capitalization of (or into)'),
+                                'I_gaze_on_thee': (
+                                    'Witheringly dithering, dill husks of'),
+                            },
+                            {
+                                'and_when': (
+                                    b'Will, like Whitewash-ed, musky'),
+                                'I_gaze_on_thee': 'Likenesses injecting',
+                            },
+                        ],
+                        # Match that the exception message raised for this object
+                        # embeds:
+                        # * The name of the first unsatisfied key.
+                        # * The expected type of this key's value.
+                        exception_str_match_regexes=(
+                            r'\band_when\b',
+                            r'\bstr\b',
+                        ),
+                    ),
                 ),
             ),
         ))
@@ -350,28 +338,32 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                             exception_str_match_regexes=(
                                 r'\bPep589484TypedDictT\b',),
                         ),
-                        # #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                        # # Empty generic instance.
-                        # PithSatisfiedMetadata(Pep589484TypedDictT()),
-                        # # Non-empty generic instance *NOT* containing the expected
-                        # # keys.
-                        # PithUnsatisfiedMetadata(
-                        #     pith=Pep589484TypedDictT({
-                        #         'and_when': 'Matricidally',
-                        #         'I_gaze_on_thee': (
-                        #             'Hatchet‐cachepotting, '
-                        #             'Scossetting mock misrule by'
-                        #         ),
-                        #     }),
-                        #     # Match that the exception message raised for this object
-                        #     # embeds:
-                        #     # * The name of the unsatisfied key.
-                        #     # * The expected types of this key's value.
-                        #     exception_str_match_regexes=(
-                        #         r'\bI_gaze_on_thee\b',
-                        #         r'\bbytes\b',
-                        #     ),
-                        # ),
+                        # Empty generic instance *NOT* containing the expected
+                        # required key.
+                        PithUnsatisfiedMetadata(
+                            pith=Pep589484TypedDictT(),
+                            # Match that the exception message raised for this
+                            # object embeds the name of the missing required key.
+                            exception_str_match_regexes=(
+                                r'\bmissing required key\b',
+                                r'\bkey\b',
+                            ),
+                        ),
+                        # Non-empty generic instance *NOT* containing the expected
+                        # keys.
+                        PithUnsatisfiedMetadata(
+                            pith=Pep589484TypedDictT({
+                                'and_when': 'Matricidally',
+                                'I_gaze_on_thee': (
+                                    'Hatchet‐cachepotting, '
+                                    'Scossetting mock misrule by'
+                                ),
+                            }),
+                            # Match that the exception message raised for this
+                            # object embeds the name of the missing required key.
+                            exception_str_match_regexes=(
+                                r'\bmissing required key\b',),
+                        ),
                     ),
                 ),
 
@@ -398,28 +390,32 @@ def hints_pep589_meta() -> 'list[HintPepMetadata]':
                             exception_str_match_regexes=(
                                 r'\bPep589484TypedDictT\b',),
                         ),
-                        # #FIXME: Uncomment *AFTER* deeply type-checking "TypedDict".
-                        # # Empty generic instance.
-                        # PithSatisfiedMetadata(Pep589484TypedDictT()),
-                        # # Non-empty generic instance *NOT* containing the expected
-                        # # keys.
-                        # PithUnsatisfiedMetadata(
-                        #     pith=Pep589484TypedDictT({
-                        #         'and_when': 'Matricidally',
-                        #         'I_gaze_on_thee': (
-                        #             'Hatchet‐cachepotting, '
-                        #             'Scossetting mock misrule by'
-                        #         ),
-                        #     }),
-                        #     # Match that the exception message raised for this object
-                        #     # embeds:
-                        #     # * The name of the unsatisfied key.
-                        #     # * The expected types of this key's value.
-                        #     exception_str_match_regexes=(
-                        #         r'\bI_gaze_on_thee\b',
-                        #         r'\bbytes\b',
-                        #     ),
-                        # ),
+                        # Empty generic instance *NOT* containing the expected
+                        # required key.
+                        PithUnsatisfiedMetadata(
+                            pith=Pep589484TypedDictT(),
+                            # Match that the exception message raised for this
+                            # object embeds the name of the missing required key.
+                            exception_str_match_regexes=(
+                                r'\bmissing required key\b',
+                                r'\bkey\b',
+                            ),
+                        ),
+                        # Non-empty generic instance *NOT* containing the expected
+                        # keys.
+                        PithUnsatisfiedMetadata(
+                            pith=Pep589484TypedDictT({
+                                'and_when': 'Matricidally',
+                                'I_gaze_on_thee': (
+                                    'Hatchet‐cachepotting, '
+                                    'Scossetting mock misrule by'
+                                ),
+                            }),
+                            # Match that the exception message raised for this
+                            # object embeds the name of the missing required key.
+                            exception_str_match_regexes=(
+                                r'\bmissing required key\b',),
+                        ),
                     ),
                 ),
             ))
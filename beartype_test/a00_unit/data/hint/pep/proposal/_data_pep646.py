@@ -151,10 +151,33 @@ def hints_pep646_meta() -> (
                     91, 0.11382,
                     'Held struggle with his throat', 'but came not forth;',
                 )),
-                #FIXME: Also test tuples *NOT* satisfying this hint *AFTER*
-                #deeply type-checking PEP 646-compliant tuple hints.
+                # Tuple deeply satisfying this hint containing *NO* variadic
+                # items.
+                PithSatisfiedMetadata((38, 0.9472)),
                 # String constant.
                 PithUnsatisfiedMetadata('For as in the theatres of crowded men'),
+                # Tuple containing fewer items than fixed child hints.
+                PithUnsatisfiedMetadata(
+                    pith=(51,),
+                    # Match that the exception message raised for this object
+                    # embeds the actual and minimum lengths of this tuple.
+                    exception_str_match_regexes=(r'\blength 1 < 2\b',),
+                ),
+                # Tuple whose leading fixed item violates this hint.
+                PithUnsatisfiedMetadata(
+                    pith=('Whom the lit trumpet', 0.5812, 'of the grand bell'),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the violating item.
+                    exception_str_match_regexes=(r'\bindex 0 item\b',),
+                ),
+                # Tuple whose variadic items *ALL* violate this hint.
+                PithUnsatisfiedMetadata(
+                    pith=(47, 0.3771, b'Sudden to rally', b'shining spheres'),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the first violating variadic item.
+                    exception_str_match_regexes=(
+                        r'\bindex 2 item\b', r'\bstr\b'),
+                ),
             ),
         ),
         HintPepMetadata(
@@ -168,10 +191,68 @@ def hints_pep646_meta() -> (
                     91, 0.11382,
                     'Held struggle with his throat', 'but came not forth;',
                 )),
-                #FIXME: Also test tuples *NOT* satisfying this hint *AFTER*
-                #deeply type-checking PEP 646-compliant tuple hints.
+                # Tuple deeply satisfying this hint containing *NO* variadic
+                # items.
+                PithSatisfiedMetadata((38, 0.9472)),
                 # String constant.
                 PithUnsatisfiedMetadata('For as in the theatres of crowded men'),
+                # Tuple containing fewer items than fixed child hints.
+                PithUnsatisfiedMetadata(
+                    pith=(51,),
+                    # Match that the exception message raised for this object
+                    # embeds the actual and minimum lengths of this tuple.
+                    exception_str_match_regexes=(r'\blength 1 < 2\b',),
+                ),
+                # Tuple whose leading fixed item violates this hint.
+                PithUnsatisfiedMetadata(
+                    pith=('Whom the lit trumpet', 0.5812, 'of the grand bell'),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the violating item.
+                    exception_str_match_regexes=(r'\bindex 0 item\b',),
+                ),
+                # Tuple whose variadic items *ALL* violate this hint.
+                PithUnsatisfiedMetadata(
+                    pith=(47, 0.3771, b'Sudden to rally', b'shining spheres'),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the first violating variadic item.
+                    exception_str_match_regexes=(
+                        r'\bindex 2 item\b', r'\bstr\b'),
+                ),
+            ),
+        ),
+
+        # PEP 585-compliant tuple hint subscripted by (in order):
+        # * An arbitrary PEP-noncompliant child hint.
+        # * A PEP 646-compliant unpacked type variable tuple, constraining only
+        #   the number of variadic items.
+        # * An arbitrary PEP-noncompliant child hint.
+        HintPepMetadata(
+            hint=tuple[int, Ts_unpacked_prefix, float],
+            pep_sign=HintSignPep646TupleFixedVariadic,
+            is_pep585_builtin_subbed=True,
+            isinstanceable_type=tuple,
+            typeargs_packed_unsubbed=(Ts,),
+            piths_meta=(
+                # Tuple deeply satisfying this hint.
+                PithSatisfiedMetadata((
+                    17, b'Upon his elbow raised,', 'all prostrate else,', 0.3,)),
+                # Tuple deeply satisfying this hint containing *NO* variadic
+                # items.
+                PithSatisfiedMetadata((29, 0.1875)),
+                # Tuple containing fewer items than fixed child hints.
+                PithUnsatisfiedMetadata(
+                    pith=(0.6,),
+                    # Match that the exception message raised for this object
+                    # embeds the actual and minimum lengths of this tuple.
+                    exception_str_match_regexes=(r'\blength 1 < 2\b',),
+                ),
+                # Tuple whose trailing fixed item violates this hint.
+                PithUnsatisfiedMetadata(
+                    pith=(73, 'Shadow’d in Pan’s', 'sweet forest'),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the violating item.
+                    exception_str_match_regexes=(r'\bindex 2 item\b',),
+                ),
             ),
         ),
 
@@ -197,11 +278,20 @@ def hints_pep646_meta() -> (
                     "He spake, and ceas'd,", b'the while a heavier threat',
                     False, 9 + 1j,
                 )),
-                #FIXME: Also test tuples *NOT* satisfying this hint *AFTER*
-                #deeply type-checking PEP 646-compliant tuple hints.
                 # String constant.
                 PithUnsatisfiedMetadata(
                     'And bid old Saturn take his throne again."—'),
+                # Tuple whose trailing fixed item violates this hint.
+                PithUnsatisfiedMetadata(
+                    pith=(
+                        8, 0.44761,
+                        'And all the gleams', b'that sleep in the white',
+                        False, 'unbroken stillness',
+                    ),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the violating item.
+                    exception_str_match_regexes=(r'\bindex 5 item\b',),
+                ),
             ),
         ),
         HintPepMetadata(
@@ -220,11 +310,20 @@ def hints_pep646_meta() -> (
                     "He spake, and ceas'd,", b'the while a heavier threat',
                     False, 9 + 1j,
                 )),
-                #FIXME: Also test tuples *NOT* satisfying this hint *AFTER*
-                #deeply type-checking PEP 646-compliant tuple hints.
                 # String constant.
                 PithUnsatisfiedMetadata(
                     'And bid old Saturn take his throne again."—'),
+                # Tuple whose trailing fixed item violates this hint.
+                PithUnsatisfiedMetadata(
+                    pith=(
+                        8, 0.44761,
+                        'And all the gleams', b'that sleep in the white',
+                        False, 'unbroken stillness',
+                    ),
+                    # Match that the exception message raised for this object
+                    # embeds the index of the violating item.
+                    exception_str_match_regexes=(r'\bindex 5 item\b',),
+                ),
             ),
         ),
 
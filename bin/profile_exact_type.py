@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+# Benchmark measuring the per-call overhead of @beartype-decorated callables
+# across the kinds of type hints whose type-checks reduce to an isinstance()
+# call against a single type: i.e.,
+# * Builtin scalar types and final classes, type-checked by code first testing
+#   "type(pith) is cls" *BEFORE* falling back to "isinstance(pith, cls)". Both
+#   the exact-type fast path and the subclass slow path (e.g., "bool" passed
+#   for "int") are measured, alongside hand-written guards isolating the cost of
+#   the generated snippet from the cost of the enclosing wrapper.
+# * Hints whose signs reside in the "HINT_SIGNS_ORIGIN_ISINSTANCEABLE" set
+#   (e.g., "list[int]", "collections.abc.Mapping[str, int]"), whose shallow
+#   type-checks are intentionally left as bare isinstance() calls.
+#
+# Each line reports the mean overhead in nanoseconds of one call to a
+# @beartype-decorated identity function relative to one call to the same
+# undecorated function.
+#
+# Usage:
+#     $ python3 bin/profile_exact_type.py
+
+from beartype import beartype
+from collections import (
+    ChainMap,
+    Counter,
+    OrderedDict,
+    defaultdict,
+    deque,
+)
+from collections.abc import (
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Collection,
+    Container,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Reversible,
+    Sequence,
+    Sized,
+    ValuesView,
+)
+from contextlib import nullcontext
+from re import (
+    Match,
+    Pattern,
+    compile as re_compile,
+)
+from timeit import repeat
+from typing import (
+    ContextManager,
+    final,
+)
+
+# Number of times each callable is called per timing below.
+CALL_COUNT = 1000000
+
+# Number of timings per callable below, the fastest of which is reported to
+# minimize noise from the active platform.
+REPEAT_COUNT = 5
+
+
+@final
+class FinalClass(object):
+    # Arbitrary final class eligible for the exact-type fast path.
+    pass
+
+
+class IntSubclass(int):
+    # Arbitrary subclass of a builtin scalar type, forcing the exact-type fast
+    # path to fall through to isinstance().
+    pass
+
+
+def identity(pith):
+    # Undecorated identity function, the baseline against which all decorated
+    # callables are measured.
+    return pith
+
+
+def guard_isinstance(pith):
+    # Hand-written guard equivalent to the code @beartype generated for builtin
+    # scalar types *BEFORE* the exact-type fast path was introduced.
+    if not isinstance(pith, int):
+        raise TypeError(pith)
+    return pith
+
+
+def guard_exact(pith):
+    # Hand-written guard equivalent to the code @beartype now generates for
+    # builtin scalar types.
+    if not (type(pith) is int or isinstance(pith, int)):
+        raise TypeError(pith)
+    return pith
+
+
+def profile_call(label: str, func, pith) -> None:
+    # Fastest total time in seconds consumed by calling the undecorated
+    # baseline.
+    time_baseline = min(repeat(
+        lambda: identity(pith), number=CALL_COUNT, repeat=REPEAT_COUNT))
+
+    # Fastest total time in seconds consumed by calling the passed callable.
+    time_func = min(repeat(
+        lambda: func(pith), number=CALL_COUNT, repeat=REPEAT_COUNT))
+
+    # Print the per-call overhead in nanoseconds.
+    print(
+        f'{label:48}: '
+        f'{(time_func - time_baseline) / CALL_COUNT * 1e9:8.1f} ns/call'
+    )
+
+
+def profile_hint(label: str, hint, pith) -> None:
+    # Profile an identity function decorated by @beartype and annotated by this
+    # hint, type-checking both the passed parameter and the returned value.
+    def func(pith: hint) -> hint:
+        return pith
+
+    profile_call(label, beartype(func), pith)
+
+
+# ....................{ SCALAR                             }....................
+print('Exact-type fast path (hand-written guards):')
+profile_call('isinstance(pith, int)       [int passed]', guard_isinstance, 42)
+profile_call('type(pith) is int or ...    [int passed]', guard_exact, 42)
+profile_call('isinstance(pith, int)       [bool passed]', guard_isinstance, True)
+profile_call('type(pith) is int or ...    [bool passed]', guard_exact, True)
+
+print('\nExact-type fast path (@beartype):')
+profile_hint('int                         [int passed]', int, 42)
+profile_hint('int                         [bool passed]', int, True)
+profile_hint('int                         [subclass passed]', int, IntSubclass(42))
+profile_hint('str                         [str passed]', str, 'Mont Blanc')
+profile_hint('float                       [float passed]', float, 4.2)
+profile_hint('bytes                       [bytes passed]', bytes, b'Arve')
+profile_hint('complex                     [complex passed]', complex, 4.2j)
+profile_hint('FinalClass                  [instance passed]', FinalClass, FinalClass())
+
+# ....................{ ISINSTANCEABLE                     }....................
+async def _coroutine() -> None:
+    pass
+
+async def _async_generator():
+    yield 42
+
+# Coroutine passed below, closed to silence "never awaited" warnings at exit.
+coroutine = _coroutine()
+
+print('\nHINT_SIGNS_ORIGIN_ISINSTANCEABLE (bare isinstance()):')
+for label, hint, pith in (
+    ('list[int]', list[int], [42]),
+    ('tuple[int, ...]', tuple[int, ...], (42,)),
+    ('tuple[int, str]', tuple[int, str], (42, 'Arve')),
+    ('dict[str, int]', dict[str, int], {'Arve': 42}),
+    ('set[int]', set[int], {42}),
+    ('frozenset[int]', frozenset[int], frozenset((42,))),
+    ('deque[int]', deque[int], deque((42,))),
+    ('defaultdict[str, int]', defaultdict[str, int], defaultdict(int)),
+    ('OrderedDict[str, int]', OrderedDict[str, int], OrderedDict(Arve=42)),
+    ('ChainMap[str, int]', ChainMap[str, int], ChainMap({'Arve': 42})),
+    ('Counter[str]', Counter[str], Counter('Arve')),
+    ('type[int]', type[int], bool),
+    ('Callable[[], None]', Callable[[], None], identity),
+    ('Collection[int]', Collection[int], [42]),
+    ('Container[int]', Container[int], [42]),
+    ('Hashable', Hashable, 42),
+    ('Iterable[int]', Iterable[int], [42]),
+    ('Iterator[int]', Iterator[int], iter(())),
+    ('AsyncIterable[int]', AsyncIterable[int], _async_generator()),
+    ('Awaitable[None]', Awaitable[None], coroutine),
+    ('ContextManager[None]', ContextManager[None], nullcontext()),
+    ('ItemsView[str, int]', ItemsView[str, int], {'Arve': 42}.items()),
+    ('KeysView[str]', KeysView[str], {'Arve': 42}.keys()),
+    ('ValuesView[int]', ValuesView[int], {'Arve': 42}.values()),
+    ('Mapping[str, int]', Mapping[str, int], {'Arve': 42}),
+    ('MutableMapping[str, int]', MutableMapping[str, int], {'Arve': 42}),
+    ('Sequence[int]', Sequence[int], [42]),
+    ('MutableSequence[int]', MutableSequence[int], [42]),
+    ('MutableSet[int]', MutableSet[int], {42}),
+    ('Reversible[int]', Reversible[int], [42]),
+    ('Sized', Sized, [42]),
+    ('Pattern[str]', Pattern[str], re_compile('Arve')),
+    ('Match[str]', Match[str], re_compile('Arve').match('Arve')),
+):
+    # Skip hints unsupported by the active Python interpreter, which would
+    # otherwise halt this benchmark.
+    try:
+        profile_hint(label, hint, pith)
+    except Exception as exception:
+        print(f'{label:48}: skipped ({type(exception).__name__})')
+
+coroutine.close()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Benchmark comparing the per-item cost of type-checking containers under each
+# non-trivial type-checking strategy against a plain isinstance() loop, which
+# serves as the practical lower bound for pure-Python type-checking.
+#
+# Usage:
+#     $ python3 bin/profile_strategy.py
+
+from beartype import (
+    BeartypeConf,
+    BeartypeStrategy,
+)
+from beartype.door import is_bearable
+from timeit import timeit
+
+# Number of items in each container type-checked below.
+CONTAINER_LEN = 10000
+
+# Number of times each container is type-checked below.
+CHECK_COUNT = 100
+
+# Containers to be type-checked below.
+list_of_ints = list(range(CONTAINER_LEN))
+list_of_lists = [[item] for item in list_of_ints]
+dict_of_ints = dict.fromkeys(map(str, list_of_ints), 0)
+
+
+def check_isinstance_loop(pith) -> bool:
+    # Plain isinstance() loop, the baseline against which all strategies are
+    # measured.
+    if not isinstance(pith, list):
+        return False
+    for item in pith:
+        if not isinstance(item, int):
+            return False
+    return True
+
+
+def profile_snippet(label: str, func) -> None:
+    # Total time in seconds consumed by the passed callable.
+    time_total = timeit(func, number=CHECK_COUNT)
+
+    # Print the per-check and per-item time in nanoseconds.
+    print(
+        f'{label}: '
+        f'{time_total / CHECK_COUNT * 1e6:12.2f} us/check, '
+        f'{time_total / (CHECK_COUNT * CONTAINER_LEN) * 1e9:8.2f} ns/item'
+    )
+
+
+profile_snippet(
+    'list[int]            [isinstance loop]',
+    lambda: check_isinstance_loop(list_of_ints),
+)
+for strategy in (
+    BeartypeStrategy.O1,
+    BeartypeStrategy.Ok,
+    BeartypeStrategy.Ologn,
+    BeartypeStrategy.On,
+):
+    conf = BeartypeConf(strategy=strategy)
+    profile_snippet(
+        f'list[int]            [{strategy.name:15}]',
+        lambda: is_bearable(list_of_ints, list[int], conf=conf),
+    )
+    profile_snippet(
+        f'list[list[int]]      [{strategy.name:15}]',
+        lambda: is_bearable(list_of_lists, list[list[int]], conf=conf),
+    )
+    profile_snippet(
+        f'dict[str, int]       [{strategy.name:15}]',
+        lambda: is_bearable(dict_of_ints, dict[str, int], conf=conf),
+    )
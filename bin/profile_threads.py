@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Scaling benchmark measuring the throughput of @beartype decoration and
+# is_bearable() type-checking across an increasing number of threads. Under
+# free-threaded CPython (e.g., "python3.14t"), throughput should scale roughly
+# linearly with the number of threads up to the number of cores; under
+# GIL-enabled CPython, throughput is expected to remain flat.
+
+from beartype import beartype
+from beartype.door import is_bearable
+from os import cpu_count
+import sys
+from threading import Barrier, Thread
+from time import perf_counter
+
+# Number of decorations and type-checks performed by each thread.
+DECORATIONS_PER_THREAD = 2000
+CHECKS_PER_THREAD = 100000
+
+def decorate(barrier: Barrier) -> None:
+    barrier.wait()
+    for _ in range(DECORATIONS_PER_THREAD):
+        @beartype
+        def ugh(text: list[str], count: int | None = None) -> dict[str, int]:
+            return {}
+
+def check(barrier: Barrier) -> None:
+    pith = ['Heavenly', 'hurt', 'it', 'gives', 'us']
+    barrier.wait()
+    for _ in range(CHECKS_PER_THREAD):
+        is_bearable(pith, list[str])
+
+def run(target, threads_len: int) -> float:
+    barrier = Barrier(threads_len + 1)
+    threads = [
+        Thread(target=target, args=(barrier,)) for _ in range(threads_len)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    time_start = perf_counter()
+    for thread in threads:
+        thread.join()
+    return perf_counter() - time_start
+
+# Note that sys._is_gil_enabled() is only available under Python >= 3.13.
+print(f'GIL enabled: {getattr(sys, "_is_gil_enabled", lambda: True)()}')
+threads_len_max = cpu_count() or 1
+threads_lens = sorted({1, 2, 4, 8, threads_len_max} - {
+    threads_len for threads_len in (2, 4, 8) if threads_len > threads_len_max})
+
+for target in (decorate, check):
+    # Warm all caches before timing.
+    run(target, 1)
+
+    time_single = run(target, 1)
+    for threads_len in threads_lens:
+        time_total = run(target, threads_len)
+        speedup = threads_len * time_single / time_total
+        print(
+            f'{target.__name__}: {threads_len} thread(s): '
+            f'{time_total:.3f}s ({speedup:.2f}x throughput)'
+        )